@@ -4,6 +4,7 @@ import logging
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.db.models import QuerySet
 
 from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.commons.exceptions import ApiError, DoesNotExist, CoreError
@@ -121,6 +122,9 @@ def check_can_write(document, user):
 def check_can_read_list(document_list, user):
     """Check that the user can read each document of the list.
 
+    The workspaces of the documents owned by other users are collected with
+    a single query, then compared to the set of accessible workspaces.
+
     Args:
         document_list:
         user:
@@ -128,36 +132,79 @@ def check_can_read_list(document_list, user):
     Returns:
 
     """
-    if document_list.count() > 0:
-        # exclude own data
-        other_users_documents = document_list.exclude(user_id=str(user.id))
+    document_workspaces = _get_other_users_document_workspaces(
+        document_list, user
+    )
+    if not document_workspaces:
+        return
+
+    # check that other users private data is not accessed
+    if None in document_workspaces:
+        raise AccessControlError(
+            "The user doesn't have enough rights to access this data"
+        )
 
-        # check that other users private data is not accessed
-        other_users_private_document = other_users_documents.filter(
-            workspace__isnull=True
+    # get set of accessible workspaces
+    accessible_workspaces = {
+        workspace.id
+        for workspace in workspace_api.get_all_workspaces_with_read_access_by_user(
+            user
         )
-        if other_users_private_document.count() > 0:
-            raise AccessControlError(
-                "The user doesn't have enough rights to access this data"
-            )
+    }
+    # check that accessed workspaces are in the set of accessible workspaces
+    if not document_workspaces <= accessible_workspaces:
+        raise AccessControlError(
+            "The user doesn't have enough rights to access this data"
+        )
+
+
+def _get_other_users_document_workspaces(document_list, user):
+    """Return the set of workspace ids (None for no workspace) of the
+    documents of the list not owned by the user.
+
+    Args:
+        document_list:
+        user:
 
-        # get list of accessible workspaces
-        accessible_workspaces = [
-            workspace.id
-            for workspace in workspace_api.get_all_workspaces_with_read_access_by_user(
-                user
+    Returns:
+
+    """
+    if _is_mongo_queryset(document_list):
+        # one aggregation, documents without workspace are grouped under None
+        return {
+            group["_id"]
+            for group in document_list.filter(user_id__ne=user.id).aggregate(
+                [{"$group": {"_id": "$workspace"}}]
             )
-        ]
-        # get list of all workspaces of returned data
-        document_workspaces = set(
-            other_users_documents.values_list("workspace", flat=True)
+        }
+    if isinstance(document_list, QuerySet):
+        return set(
+            document_list.exclude(user_id=str(user.id))
+            .order_by()
+            .values_list("workspace", flat=True)
+            .distinct()
         )
-        # check that accessed workspaces are in the list of accessible workspaces
-        for workspace in document_workspaces:
-            if workspace not in accessible_workspaces:
-                raise AccessControlError(
-                    "The user doesn't have enough rights to access this data"
-                )
+    return {
+        document.workspace.id if document.workspace is not None else None
+        for document in document_list
+        if str(document.user_id) != str(user.id)
+    }
+
+
+def _is_mongo_queryset(document_list):
+    """Is the document list a MongoEngine queryset.
+
+    Args:
+        document_list:
+
+    Returns:
+
+    """
+    if not settings.MONGODB_INDEXING:
+        return False
+    from mongoengine.queryset.queryset import QuerySet as MongoQuerySet
+
+    return isinstance(document_list, MongoQuerySet)
 
 
 def can_write_document_in_workspace(func, document, workspace, user):
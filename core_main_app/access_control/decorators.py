@@ -1,5 +1,6 @@
 """Access control decorator
 """
+from core_main_app.utils import performance
 
 
 def access_control(check_func):
@@ -32,7 +33,16 @@ def access_control(check_func):
             Returns:
 
             """
-            return check_func(func, *args, **kwargs)
+            if performance.get_request_metrics() is None:
+                return check_func(func, *args, **kwargs)
+
+            def _timed_func(*func_args, **func_kwargs):
+                # the decorated function is not part of the ACL check
+                with performance.excluded(performance.ACL_CHECK):
+                    return func(*func_args, **func_kwargs)
+
+            with performance.timed(performance.ACL_CHECK):
+                return check_func(_timed_func, *args, **kwargs)
 
         return wrapper
 
@@ -15,10 +15,14 @@ def init_app(sender, **kwargs):
     Returns:
 
     """
+    from core_main_app.components.lock.tasks import (
+        init_delete_expired_locks_periodic_task,
+    )
     from core_main_app.permissions import discover
 
     discover.init_rules(sender.apps)
     discover.create_public_workspace()
+    init_delete_expired_locks_periodic_task()
 
 
 class InitApp(AppConfig):
@@ -36,11 +40,30 @@ class InitApp(AppConfig):
             check_ssl_certificates_dir_setting,
         )
         from core_main_app.permissions import discover
+        from core_main_app.utils.cache.xml_schema import (
+            init_xml_schema_cache,
+        )
+        from core_main_app.utils.cache.workspace_access import (
+            init_workspace_access_cache,
+        )
+        from core_main_app.utils.cache.xslt import init_xslt_cache
+        from core_main_app.utils.cache.rendered_fragment import (
+            init_rendered_fragment_cache,
+        )
+        from core_main_app.utils.performance import (
+            init_performance_instrumentation,
+        )
 
+        init_performance_instrumentation()
         _check_settings()
         check_ssl_certificates_dir_setting(SSL_CERTIFICATES_DIR)
         post_migrate.connect(init_app, sender=self)
         discover.init_mongo_indexing()
+        discover.init_keyword_indexing()
+        init_xml_schema_cache()
+        init_xslt_cache()
+        init_rendered_fragment_cache()
+        init_workspace_access_cache()
 
 
 def _check_settings():
@@ -11,8 +11,10 @@ from core_main_app.commons.regex import NOT_EMPTY_OR_WHITESPACES
 from core_main_app.settings import (
     CHECKSUM_ALGORITHM,
 )
+from core_main_app.utils import performance
 from core_main_app.utils.checksum import compute_checksum
 from core_main_app.utils.datetime import datetime_now
+from core_main_app.utils.storage.hashing_file import save_file
 from core_main_app.utils.storage.storage import (
     core_file_storage,
     user_directory_path,
@@ -69,6 +71,7 @@ class AbstractData(models.Model):
         if self._content is None and self.file.name:
             # read xml file into content field
             file_content = self.file.read()
+            performance.record_bytes_read(len(file_content or b""))
             try:
                 self._content = (
                     file_content.decode("utf-8")
@@ -158,10 +161,15 @@ class AbstractData(models.Model):
                 self.creation_date = now
                 # initialize when first saved, then only updates when content is updated
                 self.last_modification_date = now
-            if self.content and CHECKSUM_ALGORITHM:
-                self.checksum = compute_checksum(
-                    str(self.content).encode(), CHECKSUM_ALGORITHM
-                )
+            if CHECKSUM_ALGORITHM:
+                # write a new file now, hashing it on the same pass
+                checksum = save_file(self.file, CHECKSUM_ALGORITHM)
+                if checksum:
+                    self.checksum = checksum
+                elif self.checksum is None and self.content:
+                    self.checksum = compute_checksum(
+                        str(self.content).encode(), CHECKSUM_ALGORITHM
+                    )
             self.save()
         except IntegrityError as exception:
             raise exceptions.NotUniqueError(str(exception))
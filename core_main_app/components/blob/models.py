@@ -13,6 +13,7 @@ from core_main_app.components.blob.access_control import (
 from core_main_app.components.workspace.models import Workspace
 from core_main_app.settings import CHECKSUM_ALGORITHM
 from core_main_app.utils.checksum import compute_checksum
+from core_main_app.utils.storage.hashing_file import save_file
 from core_main_app.utils.storage.storage import (
     user_directory_path,
     core_file_storage,
@@ -48,6 +49,8 @@ class Blob(models.Model):
     )
 
     creation_date = models.DateTimeField(auto_now_add=True)
+    # (user id, owner name), loaded on access or by the batch resolvers
+    _owner_name = None
 
     class Meta:
         ordering = ["-creation_date"]
@@ -59,7 +62,12 @@ class Blob(models.Model):
         Returns:
 
         """
-        return User.objects.get(pk=self.user_id).username
+        if self._owner_name is None or self._owner_name[0] != self.user_id:
+            self._owner_name = (
+                self.user_id,
+                User.objects.get(pk=self.user_id).username,
+            )
+        return self._owner_name[1]
 
     def metadata(self, user):
         """Get blob metadata
@@ -165,10 +173,16 @@ class Blob(models.Model):
 
         """
         try:
-            if self.blob.file and CHECKSUM_ALGORITHM:
-                self.checksum = compute_checksum(
-                    self.blob.file, CHECKSUM_ALGORITHM
-                )
+            if CHECKSUM_ALGORITHM:
+                # write a new file now, hashing it on the same pass
+                checksum = save_file(self.blob, CHECKSUM_ALGORITHM)
+                if checksum:
+                    self.checksum = checksum
+                elif self.checksum is None:
+                    with self.blob.open("rb") as blob_file:
+                        self.checksum = compute_checksum(
+                            blob_file, CHECKSUM_ALGORITHM
+                        )
             return self.save()
         except Exception as ex:
             raise exceptions.ModelError(str(ex))
@@ -3,9 +3,11 @@
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.views.main import ChangeList
 from django.forms import ChoiceField
 
 from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.components.data.batch_resolvers import resolve_owner_names
 from core_main_app.components.user import api as user_api
 from core_main_app.components.workspace import api as workspace_api
 from core_main_app.utils.admin_site.model_admin_class import (
@@ -140,6 +142,22 @@ def update_data_list(model_admin, request, queryset):
         model_admin.message_user(request, str(ex), messages.ERROR)
 
 
+class DataChangeList(ChangeList):
+    """Data change list, loading the owner names of a page in one query"""
+
+    def get_results(self, request):
+        """Get the page of results and resolve their owner names
+
+        Args:
+            request:
+
+        Returns:
+
+        """
+        super().get_results(request)
+        resolve_owner_names(self.result_list)
+
+
 class CustomDataAdmin(get_base_model_admin_class("Data")):
     """Custom Data Admin"""
 
@@ -151,6 +169,7 @@ class CustomDataAdmin(get_base_model_admin_class("Data")):
         "owner_name",
         "workspace",
     ]
+    list_select_related = ["workspace"]
     action_form = UpdateActionForm
     actions = [update_data_list]
     readonly_fields = ["checksum", "file"]
@@ -159,3 +178,15 @@ class CustomDataAdmin(get_base_model_admin_class("Data")):
     def has_add_permission(self, request, obj=None):
         """Prevent from manually adding data"""
         return False
+
+    def get_changelist(self, request, **kwargs):
+        """Return the change list class
+
+        Args:
+            request:
+            **kwargs:
+
+        Returns:
+
+        """
+        return DataChangeList
@@ -18,6 +18,7 @@ from core_main_app.components.data import (
 )
 from core_main_app.components.data.models import Data
 from core_main_app.components.data.tasks import (
+    async_bulk_upload_folder_task,
     async_migration_task,
     async_template_migration_task,
 )
@@ -27,13 +28,10 @@ from core_main_app.settings import (
     DATA_SORTING_FIELDS,
     ENABLE_JSON_SCHEMA_SUPPORT,
 )
+from core_main_app.utils.cache import xml_schema as xml_schema_cache
 from core_main_app.utils.datetime import datetime_now
 from core_main_app.utils.json_utils import validate_json_data, load_json_string
-from core_main_app.utils.query.mongo.prepare import (
-    convert_to_django,
-    get_access_filters_from_query,
-)
-from core_main_app.utils.xml import validate_xml_data
+from core_main_app.utils.query.mongo.query_plan import convert_query
 from xml_utils.xsd_tree.xsd_tree import XSDTree
 
 
@@ -129,18 +127,7 @@ def upsert(data, request):
     Returns:
 
     """
-    if data.content is None:
-        raise exceptions.ApiError(
-            "Unable to save data: content field is not set."
-        )
-
-    if data.template.format == Template.XSD:
-        check_xml_file_is_valid(data, request=request)
-    elif data.template.format == Template.JSON and ENABLE_JSON_SCHEMA_SUPPORT:
-        check_json_file_is_valid(data)
-    else:
-        # Raise an error if file extension not supported
-        raise CoreError("Unsupported file format.")
+    check_content_is_valid(data, request=request)
     data.convert_and_save()
     return data
 
@@ -156,11 +143,6 @@ def admin_insert(data, request):
     Returns:
 
     """
-    if data.content is None:
-        raise exceptions.ApiError(
-            "Unable to save data: content field is not set."
-        )
-
     # initialize times - use values if provided, set now otherwise
     now = datetime_now()
     if not data.creation_date:
@@ -171,6 +153,28 @@ def admin_insert(data, request):
         data.last_change_date = now
 
     # convert and save the data (do not call convert_and_save that will set the date fields)
+    check_content_is_valid(data, request=request)
+    data.convert_to_file()
+    data.convert_to_dict()
+    return data.save()
+
+
+def check_content_is_valid(data, request=None):
+    """Check that the content of the data is set and valid against its
+    template.
+
+    Args:
+        data:
+        request:
+
+    Returns:
+
+    """
+    if data.content is None:
+        raise exceptions.ApiError(
+            "Unable to save data: content field is not set."
+        )
+
     if data.template.format == Template.XSD:
         check_xml_file_is_valid(data, request=request)
     elif data.template.format == Template.JSON and ENABLE_JSON_SCHEMA_SUPPORT:
@@ -178,9 +182,8 @@ def admin_insert(data, request):
     else:
         # Raise an error if file extension not supported
         raise CoreError("Unsupported file format.")
-    data.convert_to_file()
-    data.convert_to_dict()
-    return data.save()
+
+    return True
 
 
 def check_xml_file_is_valid(data, request=None):
@@ -199,11 +202,9 @@ def check_xml_file_is_valid(data, request=None):
         xml_tree = XSDTree.build_tree(data.xml_content)
     except Exception as exception:
         raise exceptions.XMLError(str(exception))
-    try:
-        xsd_tree = XSDTree.build_tree(template.content)
-    except Exception as exception:
-        raise exceptions.XSDError(str(exception))
-    error = validate_xml_data(xsd_tree, xml_tree, request=request)
+    error = xml_schema_cache.validate_xml_tree(
+        template, xml_tree, request=request
+    )
     if error is not None:
         raise exceptions.XMLError(error)
 
@@ -236,13 +237,8 @@ def execute_json_query(json_query, user, order_by_field=DATA_SORTING_FIELDS):
     Returns:
 
     """
-    # get workspace and user filters from JSON query
-    workspace_filter, user_filter = get_access_filters_from_query(
-        query_dict=json_query
-    )
-
-    # convert JSON query to Django syntax
-    query = convert_to_django(query_dict=json_query)
+    # convert JSON query to Django syntax, get workspace and user filters
+    query, workspace_filter, user_filter = convert_query(json_query)
 
     # execute mongo query and return results
     if settings.MONGODB_INDEXING:
@@ -351,6 +347,37 @@ def assign(data, workspace, user):
     return data.save_object()
 
 
+def bulk_upload_folder(
+    folder, template, workspace_id, batch_size, validate, clean_title, user
+):
+    """Create a data for each file of a folder (relative to MEDIA_ROOT)
+    NB: This action is executed with an async task, use the progress / result function to retrieve
+    information about the task status
+
+    Args:
+        folder:
+        template:
+        workspace_id:
+        batch_size:
+        validate: (boolean) Validate the files against the template
+        clean_title: (boolean) Remove underscores and extension from the titles
+        user:
+
+    Return:
+        Async task id
+    """
+    task = async_bulk_upload_folder_task.delay(
+        folder,
+        str(template.id),
+        workspace_id,
+        str(user.id),
+        batch_size,
+        validate,
+        clean_title,
+    )
+    return task.task_id
+
+
 @access_control(has_perm_administration)
 def migrate_data_list(data_list, xslt_id, target_template_id, migrate, user):
     """Perform a migration / validation of the data list for the given target template id
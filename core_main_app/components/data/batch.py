@@ -0,0 +1,291 @@
+""" Batch create, update and delete of data
+"""
+import logging
+
+from django.db import transaction
+
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons import exceptions
+from core_main_app.components.data import api as data_api
+from core_main_app.components.data.models import Data
+from core_main_app.components.mongo import bulk_index
+from core_main_app.components.template import api as template_api
+from core_main_app.components.workspace.models import Workspace
+from core_main_app.settings import (
+    BACKWARD_COMPATIBILITY_DATA_XML_CONTENT,
+    DATA_BATCH_CHUNK_SIZE,
+)
+from core_main_app.utils.cache import (
+    workspace_access as workspace_access_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+CONTENT_FIELD = (
+    "xml_content" if BACKWARD_COMPATIBILITY_DATA_XML_CONTENT else "content"
+)
+
+
+def create_data_list(records, request, chunk_size=DATA_BATCH_CHUNK_SIZE):
+    """Create a data for each record of a list.
+
+    Each record is checked and saved like a single data (access control,
+    validation against the compiled schema of the template), but the
+    templates and workspaces are loaded once, the records are written with
+    one transaction per chunk and indexed in bulk.
+
+    Args:
+        records: list of {"title", "template", "workspace", "content"}
+        request:
+        chunk_size: number of records written in each transaction
+
+    Returns:
+        list of (data_id, exception) tuples, in the order of the records
+
+    """
+    templates = {}
+    workspaces = Workspace.objects.in_bulk(
+        {
+            workspace_id
+            for workspace_id in (
+                _get_id(record, "workspace")
+                for record in records
+                if isinstance(record, dict)
+            )
+            if workspace_id is not None
+        }
+    )
+
+    def _create_data(record, _):
+        data = _build_data(record, templates, workspaces, request)
+        return str(data_api.upsert(data, request).id)
+
+    return _process_in_chunks(records, _create_data, chunk_size=chunk_size)
+
+
+def update_data_list(records, request, chunk_size=DATA_BATCH_CHUNK_SIZE):
+    """Update the title and / or content of a list of data.
+
+    Args:
+        records: list of {"id", "title", "content"}
+        request:
+        chunk_size: number of records written in each transaction
+
+    Returns:
+        list of (data_id, exception) tuples, in the order of the records
+
+    """
+
+    def _update_data(record, data_by_id):
+        if not isinstance(record, dict):
+            raise exceptions.ApiError("A record must be a JSON object.")
+        data = _get_data(record, data_by_id)
+        if "title" in record:
+            data.title = record["title"]
+        if CONTENT_FIELD in record:
+            data.content = record[CONTENT_FIELD]
+        return str(data_api.upsert(data, request).id)
+
+    return _process_in_chunks(
+        records, _update_data, _load_data, chunk_size=chunk_size
+    )
+
+
+def delete_data_list(data_ids, user, chunk_size=DATA_BATCH_CHUNK_SIZE):
+    """Delete a list of data.
+
+    Args:
+        data_ids: list of data ids or {"id"}
+        user:
+        chunk_size: number of data deleted in each transaction
+
+    Returns:
+        list of (data_id, exception) tuples, in the order of the ids
+
+    """
+
+    def _delete_data(item, data_by_id):
+        data = _get_data(item, data_by_id)
+        data_id = str(data.id)
+        data_api.delete(data, user)
+        return data_id
+
+    return _process_in_chunks(
+        data_ids, _delete_data, _load_data, chunk_size=chunk_size
+    )
+
+
+def _process_in_chunks(
+    items, process, load_chunk=None, chunk_size=DATA_BATCH_CHUNK_SIZE
+):
+    """Process the items of a list, one transaction per chunk.
+
+    Each item is processed in a savepoint: an item that can't be saved
+    does not cancel the other items of its chunk. The MongoDB index is
+    updated in bulk, and the accessible workspaces are computed once.
+
+    Args:
+        items:
+        process: function(item, chunk context) returning the data id
+        load_chunk: function(chunk) returning the chunk context
+        chunk_size:
+
+    Returns:
+        list of (data_id, exception) tuples
+
+    """
+    results = []
+    chunk_size = max(chunk_size, 1)
+    with workspace_access_cache.request_scope():
+        with bulk_index.coalesce_index_updates():
+            for start in range(0, len(items), chunk_size):
+                chunk = items[start : start + chunk_size]
+                context = load_chunk(chunk) if load_chunk else None
+                with transaction.atomic():
+                    for item in chunk:
+                        results.append(_process_item(item, process, context))
+    return results
+
+
+def _process_item(item, process, context):
+    """Process an item in a savepoint
+
+    Args:
+        item:
+        process:
+        context:
+
+    Returns:
+        (data_id, exception) tuple
+
+    """
+    try:
+        with transaction.atomic():
+            return process(item, context), None
+    except Exception as exception:
+        if not isinstance(
+            exception, (exceptions.BaseCoreException, AccessControlError)
+        ):
+            logger.error("Batch: unable to save record: %s", str(exception))
+        data_id = _get_id(item, "id")
+        return (str(data_id) if data_id is not None else None), exception
+
+
+def _build_data(record, templates, workspaces, request):
+    """Build the data of a record
+
+    Args:
+        record:
+        templates: templates already loaded, by id
+        workspaces: workspaces of the batch, by id
+        request:
+
+    Returns:
+
+    """
+    if not isinstance(record, dict):
+        raise exceptions.ApiError("A record must be a JSON object.")
+    missing_fields = [
+        field
+        for field in ("title", "template", CONTENT_FIELD)
+        if record.get(field) in (None, "")
+    ]
+    if missing_fields:
+        raise exceptions.ApiError(
+            f"Missing required fields: {', '.join(missing_fields)}."
+        )
+
+    workspace = None
+    if record.get("workspace") not in (None, ""):
+        workspace = workspaces.get(_get_id(record, "workspace"))
+        if workspace is None:
+            raise exceptions.ApiError("Workspace not found.")
+
+    data = Data(
+        template=_get_template(record["template"], templates, request),
+        workspace=workspace,
+        title=record["title"],
+        user_id=str(request.user.id),
+    )
+    data.content = record[CONTENT_FIELD]
+    return data
+
+
+def _get_template(template_id, templates, request):
+    """Return a template, loaded once per batch
+
+    Args:
+        template_id:
+        templates: templates already loaded (or their errors), by id
+        request:
+
+    Returns:
+
+    """
+    template_id = str(template_id)
+    if template_id not in templates:
+        try:
+            templates[template_id] = template_api.get_by_id(
+                template_id, request=request
+            )
+        except exceptions.DoesNotExist:
+            templates[template_id] = exceptions.DoesNotExist(
+                "Template not found."
+            )
+        except Exception as exception:
+            templates[template_id] = exception
+    if isinstance(templates[template_id], Exception):
+        raise templates[template_id]
+    return templates[template_id]
+
+
+def _load_data(chunk):
+    """Load the data of a chunk with one query
+
+    Args:
+        chunk:
+
+    Returns:
+        dict of data, by id
+
+    """
+    return Data.objects.select_related("template", "workspace").in_bulk(
+        {
+            data_id
+            for data_id in (_get_id(item, "id") for item in chunk)
+            if data_id is not None
+        }
+    )
+
+
+def _get_data(item, data_by_id):
+    """Return the data of an item of the chunk
+
+    Args:
+        item: data id or {"id"}
+        data_by_id:
+
+    Returns:
+
+    """
+    data = data_by_id.get(_get_id(item, "id"))
+    if data is None:
+        raise exceptions.DoesNotExist("Data not found.")
+    return data
+
+
+def _get_id(item, field):
+    """Return the id of an item (or of one of its fields), None if invalid
+
+    Args:
+        item: id or dict
+        field:
+
+    Returns:
+
+    """
+    value = item.get(field) if isinstance(item, dict) else item
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,159 @@
+""" Batch resolution of the objects referenced by a list of data
+"""
+import logging
+
+from django.contrib.auth.models import User
+from django.db.models import prefetch_related_objects
+
+from core_main_app.components.data.content_prefetch import prefetch_content
+from core_main_app.components.data.models import Data
+from core_main_app.components.template.models import Template
+from core_main_app.components.workspace.models import Workspace
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_related(
+    data_list,
+    owner_name=False,
+    template=False,
+    workspace=False,
+    blob=False,
+    content=False,
+):
+    """Load the objects referenced by a list of data (or mongo data) with
+    one query per type, and cache them in each object.
+
+    Args:
+        data_list: list or queryset of Data or MongoData
+        owner_name: resolve the owner names
+        template: resolve the templates
+        workspace: resolve the workspaces
+        blob: resolve the blobs
+        content: read the contents
+
+    Returns:
+        list of data
+
+    """
+    data_list = list(data_list)
+    if not data_list:
+        return data_list
+
+    if owner_name:
+        resolve_owner_names(data_list)
+
+    django_data_list = [data for data in data_list if isinstance(data, Data)]
+    mongo_data_list = [
+        data for data in data_list if not isinstance(data, Data)
+    ]
+    # Django data: fill the foreign key caches
+    lookups = [
+        lookup
+        for lookup, requested in (
+            ("template", template),
+            ("workspace", workspace),
+            ("_blob", blob),
+        )
+        if requested
+    ]
+    if django_data_list and lookups:
+        prefetch_related_objects(django_data_list, *lookups)
+
+    # Mongo data: fill the related caches
+    if mongo_data_list:
+        if template:
+            _resolve_mongo_data_related(
+                mongo_data_list, "template", "_template_id", Template
+            )
+        if workspace:
+            _resolve_mongo_data_related(
+                mongo_data_list, "workspace", "_workspace_id", Workspace
+            )
+        if blob:
+            _resolve_mongo_data_blobs(mongo_data_list)
+
+    if content:
+        prefetch_content(data_list)
+    return data_list
+
+
+def resolve_owner_names(object_list):
+    """Load the owner names of a list of objects with a user_id (data,
+    mongo data, blobs) in one query.
+
+    Args:
+        object_list:
+
+    Returns:
+
+    """
+    user_ids = set()
+    for obj in object_list:
+        try:
+            user_ids.add(int(obj.user_id))
+        except (TypeError, ValueError):
+            continue
+    if not user_ids:
+        return
+
+    usernames = dict(
+        User.objects.filter(pk__in=user_ids).values_list("id", "username")
+    )
+    for obj in object_list:
+        try:
+            username = usernames.get(int(obj.user_id))
+        except (TypeError, ValueError):
+            continue
+        if username is not None:
+            obj._owner_name = (obj.user_id, username)
+
+
+def _resolve_mongo_data_related(
+    mongo_data_list, related_name, id_field, model
+):
+    """Load an object referenced by id by a list of mongo data in one query
+
+    Args:
+        mongo_data_list:
+        related_name: name of the related object (e.g. template)
+        id_field: mongo data field with the id (e.g. _template_id)
+        model: model of the related object
+
+    Returns:
+
+    """
+    ids = {
+        getattr(mongo_data, id_field)
+        for mongo_data in mongo_data_list
+        if getattr(mongo_data, id_field) is not None
+    }
+    objects = model.objects.in_bulk(ids) if ids else {}
+    for mongo_data in mongo_data_list:
+        related_id = getattr(mongo_data, id_field)
+        if related_id is None:
+            mongo_data.set_related(**{related_name: None})
+        elif related_id in objects:
+            mongo_data.set_related(**{related_name: objects[related_id]})
+
+
+def _resolve_mongo_data_blobs(mongo_data_list):
+    """Load the blobs of a list of mongo data in one query
+
+    Args:
+        mongo_data_list:
+
+    Returns:
+
+    """
+    blobs = {
+        data.id: data._blob
+        for data in Data.objects.filter(
+            pk__in=[mongo_data.pk for mongo_data in mongo_data_list]
+        )
+        .only("id", "_blob")
+        .select_related("_blob")
+    }
+    for mongo_data in mongo_data_list:
+        if mongo_data.pk in blobs:
+            mongo_data.set_related(blob=blobs[mongo_data.pk])
@@ -0,0 +1,459 @@
+""" Bulk upload of a folder of data files
+"""
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+
+from core_main_app.commons.constants import (
+    DATA_FILE_EXTENSION_FOR_TEMPLATE_FORMAT,
+)
+from core_main_app.components.data.models import Data
+from core_main_app.components.keyword_index import api as keyword_index_api
+from core_main_app.components.mongo import bulk_index
+from core_main_app.components.template.models import Template
+from core_main_app.settings import (
+    BULK_UPLOAD_QUEUE_SIZE,
+    BULK_UPLOAD_WORKERS,
+    SEARCHABLE_DATA_OCCURRENCES_LIMIT,
+    XERCES_VALIDATION,
+    XML_FORCE_LIST,
+    XML_POST_PROCESSOR,
+)
+from core_main_app.utils import xml as main_xml_utils
+from core_main_app.utils.cache import xml_schema as xml_schema_cache
+from core_main_app.utils.datetime import datetime_now
+from core_main_app.utils.json_utils import load_json_string, validate_json_data
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+logger = logging.getLogger(__name__)
+
+# context of the current process pool worker, set by _init_worker
+_worker_context = None
+
+
+class BulkUploadContext:
+    """Everything needed to parse, validate and convert the files of a folder"""
+
+    def __init__(self, template, folder, validate, clean_title):
+        """Initialize context
+
+        Args:
+            template:
+            folder: folder path, relative to MEDIA_ROOT
+            validate: validate the files against the template
+            clean_title: build the data title from the file name
+        """
+        self.template_format = template.format
+        self.template_content = template.content
+        self.folder = folder
+        self.validate = validate
+        self.clean_title = clean_title
+        self.xml_schema = None
+        self.xsd_tree = None
+        if validate and template.format == Template.XSD:
+            if XERCES_VALIDATION:
+                self.xsd_tree = XSDTree.build_tree(template.content)
+            else:
+                # compiled once, inherited by the forked workers
+                self.xml_schema = xml_schema_cache.get_xml_schema(template)
+
+    def get_title(self, file_name):
+        """Return the title of the data created from a file
+
+        Args:
+            file_name:
+
+        Returns:
+
+        """
+        if not self.clean_title:
+            return file_name
+        return (
+            file_name.replace("_", " ")
+            .replace(DATA_FILE_EXTENSION_FOR_TEMPLATE_FORMAT[Template.XSD], "")
+            .replace(
+                DATA_FILE_EXTENSION_FOR_TEMPLATE_FORMAT[Template.JSON], ""
+            )
+        )
+
+
+def process_file(context, file_name):
+    """Read, validate and convert a file of the folder.
+
+    Args:
+        context: BulkUploadContext
+        file_name:
+
+    Returns:
+        dict: file_name, title, dict_content and error (None if successful)
+
+    """
+    result = {
+        "file_name": file_name,
+        "title": context.get_title(file_name),
+        "dict_content": None,
+        "error": None,
+    }
+    try:
+        with open(
+            os.path.join(settings.MEDIA_ROOT, context.folder, file_name), "rb"
+        ) as _file:
+            content = _file.read()
+
+        if context.template_format == Template.XSD:
+            if context.validate:
+                _validate_xml(context, content)
+            result["dict_content"] = main_xml_utils.raw_xml_to_dict(
+                content,
+                postprocessor=XML_POST_PROCESSOR,
+                force_list=XML_FORCE_LIST,
+                list_limit=SEARCHABLE_DATA_OCCURRENCES_LIMIT,
+            )
+        elif context.template_format == Template.JSON:
+            result["dict_content"] = load_json_string(content)
+            if context.validate:
+                validate_json_data(
+                    result["dict_content"], context.template_content
+                )
+        else:
+            raise ValueError("Unrecognized file format.")
+    except Exception as exception:
+        result["error"] = str(exception)
+    return result
+
+
+def _validate_xml(context, content):
+    """Validate XML content, raise an exception if invalid.
+
+    Args:
+        context:
+        content:
+
+    Returns:
+
+    """
+    xml_tree = XSDTree.build_tree(content)
+    if context.xml_schema is not None:
+        error = context.xml_schema.validate(xml_tree)
+    else:
+        error = main_xml_utils.validate_xml_data(context.xsd_tree, xml_tree)
+    if error is not None:
+        raise ValueError(error)
+
+
+def _init_worker(context):
+    """Initialize a process pool worker
+
+    Args:
+        context:
+
+    Returns:
+
+    """
+    global _worker_context
+    _worker_context = context
+
+
+def _process_file_in_worker(file_name):
+    """Process a file with the context of the current worker
+
+    Args:
+        file_name:
+
+    Returns:
+
+    """
+    return process_file(_worker_context, file_name)
+
+
+def _get_process_pool(context, workers):
+    """Start a pool of forked workers, None if not possible.
+
+    The context (and the compiled schema) is inherited by the workers,
+    which never access the database.
+
+    Args:
+        context:
+        workers:
+
+    Returns:
+
+    """
+    if workers <= 1:
+        return None
+    try:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(context,),
+        )
+        # make sure the workers can be started (e.g. not a daemon process)
+        pool.submit(int).result()
+        return pool
+    except Exception as exception:
+        logger.warning(
+            "Bulk upload: unable to start process pool, "
+            "processing files sequentially: %s",
+            str(exception),
+        )
+        return None
+
+
+def list_folder(folder):
+    """Return an iterator on the names of the files of a folder
+
+    Args:
+        folder: folder path, relative to MEDIA_ROOT
+
+    Returns:
+
+    """
+    with os.scandir(os.path.join(settings.MEDIA_ROOT, folder)) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry.name
+
+
+def iter_processed_files(context, file_names, pool=None, workers=1):
+    """Process files, in a process pool if given, yield results in order.
+
+    The number of files submitted to the pool at once is bounded, so the
+    folder is streamed instead of being loaded in memory.
+
+    Args:
+        context:
+        file_names: iterable of file names
+        pool: ProcessPoolExecutor
+        workers: number of workers of the pool
+
+    Returns:
+
+    """
+    if pool is None:
+        for file_name in file_names:
+            yield process_file(context, file_name)
+        return
+
+    pending = deque()
+    for file_name in file_names:
+        pending.append(pool.submit(_process_file_in_worker, file_name))
+        if len(pending) >= workers * 4:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class BulkUploadWriter(threading.Thread):
+    """Thread saving the batches of converted files put in its queue"""
+
+    def __init__(self, template_id, workspace_id, user_id, folder):
+        """Initialize writer
+
+        Args:
+            template_id:
+            workspace_id:
+            user_id:
+            folder:
+        """
+        super().__init__(daemon=True)
+        self.template_id = template_id
+        self.workspace_id = workspace_id
+        self.user_id = user_id
+        self.folder = folder
+        self.queue = queue.Queue(maxsize=BULK_UPLOAD_QUEUE_SIZE)
+        self.valid = []
+        self.wrong = []
+        self.errors = {}
+        self.exception = None
+
+    def run(self):
+        """Save batches until None is received. If a batch can't be saved,
+        the exception is kept and the following batches are drained without
+        being saved, so the producer is never blocked on the queue.
+
+        Returns:
+
+        """
+        try:
+            while True:
+                batch = self.queue.get()
+                if batch is None:
+                    break
+                if self.exception is not None:
+                    continue
+                try:
+                    self.write_batch(batch)
+                except Exception as exception:
+                    logger.error(
+                        f"Bulk upload: unable to save batch: {str(exception)}"
+                    )
+                    self.exception = exception
+        finally:
+            connection.close()
+
+    def write_batch(self, batch):
+        """Bulk insert a batch of converted files
+
+        Args:
+            batch: list of process_file results
+
+        Returns:
+
+        """
+        data_list = [self._get_data(result) for result in batch]
+        try:
+            # Bulk insert list of data
+            data_list = Data.objects.bulk_create(data_list)
+        except Exception as exception:
+            # Log errors that occurred during bulk insert
+            logger.error("Bulk upload failed.")
+            logger.error(str(exception))
+            # try inserting each data of the batch individually
+            with bulk_index.coalesce_index_updates():
+                for result, data in zip(batch, data_list):
+                    try:
+                        data.save()
+                        self.valid.append(str(data.id))
+                    except Exception as save_exception:
+                        logger.error(
+                            f"Error during bulk upload. Retry loading failed for: {data.title}."
+                        )
+                        self._add_error(
+                            result["file_name"], str(save_exception)
+                        )
+            return
+
+        self.valid.extend(str(data.id) for data in data_list)
+        if keyword_index_api.is_keyword_index_enabled():
+            # bulk_create does not send post_save, index the batch at once
+            try:
+                keyword_index_api.index_data_list(data_list)
+            except Exception as exception:
+                logger.error(
+                    f"Bulk upload: unable to index keywords: {str(exception)}"
+                )
+        if settings.MONGODB_INDEXING:
+            # bulk_create does not send post_save, index the batch at once
+            try:
+                bulk_index.index_data_list(
+                    data_list,
+                    dict_content_list=[
+                        result["dict_content"] for result in batch
+                    ],
+                )
+            except Exception as exception:
+                logger.error(
+                    f"Bulk upload: unable to index data: {str(exception)}"
+                )
+
+    def _get_data(self, result):
+        """Create the Data of a converted file
+
+        Args:
+            result:
+
+        Returns:
+
+        """
+        now = datetime_now()
+        instance = Data(
+            template_id=self.template_id,
+            workspace_id=self.workspace_id,
+            user_id=self.user_id,
+            title=result["title"],
+            last_change_date=now,
+            creation_date=now,
+            last_modification_date=now,
+        )
+        instance.file.name = os.path.join(self.folder, result["file_name"])
+        # if data stored in mongo, don't store dict_content
+        if not settings.MONGODB_INDEXING:
+            instance.dict_content = result["dict_content"]
+        return instance
+
+    def _add_error(self, file_name, error):
+        """Record the error of a file
+
+        Args:
+            file_name:
+            error:
+
+        Returns:
+
+        """
+        self.wrong.append(file_name)
+        self.errors[file_name] = error
+
+
+def bulk_upload_folder(
+    context,
+    writer,
+    batch_size,
+    progress=None,
+    workers=BULK_UPLOAD_WORKERS,
+):
+    """Process the files of a folder and save them in batches.
+
+    Files are parsed, validated and converted by a pool of processes, the
+    converted files are sent by batches to the writer thread through its
+    bounded queue. Processing stops if the writer fails, and the exception
+    of the writer is raised.
+
+    Args:
+        context: BulkUploadContext
+        writer: BulkUploadWriter (not started)
+        batch_size:
+        progress: MigrationProgress
+        workers:
+
+    Returns:
+        {"valid": ["id"...], "wrong": ["file"...], "errors": {file: error}}
+    """
+    parse_errors = {}
+    # fork the workers before starting the writer thread
+    pool = _get_process_pool(context, workers)
+    writer.start()
+    try:
+        batch = []
+        for result in iter_processed_files(
+            context, list_folder(context.folder), pool=pool, workers=workers
+        ):
+            if writer.exception is not None:
+                break
+            if result["error"] is not None:
+                logger.error(
+                    f"ERROR: Unable to insert {result['file_name']}: {result['error']}"
+                )
+                parse_errors[result["file_name"]] = result["error"]
+            else:
+                batch.append(result)
+            if len(batch) >= batch_size:
+                writer.queue.put(batch)
+                batch = []
+            if progress:
+                progress.meta["wrong"] = len(parse_errors)
+                progress.increment()
+        if batch and writer.exception is None:
+            writer.queue.put(batch)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        writer.queue.put(None)
+        writer.join()
+
+    if writer.exception is not None:
+        raise writer.exception
+
+    return {
+        "valid": writer.valid,
+        "wrong": list(parse_errors) + writer.wrong,
+        "errors": {**parse_errors, **writer.errors},
+    }
@@ -0,0 +1,150 @@
+""" Concurrent prefetch of the content of a list of data
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from core_main_app.components.data.models import Data
+from core_main_app.settings import DATA_CONTENT_PREFETCH_WORKERS
+from core_main_app.utils import performance
+
+logger = logging.getLogger(__name__)
+
+
+def prefetch_content(data_list, workers=DATA_CONTENT_PREFETCH_WORKERS):
+    """Read the content of a list of data (or mongo data) at once, and cache
+    it in each object before serialization.
+
+    The files are read concurrently by a bounded pool of threads, or in a
+    couple of queries if the storage can read several files at once
+    (GridFS). Objects whose file can't be read are left untouched and read
+    their content on access as before.
+
+    Args:
+        data_list: list or queryset of Data or MongoData
+        workers: maximum number of concurrent reads
+
+    Returns:
+        list of data, with content cached
+
+    """
+    data_list = list(data_list)
+    files = _get_files(
+        [data for data in data_list if getattr(data, "_content", "") is None]
+    )
+    if not files:
+        return data_list
+
+    # group the files by storage
+    files_by_storage = {}
+    for data, data_file in files:
+        files_by_storage.setdefault(data_file.storage, []).append(
+            (data, data_file.name)
+        )
+
+    for storage, storage_files in files_by_storage.items():
+        names = [name for _, name in storage_files]
+        if hasattr(storage, "read_many"):
+            try:
+                contents = storage.read_many(names)
+            except Exception as exception:
+                logger.warning(
+                    "Unable to prefetch data content: %s", str(exception)
+                )
+                continue
+        else:
+            contents = _read_concurrently(storage, names, workers)
+
+        for data, name in storage_files:
+            if contents.get(name) is not None:
+                data._content = _decode(contents[name])
+    return data_list
+
+
+def _get_files(data_list):
+    """Return the (data, file) pairs of the data to read
+
+    Args:
+        data_list:
+
+    Returns:
+
+    """
+    files = []
+    mongo_data_list = []
+    for data in data_list:
+        if isinstance(data, Data):
+            if data.file.name:
+                files.append((data, data.file))
+        else:
+            # mongo data: the content is the file of the data
+            mongo_data_list.append(data)
+
+    if mongo_data_list:
+        data_files = {
+            data.id: data.file
+            for data in Data.objects.filter(
+                pk__in=[mongo_data.pk for mongo_data in mongo_data_list]
+            ).only("id", "file")
+        }
+        for mongo_data in mongo_data_list:
+            data_file = data_files.get(mongo_data.pk)
+            if data_file is not None and data_file.name:
+                files.append((mongo_data, data_file))
+    return files
+
+
+def _read_concurrently(storage, names, workers):
+    """Read files with a bounded pool of threads
+
+    Args:
+        storage:
+        names:
+        workers:
+
+    Returns:
+        dict: content by file name (None if the file can't be read)
+
+    """
+    if workers <= 1 or len(names) <= 1:
+        return {name: _read(storage, name) for name in names}
+    with ThreadPoolExecutor(max_workers=min(workers, len(names))) as pool:
+        return dict(
+            zip(names, pool.map(lambda name: _read(storage, name), names))
+        )
+
+
+def _read(storage, name):
+    """Read a file, None if it can't be read
+
+    Args:
+        storage:
+        name:
+
+    Returns:
+
+    """
+    try:
+        with storage.open(name, "rb") as data_file:
+            content = data_file.read()
+        performance.record_bytes_read(len(content))
+        return content
+    except Exception as exception:
+        logger.warning(
+            "Unable to prefetch content of %s: %s", name, str(exception)
+        )
+        return None
+
+
+def _decode(file_content):
+    """Decode file content like AbstractData.content
+
+    Args:
+        file_content:
+
+    Returns:
+
+    """
+    try:
+        return file_content.decode("utf-8") if file_content else file_content
+    except AttributeError:
+        return file_content
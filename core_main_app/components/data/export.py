@@ -0,0 +1,205 @@
+""" Streaming export of data lists
+"""
+import json
+import logging
+import zipfile
+from itertools import islice
+
+from django.db.models import QuerySet
+from django.utils.text import get_valid_filename
+from rest_framework.utils.encoders import JSONEncoder
+
+from core_main_app.components.data.content_prefetch import prefetch_content
+from core_main_app.components.template.models import Template
+from core_main_app.settings import DATA_EXPORT_CHUNK_SIZE
+from core_main_app.utils.file import (
+    get_data_file_extension_for_template_format,
+)
+from core_main_app.utils.xml import get_content_by_xpath
+
+logger = logging.getLogger(__name__)
+
+NDJSON_EXPORT_FORMAT = "ndjson"
+ZIP_EXPORT_FORMAT = "zip"
+EXPORT_FORMATS = (NDJSON_EXPORT_FORMAT, ZIP_EXPORT_FORMAT)
+
+
+def iter_data(data_list, chunk_size=DATA_EXPORT_CHUNK_SIZE):
+    """Iterate a data list without caching the results in memory.
+
+    Args:
+        data_list: Django queryset, MongoEngine queryset or list
+        chunk_size: number of documents fetched at once
+
+    Returns:
+
+    """
+    if isinstance(data_list, QuerySet):
+        return data_list.iterator(chunk_size=chunk_size)
+    if hasattr(data_list, "no_cache"):
+        # MongoEngine queryset
+        return iter(data_list.no_cache().batch_size(chunk_size))
+    return iter(data_list)
+
+
+def iter_ndjson(
+    data_list,
+    serializer_class,
+    xpath=None,
+    namespaces=None,
+    chunk_size=DATA_EXPORT_CHUNK_SIZE,
+):
+    """Serialize a data list as newline delimited JSON, one line per data.
+
+    The data are serialized by chunks of chunk_size, so that their contents
+    and related objects are loaded once per chunk by the list serializer.
+
+    Args:
+        data_list:
+        serializer_class:
+        xpath: only export the values at xpath
+        namespaces:
+        chunk_size:
+
+    Returns:
+
+    """
+    data_iterator = iter_data(data_list, chunk_size=chunk_size)
+    chunk_size = max(chunk_size, 1)
+    while True:
+        chunk = list(islice(data_iterator, chunk_size))
+        if not chunk:
+            return
+        if xpath:
+            chunk = prefetch_content(chunk)
+            for data in chunk:
+                data.xml_content = get_content_by_xpath(
+                    data.xml_content, xpath, namespaces=namespaces
+                )
+        for item in serializer_class(chunk, many=True).data:
+            yield json.dumps(item, cls=JSONEncoder) + "\n"
+
+
+class _StreamBuffer:
+    """Unseekable file object collecting the bytes written by ZipFile"""
+
+    def __init__(self):
+        """Initialize buffer"""
+        self._chunks = []
+
+    def write(self, data):
+        """Write bytes
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        """Flush (nothing to do)
+
+        Returns:
+
+        """
+
+    def pop(self):
+        """Return and clear the bytes written since the last call
+
+        Returns:
+
+        """
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_zip(data_list, chunk_size=DATA_EXPORT_CHUNK_SIZE):
+    """Stream a zip archive with one file per data.
+
+    The archive is written on the fly, the file of each data is read from
+    the storage by chunks.
+
+    Args:
+        data_list:
+        chunk_size:
+
+    Returns:
+
+    """
+    buffer = _StreamBuffer()
+    template_formats = {}
+    with zipfile.ZipFile(
+        buffer, mode="w", compression=zipfile.ZIP_DEFLATED
+    ) as zip_file:
+        for data in iter_data(data_list, chunk_size=chunk_size):
+            file_name = _get_file_name(data, template_formats)
+            with zip_file.open(file_name, mode="w", force_zip64=True) as entry:
+                for content in _iter_content(data):
+                    entry.write(content)
+                    yield buffer.pop()
+            yield buffer.pop()
+    yield buffer.pop()
+
+
+def _get_file_name(data, template_formats):
+    """Return the name of the file of a data in the archive
+
+    Args:
+        data:
+        template_formats: template format by template id, updated
+
+    Returns:
+
+    """
+    template_id = data.template_id
+    if template_id not in template_formats:
+        template_formats[template_id] = (
+            Template.objects.filter(pk=template_id)
+            .values_list("format", flat=True)
+            .first()
+        )
+    extension = get_data_file_extension_for_template_format(
+        template_formats[template_id]
+    )
+    file_name = get_valid_filename(f"{data.id}_{data.title}")
+    if extension and not file_name.endswith(extension):
+        file_name += extension
+    return file_name
+
+
+def _iter_content(data):
+    """Iterate the content of a data by chunks, read from the storage if
+    possible.
+
+    Args:
+        data:
+
+    Returns:
+
+    """
+    data_file = getattr(data, "file", None)
+    if (
+        data_file
+        and data_file.name
+        and getattr(data, "_content", None) is None
+    ):
+        try:
+            data_file.open("rb")
+        except OSError as exception:
+            logger.warning(
+                "Unable to read the file of data %s: %s",
+                str(data.id),
+                str(exception),
+            )
+        else:
+            try:
+                yield from data_file.chunks()
+            finally:
+                data_file.close()
+            return
+    content = data.content or ""
+    yield content.encode("utf-8") if isinstance(content, str) else content
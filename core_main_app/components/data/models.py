@@ -4,8 +4,7 @@
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.postgres.indexes import GinIndex
-from django.core.exceptions import ObjectDoesNotExist
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
 from django.db import models
 from django.db.models import Q
 
@@ -27,11 +26,40 @@ from core_main_app.settings import (
 )
 from core_main_app.utils import xml as xml_utils
 from core_main_app.utils.json_utils import load_json_string
+from core_main_app.utils.storage.hashing_file import HashingFile
 
 
 # TODO: Create publication workflow manager
 # TODO: execute_query / execute_query_full_result -> use find method (RETURN FULL OBJECT)
 
+# fields rendered by the serializers that are not model fields
+CONTENT_FIELDS = ("content", "xml_content")
+
+
+class DataQuerySet(models.QuerySet):
+    """Data QuerySet"""
+
+    def only_fields(self, field_names):
+        """Only load the columns needed to render a list of fields
+
+        Args:
+            field_names: serializer field names (e.g. ["id", "title"])
+
+        Returns:
+
+        """
+        model_field_names = {"id"}
+        for field_name in field_names:
+            if field_name in CONTENT_FIELDS:
+                # the content is read from the file
+                model_field_names.add("file")
+                continue
+            try:
+                model_field_names.add(Data._meta.get_field(field_name).name)
+            except FieldDoesNotExist:
+                continue
+        return self.only(*model_field_names)
+
 
 class Data(AbstractData):
     """Data object"""
@@ -52,6 +80,10 @@ class Data(AbstractData):
         related_name="_metadata",
     )
 
+    objects = DataQuerySet.as_manager()
+    # (user id, owner name), loaded on access or by the batch resolvers
+    _owner_name = None
+
     class Meta:
         """Meta"""
 
@@ -108,15 +140,10 @@ class Data(AbstractData):
         content_type = DATA_FILE_CONTENT_TYPE_FOR_TEMPLATE_FORMAT[
             self.template.format
         ]
-        # Get content
-        try:
-            content = self.content.encode("utf-8")
-        except UnicodeEncodeError:
-            content = self.content
-
-        self.file = SimpleUploadedFile(
+        # Content is encoded and sent to the storage chunk by chunk
+        self.file = HashingFile(
+            self.content,
             name=self.title,
-            content=content,
             content_type=content_type,
         )
 
@@ -127,7 +154,12 @@ class Data(AbstractData):
         Returns:
 
         """
-        return User.objects.get(pk=self.user_id).username
+        if self._owner_name is None or self._owner_name[0] != self.user_id:
+            self._owner_name = (
+                self.user_id,
+                User.objects.get(pk=self.user_id).username,
+            )
+        return self._owner_name[1]
 
     @access_control(can_read_blob)
     def blob(self, user):
@@ -2,26 +2,44 @@
 """
 
 import logging
+import time
 
-from celery import shared_task
+from celery import chord, group, shared_task, uuid
+from celery.exceptions import Ignore
 from celery.result import AsyncResult
+from django.db import transaction
 
 from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import CoreError
 from core_main_app.components.data import api as data_api
+from core_main_app.components.data import bulk_upload
+from core_main_app.components.mongo import bulk_index
 from core_main_app.components.template.models import Template
 from core_main_app.components.user import api as user_api
 from core_main_app.components.xsl_transformation import (
     api as xsl_transformation_api,
 )
+from core_main_app.settings import (
+    ENABLE_JSON_SCHEMA_SUPPORT,
+    MIGRATION_CHUNK_SIZE,
+    MIGRATION_PROGRESS_INTERVAL,
+)
 from core_main_app.system import api as system_api
+from core_main_app.utils.cache import xslt as xslt_cache
 
 logger = logging.getLogger(__name__)
 
 
-@shared_task
-def async_migration_task(data_list, xslt_id, template_id, user_id, migrate):
+@shared_task(bind=True)
+def async_migration_task(
+    self, data_list, xslt_id, template_id, user_id, migrate
+):
     """Async task which perform a migration / validation of the data list for the given target template id
 
+    Lists larger than MIGRATION_CHUNK_SIZE are split in chunks processed in
+    parallel by subtasks; the task is then replaced by the chord merging
+    their results, so the task id keeps returning the final result.
+
     Args:
         data_list:
         xslt_id:
@@ -32,72 +50,50 @@ def async_migration_task(data_list, xslt_id, template_id, user_id, migrate):
     Return:
         {"valid": ["id"...], "wrong": ["id"...]}
     """
-    success = []
-    errors = []
-    current_progress = 0
     total_data = len(data_list)
+    progress = MigrationProgress(self, total_data)
 
     try:
-        user = user_api.get_user_by_id(user_id)
-        # check user status
-        if not (user.is_staff or user.is_superuser):
-            raise AccessControlError("Only admin user can migrate data.")
-
+        user = _get_migration_user(user_id)
         target_template = system_api.get_template_by_id(template_id)
+        compiled_xslt = _get_compiled_xslt(xslt_id)
+
+        chunks = list(_split_in_chunks(data_list, MIGRATION_CHUNK_SIZE))
+        if len(chunks) > 1 and _can_fan_out(self):
+            return _replace_with_chord(
+                self,
+                chunks,
+                xslt_id,
+                template_id,
+                user_id,
+                migrate,
+                progress_meta={"current": 0, "total": total_data},
+            )
 
-        # get xsl transformation if selected
-        if xslt_id is not None:
-            xslt = xsl_transformation_api.get_by_id(str(xslt_id))
-
-        for data_id in data_list:
-            data = data_api.get_by_id(data_id, user=user)
-            # modify the data temporarily with the new targeted template
-            data.template = target_template
-
-            if xslt_id is not None:
-                # modify the xml content temporarily with the transformed data content
-                data.xml_content = xsl_transformation_api.xsl_transform(
-                    data.xml_content, xslt.name
-                )
-
-            try:
-                # save the new template for the data if the migration is True
-                if migrate:
-                    system_api.upsert_data(data)
-                else:
-                    # check if the data is valid
-                    if data.template.format == Template.XSD:
-                        data_api.check_xml_file_is_valid(data)
-                    elif data.template.format == Template.JSON:
-                        data_api.check_json_file_is_valid(data)
-                    else:
-                        raise NotImplementedError(
-                            "Migration not available for this format"
-                        )
-
-                success.append(str(data.id))
-            except Exception:
-                errors.append(str(data.id))
-            finally:
-                # increase the current progress and update the task state
-                current_progress += 1
-                async_migration_task.update_state(
-                    state="PROGRESS",
-                    meta={"current": current_progress, "total": total_data},
-                )
+        success = []
+        errors = []
+        for chunk in chunks:
+            chunk_success, chunk_errors = _migrate_data_id_list(
+                chunk, user, target_template, compiled_xslt, migrate, progress
+            )
+            success.extend(chunk_success)
+            errors.extend(chunk_errors)
+    except Ignore:
+        # the task was replaced by the chord of its chunks
+        raise
     except Exception as exception:
-        async_migration_task.update_state(
+        self.update_state(
             state="ABORT",
-            meta={"current": current_progress, "total": total_data},
+            meta={"current": progress.current, "total": total_data},
         )
         raise Exception(f"Something went wrong: {str(exception)}")
 
     return {"valid": success, "wrong": errors}
 
 
-@shared_task
+@shared_task(bind=True)
 def async_template_migration_task(
-    templates, xslt_id, target_template_id, user_id, migrate
+    self, templates, xslt_id, target_template_id, user_id, migrate
 ):
     """Async task which perform a migration / validation of all the data which belong to the given template id list
 
@@ -112,90 +108,98 @@ def async_template_migration_task(
         {"valid": <number>, "wrong": <number>}
     """
     # get the data list to check
-    current_data_progress = 0
     current_template_progress = -1
     total_data = 0
     total_template = len(templates)
+    progress = None
     success = []
     error = []
     try:
         if target_template_id and total_template > 0:
-            # get the user
-            user = user_api.get_user_by_id(user_id)
-            # check user status
-            if not (user.is_staff or user.is_superuser):
-                raise AccessControlError("Only admin user can migrate data.")
+            # check the user is an admin
+            _get_migration_user(user_id)
             # get the target template
             target_template = system_api.get_template_by_id(target_template_id)
             # get xsl transformation if selected
-            if xslt_id is not None:
-                xslt = xsl_transformation_api.get_by_id(str(xslt_id))
+            compiled_xslt = _get_compiled_xslt(xslt_id)
+
+            if _can_fan_out(self):
+                chunks = []
+                chunk_templates = []
+                for template_index, template_id in enumerate(templates):
+                    data_ids = [
+                        str(data_id)
+                        for data_id in system_api.get_all_by_template(
+                            template_id
+                        ).values_list("id", flat=True)
+                    ]
+                    template_chunks = list(
+                        _split_in_chunks(data_ids, MIGRATION_CHUNK_SIZE)
+                    )
+                    chunks.extend(template_chunks)
+                    chunk_templates.extend(
+                        [template_index] * len(template_chunks)
+                    )
+                    total_data += len(data_ids)
+                if len(chunks) > 1:
+                    return _replace_with_chord(
+                        self,
+                        chunks,
+                        xslt_id,
+                        target_template_id,
+                        user_id,
+                        migrate,
+                        progress_meta={
+                            "template_current": 0,
+                            "template_total": total_template,
+                            "data_current": 0,
+                            "data_total": total_data,
+                            "chunk_templates": chunk_templates,
+                        },
+                    )
 
             for template_id in templates:
-
                 # increase the number of processed template
                 current_template_progress += 1
-                # rest de number of data
-                current_data_progress = 0
 
                 # get a QuerySet of all the data with the given template
                 data_list = system_api.get_all_by_template(template_id)
 
                 total_data = data_list.count()
+                progress = MigrationProgress(
+                    self,
+                    total_data,
+                    meta={
+                        "template_current": current_template_progress,
+                        "template_total": total_template,
+                    },
+                    current_key="data_current",
+                    total_key="data_total",
+                )
 
-                for data in data_list.all():
-                    # modify the data temporarily with the new targeted template
-                    data.template = target_template
-
-                    if xslt_id is not None:
-                        # modify the xml content temporarily with the transformed data content
-                        data.xml_content = (
-                            xsl_transformation_api.xsl_transform(
-                                data.xml_content, xslt.name
-                            )
-                        )
-
-                    # check if the data is valid
-                    try:
-                        # save the new template for the data if the migration is True
-                        if migrate:
-                            system_api.upsert_data(data)
-                        else:
-                            # check if the data is valid
-                            if data.template.format == Template.XSD:
-                                data_api.check_xml_file_is_valid(data)
-                            elif data.template.format == Template.JSON:
-                                data_api.check_json_file_is_valid(data)
-                            else:
-                                raise NotImplementedError(
-                                    "Migration not available for this format"
-                                )
-
-                        success.append(str(data.id))
-                    except Exception:
-                        error.append(str(data.id))
-                    finally:
-                        # increase the current progress and update the task state
-                        current_data_progress += 1
-                        async_template_migration_task.update_state(
-                            state="PROGRESS",
-                            meta={
-                                "template_current": current_template_progress,
-                                "template_total": total_template,
-                                "data_current": current_data_progress,
-                                "data_total": total_data,
-                            },
-                        )
+                for data_batch in _split_in_chunks(
+                    data_list.iterator(chunk_size=MIGRATION_CHUNK_SIZE),
+                    MIGRATION_CHUNK_SIZE,
+                ):
+                    batch_success, batch_errors = _migrate_data_batch(
+                        data_batch,
+                        target_template,
+                        compiled_xslt,
+                        migrate,
+                        progress,
+                    )
+                    success.extend(batch_success)
+                    error.extend(batch_errors)
 
             return {"valid": success, "wrong": error}
 
         else:
-            async_template_migration_task.update_state(
+            self.update_state(
                 state="ABORT",
                 meta={
                     "template_current": current_template_progress,
                     "template_total": total_template,
-                    "data_current": current_data_progress,
+                    "data_current": 0,
                     "data_total": total_data,
                 },
             )
@@ -204,19 +208,360 @@ def async_template_migration_task(
                 if not target_template_id
                 else "Please provide template id."
             )
+    except Ignore:
+        # the task was replaced by the chord of its chunks
+        raise
     except Exception as exception:
-        async_template_migration_task.update_state(
+        self.update_state(
             state="ABORT",
             meta={
                 "template_current": current_template_progress,
-                "template_total": total_data,
-                "data_current": current_data_progress,
+                "template_total": total_template,
+                "data_current": progress.current if progress else 0,
                 "data_total": total_data,
             },
         )
         raise Exception(f"Something went wrong: {str(exception)}")
 
 
+@shared_task(bind=True)
+def migrate_data_chunk_task(
+    self, data_list, xslt_id, template_id, user_id, migrate
+):
+    """Migrate / validate a chunk of data (subtask of the migration tasks).
+
+    Args:
+        data_list:
+        xslt_id:
+        template_id:
+        user_id:
+        migrate:
+
+    Return:
+        {"valid": ["id"...], "wrong": ["id"...]}
+    """
+    user = _get_migration_user(user_id)
+    target_template = system_api.get_template_by_id(template_id)
+    compiled_xslt = _get_compiled_xslt(xslt_id)
+    progress = MigrationProgress(self, len(data_list))
+
+    success, errors = _migrate_data_id_list(
+        data_list, user, target_template, compiled_xslt, migrate, progress
+    )
+    return {"valid": success, "wrong": errors}
+
+
+@shared_task
+def merge_migration_results_task(results):
+    """Merge the results of the migration chunk subtasks.
+
+    Args:
+        results:
+
+    Return:
+        {"valid": ["id"...], "wrong": ["id"...]}
+    """
+    success = []
+    errors = []
+    for result in results:
+        success.extend(result["valid"])
+        errors.extend(result["wrong"])
+    return {"valid": success, "wrong": errors}
+
+
+@shared_task(bind=True)
+def async_bulk_upload_folder_task(
+    self,
+    folder,
+    template_id,
+    workspace_id,
+    user_id,
+    batch_size,
+    validate,
+    clean_title,
+):
+    """Async task which creates a data for each file of a folder
+
+    Files are parsed, validated and converted by a pool of processes and
+    saved by batches. Per-file errors are returned in the task result.
+
+    Args:
+        folder: folder path, relative to MEDIA_ROOT
+        template_id:
+        workspace_id:
+        user_id:
+        batch_size:
+        validate:
+        clean_title:
+
+    Return:
+        {"valid": ["id"...], "wrong": ["file"...], "errors": {file: error}}
+    """
+    template = system_api.get_template_by_id(template_id)
+    total = sum(1 for _ in bulk_upload.list_folder(folder))
+    progress = MigrationProgress(self, total, meta={"wrong": 0})
+    context = bulk_upload.BulkUploadContext(
+        template, folder, validate, clean_title
+    )
+    writer = bulk_upload.BulkUploadWriter(
+        template.id, workspace_id, user_id, folder
+    )
+    return bulk_upload.bulk_upload_folder(
+        context, writer, batch_size, progress=progress
+    )
+
+
+class MigrationProgress:
+    """Throttled progress reporting of a migration task"""
+
+    def __init__(
+        self,
+        task,
+        total,
+        meta=None,
+        current_key="current",
+        total_key="total",
+    ):
+        """Initialize progress
+
+        Args:
+            task: bound celery task
+            total: number of data to process
+            meta: extra information to report
+            current_key:
+            total_key:
+        """
+        self.task = task
+        self.total = total
+        self.meta = meta or {}
+        self.current_key = current_key
+        self.total_key = total_key
+        self.current = 0
+        self._last_update = None
+
+    def increment(self):
+        """Increment the progress, report it at most every
+        MIGRATION_PROGRESS_INTERVAL seconds (and when done).
+
+        Returns:
+
+        """
+        self.current += 1
+        now = time.monotonic()
+        if (
+            self._last_update is None
+            or self.current >= self.total
+            or now - self._last_update >= MIGRATION_PROGRESS_INTERVAL
+        ):
+            self._last_update = now
+            self.task.update_state(
+                state="PROGRESS",
+                meta={
+                    **self.meta,
+                    self.current_key: self.current,
+                    self.total_key: self.total,
+                },
+            )
+
+
+def _get_migration_user(user_id):
+    """Get the user performing the migration, check it is an admin.
+
+    Args:
+        user_id:
+
+    Returns:
+
+    """
+    user = user_api.get_user_by_id(user_id)
+    # check user status
+    if not (user.is_staff or user.is_superuser):
+        raise AccessControlError("Only admin user can migrate data.")
+    return user
+
+
+def _get_compiled_xslt(xslt_id):
+    """Get the compiled XSLT of the migration, None if no XSLT selected.
+
+    Args:
+        xslt_id:
+
+    Returns:
+
+    """
+    if xslt_id is None:
+        return None
+    return xslt_cache.get_xslt(xsl_transformation_api.get_by_id(str(xslt_id)))
+
+
+def _split_in_chunks(iterable, chunk_size):
+    """Split an iterable in lists of chunk_size elements, yielded as they
+    are read from the iterable.
+
+    Args:
+        iterable:
+        chunk_size:
+
+    Yields:
+
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _can_fan_out(task):
+    """True if the task runs in a worker and can start subtasks.
+
+    Args:
+        task:
+
+    Returns:
+
+    """
+    return bool(task.request.id) and not task.request.is_eager
+
+
+def _replace_with_chord(
+    task, chunks, xslt_id, template_id, user_id, migrate, progress_meta
+):
+    """Replace the task by a chord of chunk subtasks merging their results.
+
+    Args:
+        task:
+        chunks:
+        xslt_id:
+        template_id:
+        user_id:
+        migrate:
+        progress_meta:
+
+    Returns:
+
+    """
+    chunk_signatures = [
+        migrate_data_chunk_task.s(
+            chunk, xslt_id, str(template_id), user_id, migrate
+        ).set(task_id=uuid())
+        for chunk in chunks
+    ]
+    # store subtask ids so the progress can be aggregated
+    task.update_state(
+        state="PROGRESS",
+        meta={
+            **progress_meta,
+            "chunk_task_ids": [
+                signature.options["task_id"] for signature in chunk_signatures
+            ],
+        },
+    )
+    return task.replace(
+        chord(group(chunk_signatures), merge_migration_results_task.s())
+    )
+
+
+def _migrate_data_id_list(
+    data_id_list, user, target_template, compiled_xslt, migrate, progress
+):
+    """Load a list of data in one query, then migrate / validate it.
+
+    Args:
+        data_id_list:
+        user:
+        target_template:
+        compiled_xslt:
+        migrate:
+        progress:
+
+    Returns:
+        list of valid ids, list of wrong ids
+    """
+    data_list = list(data_api.get_by_id_list(data_id_list, user=user))
+    success, errors = _migrate_data_batch(
+        data_list, target_template, compiled_xslt, migrate, progress
+    )
+    # data not found
+    found_ids = {str(data.id) for data in data_list}
+    for data_id in data_id_list:
+        if str(data_id) not in found_ids:
+            errors.append(str(data_id))
+            progress.increment()
+    return success, errors
+
+
+def _migrate_data_batch(
+    data_list, target_template, compiled_xslt, migrate, progress
+):
+    """Migrate / validate a batch of data. All data of the batch are
+    validated first, then valid data are saved in a single transaction.
+
+    Args:
+        data_list:
+        target_template:
+        compiled_xslt:
+        migrate:
+        progress:
+
+    Returns:
+        list of valid ids, list of wrong ids
+    """
+    success = []
+    errors = []
+    data_to_save = []
+    for data in data_list:
+        try:
+            # modify the data temporarily with the new targeted template
+            data.template = target_template
+
+            if compiled_xslt is not None:
+                # modify the xml content temporarily with the transformed data content
+                data.xml_content = compiled_xslt.transform_xml(
+                    data.xml_content
+                )
+
+            # check if the data is valid
+            if data.template.format == Template.XSD:
+                data_api.check_xml_file_is_valid(data)
+            elif data.template.format == Template.JSON:
+                if migrate and not ENABLE_JSON_SCHEMA_SUPPORT:
+                    raise CoreError("Unsupported file format.")
+                data_api.check_json_file_is_valid(data)
+            else:
+                raise NotImplementedError(
+                    "Migration not available for this format"
+                )
+
+            if migrate:
+                data_to_save.append(data)
+            else:
+                success.append(str(data.id))
+                progress.increment()
+        except Exception:
+            errors.append(str(data.id))
+            progress.increment()
+
+    if data_to_save:
+        # save the new template for the data if the migration is True
+        # index the migrated data in MongoDB with a few bulk writes
+        with transaction.atomic(), bulk_index.coalesce_index_updates():
+            for data in data_to_save:
+                try:
+                    with transaction.atomic():
+                        data.convert_and_save()
+                    success.append(str(data.id))
+                except Exception:
+                    errors.append(str(data.id))
+                finally:
+                    progress.increment()
+
+    return success, errors
+
+
 def get_task_progress(task_id):
     """Get task status for the given task id
 
@@ -230,13 +575,58 @@ def get_task_progress(task_id):
         }
     """
     result = AsyncResult(task_id)
+    details = result.info
+    if isinstance(details, dict) and "chunk_task_ids" in details:
+        details = _get_aggregated_progress(details)
     response_data = {
         "state": result.state,
-        "details": result.info,
+        "details": details,
     }
     return response_data
 
 
+def _get_aggregated_progress(details):
+    """Sum the progress of the chunk subtasks of a migration task.
+
+    Args:
+        details:
+
+    Returns:
+
+    """
+    chunk_progress = []
+    for chunk_task_id in details["chunk_task_ids"]:
+        chunk_result = AsyncResult(chunk_task_id)
+        chunk_info = chunk_result.info
+        if chunk_result.state == "SUCCESS" and isinstance(chunk_info, dict):
+            chunk_progress.append(
+                (len(chunk_info["valid"]) + len(chunk_info["wrong"]), True)
+            )
+        elif isinstance(chunk_info, dict) and "current" in chunk_info:
+            chunk_progress.append((chunk_info["current"], False))
+        else:
+            chunk_progress.append((0, chunk_result.ready()))
+
+    current = sum(count for count, _ in chunk_progress)
+    if "chunk_templates" not in details:
+        return {"current": current, "total": details["total"]}
+
+    # index of the first template with unfinished chunks
+    template_current = details["template_total"] - 1
+    for template_index, (_, done) in zip(
+        details["chunk_templates"], chunk_progress
+    ):
+        if not done:
+            template_current = template_index
+            break
+    return {
+        "template_current": template_current,
+        "template_total": details["template_total"],
+        "data_current": current,
+        "data_total": details["data_total"],
+    }
+
+
 def get_task_result(task_id):
     """Get task result for the given task id
 
@@ -272,6 +662,26 @@ def index_mongo_data(data_id):
         )
 
 
+@shared_task
+def index_mongo_data_list(data_ids):
+    """Index a list of data in MongoDB with bulk writes
+
+    Args:
+        data_ids:
+
+    Returns:
+
+    """
+    try:
+        from core_main_app.components.mongo import bulk_index
+
+        bulk_index.index_data_ids(data_ids)
+    except Exception as exception:
+        logger.error(
+            f"ERROR : An error occurred while indexing data : {str(exception)}"
+        )
+
+
 @shared_task
 def update_mongo_data_user(data_ids, user_id):
     """Update user id of all data in list
@@ -284,12 +694,9 @@ def update_mongo_data_user(data_ids, user_id):
 
     """
     try:
-        from core_main_app.components.mongo.models import MongoData
+        from core_main_app.components.mongo import bulk_index
 
-        for data_id in data_ids:
-            mongo_data = MongoData.objects.get(pk=data_id)
-            mongo_data.user_id = user_id
-            mongo_data.save()
+        bulk_index.update_data_fields(data_ids, user_id=user_id)
     except Exception as exception:
         logger.error(
             f"ERROR : An error occurred while updating data owner : {str(exception)}"
@@ -308,12 +715,9 @@ def update_mongo_data_workspace(data_ids, workspace_id):
     """
 
     try:
-        from core_main_app.components.mongo.models import MongoData
+        from core_main_app.components.mongo import bulk_index
 
-        for data_id in data_ids:
-            mongo_data = MongoData.objects.get(pk=data_id)
-            mongo_data._workspace_id = workspace_id
-            mongo_data.save()
+        bulk_index.update_data_fields(data_ids, _workspace_id=workspace_id)
     except Exception as exception:
         logger.error(
             f"ERROR : An error occurred while updating data workspace : {str(exception)}"
@@ -0,0 +1,114 @@
+""" Flattened template API
+
+The flattened content of an XSD template is stored and served again as long
+as the checksums of the template and of its transitive dependencies are
+unchanged.
+"""
+import hashlib
+import logging
+
+from core_main_app.components.flattened_template.models import (
+    FlattenedTemplate,
+)
+from core_main_app.components.template.models import Template
+
+logger = logging.getLogger(__name__)
+
+
+def get_dependencies_checksum(template):
+    """Compute the checksum of the dependency graph of a template, from the
+    checksums of the template and of its transitive dependencies.
+
+    Args:
+        template:
+
+    Returns:
+
+    """
+    dependency_model = Template.dependencies.through
+    checksums = {template.pk: _get_template_checksum(template)}
+    template_ids = [template.pk]
+    # browse the dependency graph, one level at a time
+    while template_ids:
+        dependency_ids = set(
+            dependency_model.objects.filter(
+                from_template_id__in=template_ids
+            ).values_list("to_template_id", flat=True)
+        ).difference(checksums)
+        template_ids = []
+        for dependency in Template.objects.filter(pk__in=dependency_ids).only(
+            "id", "checksum", "_hash", "file"
+        ):
+            checksums[dependency.pk] = _get_template_checksum(dependency)
+            template_ids.append(dependency.pk)
+
+    hasher = hashlib.sha256()
+    for template_id, checksum in sorted(checksums.items()):
+        hasher.update(f"{template_id}:{checksum};".encode())
+    return hasher.hexdigest()
+
+
+def get_flat_content(template, request):
+    """Return the flattened content of an XSD template. The stored content is
+    returned if the dependency graph is unchanged, otherwise the template is
+    flattened and the store updated.
+
+    Args:
+        template:
+        request:
+
+    Returns:
+
+    """
+    dependencies_checksum = get_dependencies_checksum(template)
+    flattened_template = FlattenedTemplate.get_by_template_id(template.pk)
+    if (
+        flattened_template is not None
+        and flattened_template.dependencies_checksum == dependencies_checksum
+    ):
+        return flattened_template.content
+
+    content = _flatten(template.content, request)
+    try:
+        FlattenedTemplate.upsert(template.pk, dependencies_checksum, content)
+    except Exception as exception:
+        logger.warning(
+            "Unable to store the flattened content of template %s: %s",
+            str(template.pk),
+            str(exception),
+        )
+    return content
+
+
+def _flatten(xsd_string, request):
+    """Flatten an XSD string.
+
+    Args:
+        xsd_string:
+        request:
+
+    Returns:
+
+    """
+    from core_main_app.utils.xsd_flattener.xsd_flattener_database_url import (
+        XSDFlattenerDatabaseOrURL,
+    )
+
+    return XSDFlattenerDatabaseOrURL(xsd_string, request=request).get_flat()
+
+
+def _get_template_checksum(template):
+    """Return the checksum of a template: checksum computed on upload, or
+    template hash, or hash of the content.
+
+    Args:
+        template:
+
+    Returns:
+
+    """
+    if template.checksum:
+        return template.checksum
+    if template.hash:
+        return template.hash
+    return hashlib.sha256(template.content.encode("utf-8")).hexdigest()
@@ -0,0 +1,60 @@
+""" Flattened template model
+"""
+from django.db import models
+
+from core_main_app.components.template.models import Template
+
+
+class FlattenedTemplate(models.Model):
+    """Flattened content of an XSD template, valid as long as the checksums
+    of the template and of its transitive dependencies are unchanged."""
+
+    template = models.OneToOneField(
+        Template, on_delete=models.CASCADE, related_name="+"
+    )
+    dependencies_checksum = models.CharField(max_length=64)
+    content = models.TextField()
+    creation_date = models.DateTimeField(auto_now=True)
+
+    @staticmethod
+    def get_by_template_id(template_id):
+        """Return the flattened content of a template, None if not stored.
+
+        Args:
+            template_id:
+
+        Returns:
+
+        """
+        return FlattenedTemplate.objects.filter(
+            template_id=template_id
+        ).first()
+
+    @staticmethod
+    def upsert(template_id, dependencies_checksum, content):
+        """Store the flattened content of a template.
+
+        Args:
+            template_id:
+            dependencies_checksum:
+            content:
+
+        Returns:
+
+        """
+        flattened_template, _ = FlattenedTemplate.objects.update_or_create(
+            template_id=template_id,
+            defaults={
+                "dependencies_checksum": dependencies_checksum,
+                "content": content,
+            },
+        )
+        return flattened_template
+
+    def __str__(self):
+        """Flattened template as string
+
+        Returns:
+
+        """
+        return str(self.template_id)
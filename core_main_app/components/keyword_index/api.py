@@ -0,0 +1,225 @@
+""" Keyword index API
+
+Inverted index of the keywords of the data, used by the keyword search when
+the data are neither indexed in MongoDB nor stored in PostgreSQL.
+"""
+import logging
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import F, Q
+
+from core_main_app.components.keyword_index.models import (
+    DataKeyword,
+    KEYWORD_MAX_LENGTH,
+)
+from core_main_app.settings import KEYWORD_INDEX_ENABLED
+from core_main_app.utils.databases.backend import uses_postgresql_backend
+
+logger = logging.getLogger(__name__)
+
+KEYWORD_SCORE_FIELD = "keyword_score"
+
+
+def is_keyword_index_enabled():
+    """Return True if the keyword index is maintained and used for the
+    keyword search (not used with MongoDB indexing).
+
+    Returns:
+
+    """
+    return KEYWORD_INDEX_ENABLED and not settings.MONGODB_INDEXING
+
+
+def get_keywords(text):
+    """Return the distinct keywords of a text (lowercase words).
+
+    Args:
+        text:
+
+    Returns:
+
+    """
+    return list(
+        dict.fromkeys(
+            keyword[:KEYWORD_MAX_LENGTH]
+            for keyword in re.findall(r"\w+", str(text).lower())
+        )
+    )
+
+
+def get_keyword_counts(dict_content):
+    """Count the keywords in the values of a data dictionary.
+
+    Args:
+        dict_content:
+
+    Returns:
+        Counter of keywords
+
+    """
+    keyword_counts = Counter()
+    values = [dict_content]
+    while values:
+        value = values.pop()
+        if isinstance(value, dict):
+            values.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            values.extend(value)
+        elif isinstance(value, (str, int, float)) and not isinstance(
+            value, bool
+        ):
+            keyword_counts.update(
+                keyword[:KEYWORD_MAX_LENGTH]
+                for keyword in re.findall(r"\w+", str(value).lower())
+            )
+    return keyword_counts
+
+
+def index_data(data):
+    """Replace the keywords of a data in the index.
+
+    Args:
+        data:
+
+    Returns:
+
+    """
+    DataKeyword.replace_data_keywords(
+        data.pk, get_keyword_counts(data.dict_content)
+    )
+
+
+def index_data_list(data_list):
+    """Replace the keywords of a list of data in the index.
+
+    Args:
+        data_list:
+
+    Returns:
+
+    """
+    data_ids = [data.pk for data in data_list]
+    DataKeyword.objects.filter(data_id__in=data_ids).delete()
+    DataKeyword.objects.bulk_create(
+        [
+            DataKeyword(data_id=data.pk, keyword=keyword, count=count)
+            for data in data_list
+            for keyword, count in get_keyword_counts(data.dict_content).items()
+        ],
+        batch_size=1000,
+    )
+
+
+def rebuild_keyword_index(batch_size=500):
+    """Index the keywords of all the data.
+
+    Args:
+        batch_size:
+
+    Returns:
+        number of indexed data
+
+    """
+    from core_main_app.components.data.models import Data
+
+    indexed_count = 0
+    batch = []
+    for data in Data.objects.only("id", "dict_content").iterator(
+        chunk_size=batch_size
+    ):
+        batch.append(data)
+        if len(batch) >= batch_size:
+            index_data_list(batch)
+            indexed_count += len(batch)
+            batch = []
+    if batch:
+        index_data_list(batch)
+        indexed_count += len(batch)
+    return indexed_count
+
+
+def post_save_data(
+    sender, instance, created=False, update_fields=None, **kwargs
+):
+    """Update the keywords of a data when it is saved.
+
+    Args:
+        sender:
+        instance:
+        created:
+        update_fields:
+        **kwargs:
+
+    Returns:
+
+    """
+    if update_fields is not None and "dict_content" not in update_fields:
+        return
+    if "dict_content" in instance.get_deferred_fields():
+        return
+    try:
+        index_data(instance)
+    except Exception as exception:
+        logger.error(
+            "Unable to index the keywords of data %s: %s",
+            str(instance.pk),
+            str(exception),
+        )
+
+
+def get_keyword_filter(text):
+    """Return the filter selecting the data containing all the keywords of
+    the text.
+
+    Args:
+        text:
+
+    Returns:
+
+    """
+    keywords = get_keywords(text)
+    if not keywords:
+        return Q()
+    return Q(pk__in=DataKeyword.get_data_ids_with_keywords(keywords))
+
+
+def rank_by_keywords(data_list, text):
+    """Sort the results of a keyword search by relevance (best first):
+    textScore with MongoDB, SearchRank with PostgreSQL, number of
+    occurrences of the keywords with the keyword index.
+
+    Args:
+        data_list: results of the keyword search
+        text: searched text
+
+    Returns:
+        data_list, unchanged if the text has no keywords (no full text
+        query to rank by)
+
+    """
+    keywords = get_keywords(text)
+    if not keywords:
+        return data_list
+
+    if settings.MONGODB_INDEXING:
+        return data_list.order_by("$text_score")
+
+    if uses_postgresql_backend():
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        return data_list.annotate(
+            **{
+                KEYWORD_SCORE_FIELD: SearchRank(
+                    F("vector_column"), SearchQuery(text)
+                )
+            }
+        ).order_by(f"-{KEYWORD_SCORE_FIELD}", "pk")
+
+    if is_keyword_index_enabled():
+        return data_list.annotate(
+            **{KEYWORD_SCORE_FIELD: DataKeyword.get_score_subquery(keywords)}
+        ).order_by(f"-{KEYWORD_SCORE_FIELD}", "pk")
+
+    return data_list
@@ -0,0 +1,92 @@
+""" Keyword index model
+"""
+from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Sum
+
+from core_main_app.components.data.models import Data
+
+KEYWORD_MAX_LENGTH = 100
+
+
+class DataKeyword(models.Model):
+    """Inverted index entry: number of occurrences of a keyword in a data"""
+
+    data = models.ForeignKey(Data, on_delete=models.CASCADE, related_name="+")
+    keyword = models.CharField(max_length=KEYWORD_MAX_LENGTH)
+    count = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        """Meta"""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["keyword", "data"],
+                name="core_main_app_data_keyword_unique",
+            )
+        ]
+
+    @staticmethod
+    def get_data_ids_with_keywords(keywords):
+        """Return the ids of the data containing all the keywords.
+
+        Args:
+            keywords: list of distinct keywords
+
+        Returns:
+            queryset of data ids
+
+        """
+        return (
+            DataKeyword.objects.filter(keyword__in=keywords)
+            .values("data_id")
+            .annotate(keyword_matches=Count("keyword"))
+            .filter(keyword_matches=len(keywords))
+            .values("data_id")
+        )
+
+    @staticmethod
+    def get_score_subquery(keywords):
+        """Return the subquery computing the score of a data for the
+        keywords: total number of occurrences of the keywords.
+
+        Args:
+            keywords:
+
+        Returns:
+
+        """
+        return Subquery(
+            DataKeyword.objects.filter(
+                data_id=OuterRef("pk"), keyword__in=keywords
+            )
+            .values("data_id")
+            .annotate(score=Sum("count"))
+            .values("score")[:1]
+        )
+
+    @staticmethod
+    def replace_data_keywords(data_id, keyword_counts):
+        """Replace the index entries of a data.
+
+        Args:
+            data_id:
+            keyword_counts: number of occurrences by keyword
+
+        Returns:
+
+        """
+        DataKeyword.objects.filter(data_id=data_id).delete()
+        DataKeyword.objects.bulk_create(
+            [
+                DataKeyword(data_id=data_id, keyword=keyword, count=count)
+                for keyword, count in keyword_counts.items()
+            ]
+        )
+
+    def __str__(self):
+        """Data keyword as string
+
+        Returns:
+
+        """
+        return f"{self.keyword} ({self.data_id})"
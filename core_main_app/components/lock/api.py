@@ -3,10 +3,7 @@
 """
 import logging
 
-from core_main_app.commons.exceptions import LockError
-from core_main_app.components.lock.models import Lock
-from core_main_app.settings import LOCK_OBJECT_TTL
-from core_main_app.utils.datetime import datetime_now
+from core_main_app.components.lock.models import DatabaseLockObject
 
 logger = logging.getLogger(__name__)
 
@@ -18,30 +15,24 @@ def is_object_locked(object, user):
         object:
     Returns:
     """
-    try:
-        lock = Lock.acquire()
-        _check_object_locked(object, user, lock)
-        return False
-    except LockError:
+    if DatabaseLockObject.is_locked_by_other_user(object, str(user.id)):
+        logger.warning(
+            "is_object_locked: A user asked to access a locked object."
+        )
         return True
-    finally:
-        Lock.release()
+    return False
 
 
 def set_lock_object(object, user):
-    """Set lock on object.
+    """Set lock on object. Raise LockError if the object is locked by another
+    user.
 
     Args:
         object:
         user:
     Returns:
     """
-    try:
-        lock = Lock.acquire()
-        if not _check_object_locked(object, user, lock):
-            lock.set_lock(object, user)
-    finally:
-        Lock.release()
+    DatabaseLockObject.acquire(object, str(user.id))
 
 
 def remove_lock_on_object(object, user):
@@ -53,49 +44,19 @@ def remove_lock_on_object(object, user):
     Returns:
     """
     try:
-        lock = Lock.acquire()
-        database_lock_object = lock.get_object_locked(object)
         # Only the user who created the lock can remove it
-        if database_lock_object.user_id == str(user.id):
-            lock.remove_lock(database_lock_object)
+        DatabaseLockObject.release(object, str(user.id))
     except Exception as exception:
         logger.warning(
             "remove_lock_on_object threw an exception: %s", str(exception)
         )
-    finally:
-        Lock.release()
 
 
-def _check_object_locked(object, user, lock):
-    """Check all conditions of a lock object to define if it is locked or not.
-        If there is no lock on object, return false.
-        If there is a lock but owned by the user, return true.
-        If there is a lock no owned by the user, raise LockError exception.
-
-    Args:
-        object:
-        user:
-        lock:
+def delete_expired_locks():
+    """Delete the expired locks.
 
     Returns:
-    """
-    try:
-        database_lock_object = lock.get_object_locked(object)
-    except Exception:
-        return False
-
-    # Check if lock has expired
-    date = database_lock_object.lock_date
-    if (datetime_now() - date).total_seconds() > LOCK_OBJECT_TTL:
-        lock.remove_lock(database_lock_object)
-        return False
+        number of deleted locks
 
-    # If the user who requested the object is the same as the one who locked the object
-    # then it is not locked for him
-    if database_lock_object.user_id == str(user.id):
-        return True
-
-    logger.warning(
-        "_check_object_locked: A user asked to access a locked object."
-    )
-    raise LockError("The object is used by another user and is locked.")
+    """
+    return DatabaseLockObject.delete_expired()
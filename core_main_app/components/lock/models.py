@@ -1,114 +1,178 @@
 """
  Lock model
 """
-import threading
-
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.db import IntegrityError, models, transaction
 
 from core_main_app.commons import exceptions
 from core_main_app.components.data.models import Data
-from core_main_app.utils.datetime import datetime_now
+from core_main_app.settings import LOCK_OBJECT_TTL
+from core_main_app.utils.datetime import datetime_now, datetime_timedelta
+
 
-sem = threading.Semaphore()
+def get_lock_expiry_date():
+    """Return the date before which the locks are expired
 
+    Returns:
 
-class Lock:
     """
-    Class Lock. Singleton thread safe.
-    Only this object should be called to be used for an action regarding locking a Document.
+    return datetime_now() - datetime_timedelta(seconds=LOCK_OBJECT_TTL)
+
+
+class DatabaseLockObject(models.Model):
     """
+    Class DatabaseLockObject.
 
-    __singleton_lock = threading.Lock()
-    __singleton_instance = None
+    A document has at most one lock row (unique constraint on object): locks
+    are acquired with a conditional update or an insert, and the TTL is
+    enforced in the queries, so operations on different documents never
+    contend, including across processes.
+    """
 
-    @classmethod
-    def acquire(cls):
-        """acquire.
+    object = models.ForeignKey(Data, blank=False, on_delete=models.CASCADE)
+    user_id = models.CharField(blank=False, max_length=200)
+    lock_date = models.DateTimeField(blank=False)
 
-        Args:
-            cls:
+    class Meta:
+        """Meta"""
 
-        Returns:
-        """
-        if not cls.__singleton_instance:
-            with cls.__singleton_lock:
-                if not cls.__singleton_instance:
-                    cls.__singleton_instance = cls()
-        sem.acquire()
-        return cls.__singleton_instance
+        constraints = [
+            models.UniqueConstraint(
+                fields=["object"], name="core_main_app_lock_unique_object"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["lock_date"], name="core_main_app_lock_date_idx"
+            )
+        ]
 
-    @classmethod
-    def release(cls):
-        """release.
+    @staticmethod
+    def get_lock_by_object(obj):
+        """Get lock relative to the given object.
 
         Args:
-            cls:
+            obj:
 
         Returns:
+
         """
-        sem.release()
+        return DatabaseLockObject.objects.get(object=obj)
 
-    def set_lock(self, object, user):
-        """Set lock on a Document.
+    @staticmethod
+    def get_active_lock_by_object(obj):
+        """Get the lock of the given object if not expired, None otherwise.
 
         Args:
-            object:
-            user:
+            obj:
 
         Returns:
+
         """
-        database_lock_object = DatabaseLockObject()
-        database_lock_object.object = object
-        database_lock_object.user_id = str(user.id)
-        database_lock_object.lock_date = datetime_now()
-        database_lock_object.save()
+        return DatabaseLockObject.objects.filter(
+            object=obj, lock_date__gte=get_lock_expiry_date()
+        ).first()
 
-    def remove_lock(self, database_lock_object):
-        """Remove a lock.
+    @staticmethod
+    def is_locked_by_other_user(obj, user_id):
+        """Check if the given object has an active lock owned by another user.
 
         Args:
-            database_lock_object:
+            obj:
+            user_id:
 
         Returns:
+
         """
-        database_lock_object.delete()
+        return (
+            DatabaseLockObject.objects.filter(
+                object=obj, lock_date__gte=get_lock_expiry_date()
+            )
+            .exclude(user_id=user_id)
+            .exists()
+        )
 
-    def get_object_locked(self, object):
-        """Get the locked object.
+    @staticmethod
+    def acquire(obj, user_id):
+        """Lock the given object for the user. Take over the lock if it
+        expired, keep it if already owned by the user, raise LockError if
+        another user owns it.
 
         Args:
-            object:
+            obj:
+            user_id:
+
         Returns:
+
         """
+        # take over an expired lock
+        if DatabaseLockObject.objects.filter(
+            object=obj, lock_date__lt=get_lock_expiry_date()
+        ).update(user_id=user_id, lock_date=datetime_now()):
+            return
+
         try:
-            return DatabaseLockObject.get_lock_by_object(object)
-        except ObjectDoesNotExist as exception:
-            raise exceptions.DoesNotExist(str(exception))
-        except Exception as ex:
-            raise exceptions.ModelError(str(ex))
+            with transaction.atomic():
+                DatabaseLockObject.objects.create(
+                    object=obj, user_id=user_id, lock_date=datetime_now()
+                )
+            return
+        except IntegrityError:
+            # the object is already locked
+            pass
+
+        database_lock_object = DatabaseLockObject.get_active_lock_by_object(
+            obj
+        )
+        if database_lock_object is None:
+            # the lock expired in between: take it over
+            if DatabaseLockObject.objects.filter(
+                object=obj, lock_date__lt=get_lock_expiry_date()
+            ).update(user_id=user_id, lock_date=datetime_now()):
+                return
+        elif database_lock_object.user_id == user_id:
+            return
+        raise exceptions.LockError(
+            "The object is used by another user and is locked."
+        )
 
+    @staticmethod
+    def release(obj, user_id):
+        """Remove the lock of the given object if owned by the user.
 
-class DatabaseLockObject(models.Model):
-    """
-    Class DatabaseLockObject.
-    """
+        Args:
+            obj:
+            user_id:
 
-    object = models.ForeignKey(Data, blank=False, on_delete=models.CASCADE)
-    user_id = models.CharField(blank=False, max_length=200)
-    lock_date = models.DateTimeField(blank=False)
+        Returns:
+
+        """
+        DatabaseLockObject.objects.filter(object=obj, user_id=user_id).delete()
 
     @staticmethod
-    def get_lock_by_object(obj):
-        """Get lock relative to the given object.
+    def delete_expired(batch_size=1000):
+        """Delete the expired locks by batches.
 
         Args:
-            obj:
+            batch_size:
 
         Returns:
+            number of deleted locks
 
         """
-        return DatabaseLockObject.objects.get(object=obj)
+        expiry_date = get_lock_expiry_date()
+        deleted_count = 0
+        while True:
+            lock_ids = list(
+                DatabaseLockObject.objects.filter(
+                    lock_date__lt=expiry_date
+                ).values_list("id", flat=True)[:batch_size]
+            )
+            if not lock_ids:
+                return deleted_count
+            deleted, _ = DatabaseLockObject.objects.filter(
+                id__in=lock_ids
+            ).delete()
+            deleted_count += deleted
 
     def __str__(self):
         """Database Lock as string
@@ -0,0 +1,57 @@
+""" Lock tasks
+"""
+import logging
+
+from celery import shared_task
+from django.apps import apps
+
+from core_main_app.components.lock import api as lock_api
+from core_main_app.settings import LOCK_EXPIRY_SWEEP_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+DELETE_EXPIRED_LOCKS_TASK_NAME = "core_main_app.delete_expired_locks"
+
+
+@shared_task
+def delete_expired_locks():
+    """Delete the expired locks"""
+    try:
+        deleted_count = lock_api.delete_expired_locks()
+        logger.info("%d expired locks deleted.", deleted_count)
+    except Exception as exception:
+        logger.error(
+            "ERROR : An error occurred while deleting expired locks : %s",
+            str(exception),
+        )
+
+
+def init_delete_expired_locks_periodic_task():
+    """Schedule the periodic deletion of the expired locks with celery beat,
+    every LOCK_EXPIRY_SWEEP_INTERVAL seconds (disabled if 0).
+
+    Returns:
+
+    """
+    if not apps.is_installed("django_celery_beat"):
+        return
+
+    from django_celery_beat.models import IntervalSchedule, PeriodicTask
+
+    if LOCK_EXPIRY_SWEEP_INTERVAL <= 0:
+        PeriodicTask.objects.filter(
+            name=DELETE_EXPIRED_LOCKS_TASK_NAME
+        ).update(enabled=False)
+        return
+
+    schedule, _ = IntervalSchedule.objects.get_or_create(
+        every=LOCK_EXPIRY_SWEEP_INTERVAL, period=IntervalSchedule.SECONDS
+    )
+    PeriodicTask.objects.update_or_create(
+        name=DELETE_EXPIRED_LOCKS_TASK_NAME,
+        defaults={
+            "interval": schedule,
+            "task": f"{delete_expired_locks.__module__}.delete_expired_locks",
+            "enabled": True,
+        },
+    )
@@ -0,0 +1,182 @@
+""" Bulk synchronization of the MongoDB index
+"""
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
+
+from core_main_app.components.data.models import Data
+from core_main_app.settings import MONGODB_INDEX_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+_coalescing = threading.local()
+
+
+@contextmanager
+def coalesce_index_updates():
+    """Collect the data saved in the block and index them in batches.
+
+    The post_save signals sent inside the block do not index the data one by
+    one: their ids are collected and indexed with a few bulk writes, every
+    MONGODB_INDEX_BATCH_SIZE data and when leaving the block. Blocks can be
+    nested, the outermost block flushes the remaining ids.
+
+    Returns:
+
+    """
+    depth = getattr(_coalescing, "depth", 0)
+    if depth == 0:
+        _coalescing.data_ids = []
+    _coalescing.depth = depth + 1
+    try:
+        yield
+    finally:
+        _coalescing.depth = depth
+        if depth == 0:
+            data_ids = _coalescing.data_ids
+            _coalescing.data_ids = []
+            _flush(data_ids)
+
+
+def defer_index(data_id):
+    """Collect a data id if called in a coalesce_index_updates block.
+
+    Args:
+        data_id:
+
+    Returns:
+        bool: True if the data will be indexed when the block is left
+
+    """
+    if not getattr(_coalescing, "depth", 0):
+        return False
+    _coalescing.data_ids.append(data_id)
+    if len(_coalescing.data_ids) >= MONGODB_INDEX_BATCH_SIZE:
+        data_ids = _coalescing.data_ids
+        _coalescing.data_ids = []
+        _flush(data_ids)
+    return True
+
+
+def _flush(data_ids):
+    """Index a list of data ids, in a Celery task if MONGODB_ASYNC_SAVE.
+
+    Args:
+        data_ids:
+
+    Returns:
+
+    """
+    if not data_ids:
+        return
+    # the same data can be saved several times in a block
+    data_ids = list(dict.fromkeys(str(data_id) for data_id in data_ids))
+    if settings.MONGODB_ASYNC_SAVE:
+        from core_main_app.components.data.tasks import index_mongo_data_list
+
+        # send the task once the data is visible to the workers
+        transaction.on_commit(
+            lambda: index_mongo_data_list.apply_async((data_ids,))
+        )
+    else:
+        index_data_ids(data_ids)
+
+
+def index_data_ids(data_ids):
+    """Index a list of data in MongoDB with bulk writes.
+
+    Args:
+        data_ids:
+
+    Returns:
+
+    """
+    for start in range(0, len(data_ids), MONGODB_INDEX_BATCH_SIZE):
+        data_list = Data.objects.filter(
+            pk__in=data_ids[start : start + MONGODB_INDEX_BATCH_SIZE]
+        ).select_related("template")
+        index_data_list(list(data_list))
+
+
+def index_data_list(data_list, dict_content_list=None):
+    """Insert or replace the MongoData of a list of data in one bulk write.
+
+    Args:
+        data_list:
+        dict_content_list: converted contents of the data, computed if None
+
+    Returns:
+
+    """
+    from bson import ObjectId
+    from pymongo import ReplaceOne
+    from core_main_app.components.mongo.models import MongoData
+
+    if not data_list:
+        return
+    if dict_content_list is None:
+        dict_content_list = [None] * len(data_list)
+
+    # keep the mongo_id of the documents already indexed
+    mongo_ids = {
+        mongo_data.data_id: mongo_data.mongo_id
+        for mongo_data in MongoData.objects(
+            data_id__in=[data.id for data in data_list]
+        ).only("data_id", "mongo_id")
+    }
+    operations = []
+    for data, dict_content in zip(data_list, dict_content_list):
+        try:
+            mongo_data = MongoData.set_data_fields(
+                MongoData(mongo_id=mongo_ids.get(data.id) or ObjectId()),
+                data,
+                dict_content=dict_content,
+            )
+            mongo_data.validate()
+        except Exception as exception:
+            logger.error(
+                f"ERROR : An error occurred while indexing data {str(data.id)} : {str(exception)}"
+            )
+            continue
+        operations.append(
+            ReplaceOne(
+                {"_id": mongo_data.data_id},
+                mongo_data.to_mongo().to_dict(),
+                upsert=True,
+            )
+        )
+    if operations:
+        _get_collection().bulk_write(operations, ordered=False)
+
+
+def _get_collection():
+    """Return the pymongo collection of MongoData
+
+    Returns:
+
+    """
+    from core_main_app.components.mongo.models import MongoData
+
+    return MongoData._get_collection()
+
+
+def update_data_fields(data_ids, **fields):
+    """Update fields of the MongoData of a list of data with update_many.
+
+    Args:
+        data_ids:
+        **fields: MongoData field names and values
+
+    Returns:
+
+    """
+    from core_main_app.components.mongo.models import MongoData
+
+    data_ids = [int(data_id) for data_id in data_ids]
+    for start in range(0, len(data_ids), MONGODB_INDEX_BATCH_SIZE):
+        MongoData.objects(
+            data_id__in=data_ids[start : start + MONGODB_INDEX_BATCH_SIZE]
+        ).update(**{f"set__{field}": value for field, value in fields.items()})
@@ -12,6 +12,7 @@ from core_main_app.components.data.tasks import (
     update_mongo_data_user,
     update_mongo_data_workspace,
 )
+from core_main_app.components.mongo import bulk_index
 from core_main_app.components.template.models import Template
 from core_main_app.components.workspace.models import Workspace
 from core_main_app.settings import (
@@ -40,6 +41,8 @@ try:
             last_modification_date = mongo_fields.DateTimeField()
             last_change_date = mongo_fields.DateTimeField()
             mongo_id = mongo_fields.ObjectIdField()
+            # related objects loaded by the batch resolvers
+            _related_cache = None
 
             meta = {
                 "abstract": True,
@@ -53,6 +56,19 @@ try:
                 """
                 return self.dict_content
 
+            def set_related(self, **related):
+                """Cache related objects (e.g. template=...) loaded in batch
+
+                Args:
+                    **related:
+
+                Returns:
+
+                """
+                if self._related_cache is None:
+                    self._related_cache = {}
+                self._related_cache.update(related)
+
             @staticmethod
             def post_save_data(sender, instance, **kwargs):
                 """post_save_data
@@ -105,6 +121,8 @@ try:
                 Returns:
 
                 """
+                if self._related_cache and "template" in self._related_cache:
+                    return self._related_cache["template"]
                 return Template.get_by_id(self._template_id)
 
             @property
@@ -114,6 +132,8 @@ try:
                 Returns:
 
                 """
+                if self._related_cache and "blob" in self._related_cache:
+                    return self._related_cache["blob"]
                 try:
                     return Data.get_by_id(self.data_id)._blob
                 except Exception:
@@ -147,6 +167,8 @@ try:
                 Returns:
 
                 """
+                if self._related_cache and "workspace" in self._related_cache:
+                    return self._related_cache["workspace"]
                 return (
                     Workspace.get_by_id(self._workspace_id)
                     if self._workspace_id
@@ -230,15 +252,29 @@ try:
                     # create new mongo data otherwise
                     mongo_data = MongoData()
                     mongo_data.mongo_id = ObjectId()
-                # Get template
-                data_template = data.template
+                return MongoData.set_data_fields(mongo_data, data)
+
+            @staticmethod
+            def set_data_fields(mongo_data, data, dict_content=None):
+                """Set the fields of mongo data from data
+
+                Args:
+                    mongo_data:
+                    data:
+                    dict_content: converted content, computed if None
+
+                Returns:
+
+                """
                 # Initialize mongo data fields
                 mongo_data.data_id = data.id
                 mongo_data.title = data.title
-                if data_template.format == Template.JSON:
+                if dict_content is not None:
+                    mongo_data.dict_content = dict_content
+                elif data.template.format == Template.JSON:
                     # store python dict
                     mongo_data.dict_content = load_json_string(data.content)
-                elif data_template.format == Template.XSD:
+                elif data.template.format == Template.XSD:
                     # transform xml content into a dictionary
                     mongo_data.dict_content = xml_utils.raw_xml_to_dict(
                         data.xml_content,
@@ -247,13 +283,9 @@ try:
                         list_limit=SEARCHABLE_DATA_OCCURRENCES_LIMIT,
                     )
 
-                mongo_data._template_id = (
-                    data_template.id if data_template else None
-                )
+                mongo_data._template_id = data.template_id
                 mongo_data.user_id = data.user_id if data.user_id else None
-                mongo_data._workspace_id = (
-                    data.workspace.id if data.workspace else None
-                )
+                mongo_data._workspace_id = data.workspace_id
                 mongo_data.creation_date = data.creation_date
                 mongo_data.last_modification_date = data.last_modification_date
                 mongo_data.last_change_date = data.last_change_date
@@ -279,10 +311,7 @@ try:
                         )
                     )
                 else:
-                    for data_id in data_ids:
-                        mongo_data = MongoData.objects.get(pk=data_id)
-                        mongo_data.user_id = user_id
-                        mongo_data.save()
+                    bulk_index.update_data_fields(data_ids, user_id=user_id)
 
             @staticmethod
             def update_workspace_id_from_queryset(data_queryset, workspace_id):
@@ -304,10 +333,9 @@ try:
                         )
                     )
                 else:
-                    for data_id in data_ids:
-                        mongo_data = MongoData.objects.get(pk=data_id)
-                        mongo_data._workspace_id = workspace_id
-                        mongo_data.save()
+                    bulk_index.update_data_fields(
+                        data_ids, _workspace_id=workspace_id
+                    )
 
             @staticmethod
             def post_save_data(sender, instance, **kwargs):
@@ -318,6 +346,9 @@ try:
                     **kwargs: Args.
 
                 """
+                if bulk_index.defer_index(instance.id):
+                    # indexed in bulk at the end of the block
+                    return
                 if settings.MONGODB_ASYNC_SAVE:
                     index_mongo_data.apply_async((str(instance.id),))
                 else:
@@ -14,6 +14,7 @@ from core_main_app.components.template_version_manager.models import (
 )
 from core_main_app.components.version_manager.models import Version
 from core_main_app.settings import XSD_UPLOAD_DIR, CHECKSUM_ALGORITHM
+from core_main_app.utils import performance
 from core_main_app.utils.checksum import compute_checksum
 from core_main_app.utils.file import (
     get_template_file_content_type_for_template_format,
@@ -89,7 +90,9 @@ class Template(Version):
 
         """
         if not self._content:
-            self._content = self.file.read().decode("utf-8")
+            file_content = self.file.read()
+            performance.record_bytes_read(len(file_content))
+            self._content = file_content.decode("utf-8")
         return self._content
 
     @content.setter
@@ -258,9 +261,11 @@ class Template(Version):
         try:
             self._cls = self.class_name
             if self._content:
+                file_content = self._content.encode("utf-8")
+                performance.record_bytes_written(len(file_content))
                 self.file = SimpleUploadedFile(
                     name=self.filename,
-                    content=self._content.encode("utf-8"),
+                    content=file_content,
                     content_type=get_template_file_content_type_for_template_format(
                         self.format
                     ),
@@ -10,6 +10,9 @@ from core_main_app.components.workspace import (
 )
 from core_main_app.components.workspace.models import Workspace
 from core_main_app.permissions import api as permission_api
+from core_main_app.utils.cache import (
+    workspace_access as workspace_access_cache,
+)
 
 
 def create_and_save(title, owner_id=None, is_public=False):
@@ -129,6 +132,7 @@ def get_by_id_list(list_workspace_id):
 
 def get_all_workspaces_with_read_access_by_user(user):
     """Get all workspaces with read access for the given user.
+    The result is cached (see utils.cache.workspace_access).
 
     Args:
         user
@@ -136,16 +140,19 @@ def get_all_workspaces_with_read_access_by_user(user):
     Returns:
 
     """
-    read_permissions = (
-        permission_api.get_all_workspace_permissions_user_can_read(user)
-    )
-    return Workspace.get_all_workspaces_with_read_access_by_user_id(
-        user.id, read_permissions
+    return workspace_access_cache.get_accessible_workspaces(
+        user,
+        workspace_access_cache.READ_ACCESS,
+        lambda: Workspace.get_all_workspaces_with_read_access_by_user_id(
+            user.id,
+            permission_api.get_all_workspace_permissions_user_can_read(user),
+        ).values_list("id", flat=True),
     )
 
 
 def get_all_workspaces_with_write_access_by_user(user):
     """Get all workspaces with write access for the given user.
+    The result is cached (see utils.cache.workspace_access).
 
     Args:
         user
@@ -153,11 +160,13 @@ def get_all_workspaces_with_write_access_by_user(user):
     Returns:
 
     """
-    write_permissions = (
-        permission_api.get_all_workspace_permissions_user_can_write(user)
-    )
-    return Workspace.get_all_workspaces_with_write_access_by_user_id(
-        user.id, write_permissions
+    return workspace_access_cache.get_accessible_workspaces(
+        user,
+        workspace_access_cache.WRITE_ACCESS,
+        lambda: Workspace.get_all_workspaces_with_write_access_by_user_id(
+            user.id,
+            permission_api.get_all_workspace_permissions_user_can_write(user),
+        ).values_list("id", flat=True),
     )
 
 
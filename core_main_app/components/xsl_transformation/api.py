@@ -4,7 +4,7 @@ from core_main_app.commons import exceptions
 from core_main_app.components.xsl_transformation.models import (
     XslTransformation,
 )
-from core_main_app.utils import xml
+from core_main_app.utils.cache import xslt as xslt_cache
 from core_main_app.utils.xml import is_well_formed_xml, has_xsl_namespace
 
 
@@ -81,7 +81,7 @@ def xsl_transform(xml_content, xslt_name):
     xslt_object = get_by_name(xslt_name)
 
     try:
-        return xml.xsl_transform(xml_content, xslt_object.content)
+        return xslt_cache.xsl_transform(xml_content, xslt_object)
     except Exception:
         raise exceptions.ApiError(
             "An unexpected exception happened while transforming the XML"
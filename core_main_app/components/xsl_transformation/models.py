@@ -8,6 +8,7 @@ from django.db import models, IntegrityError
 from core_main_app.commons import exceptions
 from core_main_app.commons.regex import NOT_EMPTY_OR_WHITESPACES
 from core_main_app.settings import XSLT_UPLOAD_DIR, CHECKSUM_ALGORITHM
+from core_main_app.utils import performance
 from core_main_app.utils.checksum import compute_checksum
 from core_main_app.utils.storage.storage import core_file_storage
 
@@ -57,7 +58,9 @@ class XslTransformation(models.Model):
 
         """
         if not self._content:
-            self._content = self.file.read().decode("utf-8")
+            file_content = self.file.read()
+            performance.record_bytes_read(len(file_content))
+            self._content = file_content.decode("utf-8")
         return self._content
 
     @content.setter
@@ -147,9 +150,11 @@ class XslTransformation(models.Model):
         """
         try:
             if self._content:
+                file_content = self._content.encode("utf-8")
+                performance.record_bytes_written(len(file_content))
                 self.file = SimpleUploadedFile(
                     name=self.filename,
-                    content=self._content.encode("utf-8"),
+                    content=file_content,
                     content_type="application/xml",
                 )
             if self.content and CHECKSUM_ALGORITHM:
@@ -0,0 +1,48 @@
+""" Access Control Middleware
+"""
+import logging
+
+from django.conf import settings
+
+from core_main_app.utils.cache import (
+    workspace_access as workspace_access_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class WorkspaceAccessCacheMiddleware:
+    """Compute the workspaces accessible by the user once per request"""
+
+    def __init__(self, get_response):
+        """Init middleware
+
+        Args:
+            get_response:
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Call Middleware
+
+        Args:
+            request:
+
+        Returns:
+
+        """
+        with workspace_access_cache.request_scope():
+            response = self.get_response(request)
+            acl_stats = workspace_access_cache.get_request_stats()
+        request.acl_stats = acl_stats
+
+        logger.debug(
+            "%s %s: %d ACL queries, %d ACL cache hits",
+            request.method,
+            request.path,
+            acl_stats["acl_queries"],
+            acl_stats["acl_cache_hits"],
+        )
+        if settings.DEBUG:
+            response["X-ACL-Queries"] = str(acl_stats["acl_queries"])
+        return response
@@ -0,0 +1,50 @@
+""" Performance Middleware
+"""
+import logging
+
+from core_main_app.utils import performance
+
+logger = logging.getLogger(__name__)
+
+
+class PerformanceMiddleware:
+    """Instrument a sample of the requests and aggregate their metrics.
+    Should be placed before WorkspaceAccessCacheMiddleware to include the
+    ACL statistics of the request.
+    """
+
+    def __init__(self, get_response):
+        """Init middleware
+
+        Args:
+            get_response:
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Call Middleware
+
+        Args:
+            request:
+
+        Returns:
+
+        """
+        if not performance.is_sampled():
+            return self.get_response(request)
+
+        with performance.request_scope() as metrics:
+            response = self.get_response(request)
+        summary = metrics.get_summary(getattr(request, "acl_stats", None))
+        performance.PERFORMANCE_STATS.add(summary)
+
+        logger.debug(
+            "%s %s: %.1f ms, %d SQL queries, %d MongoDB commands",
+            request.method,
+            request.path,
+            summary["total_ms"],
+            summary["sql_count"],
+            summary["mongo_count"],
+        )
+        response["Server-Timing"] = performance.get_server_timing(summary)
+        return response
@@ -0,0 +1,56 @@
+""" Migration to allow at most one lock per data, and index the lock date.
+"""
+from django.db import migrations, models
+
+
+def delete_duplicate_locks(apps, schema_editor):
+    """Keep the most recent lock of each data
+
+    Args:
+        apps:
+        schema_editor:
+
+    Returns:
+
+    """
+    database_lock_object_model = apps.get_model(
+        "core_main_app", "DatabaseLockObject"
+    )
+    kept_object_ids = set()
+    duplicate_lock_ids = []
+    for lock_id, object_id in database_lock_object_model.objects.order_by(
+        "-lock_date", "-id"
+    ).values_list("id", "object_id"):
+        if object_id in kept_object_ids:
+            duplicate_lock_ids.append(lock_id)
+        else:
+            kept_object_ids.add(object_id)
+    database_lock_object_model.objects.filter(
+        id__in=duplicate_lock_ids
+    ).delete()
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("core_main_app", "0009_template_formats"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicate_locks, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="databaselockobject",
+            constraint=models.UniqueConstraint(
+                fields=("object",), name="core_main_app_lock_unique_object"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="databaselockobject",
+            index=models.Index(
+                fields=["lock_date"], name="core_main_app_lock_date_idx"
+            ),
+        ),
+    ]
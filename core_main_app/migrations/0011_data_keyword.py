@@ -0,0 +1,46 @@
+""" Migration to create the keyword index of the data.
+"""
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("core_main_app", "0010_lock_unique_object"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataKeyword",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("keyword", models.CharField(max_length=100)),
+                ("count", models.PositiveIntegerField(default=1)),
+                (
+                    "data",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core_main_app.data",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="datakeyword",
+            constraint=models.UniqueConstraint(
+                fields=("keyword", "data"),
+                name="core_main_app_data_keyword_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+""" Migration to create the store of flattened templates.
+"""
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration class."""
+
+    dependencies = [
+        ("core_main_app", "0011_data_keyword"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FlattenedTemplate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("dependencies_checksum", models.CharField(max_length=64)),
+                ("content", models.TextField()),
+                ("creation_date", models.DateTimeField(auto_now=True)),
+                (
+                    "template",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core_main_app.template",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -2,6 +2,10 @@
 """
 from django.db import models
 
+# models of the components that are not loaded by the admin site
+from core_main_app.components.flattened_template.models import (  # noqa: F401
+    FlattenedTemplate,
+)
 from core_main_app.permissions import rights
 from core_main_app.permissions.utils import get_formatted_name
 
@@ -86,6 +86,17 @@ def create_public_workspace():
     logger.info("FINISH create public workspace.")
 
 
+def init_keyword_indexing():
+    """Initialize the keyword index if needed"""
+    from core_main_app.components.keyword_index import (
+        api as keyword_index_api,
+    )
+
+    if keyword_index_api.is_keyword_index_enabled():
+        # Update the keyword index when a data is saved
+        post_save.connect(keyword_index_api.post_save_data, sender=Data)
+
+
 def init_mongo_indexing():
     """Initialize mongo indexing if needed"""
     if settings.MONGODB_INDEXING:
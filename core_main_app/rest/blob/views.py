@@ -23,7 +23,12 @@ from core_main_app.rest.blob.serializers import (
     BlobSerializer,
     DeleteBlobsSerializer,
 )
-from core_main_app.utils.file import get_file_http_response
+from core_main_app.utils.conditional import (
+    get_not_modified_response,
+    get_validators,
+    set_conditional_headers,
+)
+from core_main_app.utils.file import get_file_streaming_response
 
 
 class AbstractBlobList(APIView, metaclass=ABCMeta):
@@ -366,6 +371,10 @@ class BlobDownload(APIView):
 
             - code: 200
               content: Blob file
+            - code: 206
+              content: Requested range of the Blob file
+            - code: 304
+              content: Not modified since the version of the client
             - code: 403
               content: Authentication error
             - code: 404
@@ -377,8 +386,28 @@ class BlobDownload(APIView):
             # Get object
             blob_object = self.get_object(request, pk)
 
-            return get_file_http_response(
-                blob_object.blob.read(), blob_object.filename
+            # Answer conditional requests before reading the file
+            etag, last_modified = get_validators(
+                blob_object,
+                ("checksum", "creation_date"),
+                "creation_date",
+                blob_object.filename,
+            )
+            not_modified_response = get_not_modified_response(
+                request, etag, last_modified
+            )
+            if not_modified_response:
+                return not_modified_response
+
+            return set_conditional_headers(
+                get_file_streaming_response(
+                    request,
+                    blob_object.blob,
+                    blob_object.filename,
+                    etag=etag,
+                ),
+                etag,
+                last_modified,
             )
         except AccessControlError as exception:
             content = {"message": str(exception)}
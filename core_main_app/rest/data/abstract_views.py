@@ -9,7 +9,7 @@ from rest_framework.views import APIView
 
 from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.commons.constants import DATA_JSON_FIELD
-from core_main_app.commons.exceptions import RestApiError
+from core_main_app.commons.exceptions import PaginationError, RestApiError
 from core_main_app.components.data import api as data_api
 from core_main_app.settings import DATA_SORTING_FIELDS
 from core_main_app.utils.query.constants import VISIBILITY_OPTION
@@ -57,12 +57,7 @@ class AbstractExecuteLocalQueryView(APIView, metaclass=ABCMeta):
             if type(options) is str:
                 options = json.loads(options)
             title = self.request.data.get("title", None)
-            order_by_field = self.request.data.get("order_by_field", "")
-            order_by_field = (
-                order_by_field.split(",")
-                if order_by_field
-                else DATA_SORTING_FIELDS
-            )
+            order_by_field = self.get_order_by_field()
             if query is not None:
                 # prepare query
                 raw_query = self.build_query(
@@ -82,12 +77,28 @@ class AbstractExecuteLocalQueryView(APIView, metaclass=ABCMeta):
         except AccessControlError as acl_error:
             content = {"message": str(acl_error)}
             return Response(content, status=status.HTTP_403_FORBIDDEN)
+        except PaginationError as pagination_error:
+            content = {"message": str(pagination_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except Exception as api_exception:
             content = {"message": str(api_exception)}
             return Response(
                 content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def get_order_by_field(self):
+        """Return the sorting fields of the query
+
+        Returns:
+
+        """
+        order_by_field = self.request.data.get("order_by_field", "")
+        return (
+            order_by_field.split(",")
+            if order_by_field
+            else DATA_SORTING_FIELDS
+        )
+
     def build_query(
         self, query, workspaces=None, templates=None, options=None, title=None
     ):
@@ -3,7 +3,11 @@
 
 from core_main_app.components.data import api as data_api
 from core_main_app.components.data.models import Data
-from core_main_app.rest.data.serializers import DataSerializer, ContentField
+from core_main_app.rest.data.serializers import (
+    ContentField,
+    DataListSerializer,
+    DataSerializer,
+)
 from core_main_app.settings import BACKWARD_COMPATIBILITY_DATA_XML_CONTENT
 
 
@@ -18,6 +22,7 @@ class AdminDataSerializer(DataSerializer):
     class Meta:
         """Meta"""
 
+        list_serializer_class = DataListSerializer
         model = Data
         fields = [
             "id",
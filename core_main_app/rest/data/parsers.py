@@ -0,0 +1,45 @@
+""" Parsers used by the data Rest API
+"""
+import codecs
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """Parse newline delimited JSON (one JSON document per line) into a
+    list"""
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse the lines of the stream, one at a time
+
+        Args:
+            stream:
+            media_type:
+            parser_context:
+
+        Returns:
+            list of the parsed documents
+
+        """
+        if stream is None:
+            return []
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        documents = []
+        for line_number, line in enumerate(
+            codecs.getreader(encoding)(stream), start=1
+        ):
+            if not line.strip():
+                continue
+            try:
+                documents.append(json.loads(line))
+            except ValueError as exception:
+                raise ParseError(
+                    f"NDJSON parse error on line {line_number}: {str(exception)}"
+                )
+        return documents
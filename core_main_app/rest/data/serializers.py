@@ -2,10 +2,15 @@
 """
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
-from rest_framework.serializers import ModelSerializer
+from rest_framework.serializers import (
+    BaseSerializer,
+    ListSerializer,
+    ModelSerializer,
+)
 
 from core_main_app.components.data import api as data_api
-from core_main_app.components.data.models import Data
+from core_main_app.components.data.batch_resolvers import resolve_related
+from core_main_app.components.data.models import CONTENT_FIELDS, Data
 from core_main_app.components.template import api as template_api
 from core_main_app.rest.template.serializers import TemplateSerializer
 from core_main_app.settings import BACKWARD_COMPATIBILITY_DATA_XML_CONTENT
@@ -37,7 +42,48 @@ class ContentField(serializers.Field):
         return data
 
 
-class DataSerializer(ModelSerializer):
+class SelectableFieldsMixin:
+    """Serializer rendering only the fields passed in the `fields` argument"""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        """Initialize serializer
+
+        Args:
+            *args:
+            fields: names of the fields to render, all fields if None
+            **kwargs:
+        """
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
+class DataListSerializer(ListSerializer):
+    """Data list serializer, loading the related objects rendered by the
+    child serializer with one query per type"""
+
+    def to_representation(self, data):
+        """Resolve the related objects of the list, then serialize it
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        fields = self.child.fields
+        data = resolve_related(
+            data.all() if hasattr(data, "all") else data,
+            owner_name="owner_name" in fields,
+            template=isinstance(fields.get("template"), BaseSerializer),
+            workspace=isinstance(fields.get("workspace"), BaseSerializer),
+            content=any(field in fields for field in CONTENT_FIELDS),
+        )
+        return super().to_representation(data)
+
+
+class DataSerializer(SelectableFieldsMixin, ModelSerializer):
     """Data serializer"""
 
     if BACKWARD_COMPATIBILITY_DATA_XML_CONTENT:
@@ -48,6 +94,7 @@ class DataSerializer(ModelSerializer):
     class Meta:
         """Meta"""
 
+        list_serializer_class = DataListSerializer
         model = Data
         fields = [
             "id",
@@ -115,6 +162,27 @@ class DataSerializer(ModelSerializer):
         return data_api.upsert(instance, self.context["request"])
 
 
+class DataListingSerializer(SelectableFieldsMixin, ModelSerializer):
+    """Data listing serializer, without content (never reads the files)"""
+
+    class Meta:
+        """Meta"""
+
+        model = Data
+        fields = [
+            "id",
+            "template",
+            "workspace",
+            "user_id",
+            "title",
+            "checksum",
+            "creation_date",
+            "last_modification_date",
+            "last_change_date",
+        ]
+        read_only_fields = fields
+
+
 class DataWithTemplateInfoSerializer(ModelSerializer):
     """Data Full serializer"""
 
@@ -123,6 +191,7 @@ class DataWithTemplateInfoSerializer(ModelSerializer):
     class Meta:
         """Meta"""
 
+        list_serializer_class = DataListSerializer
         model = Data
         fields = [
             "id",
@@ -10,10 +10,11 @@ from django.utils.decorators import method_decorator
 from django.shortcuts import redirect
 from django.conf import settings
 from django.http import Http404
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import ParseError, ValidationError
+from rest_framework.parsers import JSONParser
 from rest_framework.permissions import (
     IsAuthenticated,
     IsAuthenticatedOrReadOnly,
@@ -25,13 +26,14 @@ from rest_framework.views import APIView
 from core_main_app.access_control.api import check_can_write
 from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.commons import exceptions
-from core_main_app.commons.constants import (
-    DATA_FILE_EXTENSION_FOR_TEMPLATE_FORMAT,
-)
 from core_main_app.commons.exceptions import XMLError, DoesNotExist
 from core_main_app.components.data import api as data_api
+from core_main_app.components.data import batch as data_batch
+from core_main_app.components.data.content_prefetch import prefetch_content
+from core_main_app.components.data import export as data_export
 from core_main_app.components.data import tasks as data_tasks
-from core_main_app.components.data.models import Data
+from core_main_app.components.data.models import CONTENT_FIELDS, Data
+from core_main_app.components.keyword_index import api as keyword_index_api
 from core_main_app.components.template import api as template_api
 from core_main_app.components.template.models import Template
 from core_main_app.components.user import api as user_api
@@ -41,36 +43,100 @@ from core_main_app.rest.data.abstract_views import (
 )
 from core_main_app.rest.data.abstract_views import AbstractMigrationView
 from core_main_app.rest.data.admin_serializers import AdminDataSerializer
+from core_main_app.rest.data.parsers import NDJSONParser
 from core_main_app.rest.data.serializers import (
+    DataListingSerializer,
     DataSerializer,
     DataWithTemplateInfoSerializer,
+    SelectableFieldsMixin,
 )
 from core_main_app.rest.mongo_data.serializers import MongoDataSerializer
-from core_main_app.settings import MAX_DOCUMENT_LIST
-from core_main_app.settings import XML_POST_PROCESSOR, XML_FORCE_LIST
-from core_main_app.utils import xml as main_xml_utils
+from core_main_app.settings import DATA_BATCH_MAX_SIZE, MAX_DOCUMENT_LIST
 from core_main_app.utils.boolean import to_bool
+from core_main_app.utils.conditional import (
+    get_not_modified_response,
+    get_validators,
+    set_conditional_headers,
+)
 from core_main_app.utils.databases.mongo.pymongo_database import (
     get_full_text_query,
 )
-from core_main_app.utils.datetime import datetime_now
 from core_main_app.utils.file import (
     get_file_http_response,
+    get_file_streaming_response,
     get_data_file_content_type_for_template_format,
     get_data_file_extension_for_template_format,
 )
-from core_main_app.utils.json_utils import (
-    format_content_json,
-    load_json_string,
-)
+from core_main_app.utils.json_utils import format_content_json
 from core_main_app.utils.pagination.rest_framework_paginator.pagination import (
-    StandardResultsSetPagination,
+    CursorResultsSetPagination,
+)
+from core_main_app.utils.pagination.rest_framework_paginator.rest_framework_paginator import (
+    get_data_paginator,
 )
 from core_main_app.utils.xml import get_content_by_xpath, format_content_xml
 
 logger = logging.getLogger(__name__)
 
 
+def get_requested_fields(fields, serializer_class):
+    """Return the list of fields requested by the client, None for all.
+    The requested fields are ignored if the serializer can't render a
+    selection of fields.
+
+    Args:
+        fields: comma separated string or list of field names
+        serializer_class:
+
+    Returns:
+
+    """
+    if not fields or not issubclass(serializer_class, SelectableFieldsMixin):
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return [field.strip() for field in fields if field.strip()]
+
+
+def select_fields(data_list, fields):
+    """Only load the columns needed to render the requested fields
+
+    Args:
+        data_list:
+        fields:
+
+    Returns:
+
+    """
+    if fields is None or not hasattr(data_list, "only_fields"):
+        return data_list
+    return data_list.only_fields(fields)
+
+
+def get_list_serializer(serializer_class, data_list, fields):
+    """Return the serializer of a data list. If the client selected the
+    fields, only render them, with the listing serializer if the content is
+    not requested (the files are not read).
+
+    Args:
+        serializer_class:
+        data_list:
+        fields:
+
+    Returns:
+
+    """
+    if fields is None or not issubclass(
+        serializer_class, SelectableFieldsMixin
+    ):
+        return serializer_class(data_list, many=True)
+    if serializer_class is DataSerializer and not set(fields) & set(
+        CONTENT_FIELDS
+    ):
+        serializer_class = DataListingSerializer
+    return serializer_class(data_list, many=True, fields=fields)
+
+
 class DataList(APIView):
     """List all user Data, or create a new one."""
 
@@ -85,6 +151,7 @@ class DataList(APIView):
             workspace: workspace_id
             template: template_id
             title: document_title
+            fields: comma separated list of the fields to return
 
         Examples:
 
@@ -94,6 +161,9 @@ class DataList(APIView):
             ../data?template=[template_id]
             ../data?title=[document_title]
             ../data?template=[template_id]&title=[document_title]&page=3
+            ../data?cursor=
+            ../data?cursor=[next_cursor]&count=true
+            ../data?fields=id,title
 
         Args:
 
@@ -123,18 +193,29 @@ class DataList(APIView):
             if title is not None:
                 data_object_list = data_object_list.filter(title=title)
 
+            # Only load the requested fields
+            fields = get_requested_fields(
+                self.request.query_params.get("fields", None), self.serializer
+            )
+            data_object_list = select_fields(data_object_list, fields)
+
             # Get paginator
-            paginator = StandardResultsSetPagination()
+            paginator = get_data_paginator(self.request)
 
             # Get requested page from list of results
             page = paginator.paginate_queryset(data_object_list, self.request)
 
             # Serialize page
-            data_serializer = self.serializer(page, many=True)
+            data_serializer = get_list_serializer(
+                self.serializer, page, fields
+            )
 
             # Return paginated response
             return paginator.get_paginated_response(data_serializer.data)
 
+        except exceptions.PaginationError as pagination_error:
+            content = {"message": str(pagination_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except Exception as api_exception:
             content = {"message": str(api_exception)}
             return Response(
@@ -309,6 +390,8 @@ class DataDetail(APIView):
 
             - code: 200
               content: Data
+            - code: 304
+              content: Not modified since the version of the client
             - code: 404
               content: Object was not found
             - code: 500
@@ -325,11 +408,26 @@ class DataDetail(APIView):
             # Get object
             data_object = self.get_object(request, pk)
 
+            # Answer conditional requests before reading the content
+            etag, last_modified = get_validators(
+                data_object,
+                ("checksum", "last_change_date"),
+                "last_change_date",
+                template_info_param,
+            )
+            not_modified_response = get_not_modified_response(
+                request, etag, last_modified
+            )
+            if not_modified_response:
+                return not_modified_response
+
             # Serialize object
             serializer = self.serializer(data_object)
 
             # Return response
-            return Response(serializer.data)
+            return set_conditional_headers(
+                Response(serializer.data), etag, last_modified
+            )
         except Http404:
             content = {"message": "Data not found."}
             return Response(content, status=status.HTTP_404_NOT_FOUND)
@@ -557,6 +655,10 @@ class DataDownload(APIView):
 
             - code: 200
               content: XML file
+            - code: 206
+              content: Requested range of the file (without pretty_print)
+            - code: 304
+              content: Not modified since the version of the client
             - code: 404
               content: Object was not found
             - code: 500
@@ -566,12 +668,45 @@ class DataDownload(APIView):
             # Get object
             data_object = self.get_object(request, pk)
 
-            # get xml content
-            data_content = data_object.content
-
             # get format bool
             pretty_print = request.query_params.get("pretty_print", False)
 
+            # Answer conditional requests before reading the content
+            etag, last_modified = get_validators(
+                data_object,
+                ("checksum", "last_modification_date"),
+                "last_modification_date",
+                data_object.title,
+                to_bool(pretty_print),
+            )
+            not_modified_response = get_not_modified_response(
+                request, etag, last_modified
+            )
+            if not_modified_response:
+                return not_modified_response
+
+            # stream the stored file if the content is not formatted
+            if not to_bool(pretty_print) and data_object.file:
+                return set_conditional_headers(
+                    get_file_streaming_response(
+                        request,
+                        data_object.file,
+                        data_object.title,
+                        content_type=get_data_file_content_type_for_template_format(
+                            data_object.template.format
+                        ),
+                        extension=get_data_file_extension_for_template_format(
+                            data_object.template.format
+                        ),
+                        etag=etag,
+                    ),
+                    etag,
+                    last_modified,
+                )
+
+            # get xml content
+            data_content = data_object.content
+
             # format content
             if to_bool(pretty_print):
                 # format XML
@@ -586,15 +721,19 @@ class DataDownload(APIView):
                         content, status=status.HTTP_400_BAD_REQUEST
                     )
 
-            return get_file_http_response(
-                data_content,
-                data_object.title,
-                content_type=get_data_file_content_type_for_template_format(
-                    data_object.template.format
-                ),
-                extension=get_data_file_extension_for_template_format(
-                    data_object.template.format
+            return set_conditional_headers(
+                get_file_http_response(
+                    data_content,
+                    data_object.title,
+                    content_type=get_data_file_content_type_for_template_format(
+                        data_object.template.format
+                    ),
+                    extension=get_data_file_extension_for_template_format(
+                        data_object.template.format
+                    ),
                 ),
+                etag,
+                last_modified,
             )
         except Http404:
             content = {"message": "Data not found."}
@@ -663,6 +802,8 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
         Url Parameters:
 
             page: page_number
+            cursor: continuation cursor (empty for the first page)
+            count: return the total count with the cursor pagination
 
         Parameters:
 
@@ -682,6 +823,11 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
             {"query": {"root.element.value": 2}}
             # get values at xpath
             {"query": {}, "xpath": "/ns:root/@element", "namespaces": {"ns": "<namespace_url>"}}
+            # get the id and title of all results
+            {"query": {}, "all": "true", "fields": ["id", "title"]}
+            # export all results as a stream of JSON lines, or as a zip of files
+            {"query": {}, "export": "ndjson"}
+            {"query": {}, "export": "zip"}
             # get results using multiple options
             {"query": {"root.element.value": 2}, "workspaces": [{"id":"workspace_id"}] , "all": "true"}
             {"query": {"root.element.value": 2}, "templates": [{"id":"template_id"}] , "all": "true"}
@@ -692,6 +838,8 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
 
             ../data/query/
             ../data/query/?page=2
+            ../data/query/?cursor=
+            ../data/query/?cursor=[next_cursor]
 
         Args:
 
@@ -722,6 +870,16 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
 
         xpath = self.request.data.get("xpath", None)
         namespaces = self.request.data.get("namespaces", None)
+        export_format = self.request.data.get("export", None)
+        if export_format is not None:
+            return self.build_export_response(
+                data_list, export_format, xpath, namespaces
+            )
+        # Only load the requested fields
+        fields = get_requested_fields(
+            self.request.data.get("fields", None), self.serializer
+        )
+        data_list = select_fields(data_list, fields)
         if "all" in self.request.data and to_bool(self.request.data["all"]):
             if data_list.count() > MAX_DOCUMENT_LIST:
                 content = {"message": "Number of documents is over the limit."}
@@ -729,34 +887,83 @@ class ExecuteLocalQueryView(AbstractExecuteLocalQueryView):
 
             # Select values at xpath if provided
             if xpath:
+                data_list = prefetch_content(data_list)
                 for data_object in data_list:
                     data_object.xml_content = get_content_by_xpath(
                         data_object.xml_content, xpath, namespaces=namespaces
                     )
             # Serialize data list
-            data_serializer = self.serializer(data_list, many=True)
+            data_serializer = get_list_serializer(
+                self.serializer, data_list, fields
+            )
             # Return response
             return Response(data_serializer.data)
         else:
             # Get paginator
-            paginator = StandardResultsSetPagination()
+            paginator = get_data_paginator(
+                self.request, order_by_field=self.get_order_by_field()
+            )
 
             # Get requested page from list of results
             page = paginator.paginate_queryset(data_list, self.request)
 
             # Select values at xpath if provided
             if xpath:
+                page = prefetch_content(page)
                 for data_object in page:
                     data_object.xml_content = get_content_by_xpath(
                         data_object.xml_content, xpath, namespaces=namespaces
                     )
 
             # Serialize page
-            data_serializer = self.serializer(page, many=True)
+            data_serializer = get_list_serializer(
+                self.serializer, page, fields
+            )
 
             # Return paginated response
             return paginator.get_paginated_response(data_serializer.data)
 
+    def build_export_response(
+        self, data_list, export_format, xpath=None, namespaces=None
+    ):
+        """Build a streaming response exporting all the results.
+
+        Args:
+
+            data_list: List of data
+            export_format: ndjson or zip
+            xpath: values to export (ndjson only)
+            namespaces:
+
+        Returns:
+
+            The streaming response
+        """
+        if export_format == data_export.NDJSON_EXPORT_FORMAT:
+            return StreamingHttpResponse(
+                data_export.iter_ndjson(
+                    data_list,
+                    self.serializer,
+                    xpath=xpath,
+                    namespaces=namespaces,
+                ),
+                content_type="application/x-ndjson",
+            )
+        if export_format == data_export.ZIP_EXPORT_FORMAT:
+            response = StreamingHttpResponse(
+                data_export.iter_zip(data_list),
+                content_type="application/zip",
+            )
+            response[
+                "Content-Disposition"
+            ] = 'attachment; filename="query_results.zip"'
+            return response
+        content = {
+            "message": "Unsupported export format, expected one of: "
+            f"{', '.join(data_export.EXPORT_FORMATS)}."
+        }
+        return Response(content, status=status.HTTP_400_BAD_REQUEST)
+
 
 class ExecuteLocalKeywordQueryView(ExecuteLocalQueryView):
     """Execute Local Keyword Query View"""
@@ -789,6 +996,29 @@ class ExecuteLocalKeywordQueryView(ExecuteLocalQueryView):
             title=title,
         )
 
+    def execute_raw_query(self, raw_query, order_by_field):
+        """Execute the raw query in database. Sort the results by relevance
+        unless sorting fields or a cursor are provided.
+
+        Args:
+
+            raw_query: Query to execute
+            order_by_field:
+
+        Returns:
+
+            Results of the query
+        """
+        data_list = super().execute_raw_query(raw_query, order_by_field)
+        if (
+            self.request.data.get("order_by_field")
+            or "cursor" in self.request.query_params
+        ):
+            return data_list
+        return keyword_index_api.rank_by_keywords(
+            data_list, str(self.request.data.get("query", ""))
+        )
+
 
 class DataAssign(APIView):
     """Assign a Data to a Workspace."""
@@ -882,6 +1112,9 @@ class DataListByWorkspace(APIView):
         Examples:
 
             ../workspace/id/data
+            ../workspace/id/data?cursor=
+            ../workspace/id/data?cursor=[next_cursor]&count=true
+            ../workspace/id/data?fields=id,title
 
 
         Args:
@@ -891,7 +1124,9 @@ class DataListByWorkspace(APIView):
         Returns:
 
             - code: 200
-              content: List of data
+              content: List of data (paginated if a cursor is given)
+            - code: 400
+              content: Bad request
             - code: 500
               content: Internal server error
         """
@@ -901,11 +1136,33 @@ class DataListByWorkspace(APIView):
                 workspace_id, request.user
             )
 
+            # Only load the requested fields
+            fields = get_requested_fields(
+                request.query_params.get("fields", None), self.serializer
+            )
+            data_object_list = select_fields(data_object_list, fields)
+
+            # Paginate with cursors if requested
+            if CursorResultsSetPagination.cursor_query_param in (
+                request.query_params
+            ):
+                paginator = CursorResultsSetPagination()
+                page = paginator.paginate_queryset(data_object_list, request)
+                data_serializer = get_list_serializer(
+                    self.serializer, page, fields
+                )
+                return paginator.get_paginated_response(data_serializer.data)
+
             # Serialize object
-            data_serializer = self.serializer(data_object_list, many=True)
+            data_serializer = get_list_serializer(
+                self.serializer, data_object_list, fields
+            )
 
             # Return response
             return Response(data_serializer.data, status=status.HTTP_200_OK)
+        except exceptions.PaginationError as pagination_error:
+            content = {"message": str(pagination_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except Exception as api_exception:
             content = {"message": str(api_exception)}
             return Response(
@@ -1138,37 +1395,13 @@ class BulkUploadFolder(APIView):
 
     permission_classes = (IsAdminUser,)
 
-    @staticmethod
-    def _bulk_create(data_list):
-        """Bulk insert list of data
-
-        Args:
-            data_list:
-
-        Returns:
-
-        """
-        try:
-            # Bulk insert list of data
-            Data.objects.bulk_create(data_list)
-        except Exception as exception:
-            # Log errors that occurred during bulk insert
-            logger.error("Bulk upload failed.")
-            logger.error(str(exception))
-            # try inserting each data of the batch individually
-            for error_data in data_list:
-                try:
-                    error_data.save()
-                except Exception:
-                    logger.error(
-                        f"Error during bulk upload. Retry loading failed for: {error_data.title}."
-                    )
-
     def put(self, request):
         """Bulk upload a folder.
 
         Dataset needs to be placed in the MEDIA_ROOT folder.
         The folder parameter is a relative path from the MEDIA_ROOT.
+        The upload runs in an async task, use the migration task progress /
+        result endpoints with the returned task id to follow it.
 
         Parameters:
 
@@ -1210,91 +1443,21 @@ class BulkUploadFolder(APIView):
             # Get Template
             template = template_api.get_by_id(template_id)
 
-            data_list = []
-
-            if not os.path.exists(os.path.join(settings.MEDIA_ROOT, folder)):
+            if not os.path.isdir(os.path.join(settings.MEDIA_ROOT, folder)):
                 content = {"message": "Folder not found."}
                 return Response(content, status=status.HTTP_400_BAD_REQUEST)
 
-            for data_file in os.listdir(
-                os.path.join(settings.MEDIA_ROOT, folder)
-            ):
-                try:
-                    # initialize times
-                    now = datetime_now()
-                    # Create data
-                    instance = Data(
-                        template_id=template_id,
-                        workspace_id=workspace,
-                        user_id=request.user.id,
-                        last_change_date=now,
-                        creation_date=now,
-                        last_modification_date=now,
-                    )
-                    # Set title
-                    instance.title = (
-                        data_file.replace("_", " ")
-                        .replace(
-                            DATA_FILE_EXTENSION_FOR_TEMPLATE_FORMAT[
-                                Template.XSD
-                            ],
-                            "",
-                        )
-                        .replace(
-                            DATA_FILE_EXTENSION_FOR_TEMPLATE_FORMAT[
-                                Template.JSON
-                            ],
-                            "",
-                        )
-                        if clean_title
-                        else data_file
-                    )
-                    # Set file
-                    instance.file.name = os.path.join(folder, data_file)
-                    # Validate file
-                    if validate:
-                        if template.format == Template.XSD:
-                            data_api.check_xml_file_is_valid(
-                                instance, request=request
-                            )
-                        elif template.format == Template.JSON:
-                            data_api.check_json_file_is_valid(instance)
-                    # Convert to JSON
-                    with open(
-                        os.path.join(settings.MEDIA_ROOT, folder, data_file),
-                        "rb",
-                    ) as _file:
-                        if template.format == Template.XSD:
-                            instance.dict_content = (
-                                main_xml_utils.raw_xml_to_dict(
-                                    _file,
-                                    postprocessor=XML_POST_PROCESSOR,
-                                    force_list=XML_FORCE_LIST,
-                                )
-                            )
-                        elif template.format == Template.JSON:
-                            instance.dict_content = load_json_string(
-                                _file.read()
-                            )
-                    # Add data to list
-                    data_list.append(instance)
-                except Exception as exception:
-                    logger.error(
-                        f"ERROR: Unable to insert {data_file}: {str(exception)}"
-                    )
-                # If data list reaches batch size
-                if len(data_list) == batch_size:
-                    # Bulk insert list of data
-                    BulkUploadFolder._bulk_create(data_list)
-                    # Clear list of data
-                    data_list = list()
-            # insert the last batch
-            BulkUploadFolder._bulk_create(data_list)
-
-            content = {
-                "message": "Bulk upload is complete. Check the logs for errors."
-            }
-            return Response(content, status=status.HTTP_200_OK)
+            # Start the bulk upload task
+            task_id = data_api.bulk_upload_folder(
+                folder,
+                template,
+                workspace,
+                batch_size,
+                validate,
+                clean_title,
+                request.user,
+            )
+            return Response(task_id, status=status.HTTP_200_OK)
 
         except DoesNotExist:
             content = {"message": "Template not found."}
@@ -1304,3 +1467,190 @@ class BulkUploadFolder(APIView):
             return Response(
                 content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class DataBatch(APIView):
+    """Create, update or delete a list of Data"""
+
+    permission_classes = (IsAuthenticated,)
+    parser_classes = (JSONParser, NDJSONParser)
+
+    def post(self, request):
+        """Create a list of Data
+
+        The records are sent as a JSON array, or as newline delimited JSON
+        (Content-Type: application/x-ndjson), one record per line.
+
+        Parameters:
+
+            [
+                {
+                    "title": "document_title",
+                    "template": "template_id",
+                    "workspace": "workspace_id",
+                    "content": "document_content"
+                },
+                ...
+            ]
+
+        Args:
+
+            request: HTTP request
+
+        Returns:
+
+            - code: 207
+              content: Status of each record
+            - code: 400
+              content: Invalid list of records
+            - code: 500
+              content: Internal server error
+        """
+        return self._process_batch(
+            request,
+            lambda records: data_batch.create_data_list(records, request),
+            status.HTTP_201_CREATED,
+        )
+
+    def patch(self, request):
+        """Update a list of Data
+
+        Parameters:
+
+            [
+                {
+                    "id": "data_id",
+                    "title": "new_title",
+                    "content": "new_xml_content"
+                },
+                ...
+            ]
+
+        Args:
+
+            request: HTTP request
+
+        Returns:
+
+            - code: 207
+              content: Status of each record
+            - code: 400
+              content: Invalid list of records
+            - code: 500
+              content: Internal server error
+        """
+        return self._process_batch(
+            request,
+            lambda records: data_batch.update_data_list(records, request),
+            status.HTTP_200_OK,
+        )
+
+    def delete(self, request):
+        """Delete a list of Data
+
+        Parameters:
+
+            ["data_id", ...] or [{"id": "data_id"}, ...]
+
+        Args:
+
+            request: HTTP request
+
+        Returns:
+
+            - code: 207
+              content: Status of each data
+            - code: 400
+              content: Invalid list of ids
+            - code: 500
+              content: Internal server error
+        """
+        return self._process_batch(
+            request,
+            lambda data_ids: data_batch.delete_data_list(
+                data_ids, request.user
+            ),
+            status.HTTP_204_NO_CONTENT,
+        )
+
+    def _process_batch(self, request, process, success_status):
+        """Process the list of the request, return the status of each item
+
+        Args:
+            request:
+            process: function processing the list
+            success_status: status of the processed items
+
+        Returns:
+
+        """
+        try:
+            items = request.data
+            if not isinstance(items, list):
+                content = {"message": "Expected a list of records."}
+                return Response(content, status=status.HTTP_400_BAD_REQUEST)
+            if len(items) > DATA_BATCH_MAX_SIZE:
+                content = {
+                    "message": f"A batch can't contain more than "
+                    f"{DATA_BATCH_MAX_SIZE} records."
+                }
+                return Response(content, status=status.HTTP_400_BAD_REQUEST)
+
+            results = []
+            for index, (data_id, exception) in enumerate(process(items)):
+                result = {"index": index, "id": data_id}
+                if exception is None:
+                    result["status"] = success_status
+                else:
+                    result["status"] = _get_batch_error_status(exception)
+                    # core exception messages can be lists of errors
+                    result["message"] = getattr(exception, "message", None)
+                    if result["message"] is None:
+                        result["message"] = str(exception)
+                results.append(result)
+
+            failed = sum(
+                result["status"] != success_status for result in results
+            )
+            content = {
+                "results": results,
+                "succeeded": len(results) - failed,
+                "failed": failed,
+            }
+            return Response(content, status=status.HTTP_207_MULTI_STATUS)
+        except ParseError as parse_exception:
+            content = {"message": parse_exception.detail}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+def _get_batch_error_status(exception):
+    """Return the status of an item of a batch that was not processed
+
+    Args:
+        exception:
+
+    Returns:
+
+    """
+    if isinstance(exception, AccessControlError):
+        return status.HTTP_403_FORBIDDEN
+    if isinstance(exception, exceptions.DoesNotExist):
+        return status.HTTP_404_NOT_FOUND
+    if isinstance(exception, exceptions.NotUniqueError):
+        return status.HTTP_409_CONFLICT
+    if isinstance(
+        exception,
+        (
+            exceptions.ApiError,
+            exceptions.CoreError,
+            exceptions.XMLError,
+            exceptions.JSONError,
+        ),
+    ):
+        return status.HTTP_400_BAD_REQUEST
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -3,11 +3,15 @@
 from rest_framework import serializers
 from rest_framework.serializers import Serializer
 
-from core_main_app.rest.data.serializers import ContentField
+from core_main_app.rest.data.serializers import (
+    ContentField,
+    DataListSerializer,
+    SelectableFieldsMixin,
+)
 from core_main_app.settings import BACKWARD_COMPATIBILITY_DATA_XML_CONTENT
 
 
-class MongoDataSerializer(Serializer):
+class MongoDataSerializer(SelectableFieldsMixin, Serializer):
     """Data serializer"""
 
     id = serializers.IntegerField(read_only=True)
@@ -27,6 +31,7 @@ class MongoDataSerializer(Serializer):
     class Meta:
         """Meta"""
 
+        list_serializer_class = DataListSerializer
         fields = [
             "id",
             "template",
@@ -8,10 +8,18 @@ from rest_framework.views import APIView
 from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.commons import exceptions as exceptions
 from core_main_app.commons.exceptions import XMLError
+from core_main_app.components.flattened_template import (
+    api as flattened_template_api,
+)
 from core_main_app.components.template import api as template_api
 from core_main_app.components.template.models import Template
 from core_main_app.rest.template.serializers import TemplateSerializer
 from core_main_app.utils.boolean import to_bool
+from core_main_app.utils.conditional import (
+    get_not_modified_response,
+    get_validators,
+    set_conditional_headers,
+)
 from core_main_app.utils.file import (
     get_file_http_response,
     get_template_file_content_type_for_template_format,
@@ -19,6 +27,9 @@ from core_main_app.utils.file import (
 )
 from core_main_app.utils.json_utils import format_content_json
 from core_main_app.utils.xml import format_content_xml
+from core_main_app.utils.xsd_flattener.xsd_flattener_database_url import (
+    XSDFlattenerDatabaseOrURL,
+)
 
 
 class TemplateDetail(APIView):
@@ -112,11 +123,14 @@ class TemplateDownload(APIView):
 
             ../template/[template_id]/download
             ../template/[template_id]/download?pretty_print=false
+            ../template/[template_id]/download?flatten=true
 
         Returns:
 
             - code: 200
               content: XSD file
+            - code: 304
+              content: Not modified since the version of the client
             - code: 404
               content: Object was not found
             - code: 500
@@ -125,13 +139,41 @@ class TemplateDownload(APIView):
         try:
             # Get object
             template_object = self.get_object(pk, request=request)
-
-            # get xml content
-            content = template_object.content
-
+            flatten = (
+                to_bool(request.query_params.get("flatten", False))
+                and template_object.format == Template.XSD
+            )
             # get format bool
             pretty_print = request.query_params.get("pretty_print", False)
 
+            # Answer conditional requests before reading the content (the
+            # flattened content also depends on the included templates)
+            etag, last_modified = get_validators(
+                template_object,
+                ("hash",),
+                None if flatten else "creation_date",
+                template_object.filename,
+                to_bool(pretty_print),
+                flatten
+                and template_object.hash
+                and flattened_template_api.get_dependencies_checksum(
+                    template_object
+                ),
+            )
+            not_modified_response = get_not_modified_response(
+                request, etag, last_modified
+            )
+            if not_modified_response:
+                return not_modified_response
+
+            # get xml content (flattened if requested)
+            if flatten:
+                content = XSDFlattenerDatabaseOrURL(
+                    None, request=request, template=template_object
+                ).get_flat()
+            else:
+                content = template_object.content
+
             # format content
             if to_bool(pretty_print):
                 # format XML
@@ -146,15 +188,19 @@ class TemplateDownload(APIView):
                         content, status=status.HTTP_400_BAD_REQUEST
                     )
 
-            return get_file_http_response(
-                content,
-                template_object.filename,
-                content_type=get_template_file_content_type_for_template_format(
-                    template_object.format
-                ),
-                extension=get_template_file_extension_for_template_format(
-                    template_object.format
+            return set_conditional_headers(
+                get_file_http_response(
+                    content,
+                    template_object.filename,
+                    content_type=get_template_file_content_type_for_template_format(
+                        template_object.format
+                    ),
+                    extension=get_template_file_extension_for_template_format(
+                        template_object.format
+                    ),
                 ),
+                etag,
+                last_modified,
             )
         except Http404:
             content = {"message": "Template not found."}
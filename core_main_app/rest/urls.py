@@ -13,7 +13,7 @@ from core_main_app.rest.template_xsl_rendering import (
     views as template_xsl_rendering_views,
 )
 from core_main_app.rest.user import views as user_views
-from core_main_app.rest.views import CoreSettings
+from core_main_app.rest.views import CoreSettings, PerformanceStats
 from core_main_app.rest.web_page import views as web_page_views
 from core_main_app.rest.workspace import views as workspace_views
 from core_main_app.rest.xsl_transformation import (
@@ -142,6 +142,11 @@ urlpatterns = [
         data_views.BulkUploadFolder.as_view(),
         name="core_main_app_rest_data_bulk_upload",
     ),
+    re_path(
+        r"^data/batch/$",
+        data_views.DataBatch.as_view(),
+        name="core_main_app_rest_data_batch",
+    ),
     re_path(
         r"^data/(?P<pk>\w+)/assign/(?P<workspace_id>\w+)$",
         data_views.DataAssign.as_view(),
@@ -387,6 +392,11 @@ urlpatterns = [
         CoreSettings.as_view(),
         name="core_main_app_rest_core_settings",
     ),
+    re_path(
+        r"^performance-stats/$",
+        PerformanceStats.as_view(),
+        name="core_main_app_rest_performance_stats",
+    ),
 ]
 
 urlpatterns = format_suffix_patterns(urlpatterns)
@@ -5,10 +5,11 @@ from importlib import metadata
 from django.conf import settings
 from django.db import connection
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core_main_app.utils import performance
 from core_main_app.utils.databases.backend import (
     uses_postgresql_backend,
     uses_sqlite3_backend,
@@ -81,3 +82,29 @@ class CoreSettings(APIView):
             return Response(
                 content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class PerformanceStats(APIView):
+    """Get performance statistics of the process"""
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request):
+        """Get the percentiles of the sampled requests (durations, number of
+        queries, storage bytes, ACL checks) and the statistics of the caches
+        of the process serving the request.
+
+        Args:
+
+            request: HTTP request
+
+        Returns:
+
+            - code: 200
+              content: Performance statistics
+            - code: 403
+              content: Forbidden
+        """
+        return Response(
+            performance.get_performance_stats(), status=status.HTTP_200_OK
+        )
@@ -86,11 +86,23 @@ LOCK_OBJECT_TTL = getattr(settings, "LOCK_OBJECT_TTL", 600)  # 10 min
 """ :py:class:`int`: Lock duration on files.
 """
 
+LOCK_EXPIRY_SWEEP_INTERVAL = getattr(
+    settings, "LOCK_EXPIRY_SWEEP_INTERVAL", 600
+)
+""" :py:class:`int`: Interval in seconds between two deletions of the expired locks (0 to disable).
+"""
+
 # Results per page for paginator
 RESULTS_PER_PAGE = getattr(settings, "RESULTS_PER_PAGE", 10)
 """ :py:class:`int`: Results per page.
 """
 
+PAGINATION_COUNT_CACHE_TTL = getattr(
+    settings, "PAGINATION_COUNT_CACHE_TTL", 60
+)
+""" :py:class:`int`: Number of seconds the total count returned by the cursor pagination is cached (0 to disable).
+"""
+
 CAN_SET_PUBLIC_DATA_TO_PRIVATE = getattr(
     settings, "CAN_SET_PUBLIC_DATA_TO_PRIVATE", True
 )
@@ -140,7 +152,49 @@ SSL_CERTIFICATES_DIR = getattr(settings, "SSL_CERTIFICATES_DIR", True)
 """
 
 XSD_URI_RESOLVER = getattr(settings, "XSD_URI_RESOLVER", None)
-""" :py:class:`str`: XSD URI Resolver for lxml validation. Choose from:  None, 'REQUESTS_RESOLVER'.
+""" :py:class:`str`: XSD URI Resolver for lxml validation. Choose from:  None, 'REQUESTS_RESOLVER',
+    'LOCAL_RESOLVER'.
+"""
+
+XSD_URI_RESOLVER_CACHE_TIMEOUT = getattr(
+    settings, "XSD_URI_RESOLVER_CACHE_TIMEOUT", 300
+)
+""" :py:class:`int`: Number of seconds the LOCAL_RESOLVER keeps the content of remote URIs in memory
+    (per process). Set to 0 to disable the cache.
+"""
+
+XSD_SCHEMA_CACHE_SIZE = getattr(settings, "XSD_SCHEMA_CACHE_SIZE", 64)
+""" :py:class:`int`: Maximum number of compiled XML Schemas kept in memory (per process)
+    to validate data. Set to 0 to disable the cache.
+"""
+
+XSLT_CACHE_SIZE = getattr(settings, "XSLT_CACHE_SIZE", 64)
+""" :py:class:`int`: Maximum number of compiled XSLT kept in memory (per process)
+    to transform data. Set to 0 to disable the cache.
+"""
+
+RENDERED_FRAGMENT_CACHE_TIMEOUT = getattr(
+    settings, "RENDERED_FRAGMENT_CACHE_TIMEOUT", 3600
+)
+""" :py:class:`int`: Number of seconds the HTML rendered from a data with an XSLT is kept in the Django cache
+    (0 to disable).
+"""
+
+RENDERED_FRAGMENT_CACHE_PREWARM = getattr(
+    settings, "RENDERED_FRAGMENT_CACHE_PREWARM", False
+)
+""" :py:class:`bool`: Render the list and detail HTML of a data with the default XSLT of its template
+    when the data is saved.
+"""
+
+KEYWORD_INDEX_ENABLED = getattr(settings, "KEYWORD_INDEX_ENABLED", False)
+""" :py:class:`bool`: Maintain an inverted index of the keywords of the data, used to filter
+    and rank the results of the keyword search without PostgreSQL or MongoDB indexing.
+"""
+
+QUERY_PLAN_CACHE_SIZE = getattr(settings, "QUERY_PLAN_CACHE_SIZE", 256)
+""" :py:class:`int`: Maximum number of translated query plans kept in memory (per process),
+    one per query shape. Set to 0 to disable the cache.
 """
 
 XML_FORCE_LIST = getattr(settings, "XML_FORCE_LIST", False)
@@ -163,6 +217,10 @@ VERIFY_DATA_ACCESS = getattr(settings, "VERIFY_DATA_ACCESS", False)
 """ :py:class:`bool`: Verify that data returned by a query can be accessed.
 """
 
+WORKSPACE_ACCESS_CACHE_TTL = getattr(settings, "WORKSPACE_ACCESS_CACHE_TTL", 5)
+""" :py:class:`int`: Number of seconds the workspaces accessible by a user are kept in the Django cache (0 to disable).
+"""
+
 DATA_SORTING_FIELDS = getattr(settings, "DATA_SORTING_FIELDS", [])
 """ ::py:class:`str` Set the default sort fields for the data query. all the field must
     be prefixed by "+" or "-" (asc or desc sort) the sort can be multi field and each
@@ -195,6 +253,10 @@ MONGODB_ASYNC_SAVE = getattr(settings, "MONGODB_ASYNC_SAVE", True)
     If True, data are saved in MongoDB asynchronously.
 """
 
+MONGODB_INDEX_BATCH_SIZE = getattr(settings, "MONGODB_INDEX_BATCH_SIZE", 1000)
+""" :py:class:`int`: Maximum number of data indexed / updated in MongoDB by a single bulk write.
+"""
+
 MONGO_HOST = getattr(settings, "MONGO_HOST", "localhost")
 """ :py:class:`str`: MongoDB host.
 """
@@ -232,10 +294,73 @@ CUSTOM_FILE_STORAGE = getattr(settings, "CUSTOM_FILE_STORAGE", {})
     }
 """
 
+MIGRATION_CHUNK_SIZE = getattr(settings, "MIGRATION_CHUNK_SIZE", 500)
+""" :py:class:`int`: Number of data processed by each subtask of a data migration / validation.
+"""
+
+MIGRATION_PROGRESS_INTERVAL = getattr(
+    settings, "MIGRATION_PROGRESS_INTERVAL", 2
+)
+""" :py:class:`int`: Minimum number of seconds between two progress updates of a migration task.
+"""
+
+BULK_UPLOAD_WORKERS = getattr(settings, "BULK_UPLOAD_WORKERS", 4)
+""" :py:class:`int`: Number of processes parsing, validating and converting files during a bulk upload (1 to disable the process pool).
+"""
+
+BULK_UPLOAD_QUEUE_SIZE = getattr(settings, "BULK_UPLOAD_QUEUE_SIZE", 10)
+""" :py:class:`int`: Maximum number of converted batches waiting to be saved during a bulk upload.
+"""
+
 MAX_DOCUMENT_LIST = getattr(settings, "MAX_DOCUMENT_LIST", 100)
 """ :py:class:`int`: Maximum number of documents to be returned at once by the api.
 """
 
+DATA_EXPORT_CHUNK_SIZE = getattr(settings, "DATA_EXPORT_CHUNK_SIZE", 500)
+""" :py:class:`int`: Number of documents fetched at once by the streaming export of query results.
+"""
+
+DATA_BATCH_MAX_SIZE = getattr(settings, "DATA_BATCH_MAX_SIZE", 1000)
+""" :py:class:`int`: Maximum number of records sent at once to the data batch endpoint.
+"""
+
+DATA_BATCH_CHUNK_SIZE = getattr(settings, "DATA_BATCH_CHUNK_SIZE", 200)
+""" :py:class:`int`: Number of records of a batch written in each database transaction.
+"""
+
+DATA_CONTENT_PREFETCH_WORKERS = getattr(
+    settings, "DATA_CONTENT_PREFETCH_WORKERS", 8
+)
+""" :py:class:`int`: Maximum number of files read concurrently to serialize a list of data (1 to read them sequentially).
+"""
+
+FILE_DOWNLOAD_CHUNK_SIZE = getattr(
+    settings, "FILE_DOWNLOAD_CHUNK_SIZE", 64 * 1024
+)
+""" :py:class:`int`: Number of bytes read from the storage at once when a blob or data file is downloaded.
+"""
+
+FILE_DOWNLOAD_OFFLOAD_HEADER = getattr(
+    settings, "FILE_DOWNLOAD_OFFLOAD_HEADER", None
+)
+""" :py:class:`str`: Header used to let the web server send the downloaded files of the file system storage
+    (`X-Sendfile` or `X-Accel-Redirect`), None to send them from Django.
+"""
+
+FILE_DOWNLOAD_OFFLOAD_PREFIX = getattr(
+    settings, "FILE_DOWNLOAD_OFFLOAD_PREFIX", "/protected-media/"
+)
+""" :py:class:`str`: Internal location of the file system storage in the web server, used with `X-Accel-Redirect`.
+"""
+
+PERFORMANCE_SAMPLE_RATE = getattr(settings, "PERFORMANCE_SAMPLE_RATE", 0.05)
+""" :py:class:`float`: Fraction of the requests instrumented by the performance middleware (0 to disable it, 1 for all requests).
+"""
+
+PERFORMANCE_STATS_WINDOW = getattr(settings, "PERFORMANCE_STATS_WINDOW", 1000)
+""" :py:class:`int`: Number of sampled requests used to compute the performance percentiles.
+"""
+
 CHECKSUM_ALGORITHM = getattr(settings, "CHECKSUM_ALGORITHM", None)
 """ :py:class:`str`: Checksum algorithm used for uploaded files.
     Examples:
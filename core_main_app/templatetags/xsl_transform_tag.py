@@ -2,7 +2,6 @@
 """
 
 from django import template
-from django.contrib.staticfiles import finders
 
 from core_main_app.commons import exceptions
 from core_main_app.components.template_xsl_rendering import (
@@ -11,9 +10,10 @@ from core_main_app.components.template_xsl_rendering import (
 from core_main_app.components.xsl_transformation import (
     api as xsl_transformation_api,
 )
-from core_main_app.settings import DEFAULT_DATA_RENDERING_XSLT
-from core_main_app.utils.file import read_file_content
-from core_main_app.utils.xml import xsl_transform
+from core_main_app.utils.cache import (
+    rendered_fragment as rendered_fragment_cache,
+    xslt as xslt_cache,
+)
 
 register = template.Library()
 
@@ -55,6 +55,10 @@ def render_xml_as_html_detail(*args, **kwargs):
 
 def _render_xml_as_html(xslt_type, *args, **kwargs):
     """Render an XML to HTML according to an xslt type (list or detail).
+
+    When a data is given, the HTML is cached (see RENDERED_FRAGMENT_CACHE_TIMEOUT)
+    and the content of the data is rendered if no xml_content is given.
+
     Args:
         xslt_type
         *args:
@@ -65,7 +69,7 @@ def _render_xml_as_html(xslt_type, *args, **kwargs):
 
     """
 
-    xml_string = kwargs["xml_content"]
+    data = kwargs.get("data", None)
     template_id = kwargs.get("template_id", None)
     template_hash = kwargs.get("template_hash", None)
     xsl_transform_id = kwargs.get("xslt_id", None)
@@ -105,12 +109,37 @@ def _render_xml_as_html(xslt_type, *args, **kwargs):
                     "No template information provided. Default xslt will be used."
                 )
 
-            xslt_string = xsl_transformation.content
+            compiled_xslt = xslt_cache.get_xslt(xsl_transformation)
 
         except (Exception, exceptions.DoesNotExist):
-            default_xslt_path = finders.find(DEFAULT_DATA_RENDERING_XSLT)
-            xslt_string = read_file_content(default_xslt_path)
-
-        return xsl_transform(xml_string, xslt_string)
+            xsl_transformation = None
+            compiled_xslt = xslt_cache.get_default_xslt()
+
+        return rendered_fragment_cache.get_or_render(
+            xslt_type,
+            data,
+            xsl_transformation,
+            lambda: compiled_xslt.transform_xml(_get_xml_content(kwargs)),
+        )
     except Exception:
-        return xml_string
+        return _get_xml_content(kwargs)
+
+
+def _get_xml_content(kwargs):
+    """Return the XML to render: xml_content, or the content of the data.
+
+    Args:
+        kwargs:
+
+    Returns:
+
+    """
+    xml_string = kwargs.get("xml_content", None)
+    data = kwargs.get("data", None)
+    if xml_string is None and data is not None:
+        return (
+            data.get("content", None)
+            if isinstance(data, dict)
+            else data.content
+        )
+    return xml_string
@@ -0,0 +1,136 @@
+""" Process-local LRU cache
+"""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe, size-capped LRU cache with hit/miss counters"""
+
+    def __init__(self, max_size):
+        """Initialize cache
+
+        Args:
+            max_size: maximum number of entries (0 disables the cache)
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Return the value cached for key, mark it as recently used.
+
+        Args:
+            key:
+            default:
+
+        Returns:
+
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Cache value for key, evict least recently used entries if full.
+
+        Args:
+            key:
+            value:
+
+        Returns:
+
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        """Remove key from the cache.
+
+        Args:
+            key:
+
+        Returns:
+
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_if(self, predicate):
+        """Remove all entries for which predicate(key, value) is True.
+
+        Args:
+            predicate:
+
+        Returns:
+
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, value in self._entries.items()
+                if predicate(key, value)
+            ]
+            for key in keys:
+                del self._entries[key]
+
+    def clear(self):
+        """Remove all entries and reset counters.
+
+        Returns:
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self):
+        """Number of entries in the cache
+
+        Returns:
+
+        """
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """True if key is cached (does not update counters or order)
+
+        Args:
+            key:
+
+        Returns:
+
+        """
+        return key in self._entries
+
+    def stats(self):
+        """Return cache counters.
+
+        Returns:
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
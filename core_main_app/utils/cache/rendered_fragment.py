@@ -0,0 +1,206 @@
+""" Cache of the HTML fragments rendered from data with an XSLT
+"""
+import hashlib
+import logging
+
+from django.core.cache import cache
+
+from core_main_app.settings import (
+    DEFAULT_DATA_RENDERING_XSLT,
+    RENDERED_FRAGMENT_CACHE_PREWARM,
+    RENDERED_FRAGMENT_CACHE_TIMEOUT,
+)
+from core_main_app.utils.cache import xslt as xslt_cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "core_main_app:rendered_fragment"
+
+
+def get_data_version(data):
+    """Return the id and version of a data (checksum, or last modification
+    date if the data has no checksum), None if the data can't be cached.
+
+    Args:
+        data: Data or dict
+
+    Returns:
+
+    """
+    data_id = _get_attribute(data, "id")
+    version = _get_attribute(data, "checksum") or _get_attribute(
+        data, "last_modification_date"
+    )
+    if data_id is None or not version:
+        return None
+    return str(data_id), str(version)
+
+
+def get_xslt_version(xsl_transformation):
+    """Return the id and version of an XslTransformation, the default
+    rendering XSLT if None, None if the XSLT can't be cached.
+
+    Args:
+        xsl_transformation:
+
+    Returns:
+
+    """
+    if xsl_transformation is None:
+        return "default", DEFAULT_DATA_RENDERING_XSLT
+    return xslt_cache.get_xsl_transformation_cache_key(xsl_transformation)
+
+
+def get_cache_key(xslt_type, data, xsl_transformation):
+    """Return the cache key of a fragment, None if it can't be cached.
+
+    The key contains the versions of the data and of the XSLT: a fragment
+    rendered from a previous version is never returned, and expires after
+    RENDERED_FRAGMENT_CACHE_TIMEOUT seconds.
+
+    Args:
+        xslt_type:
+        data:
+        xsl_transformation:
+
+    Returns:
+
+    """
+    if RENDERED_FRAGMENT_CACHE_TIMEOUT <= 0 or data is None:
+        return None
+    data_version = get_data_version(data)
+    xslt_version = get_xslt_version(xsl_transformation)
+    if data_version is None or xslt_version is None:
+        return None
+    # checksums can exceed the key length supported by memcached
+    version = hashlib.sha256(
+        "|".join((*data_version, *xslt_version)).encode("utf-8")
+    ).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{xslt_type}:{data_version[0]}:{version}"
+
+
+def get_or_render(xslt_type, data, xsl_transformation, render):
+    """Return the fragment of a data from the cache, or render and cache it.
+
+    Args:
+        xslt_type: List or Detail
+        data: Data or dict, None to not use the cache
+        xsl_transformation: XslTransformation, None for the default XSLT
+        render: function returning the fragment
+
+    Returns:
+        str: HTML fragment
+
+    """
+    cache_key = get_cache_key(xslt_type, data, xsl_transformation)
+    if cache_key is None:
+        return render()
+
+    fragment = _cache_get(cache_key)
+    if fragment is None:
+        fragment = render()
+        try:
+            cache.set(cache_key, fragment, RENDERED_FRAGMENT_CACHE_TIMEOUT)
+        except Exception as exception:
+            logger.warning(
+                "Unable to cache rendered fragment: %s", str(exception)
+            )
+    return fragment
+
+
+def prewarm(data):
+    """Render the list and detail fragments of a data with the default
+    XSLT of its template.
+
+    Args:
+        data:
+
+    Returns:
+
+    """
+    from core_main_app.components.template.models import Template
+    from core_main_app.templatetags.xsl_transform_tag import (
+        render_xml_as_html_detail,
+        render_xml_as_html_list,
+    )
+
+    if data.template.format != Template.XSD:
+        return
+    for render_xml_as_html in (
+        render_xml_as_html_list,
+        render_xml_as_html_detail,
+    ):
+        render_xml_as_html(data=data, template_id=data.template_id)
+
+
+def post_save_data(sender, instance, **kwargs):
+    """Pre-warm the fragments of a data when it is saved
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    try:
+        prewarm(instance)
+    except Exception as exception:
+        logger.warning(
+            "Unable to pre-warm rendered fragments of data %s: %s",
+            str(instance.pk),
+            str(exception),
+        )
+
+
+def init_rendered_fragment_cache():
+    """Connect the Data signal pre-warming the cache, if enabled.
+
+    Returns:
+
+    """
+    if (
+        not RENDERED_FRAGMENT_CACHE_PREWARM
+        or RENDERED_FRAGMENT_CACHE_TIMEOUT <= 0
+    ):
+        return
+
+    from django.db.models.signals import post_save
+    from core_main_app.components.data.models import Data
+
+    post_save.connect(post_save_data, sender=Data)
+
+
+def _cache_get(cache_key):
+    """Return a fragment from the cache, None if missing or if the cache is
+    unavailable.
+
+    Args:
+        cache_key:
+
+    Returns:
+
+    """
+    try:
+        return cache.get(cache_key)
+    except Exception as exception:
+        logger.warning(
+            "Unable to read rendered fragment cache: %s", str(exception)
+        )
+        return None
+
+
+def _get_attribute(obj, name):
+    """Return an attribute of an object or a value of a dict
+
+    Args:
+        obj:
+        name:
+
+    Returns:
+
+    """
+    if isinstance(obj, dict):
+        return obj.get(name, None)
+    return getattr(obj, name, None)
@@ -0,0 +1,193 @@
+""" Cache of the workspaces accessible by a user
+"""
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.core.cache import cache
+
+from core_main_app.settings import WORKSPACE_ACCESS_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+READ_ACCESS = "read"
+WRITE_ACCESS = "write"
+
+GENERATION_CACHE_KEY = "core_main_app:workspace_access:generation"
+
+_request_scope = threading.local()
+
+
+@contextmanager
+def request_scope():
+    """Memoize the accessible workspaces for the duration of the block
+    (typically a request) and count the ACL queries.
+
+    Yields:
+        dict: ACL statistics of the block
+
+    """
+    previous_scope = getattr(_request_scope, "scope", None)
+    scope = {"workspaces": {}, "acl_queries": 0, "acl_cache_hits": 0}
+    _request_scope.scope = scope
+    try:
+        yield scope
+    finally:
+        _request_scope.scope = previous_scope
+
+
+def get_request_stats():
+    """Return the ACL statistics of the current request, None if not in a
+    request scope.
+
+    Returns:
+
+    """
+    scope = getattr(_request_scope, "scope", None)
+    if scope is None:
+        return None
+    return {
+        "acl_queries": scope["acl_queries"],
+        "acl_cache_hits": scope["acl_cache_hits"],
+    }
+
+
+def get_accessible_workspaces(user, access, get_workspace_ids):
+    """Return the workspaces a user can access, from the caches if possible.
+
+    The queryset is memoized in the request scope (and evaluated once), the
+    workspace ids are cached for WORKSPACE_ACCESS_CACHE_TTL seconds.
+
+    Args:
+        user:
+        access: READ_ACCESS or WRITE_ACCESS
+        get_workspace_ids: function computing the workspace ids of the user
+
+    Returns:
+        QuerySet of Workspace
+
+    """
+    from core_main_app.components.workspace.models import Workspace
+
+    scope = getattr(_request_scope, "scope", None)
+    memo_key = (_get_user_key(user), access)
+    if scope is not None and memo_key in scope["workspaces"]:
+        scope["acl_cache_hits"] += 1
+        return scope["workspaces"][memo_key]
+
+    cache_key = None
+    workspace_ids = None
+    if WORKSPACE_ACCESS_CACHE_TTL > 0:
+        cache_key = _get_cache_key(*memo_key)
+        workspace_ids = cache.get(cache_key)
+
+    if workspace_ids is None:
+        if scope is not None:
+            scope["acl_queries"] += 1
+        workspace_ids = list(get_workspace_ids())
+        if cache_key is not None:
+            cache.set(cache_key, workspace_ids, WORKSPACE_ACCESS_CACHE_TTL)
+    elif scope is not None:
+        scope["acl_cache_hits"] += 1
+
+    workspaces = Workspace.objects.filter(pk__in=workspace_ids)
+    if scope is not None:
+        scope["workspaces"][memo_key] = workspaces
+    return workspaces
+
+
+def invalidate():
+    """Invalidate the accessible workspaces of all users.
+
+    Returns:
+
+    """
+    scope = getattr(_request_scope, "scope", None)
+    if scope is not None:
+        scope["workspaces"].clear()
+    if WORKSPACE_ACCESS_CACHE_TTL <= 0:
+        return
+    try:
+        cache.add(GENERATION_CACHE_KEY, 0, None)
+        cache.incr(GENERATION_CACHE_KEY)
+    except Exception as exception:
+        logger.warning(
+            "Unable to invalidate workspace access cache: %s", str(exception)
+        )
+
+
+def _get_user_key(user):
+    """Return the key of a user in the caches
+
+    Args:
+        user:
+
+    Returns:
+
+    """
+    if user.is_anonymous:
+        return "anonymous"
+    return f"{str(user.id)}{'-superuser' if user.is_superuser else ''}"
+
+
+def _get_cache_key(user_key, access):
+    """Return the key of the accessible workspaces in the shared cache
+
+    Args:
+        user_key:
+        access:
+
+    Returns:
+
+    """
+    generation = cache.get(GENERATION_CACHE_KEY, 0)
+    return f"core_main_app:workspace_access:{generation}:{access}:{user_key}"
+
+
+def workspace_changed(sender, instance, **kwargs):
+    """Invalidate the cache when a workspace is saved or deleted
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    invalidate()
+
+
+def permissions_changed(sender, instance, action, **kwargs):
+    """Invalidate the cache when permissions or group memberships change
+
+    Args:
+        sender:
+        instance:
+        action:
+        **kwargs:
+
+    Returns:
+
+    """
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate()
+
+
+def init_workspace_access_cache():
+    """Connect the signals invalidating the cache
+
+    Returns:
+
+    """
+    from django.contrib.auth.models import Group, User
+    from django.db.models.signals import post_save, post_delete, m2m_changed
+    from core_main_app.components.workspace.models import Workspace
+
+    post_save.connect(workspace_changed, sender=Workspace)
+    post_delete.connect(workspace_changed, sender=Workspace)
+    m2m_changed.connect(
+        permissions_changed, sender=User.user_permissions.through
+    )
+    m2m_changed.connect(permissions_changed, sender=Group.permissions.through)
+    m2m_changed.connect(permissions_changed, sender=User.groups.through)
@@ -0,0 +1,340 @@
+""" Cache of compiled XML Schema validators
+
+A compiled schema is shared by all the users unless its includes and
+imports were resolved with the request of a user (the URI resolver forwards
+the session of the user and checks its template permissions): it is then
+only reused for the requests of the same user.
+"""
+import hashlib
+import logging
+import threading
+
+from lxml import etree
+
+from core_main_app.commons import exceptions
+from core_main_app.settings import XERCES_VALIDATION, XSD_SCHEMA_CACHE_SIZE
+from core_main_app.utils import performance
+from core_main_app.utils.cache.lru_cache import LRUCache
+from core_main_app.utils.resolvers.resolver_utils import lmxl_uri_resolver
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+logger = logging.getLogger(__name__)
+
+XSD_SCHEMA_CACHE = LRUCache(XSD_SCHEMA_CACHE_SIZE)
+
+
+class CompiledXMLSchema:
+    """Compiled lxml XMLSchema and the templates it was built from"""
+
+    def __init__(self, xml_schema, dependency_ids, depends_on_request=False):
+        """Initialize compiled schema
+
+        Args:
+            xml_schema: lxml XMLSchema
+            dependency_ids: ids of all the templates included/imported
+            depends_on_request: True if includes/imports were resolved with
+                the request of a user
+        """
+        self.xml_schema = xml_schema
+        self.dependency_ids = frozenset(dependency_ids)
+        self.depends_on_request = depends_on_request
+        # XMLSchema keeps the error log of the last validation on the object
+        self.lock = threading.Lock()
+
+    def validate(self, xml_tree):
+        """Validate an XML tree.
+
+        Args:
+            xml_tree:
+
+        Returns: None if no errors, string otherwise
+
+        """
+        with performance.timed(performance.XSD_VALIDATE), self.lock:
+            try:
+                self.xml_schema.assertValid(xml_tree)
+            except Exception as exception:
+                return str(exception)
+        return None
+
+
+def get_template_cache_key(template):
+    """Return the cache key of a template, None if it can't be cached.
+
+    Args:
+        template:
+
+    Returns:
+
+    """
+    if template.pk is None:
+        return None
+    version = template.checksum or template.hash
+    if not version:
+        version = hashlib.sha1(template.content.encode("utf-8")).hexdigest()
+    return str(template.pk), version
+
+
+def get_request_cache_key(request):
+    """Return the part of the cache key identifying the user of a request.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    user_id = getattr(getattr(request, "user", None), "pk", None)
+    return f"user:{user_id}" if user_id is not None else "user:anonymous"
+
+
+def compile_xml_schema(template, request=None):
+    """Build and compile the XML Schema of a template. The schema depends on
+    the request if the URI resolver was used to resolve an include or import
+    with the request.
+
+    Args:
+        template:
+        request:
+
+    Returns: CompiledXMLSchema
+
+    """
+    with performance.timed(performance.XSD_COMPILE):
+        try:
+            xsd_tree = XSDTree.build_tree(template.content)
+        except Exception as exception:
+            raise exceptions.XSDError(str(exception))
+
+        uri_resolver = lmxl_uri_resolver(request=request)
+        if uri_resolver:
+            uri_resolver = _TrackingResolver(uri_resolver)
+            xsd_tree.parser.resolvers.add(uri_resolver)
+        try:
+            xml_schema = etree.XMLSchema(xsd_tree)
+        except Exception as exception:
+            raise exceptions.XMLError(str(exception))
+
+    return CompiledXMLSchema(
+        xml_schema,
+        _get_dependency_ids(template) if template.pk is not None else [],
+        depends_on_request=request is not None
+        and uri_resolver is not None
+        and uri_resolver.used,
+    )
+
+
+def get_xml_schema(template, request=None):
+    """Return the compiled XML Schema of a template, from the cache if possible.
+
+    Schemas compiled without resolving includes/imports with a request are
+    cached for all the users, by template id and checksum. Schemas whose
+    includes/imports were resolved with the request of a user are cached by
+    template id, checksum and user, and only returned to that user.
+
+    Args:
+        template:
+        request:
+
+    Returns: CompiledXMLSchema
+
+    """
+    cache_key = get_template_cache_key(template)
+    if cache_key is None:
+        return compile_xml_schema(template, request=request)
+
+    compiled_schema = XSD_SCHEMA_CACHE.get(cache_key)
+    if compiled_schema is None and request is not None:
+        compiled_schema = XSD_SCHEMA_CACHE.get(
+            (*cache_key, get_request_cache_key(request))
+        )
+    if compiled_schema is None:
+        compiled_schema = compile_xml_schema(template, request=request)
+        if compiled_schema.depends_on_request:
+            cache_key = (*cache_key, get_request_cache_key(request))
+        XSD_SCHEMA_CACHE.set(cache_key, compiled_schema)
+    return compiled_schema
+
+
+def validate_xml_tree(template, xml_tree, request=None):
+    """Validate an XML tree against a template.
+
+    Args:
+        template:
+        xml_tree:
+        request:
+
+    Returns: None if no errors, string otherwise
+
+    """
+    if XERCES_VALIDATION:
+        # validation is delegated to the Xerces server, nothing to cache
+        from core_main_app.utils.xml import validate_xml_data
+
+        try:
+            xsd_tree = XSDTree.build_tree(template.content)
+        except Exception as exception:
+            raise exceptions.XSDError(str(exception))
+        return validate_xml_data(xsd_tree, xml_tree, request=request)
+
+    try:
+        compiled_schema = get_xml_schema(template, request=request)
+    except exceptions.XMLError as exception:
+        return str(exception)
+    return compiled_schema.validate(xml_tree)
+
+
+def invalidate_template(template_id):
+    """Remove a template, and the templates depending on it, from the cache.
+
+    Args:
+        template_id:
+
+    Returns:
+
+    """
+    template_id = str(template_id)
+    XSD_SCHEMA_CACHE.invalidate_if(
+        lambda key, value: key[0] == template_id
+        or template_id in value.dependency_ids
+    )
+
+
+def get_cache_stats():
+    """Return hit/miss counters of the compiled schema cache.
+
+    Returns:
+
+    """
+    return XSD_SCHEMA_CACHE.stats()
+
+
+def clear_cache():
+    """Clear the compiled schema cache.
+
+    Returns:
+
+    """
+    XSD_SCHEMA_CACHE.clear()
+
+
+def post_save_template(sender, instance, **kwargs):
+    """Invalidate cached schemas when a template is saved
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    invalidate_template(instance.pk)
+
+
+def post_delete_template(sender, instance, **kwargs):
+    """Invalidate cached schemas when a template is deleted
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    invalidate_template(instance.pk)
+
+
+def m2m_changed_template_dependencies(sender, instance, action, **kwargs):
+    """Invalidate cached schemas when the dependencies of a template change
+
+    Args:
+        sender:
+        instance:
+        action:
+        **kwargs:
+
+    Returns:
+
+    """
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_template(instance.pk)
+
+
+def init_xml_schema_cache():
+    """Connect the template signals invalidating the cache
+
+    Returns:
+
+    """
+    from django.db.models.signals import (
+        post_save,
+        post_delete,
+        m2m_changed,
+    )
+    from core_main_app.components.template.models import Template
+
+    post_save.connect(post_save_template, sender=Template)
+    post_delete.connect(post_delete_template, sender=Template)
+    m2m_changed.connect(
+        m2m_changed_template_dependencies,
+        sender=Template.dependencies.through,
+    )
+
+
+class _TrackingResolver(etree.Resolver):
+    """URI resolver recording whether it was used"""
+
+    def __init__(self, resolver):
+        """Initialize resolver
+
+        Args:
+            resolver: resolver to delegate to
+        """
+        super().__init__()
+        self.resolver = resolver
+        self.used = False
+
+    def resolve(self, url, id, context):
+        """Resolve the URI with the delegate resolver
+
+        Args:
+            url:
+            id:
+            context:
+
+        Returns:
+
+        """
+        self.used = True
+        return self.resolver.resolve(url, id, context)
+
+
+def _get_dependency_ids(template):
+    """Return the ids of all the templates a template depends on (transitively).
+
+    Args:
+        template:
+
+    Returns:
+
+    """
+    dependency_ids = set()
+    templates_to_visit = [template]
+    while templates_to_visit:
+        current_template = templates_to_visit.pop()
+        try:
+            dependencies = list(current_template.dependencies.all())
+        except Exception as exception:
+            logger.warning(
+                "Unable to get dependencies of template %s: %s",
+                str(current_template.pk),
+                str(exception),
+            )
+            continue
+        for dependency in dependencies:
+            if str(dependency.pk) not in dependency_ids:
+                dependency_ids.add(str(dependency.pk))
+                templates_to_visit.append(dependency)
+    return dependency_ids
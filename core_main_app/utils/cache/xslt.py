@@ -0,0 +1,234 @@
+""" Cache of compiled XSLT stylesheets
+"""
+import hashlib
+import logging
+import threading
+
+from django.contrib.staticfiles import finders
+
+from core_main_app.commons import exceptions
+from core_main_app.settings import (
+    DEFAULT_DATA_RENDERING_XSLT,
+    XSLT_CACHE_SIZE,
+)
+from core_main_app.utils import performance
+from core_main_app.utils.cache.lru_cache import LRUCache
+from core_main_app.utils.file import read_file_content
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+logger = logging.getLogger(__name__)
+
+XSLT_CACHE = LRUCache(XSLT_CACHE_SIZE)
+
+_default_xslt = None
+_default_xslt_lock = threading.Lock()
+
+
+class CompiledXSLT:
+    """Compiled lxml XSLT transformation"""
+
+    def __init__(self, transform):
+        """Initialize compiled XSLT
+
+        Args:
+            transform: lxml XSLT
+        """
+        self.transform = transform
+        # XSLT objects keep the error log of the last run on the object
+        self.lock = threading.Lock()
+
+    def transform_xml(self, xml_string):
+        """Apply the transformation to an XML string.
+
+        Args:
+            xml_string:
+
+        Returns:
+            str: transformed document
+
+        """
+        try:
+            with performance.timed(performance.XSLT_TRANSFORM):
+                xml_tree = XSDTree.build_tree(xml_string)
+                with self.lock:
+                    transformed_tree = self.transform(xml_tree)
+                return str(transformed_tree)
+        except Exception:
+            raise exceptions.CoreError(
+                "An unexpected exception happened while transforming the XML"
+            )
+
+
+def compile_xslt(xslt_string):
+    """Compile an XSLT string.
+
+    Args:
+        xslt_string:
+
+    Returns: CompiledXSLT
+
+    """
+    try:
+        with performance.timed(performance.XSLT_COMPILE):
+            xslt_tree = XSDTree.build_tree(xslt_string)
+            return CompiledXSLT(XSDTree.transform_to_xslt(xslt_tree))
+    except Exception:
+        raise exceptions.CoreError(
+            "An unexpected exception happened while compiling the XSLT"
+        )
+
+
+def get_xsl_transformation_cache_key(xsl_transformation):
+    """Return the cache key of an XslTransformation, None if it can't be cached.
+
+    Args:
+        xsl_transformation:
+
+    Returns:
+
+    """
+    if xsl_transformation.pk is None:
+        return None
+    version = xsl_transformation.checksum
+    if not version:
+        version = hashlib.sha1(
+            xsl_transformation.content.encode("utf-8")
+        ).hexdigest()
+    return str(xsl_transformation.pk), version
+
+
+def get_xslt(xsl_transformation):
+    """Return the compiled XSLT of an XslTransformation, from the cache if possible.
+
+    Args:
+        xsl_transformation:
+
+    Returns: CompiledXSLT
+
+    """
+    cache_key = get_xsl_transformation_cache_key(xsl_transformation)
+    if cache_key is None:
+        return compile_xslt(xsl_transformation.content)
+
+    compiled_xslt = XSLT_CACHE.get(cache_key)
+    if compiled_xslt is None:
+        compiled_xslt = compile_xslt(xsl_transformation.content)
+        XSLT_CACHE.set(cache_key, compiled_xslt)
+    return compiled_xslt
+
+
+def get_default_xslt():
+    """Return the compiled DEFAULT_DATA_RENDERING_XSLT (compiled once).
+
+    Returns: CompiledXSLT
+
+    """
+    global _default_xslt
+    if _default_xslt is None:
+        with _default_xslt_lock:
+            if _default_xslt is None:
+                default_xslt_path = finders.find(DEFAULT_DATA_RENDERING_XSLT)
+                _default_xslt = compile_xslt(
+                    read_file_content(default_xslt_path)
+                )
+    return _default_xslt
+
+
+def xsl_transform(xml_string, xsl_transformation):
+    """Apply an XslTransformation to an XML string.
+
+    Args:
+        xml_string:
+        xsl_transformation:
+
+    Returns:
+        str: transformed document
+
+    """
+    return get_xslt(xsl_transformation).transform_xml(xml_string)
+
+
+def invalidate_xsl_transformation(xsl_transformation_id):
+    """Remove an XslTransformation from the cache.
+
+    Args:
+        xsl_transformation_id:
+
+    Returns:
+
+    """
+    xsl_transformation_id = str(xsl_transformation_id)
+    XSLT_CACHE.invalidate_if(
+        lambda key, value: key[0] == xsl_transformation_id
+    )
+
+
+def get_cache_stats():
+    """Return hit/miss counters of the compiled XSLT cache.
+
+    Returns:
+
+    """
+    return XSLT_CACHE.stats()
+
+
+def clear_cache():
+    """Clear the compiled XSLT cache.
+
+    Returns:
+
+    """
+    XSLT_CACHE.clear()
+
+
+def post_save_xsl_transformation(sender, instance, **kwargs):
+    """Invalidate cached XSLT when an XslTransformation is saved
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    invalidate_xsl_transformation(instance.pk)
+
+
+def post_delete_xsl_transformation(sender, instance, **kwargs):
+    """Invalidate cached XSLT when an XslTransformation is deleted
+
+    Args:
+        sender:
+        instance:
+        **kwargs:
+
+    Returns:
+
+    """
+    invalidate_xsl_transformation(instance.pk)
+
+
+def init_xslt_cache():
+    """Connect the XslTransformation signals invalidating the cache and
+    compile the default rendering XSLT.
+
+    Returns:
+
+    """
+    from django.db.models.signals import post_save, post_delete
+    from core_main_app.components.xsl_transformation.models import (
+        XslTransformation,
+    )
+
+    post_save.connect(post_save_xsl_transformation, sender=XslTransformation)
+    post_delete.connect(
+        post_delete_xsl_transformation, sender=XslTransformation
+    )
+    try:
+        get_default_xslt()
+    except Exception as exception:
+        logger.warning(
+            "Unable to compile DEFAULT_DATA_RENDERING_XSLT: %s",
+            str(exception),
+        )
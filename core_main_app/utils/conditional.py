@@ -0,0 +1,131 @@
+""" Conditional GET utils (ETag / Last-Modified)
+
+The validators are computed from the stored fields of the objects
+(checksum, dates), so a conditional request is answered without reading the
+file content from the storage.
+"""
+import hashlib
+from datetime import datetime, timezone as datetime_timezone
+
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_etags
+
+
+def get_etag(version, *variant):
+    """Return a strong ETag from the stored version of an object (checksum
+    or date) and the parameters changing its representation.
+
+    Args:
+        version: checksum or modification date, None if unknown
+        *variant: parameters of the request changing the response
+
+    Returns:
+        quoted ETag, None if the version is unknown
+
+    """
+    if not version:
+        return None
+    value = "|".join(str(item) for item in (version, *variant))
+    return f'"{hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def get_validators(obj, version_fields, date_field, *variant):
+    """Return the ETag and the Last-Modified date of an object, from its
+    stored fields.
+
+    Args:
+        obj:
+        version_fields: fields identifying the version of the object
+        date_field: modification date field, None if not used
+        *variant: parameters of the request changing the response
+
+    Returns:
+        (etag, last_modified) tuple
+
+    """
+    versions = [
+        str(version)
+        for version in (getattr(obj, field, None) for field in version_fields)
+        if version
+    ]
+    last_modified = getattr(obj, date_field, None) if date_field else None
+    return get_etag(":".join(versions), *variant), last_modified
+
+
+def get_not_modified_response(request, etag=None, last_modified=None):
+    """Return a 304 Not Modified response (412 for a failed If-Match) when
+    the client already has the current version, None otherwise.
+
+    Args:
+        request:
+        etag:
+        last_modified: datetime
+
+    Returns:
+
+    """
+    last_modified_timestamp = _get_timestamp(last_modified)
+    if etag is None and last_modified_timestamp is None:
+        return None
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified_timestamp
+    )
+    if response is not None:
+        set_conditional_headers(response, etag, last_modified)
+    return response
+
+
+def set_conditional_headers(response, etag=None, last_modified=None):
+    """Set the ETag and Last-Modified headers of a response. The response
+    is revalidated by the clients before being reused.
+
+    Args:
+        response:
+        etag:
+        last_modified: datetime
+
+    Returns:
+
+    """
+    last_modified_timestamp = _get_timestamp(last_modified)
+    if etag:
+        response["ETag"] = etag
+    if last_modified_timestamp is not None:
+        response["Last-Modified"] = http_date(last_modified_timestamp)
+    if etag or last_modified_timestamp is not None:
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def is_if_range_valid(request, etag):
+    """Return False if the Range of the request must be ignored because its
+    If-Range validator does not match the current ETag.
+
+    Args:
+        request:
+        etag:
+
+    Returns:
+
+    """
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    return etag is not None and parse_etags(if_range) == [etag]
+
+
+def _get_timestamp(date):
+    """Return the timestamp of a datetime, None if the date is not set
+
+    Args:
+        date:
+
+    Returns:
+
+    """
+    if not isinstance(date, datetime):
+        return None
+    if timezone.is_naive(date):
+        date = timezone.make_aware(date, datetime_timezone.utc)
+    return int(date.timestamp())
@@ -5,8 +5,10 @@ import pathlib
 import re
 from io import BytesIO
 from mimetypes import guess_type
+from urllib.parse import quote
 
-from django.http.response import HttpResponse
+from django.core.files.base import File
+from django.http.response import FileResponse, HttpResponse
 
 from core_main_app.commons.constants import (
     DATA_FILE_CONTENT_TYPE_FOR_TEMPLATE_FORMAT,
@@ -15,6 +17,14 @@ from core_main_app.commons.constants import (
     TEMPLATE_FILE_EXTENSION_FOR_TEMPLATE_FORMAT,
 )
 from core_main_app.commons.exceptions import CoreError
+from core_main_app.settings import (
+    FILE_DOWNLOAD_CHUNK_SIZE,
+    FILE_DOWNLOAD_OFFLOAD_HEADER,
+    FILE_DOWNLOAD_OFFLOAD_PREFIX,
+)
+from core_main_app.utils.conditional import is_if_range_valid
+
+RANGE_REGEX = re.compile(r"^bytes=(\d*)-(\d*)$")
 
 
 def get_file_http_response(
@@ -61,6 +71,173 @@ def get_file_http_response(
         raise CoreError("An unexpected error occurred.")
 
 
+def get_file_streaming_response(
+    request, file, file_name, content_type=None, extension="", etag=None
+):
+    """Return a streaming http response with a file to download, read chunk
+    by chunk from the storage. Supports single byte ranges (HTTP Range
+    header), and the offload of files of the file system storage to the web
+    server (FILE_DOWNLOAD_OFFLOAD_HEADER).
+
+    Args:
+        request:
+        file: stored file (FieldFile) or file object
+        file_name:
+        content_type:
+        extension:
+        etag: ETag of the file, the Range is ignored if If-Range differs
+
+    Returns:
+
+    """
+    if not isinstance(file, File):
+        file = File(file)
+    # guess file content type if not set
+    if content_type is None:
+        content_type = guess_type(file_name)[0] or "application/octet-stream"
+    # set filename extension
+    if extension and not file_name.endswith(extension):
+        if not extension.startswith("."):
+            extension = "." + extension
+        file_name += extension
+
+    response = _get_offload_response(file, content_type)
+    if response is None:
+        size = file.size
+        range_header = request.headers.get("Range")
+        if range_header and not is_if_range_valid(request, etag):
+            range_header = None
+        try:
+            byte_range = _get_byte_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+        if byte_range is None:
+            response = FileResponse(file, content_type=content_type)
+            response["Content-Length"] = str(size)
+        else:
+            start, end = byte_range
+            response = FileResponse(
+                _FileRange(file, start, end - start + 1),
+                status=206,
+                content_type=content_type,
+            )
+            response["Content-Length"] = str(end - start + 1)
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response.block_size = FILE_DOWNLOAD_CHUNK_SIZE
+        response["Accept-Ranges"] = "bytes"
+
+    # set content disposition in response
+    response["Content-Disposition"] = "attachment; filename=" + file_name
+    return response
+
+
+def _get_offload_response(file, content_type):
+    """Return an empty response telling the web server to send a file of
+    the file system storage, None if not enabled or not supported by the
+    storage.
+
+    Args:
+        file:
+        content_type:
+
+    Returns:
+
+    """
+    if not FILE_DOWNLOAD_OFFLOAD_HEADER:
+        return None
+    try:
+        file_path = file.path
+    except (AttributeError, NotImplementedError, ValueError):
+        return None
+    if not file_path:
+        return None
+
+    response = HttpResponse(content_type=content_type)
+    if FILE_DOWNLOAD_OFFLOAD_HEADER == "X-Accel-Redirect":
+        response[FILE_DOWNLOAD_OFFLOAD_HEADER] = quote(
+            FILE_DOWNLOAD_OFFLOAD_PREFIX.rstrip("/") + "/" + file.name
+        )
+    else:
+        response[FILE_DOWNLOAD_OFFLOAD_HEADER] = file_path
+    return response
+
+
+def _get_byte_range(range_header, size):
+    """Return the first and last positions of the byte range requested by
+    a Range header. Multiple or malformed ranges are ignored.
+
+    Args:
+        range_header:
+        size: size of the file
+
+    Returns:
+        (start, end) tuple, None to send the whole file
+
+    Raises:
+        ValueError: range not satisfiable
+
+    """
+    if not range_header or size == 0:
+        return None
+    match = RANGE_REGEX.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    start, end = match.groups()
+    if start == "":
+        # suffix range: last bytes of the file
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start = int(start)
+        end = min(int(end), size - 1) if end else size - 1
+        if match.group(2) and int(match.group(2)) < start:
+            return None
+    if start >= size:
+        raise ValueError("Range not satisfiable.")
+    return start, end
+
+
+class _FileRange:
+    """File object reading a range of bytes of a file"""
+
+    def __init__(self, file, start, length):
+        """Initialize the range
+
+        Args:
+            file:
+            start:
+            length:
+        """
+        self.file = file
+        self.file.seek(start)
+        self.remaining = length
+
+    def read(self, size=-1):
+        """Read bytes from the range.
+
+        Args:
+            size:
+
+        Returns:
+
+        """
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size) if size else b""
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        """Close the file.
+
+        Returns:
+
+        """
+        self.file.close()
+
+
 def read_file_content(file_path):
     """Read the content of a file
 
@@ -0,0 +1,368 @@
+""" Keyset paginator
+"""
+import base64
+import binascii
+import hashlib
+import json
+import logging
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db.models import F, Q, QuerySet
+from django.utils.functional import cached_property
+
+from core_main_app.commons.exceptions import PaginationError
+from core_main_app.settings import PAGINATION_COUNT_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_KEY_FIELD = "pk"
+
+
+def get_ordering(order_by_field):
+    """Return the ordering of the pages: the sorting fields followed by the
+    primary key, which makes the position of each document unique.
+
+    Args:
+        order_by_field: list of fields, prefixed by "+" or "-" (e.g. ["-title"])
+
+    Returns:
+        list of (field name, descending) tuples
+
+    """
+    ordering = []
+    for field in order_by_field or []:
+        field = field.strip()
+        if not field:
+            continue
+        descending = field.startswith("-")
+        name = field.lstrip("+-")
+        if name in ("id", "data_id"):
+            name = PRIMARY_KEY_FIELD
+        if name not in [ordering_name for ordering_name, _ in ordering]:
+            ordering.append((name, descending))
+    if PRIMARY_KEY_FIELD not in [name for name, _ in ordering]:
+        ordering.append((PRIMARY_KEY_FIELD, False))
+    return ordering
+
+
+def encode_cursor(ordering, values):
+    """Encode the position of a document in an opaque cursor.
+
+    Args:
+        ordering:
+        values: values of the ordering fields for the document
+
+    Returns:
+
+    """
+    position = {
+        "o": [
+            f"{'-' if descending else ''}{name}"
+            for name, descending in ordering
+        ],
+        "v": [_encode_value(value) for value in values],
+    }
+    return base64.urlsafe_b64encode(
+        json.dumps(position, separators=(",", ":")).encode("utf-8")
+    ).decode("ascii")
+
+
+def decode_cursor(ordering, cursor):
+    """Decode an opaque cursor, raise PaginationError if invalid.
+
+    Args:
+        ordering:
+        cursor:
+
+    Returns:
+        values of the ordering fields
+
+    """
+    try:
+        position = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        )
+        values = [_decode_value(value) for value in position["v"]]
+        fields = position["o"]
+    except (
+        binascii.Error,
+        UnicodeError,
+        ValueError,
+        KeyError,
+        TypeError,
+    ) as exception:
+        raise PaginationError(f"Invalid cursor: {str(exception)}.")
+
+    expected_fields = [
+        f"{'-' if descending else ''}{name}" for name, descending in ordering
+    ]
+    if fields != expected_fields or len(values) != len(ordering):
+        raise PaginationError("Invalid cursor: the sorting fields changed.")
+    return values
+
+
+def _encode_value(value):
+    """Encode a field value in JSON
+
+    Args:
+        value:
+
+    Returns:
+
+    """
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode_value(value):
+    """Decode a field value from JSON
+
+    Args:
+        value:
+
+    Returns:
+
+    """
+    if isinstance(value, dict):
+        return datetime.fromisoformat(value["$date"])
+    return value
+
+
+class KeysetPaginator:
+    """Paginate a Django or MongoEngine queryset with keyset (seek) queries.
+
+    Each page filters the documents located after the last document of the
+    previous page (WHERE (f1, f2, id) > (v1, v2, vid)) instead of skipping
+    the previous pages: deep pages are as fast as the first one.
+
+    Null values are placed after the other values in ascending order with
+    the Django ORM (PostgreSQL default), before them with MongoDB.
+    """
+
+    def __init__(self, object_list, per_page, order_by_field):
+        """Initialize paginator
+
+        Args:
+            object_list: Django or MongoEngine queryset
+            per_page:
+            order_by_field: sorting fields (e.g. DATA_SORTING_FIELDS)
+        """
+        self.object_list = object_list
+        self.per_page = per_page
+        self.ordering = get_ordering(order_by_field)
+        self.is_django_queryset = isinstance(object_list, QuerySet)
+
+    def page(self, cursor=None):
+        """Return the page located after the cursor, and the cursor of the
+        next page (None if last page).
+
+        Args:
+            cursor: opaque cursor, None for the first page
+
+        Returns:
+            list, str
+
+        """
+        queryset = self._order(self.object_list)
+        if cursor:
+            queryset = queryset.filter(
+                self._get_after_filter(decode_cursor(self.ordering, cursor))
+            )
+
+        items = list(queryset[: self.per_page + 1])
+        if len(items) <= self.per_page:
+            return items, None
+        items = items[: self.per_page]
+        return items, encode_cursor(self.ordering, self._get_values(items[-1]))
+
+    @cached_property
+    def count(self):
+        """Return the total number of documents, cached for
+        PAGINATION_COUNT_CACHE_TTL seconds.
+
+        Returns:
+
+        """
+        cache_key = None
+        if PAGINATION_COUNT_CACHE_TTL > 0:
+            cache_key = self._get_count_cache_key()
+            if cache_key is not None:
+                count = cache.get(cache_key)
+                if count is not None:
+                    return count
+
+        count = self.object_list.count()
+        if cache_key is not None:
+            cache.set(cache_key, count, PAGINATION_COUNT_CACHE_TTL)
+        return count
+
+    def _get_count_cache_key(self):
+        """Return the cache key of the count of the queryset, None if the
+        query can't be serialized.
+
+        Returns:
+
+        """
+        try:
+            if self.is_django_queryset:
+                query = str(self.object_list.order_by().query)
+            else:
+                query = json.dumps(
+                    self.object_list._query, sort_keys=True, default=str
+                )
+        except Exception as exception:
+            logger.warning(
+                "Unable to build the count cache key: %s", str(exception)
+            )
+            return None
+        return (
+            "core_main_app:pagination:count:"
+            f"{hashlib.sha1(query.encode('utf-8')).hexdigest()}"
+        )
+
+    def _order(self, queryset):
+        """Sort the queryset by the ordering fields
+
+        Args:
+            queryset:
+
+        Returns:
+
+        """
+        if self.is_django_queryset:
+            return queryset.order_by(
+                *[
+                    F(name).desc(nulls_first=True)
+                    if descending
+                    else F(name).asc(nulls_last=True)
+                    for name, descending in self.ordering
+                ]
+            )
+        return queryset.order_by(
+            *[
+                f"{'-' if descending else '+'}{name}"
+                for name, descending in self.ordering
+            ]
+        )
+
+    def _get_values(self, document):
+        """Return the values of the ordering fields of a document
+
+        Args:
+            document:
+
+        Returns:
+
+        """
+        values = []
+        for name, _ in self.ordering:
+            if name == PRIMARY_KEY_FIELD:
+                values.append(document.pk)
+            elif self.is_django_queryset:
+                # use the column value of the foreign keys (e.g. template_id)
+                field = document._meta.get_field(name)
+                values.append(getattr(document, field.attname))
+            else:
+                values.append(getattr(document, name))
+        return values
+
+    def _get_after_filter(self, values):
+        """Return the filter selecting the documents located after the
+        position: (f1 > v1) or (f1 = v1 and f2 > v2) or ...
+
+        Args:
+            values:
+
+        Returns:
+
+        """
+        q_class = Q
+        if not self.is_django_queryset:
+            from mongoengine.queryset.visitor import Q as MongoQ
+
+            q_class = MongoQ
+
+        after_filter = None
+        equal_filter = None
+        for (name, descending), value in zip(self.ordering, values):
+            field_filter = self._get_field_after_filter(
+                q_class, name, descending, value
+            )
+            if field_filter is not None:
+                if equal_filter is not None:
+                    field_filter = equal_filter & field_filter
+                after_filter = (
+                    field_filter
+                    if after_filter is None
+                    else after_filter | field_filter
+                )
+            field_equal_filter = (
+                q_class(**{f"{name}__isnull": True})
+                if self.is_django_queryset and value is None
+                else q_class(**{name: value})
+            )
+            equal_filter = (
+                field_equal_filter
+                if equal_filter is None
+                else equal_filter & field_equal_filter
+            )
+        return after_filter if after_filter is not None else q_class(pk=None)
+
+    def _get_field_after_filter(self, q_class, name, descending, value):
+        """Return the filter selecting the values of a field located after a
+        value, None if there are none.
+
+        Args:
+            q_class: Django or MongoEngine Q
+            name:
+            descending:
+            value:
+
+        Returns:
+
+        """
+        # nulls are the greatest values with the ORM, the smallest with Mongo
+        nulls_greatest = self.is_django_queryset
+        operator = "lt" if descending else "gt"
+        nulls_after = nulls_greatest != descending
+        if value is None:
+            if nulls_after:
+                return None
+            return self._get_not_null_filter(q_class, name)
+
+        field_filter = q_class(**{f"{name}__{operator}": value})
+        if nulls_after:
+            field_filter = field_filter | self._get_null_filter(q_class, name)
+        return field_filter
+
+    def _get_null_filter(self, q_class, name):
+        """Return the filter selecting null values
+
+        Args:
+            q_class:
+            name:
+
+        Returns:
+
+        """
+        if self.is_django_queryset:
+            return q_class(**{f"{name}__isnull": True})
+        return q_class(**{name: None})
+
+    def _get_not_null_filter(self, q_class, name):
+        """Return the filter selecting not null values
+
+        Args:
+            q_class:
+            name:
+
+        Returns:
+
+        """
+        if self.is_django_queryset:
+            return q_class(**{f"{name}__isnull": False})
+        return q_class(**{f"{name}__ne": None})
@@ -1,9 +1,14 @@
 """Pagination configuration for rest_framework
 """
 from django.conf import settings
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
-from core_main_app.settings import RESULTS_PER_PAGE
+from core_main_app.settings import DATA_SORTING_FIELDS, RESULTS_PER_PAGE
+from core_main_app.utils.pagination.keyset_paginator.paginator import (
+    KeysetPaginator,
+)
 from core_main_app.utils.pagination.mongoengine_paginator.paginator import (
     MongoenginePaginator,
 )
@@ -15,3 +20,82 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size = RESULTS_PER_PAGE
     if settings.MONGODB_INDEXING:
         django_paginator_class = MongoenginePaginator
+
+
+class CursorResultsSetPagination(BasePagination):
+    """Keyset pagination with opaque continuation cursors.
+
+    The first page is requested with an empty cursor (?cursor=), the
+    following pages with the cursor returned in the `next` link. The total
+    count is only returned if requested (?count=true).
+    """
+
+    page_size = RESULTS_PER_PAGE
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+
+    def __init__(self, order_by_field=None):
+        """Initialize pagination
+
+        Args:
+            order_by_field: sorting fields, DATA_SORTING_FIELDS if None
+        """
+        self.order_by_field = (
+            DATA_SORTING_FIELDS if order_by_field is None else order_by_field
+        )
+        self.request = None
+        self.paginator = None
+        self.next_cursor = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return the page of the queryset located after the request cursor
+
+        Args:
+            queryset:
+            request:
+            view:
+
+        Returns:
+
+        """
+        self.request = request
+        self.paginator = KeysetPaginator(
+            queryset, self.page_size, self.order_by_field
+        )
+        page, self.next_cursor = self.paginator.page(
+            request.query_params.get(self.cursor_query_param) or None
+        )
+        return page
+
+    def get_next_link(self):
+        """Return the link of the next page, None if last page
+
+        Returns:
+
+        """
+        if self.next_cursor is None:
+            return None
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.count_query_param
+        )
+        return replace_query_param(
+            url, self.cursor_query_param, self.next_cursor
+        )
+
+    def get_paginated_response(self, data):
+        """Return the paginated response
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        content = {"next": self.get_next_link()}
+        if (
+            self.request.query_params.get(self.count_query_param, "").lower()
+            == "true"
+        ):
+            content["count"] = self.paginator.count
+        content["results"] = data
+        return Response(content)
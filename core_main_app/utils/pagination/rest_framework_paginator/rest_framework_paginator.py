@@ -4,6 +4,7 @@ from urllib.parse import urlparse
 
 from core_main_app.commons.exceptions import PaginationError
 from core_main_app.utils.pagination.rest_framework_paginator.pagination import (
+    CursorResultsSetPagination,
     StandardResultsSetPagination,
 )
 
@@ -47,3 +48,18 @@ def get_paginator():
     """
     # return paginator
     return StandardResultsSetPagination()
+
+
+def get_data_paginator(request, order_by_field=None):
+    """Create a paginator, with cursor pagination if requested (?cursor=)
+
+    Args:
+        request:
+        order_by_field: sorting fields of the cursor pagination
+
+    Returns:
+
+    """
+    if CursorResultsSetPagination.cursor_query_param in request.query_params:
+        return CursorResultsSetPagination(order_by_field=order_by_field)
+    return StandardResultsSetPagination()
@@ -0,0 +1,433 @@
+""" Per-request performance instrumentation
+
+The operations of a sampled request (SQL queries, MongoDB commands, storage
+reads and writes, XSD/XSLT compilations and transformations, ACL checks) are
+counted and timed in a request scope. The summaries of the requests are
+aggregated by process to compute percentiles.
+"""
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+
+from core_main_app.settings import (
+    PERFORMANCE_SAMPLE_RATE,
+    PERFORMANCE_STATS_WINDOW,
+)
+
+logger = logging.getLogger(__name__)
+
+SQL = "sql"
+MONGO = "mongo"
+XSD_COMPILE = "xsd_compile"
+XSD_VALIDATE = "xsd_validate"
+XSLT_COMPILE = "xslt_compile"
+XSLT_TRANSFORM = "xslt_transform"
+ACL_CHECK = "acl_check"
+OPERATIONS = (
+    SQL,
+    MONGO,
+    XSD_COMPILE,
+    XSD_VALIDATE,
+    XSLT_COMPILE,
+    XSLT_TRANSFORM,
+    ACL_CHECK,
+)
+PERCENTILES = (50, 90, 99)
+
+_request_metrics = contextvars.ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """Counts and durations of the operations of a request"""
+
+    def __init__(self):
+        """Initialize metrics"""
+        self.start_time = time.perf_counter()
+        self.counts = defaultdict(int)
+        self.durations = defaultdict(float)
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.active_operations = set()
+        self.excluded_durations = defaultdict(float)
+
+    def record(self, operation, duration):
+        """Record an operation.
+
+        Args:
+            operation:
+            duration: in seconds
+
+        Returns:
+
+        """
+        self.counts[operation] += 1
+        self.durations[operation] += duration
+
+    def get_summary(self, acl_stats=None):
+        """Return the metrics of the request as a flat dictionary (durations
+        in milliseconds).
+
+        Args:
+            acl_stats: ACL statistics of the workspace access cache
+
+        Returns:
+
+        """
+        summary = {
+            "total_ms": (time.perf_counter() - self.start_time) * 1000,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+        }
+        for operation in OPERATIONS:
+            summary[f"{operation}_count"] = self.counts[operation]
+            summary[f"{operation}_ms"] = self.durations[operation] * 1000
+        if acl_stats:
+            summary.update(acl_stats)
+        return summary
+
+
+class PerformanceStats:
+    """Summaries of the last sampled requests of the process"""
+
+    def __init__(self, window):
+        """Initialize stats
+
+        Args:
+            window: number of request summaries kept
+        """
+        self.window = window
+        self._summaries = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.sampled_requests = 0
+
+    def add(self, summary):
+        """Add the summary of a request.
+
+        Args:
+            summary:
+
+        Returns:
+
+        """
+        with self._lock:
+            self._summaries.append(summary)
+            self.sampled_requests += 1
+
+    def get_percentiles(self):
+        """Return the percentiles of each metric of the kept summaries.
+
+        Returns:
+
+        """
+        with self._lock:
+            summaries = list(self._summaries)
+            sampled_requests = self.sampled_requests
+        metrics = {}
+        for name in sorted({key for summary in summaries for key in summary}):
+            values = sorted(summary.get(name, 0) for summary in summaries)
+            metrics[name] = {
+                f"p{percentile}": _get_percentile(values, percentile)
+                for percentile in PERCENTILES
+            }
+            metrics[name]["max"] = values[-1]
+            metrics[name]["mean"] = sum(values) / len(values)
+        return {
+            "sampled_requests": sampled_requests,
+            "window": len(summaries),
+            "metrics": metrics,
+        }
+
+    def clear(self):
+        """Remove all the summaries.
+
+        Returns:
+
+        """
+        with self._lock:
+            self._summaries.clear()
+            self.sampled_requests = 0
+
+
+PERFORMANCE_STATS = PerformanceStats(PERFORMANCE_STATS_WINDOW)
+
+
+def is_sampled():
+    """Return True if the current request should be instrumented.
+
+    Returns:
+
+    """
+    return PERFORMANCE_SAMPLE_RATE > 0 and (
+        PERFORMANCE_SAMPLE_RATE >= 1
+        or random.random() < PERFORMANCE_SAMPLE_RATE
+    )
+
+
+@contextmanager
+def request_scope():
+    """Instrument the operations executed in the scope.
+
+    Returns:
+
+    """
+    metrics = RequestMetrics()
+    token = _request_metrics.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_time_sql))
+            yield metrics
+    finally:
+        _request_metrics.reset(token)
+
+
+def get_request_metrics():
+    """Return the metrics of the current request, None if not instrumented.
+
+    Returns:
+
+    """
+    return _request_metrics.get()
+
+
+def record(operation, duration):
+    """Record an operation of the current request.
+
+    Args:
+        operation:
+        duration: in seconds
+
+    Returns:
+
+    """
+    metrics = _request_metrics.get()
+    if metrics is not None:
+        metrics.record(operation, duration)
+
+
+@contextmanager
+def timed(operation):
+    """Time the operations executed in the context, if the current request
+    is instrumented. Nested operations of the same type (e.g. ACL checks of
+    APIs calling other APIs) are counted once.
+
+    Args:
+        operation:
+
+    Returns:
+
+    """
+    metrics = _request_metrics.get()
+    if metrics is None or operation in metrics.active_operations:
+        yield
+        return
+    metrics.active_operations.add(operation)
+    start_time = time.perf_counter()
+    excluded_duration = metrics.excluded_durations[operation]
+    try:
+        yield
+    finally:
+        metrics.active_operations.discard(operation)
+        metrics.record(
+            operation,
+            time.perf_counter()
+            - start_time
+            - (metrics.excluded_durations[operation] - excluded_duration),
+        )
+
+
+@contextmanager
+def excluded(operation):
+    """Exclude the time spent in the context from the duration of the
+    enclosing timed operation (e.g. the API call made by an ACL check).
+    Operations of the same type executed in the context are timed
+    separately.
+
+    Args:
+        operation:
+
+    Returns:
+
+    """
+    metrics = _request_metrics.get()
+    if metrics is None or operation not in metrics.active_operations:
+        yield
+        return
+    metrics.active_operations.discard(operation)
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.excluded_durations[operation] += (
+            time.perf_counter() - start_time
+        )
+        metrics.active_operations.add(operation)
+
+
+def record_bytes_read(size):
+    """Record bytes read from the file storage.
+
+    Args:
+        size:
+
+    Returns:
+
+    """
+    metrics = _request_metrics.get()
+    if metrics is not None:
+        metrics.bytes_read += size
+
+
+def record_bytes_written(size):
+    """Record bytes written to the file storage.
+
+    Args:
+        size:
+
+    Returns:
+
+    """
+    metrics = _request_metrics.get()
+    if metrics is not None:
+        metrics.bytes_written += size
+
+
+def get_server_timing(summary):
+    """Return the Server-Timing header value of a request summary.
+
+    Args:
+        summary:
+
+    Returns:
+
+    """
+    entries = [f"total;dur={summary['total_ms']:.1f}"]
+    for operation in OPERATIONS:
+        count = summary[f"{operation}_count"]
+        if count:
+            entries.append(
+                f"{operation};dur={summary[f'{operation}_ms']:.1f};"
+                f'desc="{count}"'
+            )
+    if summary["bytes_read"] or summary["bytes_written"]:
+        entries.append(
+            f'storage;desc="read {summary["bytes_read"]} B, '
+            f'written {summary["bytes_written"]} B"'
+        )
+    return ", ".join(entries)
+
+
+def get_performance_stats():
+    """Return the percentiles of the sampled requests, and the statistics of
+    the caches of the process.
+
+    Returns:
+
+    """
+    from core_main_app.utils.cache import xml_schema as xml_schema_cache
+    from core_main_app.utils.cache import xslt as xslt_cache
+    from core_main_app.utils.query.mongo.query_plan import (
+        get_query_plan_stats,
+    )
+
+    return {
+        "sample_rate": PERFORMANCE_SAMPLE_RATE,
+        "requests": PERFORMANCE_STATS.get_percentiles(),
+        "caches": {
+            "xml_schema": xml_schema_cache.get_cache_stats(),
+            "xslt": xslt_cache.get_cache_stats(),
+            "query_plan": get_query_plan_stats(),
+        },
+    }
+
+
+def init_performance_instrumentation():
+    """Register the MongoDB command listener (before the clients are
+    created).
+
+    Returns:
+
+    """
+    if PERFORMANCE_SAMPLE_RATE <= 0:
+        return
+    try:
+        from pymongo import monitoring
+    except ImportError:
+        return
+
+    class MongoCommandListener(monitoring.CommandListener):
+        """Record the MongoDB commands of the instrumented requests"""
+
+        def started(self, event):
+            """Command started
+
+            Args:
+                event:
+
+            Returns:
+
+            """
+
+        def succeeded(self, event):
+            """Command succeeded
+
+            Args:
+                event:
+
+            Returns:
+
+            """
+            record(MONGO, event.duration_micros / 1e6)
+
+        def failed(self, event):
+            """Command failed
+
+            Args:
+                event:
+
+            Returns:
+
+            """
+            record(MONGO, event.duration_micros / 1e6)
+
+    monitoring.register(MongoCommandListener())
+
+
+def _time_sql(execute, sql, params, many, context):
+    """Execute wrapper timing the SQL queries
+
+    Args:
+        execute:
+        sql:
+        params:
+        many:
+        context:
+
+    Returns:
+
+    """
+    start_time = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        record(SQL, time.perf_counter() - start_time)
+
+
+def _get_percentile(sorted_values, percentile):
+    """Return the percentile of sorted values (nearest rank).
+
+    Args:
+        sorted_values:
+        percentile:
+
+    Returns:
+
+    """
+    index = max(0, -(-len(sorted_values) * percentile // 100) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
@@ -0,0 +1,572 @@
+""" Cache of translated query plans
+
+The translation of a query to the ORM only depends on its shape: the keys,
+the operators and the types of the values. A query plan is built once per
+shape and kept in a LRU cache. It records where the values are located in
+the query, and rebuilds the Q objects from the values of each new query
+without translating it again.
+"""
+import logging
+import re
+import threading
+import time
+
+from django.conf import settings
+
+from core_main_app.commons.exceptions import QueryError
+from core_main_app.settings import QUERY_PLAN_CACHE_SIZE
+from core_main_app.utils.cache.lru_cache import LRUCache
+from core_main_app.utils.databases.backend import uses_postgresql_backend
+from core_main_app.utils.query.mongo.prepare import (
+    sanitize_number,
+    sanitize_value,
+)
+
+logger = logging.getLogger(__name__)
+
+QUERY_PLAN_CACHE = LRUCache(QUERY_PLAN_CACHE_SIZE)
+
+ACCESS_FILTER_KEYS = ("workspace", "_workspace_id", "user_id", "_id", "id")
+LOGICAL_OPERATORS = ("$and", "$or")
+
+# value transformations applied when the Q objects are built
+NUMBER_VALUE = "number"
+PATTERN_VALUE = "pattern"
+
+_stats_lock = threading.Lock()
+_stats = {
+    "translations": 0,
+    "translation_time": 0.0,
+    "builds": 0,
+    "build_time": 0.0,
+}
+
+
+class QueryPlan:
+    """Translated query, built from the paths of the values in the query"""
+
+    def __init__(self, q_class, query_steps, access_filters):
+        """Initialize query plan
+
+        Args:
+            q_class: Django or MongoEngine Q
+            query_steps: list of (operator, step) combined in a Q
+            access_filters: list of (filter name, path, is list)
+        """
+        self.q_class = q_class
+        self.query_steps = query_steps
+        self.access_filters = access_filters
+
+    def get_query(self, query_dict):
+        """Build the Q object of a query with the shape of the plan
+
+        Args:
+            query_dict:
+
+        Returns:
+
+        """
+        return self._build_steps(self.query_steps, query_dict)
+
+    def get_access_filters(self, query_dict):
+        """Return the workspace and user filters of a query with the shape of
+        the plan
+
+        Args:
+            query_dict:
+
+        Returns:
+            list of workspaces, list of users
+
+        """
+        filters = {"workspace": [], "user": []}
+        for name, path, is_list in self.access_filters:
+            value = _get_value(query_dict, path)
+            values = value if is_list else [value]
+            if name == "user":
+                values = [str(user_id) for user_id in values]
+            filters[name].extend(values)
+        return filters["workspace"], filters["user"]
+
+    def _build_steps(self, steps, query_dict):
+        """Combine the Q objects of a list of steps
+
+        Args:
+            steps:
+            query_dict:
+
+        Returns:
+
+        """
+        q_list = self.q_class()
+        for operator, step in steps:
+            query = self._build_step(step, query_dict)
+            if operator == "|":
+                q_list |= query
+            else:
+                q_list &= query
+        return q_list
+
+    def _build_step(self, step, query_dict):
+        """Build the Q object of a step
+
+        Args:
+            step:
+            query_dict:
+
+        Returns:
+
+        """
+        step_type = step[0]
+        if step_type == "filter":
+            _, lookup, path, transform, negate = step
+            value = _get_value(query_dict, path)
+            if transform == NUMBER_VALUE:
+                value = sanitize_number(value)
+            elif transform == PATTERN_VALUE:
+                value = value.pattern
+            query = self.q_class(**{lookup: sanitize_value(value)})
+            return ~query if negate else query
+        if step_type == "constant":
+            _, lookup, value, negate = step
+            query = self.q_class(**{lookup: sanitize_value(value)})
+            return ~query if negate else query
+        if step_type == "text":
+            return self._build_text_query(_get_value(query_dict, step[1]))
+        # sub query
+        return self._build_steps(step[1], query_dict)
+
+    def _build_text_query(self, text_query):
+        """Build a full text query
+
+        Args:
+            text_query:
+
+        Returns:
+
+        """
+        if not isinstance(text_query, str):
+            raise QueryError("Unsupported value found in: $text")
+        # strip white spaces
+        text_query = text_query.strip()
+        # sanitize string
+        sanitize_value(text_query)
+        # if data stored in MongoDB
+        if settings.MONGODB_INDEXING:
+            return self.q_class(__raw__={"$text": {"$search": text_query}})
+        # if data stored in PostgreSQL
+        if uses_postgresql_backend():
+            return self.q_class(vector_column=text_query)
+        # if keywords indexed
+        from core_main_app.components.keyword_index import (
+            api as keyword_index_api,
+        )
+
+        if keyword_index_api.is_keyword_index_enabled():
+            return keyword_index_api.get_keyword_filter(text_query)
+        # extract keywords from dict
+        query = self.q_class()
+        for keyword in text_query.split(" "):
+            # add text filter
+            query &= self.q_class(
+                dict_content__icontains=keyword.replace('"', "")
+            )
+        return query
+
+
+def get_query_plan(query_dict):
+    """Return the plan of a query, from the cache if a query with the same
+    shape was already translated.
+
+    Args:
+        query_dict:
+
+    Returns:
+
+    """
+    shape = (settings.MONGODB_INDEXING, get_query_shape(query_dict))
+    query_plan = QUERY_PLAN_CACHE.get(shape)
+    if query_plan is None:
+        start = time.perf_counter()
+        query_plan = compile_query_plan(query_dict)
+        _update_stats("translation", time.perf_counter() - start)
+        QUERY_PLAN_CACHE.set(shape, query_plan)
+    return query_plan
+
+
+def convert_query(query_dict):
+    """Translate a query to a Q object and extract its access filters
+
+    Args:
+        query_dict:
+
+    Returns:
+        Q, list of workspaces, list of users
+
+    """
+    query_plan = get_query_plan(query_dict)
+    start = time.perf_counter()
+    query = query_plan.get_query(query_dict)
+    workspace_filter, user_filter = query_plan.get_access_filters(query_dict)
+    _update_stats("build", time.perf_counter() - start)
+    return query, workspace_filter, user_filter
+
+
+def convert_to_query(query_dict):
+    """Translate a query to a Q object
+
+    Args:
+        query_dict:
+
+    Returns:
+
+    """
+    query_plan = get_query_plan(query_dict)
+    start = time.perf_counter()
+    query = query_plan.get_query(query_dict)
+    _update_stats("build", time.perf_counter() - start)
+    return query
+
+
+def get_query_shape(query_dict):
+    """Return the shape of a query: keys, operators and types of the values.
+    Raise QueryError if the $where operator is found.
+
+    Args:
+        query_dict:
+
+    Returns:
+
+    """
+    if not isinstance(query_dict, dict):
+        return _get_value_shape(query_dict)
+    shape = []
+    for key, value in query_dict.items():
+        if "$where" in key:
+            raise QueryError("Unsupported operator found")
+        if key in LOGICAL_OPERATORS and isinstance(value, list):
+            value_shape = (
+                "list",
+                tuple(get_query_shape(sub_value) for sub_value in value),
+            )
+        elif isinstance(value, dict):
+            value_shape = get_query_shape(value)
+        else:
+            value_shape = _get_value_shape(value)
+        shape.append((key, value_shape))
+    return "dict", tuple(shape)
+
+
+def _get_value_shape(value):
+    """Return the shape of a value
+
+    Args:
+        value:
+
+    Returns:
+
+    """
+    if isinstance(value, str):
+        if "$where" in value:
+            raise QueryError("Unsupported operator found")
+        return str
+    if isinstance(value, bool):
+        return bool, value
+    if isinstance(value, (int, float)) or value is None:
+        return type(value)
+    if "$where" in str(value):
+        raise QueryError("Unsupported operator found")
+    return type(value)
+
+
+def compile_query_plan(query_dict):
+    """Translate a query to a query plan
+
+    Args:
+        query_dict:
+
+    Returns:
+
+    """
+    if settings.MONGODB_INDEXING:
+        from mongoengine.queryset.visitor import Q
+    else:
+        from django.db.models import Q
+
+    return QueryPlan(
+        Q,
+        _compile_query_steps(query_dict, ()),
+        _compile_access_filters(query_dict, ()),
+    )
+
+
+def _compile_query_steps(query_dict, path):
+    """Extract criteria from mongodb query and translates them to steps
+    building a django ORM query
+
+    Args:
+        query_dict:
+        path: path of the query in the full query
+
+    Returns:
+
+    """
+    template_key = "_template_id" if settings.MONGODB_INDEXING else "template"
+    steps = []
+    # iterate through query dict key/value pairs
+    for key, value in query_dict.items():
+        value_path = path + (key,)
+        # if the key is not an operator
+        if not key.startswith("$"):
+            # check if $ found in key
+            if "$" in key:
+                raise QueryError("Unsupported $ operator found")
+            # ignore workspace and user_id filters (dealt with by acl layer)
+            if key in ACCESS_FILTER_KEYS:
+                continue
+            # if key is template
+            if key == "template":
+                # check if filtering by a list
+                if isinstance(value, dict) and "$in" in value:
+                    # add filter by list of templates
+                    steps.append(
+                        (
+                            "&",
+                            (
+                                "filter",
+                                f"{template_key}__in",
+                                value_path + ("$in",),
+                                None,
+                                False,
+                            ),
+                        )
+                    )
+                # check if filtering by single value
+                elif isinstance(value, (int, str)):
+                    # add filter by value (template id)
+                    steps.append(
+                        (
+                            "&",
+                            ("filter", template_key, value_path, None, False),
+                        )
+                    )
+            else:
+                steps.append(("&", _compile_filter(key, value, value_path)))
+        # if operator and
+        elif key == "$and":
+            # iterate though sub dict
+            for index, sub_value in enumerate(value):
+                steps.append(
+                    (
+                        "&",
+                        (
+                            "query",
+                            _compile_query_steps(
+                                sub_value, value_path + (index,)
+                            ),
+                        ),
+                    )
+                )
+        # if operator or
+        elif key == "$or":
+            # iterate through sub dict
+            for index, sub_value in enumerate(value):
+                steps.append(
+                    (
+                        "|",
+                        (
+                            "query",
+                            _compile_query_steps(
+                                sub_value, value_path + (index,)
+                            ),
+                        ),
+                    )
+                )
+        # if operators text and search found
+        elif key == "$text" and isinstance(value, dict) and "$search" in value:
+            steps.append(("&", ("text", value_path + ("$search",))))
+        else:
+            # raise an error if another operator was found
+            raise QueryError(f"Unsupported operator found: {key}")
+    return steps
+
+
+def _compile_filter(key, value, value_path):
+    """Translate the criteria on a field to a step
+
+    Args:
+        key:
+        value:
+        value_path:
+
+    Returns:
+
+    """
+    # initialize negate var to invert django queries
+    negate = False
+    # replace dots by double underscores (django notation)
+    key = key.replace(".", "__")
+    # initialize operator
+    operator = "exact"
+    transform = None
+    # check if not operator
+    if isinstance(value, dict) and "$not" in value:
+        negate = True
+        # add not to key
+        key = f"{key}__not" if settings.MONGODB_INDEXING else key
+        # move value to document in $not
+        value = value["$not"]
+        value_path += ("$not",)
+    # if value is a regex
+    if isinstance(value, re.Pattern):
+        # set regex operator
+        operator = "regex"
+        # set value with regex pattern
+        transform = PATTERN_VALUE
+    # if the value is a dict
+    elif isinstance(value, dict):
+        for value_operator, lookup_operator in (
+            ("$ne", "exact"),
+            ("$eq", "exact"),
+            ("$lt", "lt"),
+            ("$lte", "lte"),
+            ("$gt", "gt"),
+            ("$gte", "gte"),
+            ("$in", "in"),
+            ("$regex", "regex"),
+        ):
+            if value_operator in value:
+                operator = lookup_operator
+                value_path += (value_operator,)
+                if value_operator == "$ne":
+                    # set not equal to create query not
+                    negate = True
+                    operator = "ne" if settings.MONGODB_INDEXING else operator
+                elif value_operator in ("$lt", "$lte", "$gt", "$gte"):
+                    transform = NUMBER_VALUE
+                break
+        else:
+            # check if exists operator
+            if "$exists" not in value:
+                # If an operator not listed above is found, an exception is raised
+                raise QueryError(f"Unsupported operator found: {value}")
+            # skip case where set to False for now (i.e. can not look for documents where path is absent)
+            if value["$exists"] is False:
+                raise QueryError(
+                    'Unsupported operator found: {"$exists": False}'
+                )
+            if settings.MONGODB_INDEXING:
+                # set exists operator
+                return (
+                    "constant",
+                    f"{key}__exists",
+                    True,
+                    False,
+                )
+            # look for the last element of the key in the rest of the path
+            # (e.g. dict_content__root__element: dict_content__root has key element)
+            *key_path, value = key.split("__")
+            return (
+                "constant",
+                f"{'__'.join(key_path)}__has_key",
+                value,
+                negate,
+            )
+    return (
+        "filter",
+        f"{key}__{operator}",
+        value_path,
+        transform,
+        negate and not settings.MONGODB_INDEXING,
+    )
+
+
+def _compile_access_filters(query_dict, path):
+    """Return the location of the workspace and user filters of a query
+
+    Args:
+        query_dict:
+        path:
+
+    Returns:
+        list of (filter name, path, is list)
+
+    """
+    access_filters = []
+    for key, value in query_dict.items():
+        value_path = path + (key,)
+        if key in ("workspace", "user_id"):
+            name = "workspace" if key == "workspace" else "user"
+            # if filter on a list of values
+            if isinstance(value, dict) and "$in" in value:
+                access_filters.append((name, value_path + ("$in",), True))
+            # if filter on a single value
+            elif isinstance(value, (int, str)) or (
+                name == "workspace" and value is None
+            ):
+                access_filters.append((name, value_path, False))
+        elif key in LOGICAL_OPERATORS:
+            for index, sub_value in enumerate(value):
+                access_filters.extend(
+                    _compile_access_filters(sub_value, value_path + (index,))
+                )
+    return access_filters
+
+
+def _get_value(query_dict, path):
+    """Return the value located at path in the query
+
+    Args:
+        query_dict:
+        path:
+
+    Returns:
+
+    """
+    value = query_dict
+    for key in path:
+        value = value[key]
+    return value
+
+
+def _update_stats(name, duration):
+    """Update the translation statistics
+
+    Args:
+        name: translation or build
+        duration:
+
+    Returns:
+
+    """
+    with _stats_lock:
+        _stats[f"{name}s"] += 1
+        _stats[f"{name}_time"] += duration
+
+
+def get_query_plan_stats():
+    """Return the statistics of the query plan cache: hits, misses, hit rate,
+    number and total time (in seconds) of the translations and of the query
+    builds.
+
+    Returns:
+
+    """
+    stats = QUERY_PLAN_CACHE.stats()
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    with _stats_lock:
+        stats.update(_stats)
+    return stats
+
+
+def clear_query_plan_cache():
+    """Clear the query plan cache and its statistics
+
+    Returns:
+
+    """
+    QUERY_PLAN_CACHE.clear()
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0 if isinstance(_stats[key], int) else 0.0
@@ -0,0 +1,178 @@
+""" lxml URI resolver serving the templates of this server from the database
+"""
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core_main_app.settings import (
+    SERVER_URI,
+    SSL_CERTIFICATES_DIR,
+    XSD_URI_RESOLVER_CACHE_TIMEOUT,
+)
+from core_main_app.utils.cache.lru_cache import LRUCache
+from core_main_app.utils.resolvers.requests_resolver import RequestsResolver
+from core_main_app.utils.urls import get_template_download_pattern
+
+logger = logging.getLogger(__name__)
+
+REMOTE_CONTENT_CACHE_SIZE = 128
+REMOTE_CONTENT_CACHE = LRUCache(REMOTE_CONTENT_CACHE_SIZE)
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """Return the HTTP session shared by the resolvers of the process
+    (connection pool with keep-alive).
+
+    Returns:
+
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                http_session = requests.Session()
+                http_session.verify = SSL_CERTIFICATES_DIR
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+                http_session.mount("http://", adapter)
+                http_session.mount("https://", adapter)
+                _http_session = http_session
+    return _http_session
+
+
+def get_remote_content(url):
+    """Return the content found at a remote URL. Responses are cached for
+    XSD_URI_RESOLVER_CACHE_TIMEOUT seconds.
+
+    Args:
+        url:
+
+    Returns:
+
+    """
+    cached_response = REMOTE_CONTENT_CACHE.get(url)
+    if cached_response is not None:
+        expiry_time, content = cached_response
+        if time.monotonic() < expiry_time:
+            return content
+        REMOTE_CONTENT_CACHE.invalidate(url)
+
+    response = get_http_session().get(url)
+    response.raise_for_status()
+    content = response.content
+    if XSD_URI_RESOLVER_CACHE_TIMEOUT > 0:
+        REMOTE_CONTENT_CACHE.set(
+            url, (time.monotonic() + XSD_URI_RESOLVER_CACHE_TIMEOUT, content)
+        )
+    return content
+
+
+def clear_remote_content_cache():
+    """Clear the cache of remote contents.
+
+    Returns:
+
+    """
+    REMOTE_CONTENT_CACHE.clear()
+
+
+class LocalResolver(RequestsResolver):
+    """URI Resolver for lxml getting the templates of this server from the
+    database, and the other URIs with a shared HTTP session"""
+
+    def resolve(self, url, id, context):
+        """Resolve the URI from the database if it is a template download
+        URL of this server, using the HTTP session otherwise.
+
+        Args:
+            url:
+            id:
+            context:
+
+        Returns:
+
+        """
+        template_id = self.get_local_template_id(url)
+        if template_id is not None:
+            if self.request is None:
+                # no user to check the access: request our own server
+                return super().resolve(url, id, context)
+            content = self.get_template_content(template_id)
+            if content is None:
+                return None
+            return self.resolve_string(content, context, base_url=url)
+
+        try:
+            return self.resolve_string(
+                get_remote_content(url), context, base_url=url
+            )
+        except Exception as exception:
+            # if an error occurs return None to use the next registered resolver (or lxml default resolver)
+            logger.error(
+                "An error occurred with the LocalResolver while getting %s: %s",
+                url,
+                str(exception),
+            )
+            return None
+
+    def get_local_template_id(self, url):
+        """Return the id of the template if the URL is a template download
+        URL of this server, None otherwise.
+
+        Args:
+            url:
+
+        Returns:
+
+        """
+        parsed_url = urlparse(url)
+        if parsed_url.netloc and parsed_url.netloc not in self._get_hosts():
+            return None
+        match = get_template_download_pattern().match(parsed_url.path)
+        if not match:
+            return None
+        return match.group("pk")
+
+    def get_template_content(self, template_id):
+        """Return the content of a template readable by the user of the
+        request, None if it can't be read.
+
+        Args:
+            template_id:
+
+        Returns:
+
+        """
+        from core_main_app.components.template import api as template_api
+
+        try:
+            template = template_api.get_by_id(
+                template_id, request=self.request
+            )
+            return template.content.encode("utf-8")
+        except Exception as exception:
+            logger.warning(
+                "LocalResolver could not get template %s: %s",
+                str(template_id),
+                str(exception),
+            )
+            return None
+
+    def _get_hosts(self):
+        """Return the host names of this server.
+
+        Returns:
+
+        """
+        hosts = {urlparse(SERVER_URI).netloc}
+        try:
+            hosts.add(self.request.get_host())
+        except Exception:
+            pass
+        return hosts
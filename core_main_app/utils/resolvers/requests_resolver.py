@@ -14,10 +14,12 @@ class RequestsResolver(DefaultURIResolver):
     """Requests URI Resolver for lxml"""
 
     session_id = None
+    request = None
 
-    def __init__(self, session_id=None):
+    def __init__(self, session_id=None, request=None):
         super().__init__()
         self.session_id = session_id
+        self.request = request
 
     def resolve(self, url, id, context):
         """Resolve the URI using the requests api
@@ -17,8 +17,8 @@ def lmxl_uri_resolver(*args, **kwargs):
 
     """
     uri_resolver = None
+    request = kwargs.pop("request", None)
     try:
-        request = kwargs.pop("request")
         session_id = request.session.session_key
     except Exception:
         logger.info("No request or session id is None")
@@ -33,7 +33,7 @@ def lmxl_uri_resolver(*args, **kwargs):
         # Return the correct resolver depending on the setting
 
         uri_resolver = XSD_URI_RESOLVERS[XSD_URI_RESOLVER](
-            session_id=session_id
+            session_id=session_id, request=request
         )
 
     return uri_resolver
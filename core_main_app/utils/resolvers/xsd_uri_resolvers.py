@@ -1,7 +1,9 @@
 """ List of available uri resolvers for lxml
 """
+from core_main_app.utils.resolvers.local_resolver import LocalResolver
 from core_main_app.utils.resolvers.requests_resolver import RequestsResolver
 
 XSD_URI_RESOLVERS = {
     "REQUESTS_RESOLVER": RequestsResolver,
+    "LOCAL_RESOLVER": LocalResolver,
 }
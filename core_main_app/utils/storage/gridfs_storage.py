@@ -1,6 +1,7 @@
 """ GridFSStorage class (previously blob_utils)
 """
 
+from django.core.files.base import File
 from django.core.files.storage import Storage
 from django.utils.deconstruct import deconstructible
 
@@ -12,6 +13,30 @@ from core_main_app.settings import (
 if GRIDFS_STORAGE:
     from gridfs import NoFile, GridFS
 
+    class GridFSFile(File):
+        """File of the GridFS storage: read chunk by chunk from the database,
+        with reads aligned on the GridFS chunks.
+        """
+
+        def __init__(self, grid_out, name):
+            """Initialize GridFSFile
+
+            Args:
+                grid_out: GridOut of the last version of the file
+                name:
+            """
+            super().__init__(grid_out, name)
+            self.DEFAULT_CHUNK_SIZE = grid_out.chunk_size
+
+        @property
+        def size(self):
+            """Return size of the file
+
+            Returns:
+
+            """
+            return self.file.length
+
     @deconstructible
     class GridFSStorage(Storage):
         """GridFS Storage.
@@ -40,7 +65,10 @@ if GRIDFS_STORAGE:
             """
             grid_fs = self._get_gridfs()
             try:
-                return grid_fs.get_last_version(name)
+                grid_out = grid_fs.get_last_version(name)
+                if "w" in mode:
+                    return grid_out
+                return GridFSFile(grid_out, name)
             except NoFile:
                 if "w" in mode:
                     return grid_fs.new_file(filename=name)
@@ -76,6 +104,40 @@ if GRIDFS_STORAGE:
             except NoFile:
                 pass
 
+        def read_many(self, names):
+            """Read the last version of several files with one query on the
+            files and one query on the chunks.
+
+            Args:
+                names:
+
+            Returns:
+                dict: content by file name (missing files are not returned)
+
+            """
+            self._get_gridfs()
+            file_ids = {}
+            # sorted by upload date: the last version is kept
+            for grid_file in (
+                self._db[f"{self.collection}.files"]
+                .find({"filename": {"$in": list(names)}}, {"filename": 1})
+                .sort("uploadDate", 1)
+            ):
+                file_ids[grid_file["filename"]] = grid_file["_id"]
+
+            chunks = {file_id: [] for file_id in file_ids.values()}
+            for chunk in (
+                self._db[f"{self.collection}.chunks"]
+                .find({"files_id": {"$in": list(chunks)}})
+                .sort([("files_id", 1), ("n", 1)])
+            ):
+                chunks[chunk["files_id"]].append(chunk["data"])
+
+            return {
+                name: b"".join(chunks[file_id])
+                for name, file_id in file_ids.items()
+            }
+
         def exists(self, name):
             """Check if file exists
 
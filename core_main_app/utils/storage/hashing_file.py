@@ -0,0 +1,258 @@
+""" Single-pass write and hash of files sent to the storage
+"""
+import io
+
+from django.core.files.base import File
+from django.utils.functional import cached_property
+
+from core_main_app.commons.exceptions import CoreError
+from core_main_app.utils import performance
+from core_main_app.utils.checksum import CHECKSUM_ALGORITHMS
+
+
+class HashingFile(File):
+    """File streaming a content to the storage chunk by chunk, and updating
+    its checksum with each chunk read by the storage.
+
+    The content can be a string (encoded in UTF-8 one chunk at a time),
+    bytes, or a file object.
+    """
+
+    def __init__(
+        self,
+        content,
+        name=None,
+        content_type=None,
+        checksum_algorithm=None,
+        chunk_size=File.DEFAULT_CHUNK_SIZE,
+    ):
+        """Initialize the file
+
+        Args:
+            content: string, bytes or file object
+            name:
+            content_type:
+            checksum_algorithm: key of CHECKSUM_ALGORITHMS, None to not hash
+            chunk_size:
+        """
+        if (
+            checksum_algorithm is not None
+            and checksum_algorithm not in CHECKSUM_ALGORITHMS
+        ):
+            raise CoreError(
+                f"CHECKSUM_ALGORITHM needs to be in: {CHECKSUM_ALGORITHMS.keys()}"
+            )
+        super().__init__(None, name or getattr(content, "name", None))
+        self.content = content
+        self.content_type = content_type or getattr(
+            content, "content_type", None
+        )
+        self.checksum_algorithm = checksum_algorithm
+        self.chunk_size = chunk_size
+        self._reset()
+
+    def _reset(self):
+        """Restart reading the content from the beginning.
+
+        Returns:
+
+        """
+        self._source = self._iter_content()
+        self._buffer = b""
+        self._position = 0
+        self._is_complete = False
+        self._hasher = (
+            CHECKSUM_ALGORITHMS[self.checksum_algorithm]()
+            if self.checksum_algorithm
+            else None
+        )
+
+    def _iter_content(self):
+        """Iterate over the encoded chunks of the content.
+
+        Returns:
+
+        """
+        content = self.content
+        if isinstance(content, str):
+            for index in range(0, len(content), self.chunk_size):
+                yield content[index : index + self.chunk_size].encode("utf-8")
+        elif isinstance(content, (bytes, bytearray, memoryview)):
+            view = memoryview(content)
+            for index in range(0, len(view), self.chunk_size):
+                yield bytes(view[index : index + self.chunk_size])
+        else:
+            if hasattr(content, "seek"):
+                content.seek(0)
+            while chunk := content.read(self.chunk_size):
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                yield chunk
+
+    def _next_chunk(self):
+        """Read the next chunk of the content, and update the checksum.
+
+        Returns:
+            chunk, empty bytes at the end of the content
+
+        """
+        chunk = next(self._source, b"")
+        if not chunk:
+            self._is_complete = True
+        elif self._hasher:
+            self._hasher.update(chunk)
+        return chunk
+
+    def read(self, size=-1):
+        """Read bytes from the content.
+
+        Args:
+            size: number of bytes, all the remaining content if negative
+
+        Returns:
+
+        """
+        if size is None or size < 0:
+            chunks = [self._buffer]
+            while chunk := self._next_chunk():
+                chunks.append(chunk)
+            data, self._buffer = b"".join(chunks), b""
+        else:
+            while len(self._buffer) < size and not self._is_complete:
+                self._buffer += self._next_chunk()
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        self._position += len(data)
+        performance.record_bytes_written(len(data))
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Move to the beginning of the content (only supported position).
+
+        Args:
+            offset:
+            whence:
+
+        Returns:
+
+        """
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("Only seek(0) is supported.")
+        self._reset()
+        return 0
+
+    def tell(self):
+        """Return the current position.
+
+        Returns:
+
+        """
+        return self._position
+
+    def seekable(self):
+        """Return True: the content can be read again from the beginning.
+
+        Returns:
+
+        """
+        return True
+
+    def readable(self):
+        """Return True: the content can be read.
+
+        Returns:
+
+        """
+        return True
+
+    def open(self, mode=None):
+        """Reopen the file from the beginning.
+
+        Args:
+            mode:
+
+        Returns:
+
+        """
+        self.seek(0)
+        return self
+
+    def close(self):
+        """Close the file (the content stays available).
+
+        Returns:
+
+        """
+
+    @property
+    def closed(self):
+        """Return False: the content is always available.
+
+        Returns:
+
+        """
+        return False
+
+    @cached_property
+    def size(self):
+        """Return the size of the encoded content, without keeping it in
+        memory.
+
+        Returns:
+
+        """
+        if isinstance(self.content, str):
+            return sum(
+                len(self.content[index : index + self.chunk_size].encode())
+                for index in range(0, len(self.content), self.chunk_size)
+            )
+        if isinstance(self.content, (bytes, bytearray, memoryview)):
+            return memoryview(self.content).nbytes
+        return File(self.content).size
+
+    @property
+    def checksum(self):
+        """Return the checksum of the content read by the storage. The end
+        of the content is read if the storage did not read all of it.
+
+        Returns:
+            checksum, None if no checksum algorithm
+
+        """
+        if self._hasher is None:
+            return None
+        while not self._is_complete:
+            self._next_chunk()
+        return self._hasher.hexdigest()
+
+
+def save_file(field_file, checksum_algorithm=None):
+    """Write a new file of a model to its storage, and compute its checksum
+    on the same pass.
+
+    Args:
+        field_file: FileField value of a model
+        checksum_algorithm:
+
+    Returns:
+        checksum of the written file, None if the file was already stored
+
+    """
+    if not field_file or field_file._committed:
+        return None
+    content = field_file.file
+    if isinstance(content, HashingFile):
+        content = HashingFile(
+            content.content,
+            name=content.name,
+            content_type=content.content_type,
+            checksum_algorithm=checksum_algorithm,
+            chunk_size=content.chunk_size,
+        )
+    else:
+        content = HashingFile(
+            content,
+            name=field_file.name,
+            checksum_algorithm=checksum_algorithm,
+        )
+    field_file.save(field_file.name, content, save=False)
+    return content.checksum
@@ -3,14 +3,15 @@
 import logging
 import re
 from urllib.parse import urlparse
+from xml.parsers import expat
 
-import xmltodict
 from django.urls import reverse
 
 from core_main_app.commons import exceptions
 from core_main_app.settings import XERCES_VALIDATION, SERVER_URI
 from core_main_app.utils.resolvers.resolver_utils import lmxl_uri_resolver
 from core_main_app.utils.urls import get_template_download_pattern
+from core_main_app.utils import xml_to_dict
 from xml_utils import xpath as xml_utils_xpath
 from xml_utils.commons import constants as xml_utils_constants
 from xml_utils.commons import exceptions as xml_utils_exceptions
@@ -181,15 +182,24 @@ def raw_xml_to_dict(
             if not callable(postprocessor):
                 raise exceptions.CoreError("postprocessor is not callable")
 
-        # convert xml to dict
-        dict_raw = xmltodict.parse(
-            raw_xml, postprocessor=postprocessor, force_list=force_list
+        # convert xml to dict, removing the lists of the root element which
+        # size exceed the limit while parsing (if element names are kept)
+        dict_raw = xml_to_dict.parse(
+            raw_xml,
+            postprocessor=postprocessor,
+            force_list=force_list,
+            list_limit=(
+                list_limit
+                if postprocessor is None
+                or postprocessor in XML_POST_PROCESSORS.values()
+                else None
+            ),
         )
         if list_limit:
             # Remove lists which size exceed the limit size
             remove_lists_from_xml_dict(dict_raw, list_limit)
         return dict_raw
-    except xmltodict.expat.ExpatError:
+    except expat.ExpatError:
         raise exceptions.XMLError(
             "An unexpected error happened during the XML parsing."
         )
@@ -0,0 +1,232 @@
+""" Single-pass XML to dict converter
+"""
+from xml.parsers import expat
+
+CDATA_KEY = "#text"
+ATTRIBUTE_PREFIX = "@"
+
+
+class XmlDictHandler:
+    """Expat handler building the same dict as xmltodict.parse, applying the
+    post-processor and force_list while parsing.
+
+    When a list limit is set, the lists of children of the root element
+    exceeding the limit are removed as soon as they pass the limit, and the
+    following occurrences of the child are skipped without being converted.
+    Lists of nested elements are kept: whether they must be removed depends
+    on the elements that follow them (remove_lists_from_xml_dict does not
+    remove the lists found in the items of other lists).
+    """
+
+    def __init__(self, postprocessor=None, force_list=None, list_limit=None):
+        """Initialize handler
+
+        Args:
+            postprocessor: callable(path, key, value) returning (key, value)
+            force_list: boolean, collection of keys or callable
+            list_limit: maximum size of the lists of the root element, None
+                for no limit (the post-processor must keep the element
+                names)
+        """
+        self.postprocessor = postprocessor
+        self.force_list = force_list
+        self.list_limit = list_limit
+        self.path = []
+        self.stack = []
+        self.item = None
+        self.data = []
+        self.dropped = None
+        self.skip_depth = 0
+
+    def start_element(self, name, attrs):
+        """Open an element
+
+        Args:
+            name:
+            attrs: list of attribute names and values
+
+        Returns:
+
+        """
+        if self.skip_depth:
+            self.skip_depth += 1
+            return
+        if self.dropped and name in self.dropped:
+            # the list of this element was removed: skip the subtree
+            self.skip_depth = 1
+            return
+
+        attrs = dict(zip(attrs[0::2], attrs[1::2]))
+        self.path.append((name, attrs or None))
+        self.stack.append((self.item, self.data, self.dropped))
+        attr_entries = []
+        for key, value in attrs.items():
+            key = ATTRIBUTE_PREFIX + key
+            entry = (
+                self.postprocessor(self.path, key, value)
+                if self.postprocessor
+                else (key, value)
+            )
+            if entry:
+                attr_entries.append(entry)
+        self.item = dict(attr_entries) or None
+        self.data = []
+        # only the lists of the root element are limited while parsing
+        self.dropped = (
+            set() if len(self.path) == 1 and self._can_limit(name) else None
+        )
+
+    def end_element(self, name):
+        """Close an element
+
+        Args:
+            name:
+
+        Returns:
+
+        """
+        if self.skip_depth:
+            self.skip_depth -= 1
+            return
+
+        data = "".join(self.data) if self.data else None
+        item = self.item
+        self.item, self.data, self.dropped = self.stack.pop()
+        if data:
+            data = data.strip() or None
+        if item is not None:
+            if data:
+                self.push_data(item, CDATA_KEY, data, None)
+            self.item = self.push_data(self.item, name, item, self.dropped)
+        else:
+            self.item = self.push_data(self.item, name, data, self.dropped)
+        self.path.pop()
+
+    def characters(self, data):
+        """Collect the text of an element
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        if not self.skip_depth:
+            self.data.append(data)
+
+    def push_data(self, item, key, data, dropped):
+        """Add a value to an item
+
+        Args:
+            item:
+            key:
+            data:
+            dropped: keys of the removed lists of the item, None if the
+                lists of the item are not limited
+
+        Returns:
+
+        """
+        if self.postprocessor is not None:
+            result = self.postprocessor(self.path, key, data)
+            if result is None:
+                return item
+            key, data = result
+        if dropped is not None and key in dropped:
+            return item
+        if item is None:
+            item = dict()
+        if key not in item:
+            item[key] = [data] if self._should_force_list(key, data) else data
+            return item
+
+        value = item[key]
+        size = len(value) + 1 if isinstance(value, list) else 2
+        if dropped is not None and size > self.list_limit:
+            # the list exceeds the limit: remove it
+            del item[key]
+            dropped.add(key)
+        elif isinstance(value, list):
+            value.append(data)
+        else:
+            item[key] = [value, data]
+        return item
+
+    def _can_limit(self, name):
+        """Check if the lists of the root element can be limited while
+        parsing: the root element must not be converted to a list.
+
+        Args:
+            name: name of the root element
+
+        Returns:
+
+        """
+        if not self.list_limit:
+            return False
+        if not self.force_list:
+            return True
+        if isinstance(self.force_list, bool) or callable(self.force_list):
+            return False
+        return name not in self.force_list
+
+    def _should_force_list(self, key, value):
+        """Check if the value of the key should be a list
+
+        Args:
+            key:
+            value:
+
+        Returns:
+
+        """
+        if not self.force_list:
+            return False
+        if isinstance(self.force_list, bool):
+            return self.force_list
+        try:
+            return key in self.force_list
+        except TypeError:
+            return self.force_list(self.path[:-1], key, value)
+
+
+def parse(xml_input, postprocessor=None, force_list=None, list_limit=None):
+    """Convert XML to dict in a single pass. Gives the same result as
+    xmltodict.parse, without building the lists of the root element that
+    exceed the limit. Call remove_lists_from_xml_dict on the result to
+    remove the lists of nested elements. Raises expat.ExpatError if the XML
+    is not well-formed.
+
+    Args:
+        xml_input: string, bytes or binary file
+        postprocessor:
+        force_list:
+        list_limit: maximum size of the lists of the root element (the
+            post-processor must keep the element names)
+
+    Returns:
+
+    """
+    handler = XmlDictHandler(
+        postprocessor=postprocessor,
+        force_list=force_list,
+        list_limit=list_limit,
+    )
+    encoding = None
+    if isinstance(xml_input, str):
+        encoding = "utf-8"
+        xml_input = xml_input.encode(encoding)
+    parser = expat.ParserCreate(encoding)
+    parser.ordered_attributes = True
+    parser.buffer_text = True
+    parser.StartElementHandler = handler.start_element
+    parser.EndElementHandler = handler.end_element
+    parser.CharacterDataHandler = handler.characters
+    # don't expand entities
+    parser.DefaultHandler = lambda data: None
+    parser.ExternalEntityRefHandler = lambda *args: 1
+    if hasattr(xml_input, "read"):
+        parser.ParseFile(xml_input)
+    else:
+        parser.Parse(xml_input, True)
+    return handler.item
@@ -14,19 +14,42 @@ from xml_utils.xsd_flattener.xsd_flattener_url import XSDFlattenerURL
 class XSDFlattenerDatabaseOrURL(XSDFlattenerRequestsURL):
     """Get the content of the dependency from the database or from the URL."""
 
-    def __init__(self, xml_string, request, download_enabled=True):
+    def __init__(
+        self, xml_string, request, download_enabled=True, template=None
+    ):
         """Initializes the flattener
 
         Args:
-            xml_string:
+            xml_string: not read if the template is given
             download_enabled:
             request:
+            template: template of the XML string, to use the stored
+                flattened content
         """
         self.request = request
+        self.template = template
         XSDFlattenerURL.__init__(
             self, xml_string=xml_string, download_enabled=download_enabled
         )
 
+    def get_flat(self):
+        """Returns the flattened file. Returns the stored flattened content
+        of the template if the flattener was given one.
+
+        Returns:
+
+        """
+        if self.template is None:
+            return super().get_flat()
+
+        from core_main_app.components.flattened_template import (
+            api as flattened_template_api,
+        )
+
+        return flattened_template_api.get_flat_content(
+            self.template, request=self.request
+        )
+
     def get_dependency_content(self, uri):
         """Get the content of the dependency from the database or from the URL. Try to get the content from the
         database first and then try to download it from the provided URI.
@@ -22,6 +22,7 @@ from core_main_app.components.blob import api as blob_api
 from core_main_app.components.blob.models import Blob
 from core_main_app.components.data import api as data_api
 from core_main_app.components.group import api as group_api
+from core_main_app.components.mongo import bulk_index
 from core_main_app.components.template import api as template_api
 from core_main_app.components.user import api as user_api
 from core_main_app.components.workspace import api as workspace_api
@@ -500,17 +501,19 @@ class AssignView(View):
             except Exception:
                 return HttpResponseBadRequest("Something wrong happened.")
 
-        for data_id in document_ids:
-            try:
-                self.api.assign(
-                    self.api.get_by_id(data_id, request.user),
-                    workspace,
-                    request.user,
-                )
-            except AccessControlError as ace:
-                return HttpResponseForbidden(escape(str(ace)))
-            except Exception:
-                return HttpResponseBadRequest("Something wrong happened.")
+        # index the assigned documents in MongoDB with a few bulk writes
+        with bulk_index.coalesce_index_updates():
+            for data_id in document_ids:
+                try:
+                    self.api.assign(
+                        self.api.get_by_id(data_id, request.user),
+                        workspace,
+                        request.user,
+                    )
+                except AccessControlError as ace:
+                    return HttpResponseForbidden(escape(str(ace)))
+                except Exception:
+                    return HttpResponseBadRequest("Something wrong happened.")
 
         return HttpResponse(
             json.dumps({}), content_type="application/javascript"
@@ -528,11 +531,12 @@ def change_data_display(request):
     try:
         xsl_transformation_id = request.POST.get("xslt_id", None)
         data_id = request.POST.get("data_id", None)
+        data = None
+        xml_content = None
         if data_id:
             data = data_api.get_by_id(data_id, request.user)
             template_id = data.template.id
             template_hash = data.template.hash
-            xml_content = data.xml_content
         else:
             template_id = request.POST.get("template_id", None)
             xml_content = request.POST.get("content", "")
@@ -547,6 +551,7 @@ def change_data_display(request):
             json.dumps(
                 {
                     "template": render_xml_as_html_detail(
+                        data=data,
                         xml_content=xml_content,
                         template_id=template_id,
                         template_hash=template_hash,
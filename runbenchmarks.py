@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+""" Run benchmarks
+
+Examples:
+    python runbenchmarks.py --output results.json
+    python runbenchmarks.py --baseline results.json
+    python runbenchmarks.py --baseline tests/benchmarks/baselines/2.9.0.json
+    python runbenchmarks.py --backend mongo --filter ExecuteLocalQueryView
+
+tests/benchmarks/baselines contains reference results, produced with the
+default arguments. Timings depend on the machine: generate a baseline with
+--output on the machine running the comparison to detect regressions.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+import django
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    teardown_databases,
+)
+
+
+def _parse_args():
+    """Parse command line arguments
+
+    Returns:
+
+    """
+    parser = argparse.ArgumentParser(description="Run the benchmarks.")
+    parser.add_argument(
+        "--backend",
+        choices=["sqlite", "mongo"],
+        default="sqlite",
+        help="index the data in a MongoDB stand-in (mongomock) or not",
+    )
+    parser.add_argument(
+        "--data-count", type=int, default=100, help="number of data"
+    )
+    parser.add_argument(
+        "--item-count", type=int, default=50, help="number of items per data"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of timed runs"
+    )
+    parser.add_argument(
+        "--filter", default=None, help="only run benchmarks containing"
+    )
+    parser.add_argument("--output", default=None, help="JSON results file")
+    parser.add_argument(
+        "--baseline", default=None, help="JSON results file to compare to"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown reported as a regression",
+    )
+    return parser.parse_args()
+
+
+def _run(args):
+    """Run the benchmarks
+
+    Args:
+        args:
+
+    Returns:
+        exit code
+    """
+    from tests.benchmarks import runner, suite
+
+    fixture = suite.BenchmarkFixture(
+        data_count=args.data_count, item_count=args.item_count
+    )
+    fixture.insert_data()
+    benchmark_results = {}
+    for benchmark in suite.get_benchmarks(fixture):
+        if args.filter and args.filter not in benchmark.name:
+            continue
+        benchmark_results[benchmark.name] = runner.run_benchmark(
+            benchmark, repeat=args.repeat
+        )
+
+    results = {
+        "metadata": runner.get_metadata(
+            backend=args.backend,
+            data_count=args.data_count,
+            item_count=args.item_count,
+            repeat=args.repeat,
+        ),
+        "benchmarks": benchmark_results,
+    }
+    comparison = None
+    if args.baseline:
+        comparison = runner.compare_results(
+            results, runner.load_results(args.baseline), args.threshold
+        )
+        results["comparison"] = comparison
+    if args.output:
+        runner.save_results(results, args.output)
+    print(runner.format_report(results, comparison))
+    if comparison and any(item["regression"] for item in comparison.values()):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    arguments = _parse_args()
+    os.environ.setdefault(
+        "DJANGO_SETTINGS_MODULE", "tests.test_settings_sqlite3"
+    )
+    django.setup()
+    mongo_database = None
+    if arguments.backend == "mongo":
+        from core_main_app.utils.integration_tests.integration_base_test_case import (
+            MOCK_DATABASE_HOST,
+            MOCK_DATABASE_NAME,
+        )
+        from core_main_app.utils.tests_tools.databases.mongo.mongoengine_database import (
+            Database,
+        )
+
+        # import before enabling MONGODB_INDEXING: use the stand-in instead
+        # of connecting to MONGODB_URI
+        import core_main_app.utils.databases.mongo  # noqa: F401
+
+        mongo_database = Database(MOCK_DATABASE_HOST, MOCK_DATABASE_NAME)
+        mongo_database.connect()
+    media_root = tempfile.mkdtemp(prefix="benchmarks_")
+    with override_settings(
+        MONGODB_INDEXING=arguments.backend == "mongo",
+        MONGODB_ASYNC_SAVE=False,
+        MEDIA_ROOT=media_root,
+    ):
+        if mongo_database:
+            from core_main_app.permissions.discover import init_mongo_indexing
+
+            init_mongo_indexing()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            exit_code = _run(arguments)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            if mongo_database:
+                mongo_database.disconnect()
+            shutil.rmtree(media_root, ignore_errors=True)
+    sys.exit(exit_code)
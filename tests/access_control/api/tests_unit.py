@@ -30,3 +30,85 @@ class TestCanAnonymousAccessPublicData(TestCase):
         access_control_api.can_anonymous_access_public_data(func, *[user])
 
         func.assert_called()
+
+
+class TestCheckCanReadList(TestCase):
+    """Unit tests for `check_can_read_list` function."""
+
+    @patch.object(
+        access_control_api.workspace_api,
+        "get_all_workspaces_with_read_access_by_user",
+    )
+    def test_owned_documents_do_not_compute_workspaces(
+        self, mock_get_workspaces
+    ):
+        """test_owned_documents_do_not_compute_workspaces"""
+        user = create_mock_user("1")
+        document_list = [_create_document("1", None)]
+
+        access_control_api.check_can_read_list(document_list, user)
+
+        mock_get_workspaces.assert_not_called()
+
+    @patch.object(
+        access_control_api.workspace_api,
+        "get_all_workspaces_with_read_access_by_user",
+    )
+    def test_other_user_private_document_raises_error(
+        self, mock_get_workspaces
+    ):
+        """test_other_user_private_document_raises_error"""
+        user = create_mock_user("1")
+        document_list = [_create_document("1", 1), _create_document("2", None)]
+
+        with self.assertRaises(access_control_api.AccessControlError):
+            access_control_api.check_can_read_list(document_list, user)
+        mock_get_workspaces.assert_not_called()
+
+    @patch.object(
+        access_control_api.workspace_api,
+        "get_all_workspaces_with_read_access_by_user",
+    )
+    def test_document_in_accessible_workspace_passes(
+        self, mock_get_workspaces
+    ):
+        """test_document_in_accessible_workspace_passes"""
+        user = create_mock_user("1")
+        mock_get_workspaces.return_value = [MagicMock(id=1), MagicMock(id=2)]
+        document_list = [_create_document("2", 1), _create_document("3", 2)]
+
+        access_control_api.check_can_read_list(document_list, user)
+
+        mock_get_workspaces.assert_called_once_with(user)
+
+    @patch.object(
+        access_control_api.workspace_api,
+        "get_all_workspaces_with_read_access_by_user",
+    )
+    def test_document_in_inaccessible_workspace_raises_error(
+        self, mock_get_workspaces
+    ):
+        """test_document_in_inaccessible_workspace_raises_error"""
+        user = create_mock_user("1")
+        mock_get_workspaces.return_value = [MagicMock(id=1)]
+        document_list = [_create_document("2", 1), _create_document("3", 2)]
+
+        with self.assertRaises(access_control_api.AccessControlError):
+            access_control_api.check_can_read_list(document_list, user)
+
+
+def _create_document(user_id, workspace_id):
+    """Create a mock document
+
+    Args:
+        user_id:
+        workspace_id:
+
+    Returns:
+
+    """
+    document = MagicMock(user_id=user_id)
+    document.workspace = (
+        None if workspace_id is None else MagicMock(id=workspace_id)
+    )
+    return document
@@ -0,0 +1,2 @@
+""" Benchmarks of the data ingestion, validation, query and rendering paths
+"""
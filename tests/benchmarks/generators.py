@@ -0,0 +1,79 @@
+""" Synthetic templates and data for the benchmarks
+"""
+import random
+
+XSD_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
+TAGS = ["alloy", "ceramic", "polymer", "composite", "metal", "glass"]
+
+
+def generate_xsd():
+    """Generate an XML Schema for records made of a list of items.
+
+    Returns:
+
+    """
+    return (
+        f'<xs:schema xmlns:xs="{XSD_NAMESPACE}">'
+        '<xs:element name="root"><xs:complexType><xs:sequence>'
+        '<xs:element name="title" type="xs:string"/>'
+        '<xs:element name="item" minOccurs="0" maxOccurs="unbounded">'
+        "<xs:complexType><xs:sequence>"
+        '<xs:element name="name" type="xs:string"/>'
+        '<xs:element name="value" type="xs:decimal"/>'
+        '<xs:element name="tag" type="xs:string" minOccurs="0"'
+        ' maxOccurs="unbounded"/>'
+        "</xs:sequence>"
+        '<xs:attribute name="id" type="xs:integer"/>'
+        "</xs:complexType></xs:element>"
+        "</xs:sequence></xs:complexType></xs:element>"
+        "</xs:schema>"
+    )
+
+
+def generate_xml(index, item_count, seed=0):
+    """Generate a record valid against the generated XML Schema. The same
+    arguments always produce the same record.
+
+    Args:
+        index: index of the record
+        item_count: number of items in the record
+        seed:
+
+    Returns:
+
+    """
+    rand = random.Random(f"{seed}-{index}")
+    items = []
+    for item_index in range(item_count):
+        tags = "".join(
+            f"<tag>{rand.choice(TAGS)}</tag>"
+            for _ in range(rand.randint(0, 3))
+        )
+        items.append(
+            f'<item id="{item_index}">'
+            f"<name>name {index} {item_index}</name>"
+            f"<value>{rand.uniform(0, 100):.3f}</value>"
+            f"{tags}</item>"
+        )
+    return f"<root><title>record {index}</title>{''.join(items)}</root>"
+
+
+def generate_query():
+    """Generate a query on the generated records, with nested logical
+    operators, a regex and comparison operators.
+
+    Returns:
+
+    """
+    return {
+        "$and": [
+            {"root.title": {"$regex": "^record"}},
+            {
+                "$or": [
+                    {"root.item.value": {"$gt": 50}},
+                    {"root.item.tag": {"$in": ["alloy", "glass"]}},
+                ]
+            },
+            {"root.item.name": {"$exists": True}},
+        ]
+    }
@@ -0,0 +1,183 @@
+""" Benchmark runner: timing, statistics, reports and baseline comparison
+"""
+import json
+import platform
+import statistics
+import time
+
+import django
+
+RESULTS_FORMAT_VERSION = 1
+
+
+class Benchmark:
+    """A function to time, with optional setup called before each run"""
+
+    def __init__(self, name, func, setup=None, number=1):
+        """Initialize benchmark
+
+        Args:
+            name:
+            func: function to time, called with the value returned by setup
+            setup: function called (not timed) before each run
+            number: number of calls of func per run
+        """
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.number = number
+
+    def run_once(self):
+        """Time one run, return the duration of one call (seconds).
+
+        Returns:
+
+        """
+        args = (self.setup(),) if self.setup else ()
+        start = time.perf_counter()
+        for _ in range(self.number):
+            self.func(*args)
+        return (time.perf_counter() - start) / self.number
+
+
+def run_benchmark(benchmark, repeat=5, warmup=1):
+    """Run a benchmark, return the statistics of the durations.
+
+    Args:
+        benchmark:
+        repeat: number of timed runs
+        warmup: number of runs before the timed runs
+
+    Returns:
+
+    """
+    for _ in range(warmup):
+        benchmark.run_once()
+    durations = [benchmark.run_once() for _ in range(repeat)]
+    return get_statistics(durations)
+
+
+def get_statistics(durations):
+    """Return the statistics of a list of durations (seconds).
+
+    Args:
+        durations:
+
+    Returns:
+
+    """
+    sorted_durations = sorted(durations)
+    median = statistics.median(sorted_durations)
+    p95_index = min(
+        len(sorted_durations) - 1, int(round(0.95 * (len(durations) - 1)))
+    )
+    return {
+        "runs": len(durations),
+        "min": sorted_durations[0],
+        "max": sorted_durations[-1],
+        "mean": statistics.mean(sorted_durations),
+        "median": median,
+        "stdev": statistics.stdev(sorted_durations)
+        if len(durations) > 1
+        else 0.0,
+        "p95": sorted_durations[p95_index],
+        "ops_per_sec": 1 / median if median > 0 else None,
+    }
+
+
+def get_metadata(**extra):
+    """Return the environment of the benchmark run.
+
+    Args:
+        **extra:
+
+    Returns:
+
+    """
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "platform": platform.platform(),
+        **extra,
+    }
+
+
+def save_results(results, path):
+    """Write results to a JSON file.
+
+    Args:
+        results:
+        path:
+
+    Returns:
+
+    """
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    """Read results from a JSON file.
+
+    Args:
+        path:
+
+    Returns:
+
+    """
+    with open(path, encoding="utf-8") as results_file:
+        return json.load(results_file)
+
+
+def compare_results(results, baseline, threshold=0.2):
+    """Compare the median durations of results to a baseline.
+
+    Args:
+        results:
+        baseline:
+        threshold: relative slowdown above which a benchmark is a regression
+
+    Returns:
+        {name: {"baseline", "current", "ratio", "regression"}}
+    """
+    comparison = {}
+    for name, current in results["benchmarks"].items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is None or not reference["median"]:
+            continue
+        ratio = current["median"] / reference["median"]
+        comparison[name] = {
+            "baseline": reference["median"],
+            "current": current["median"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        }
+    return comparison
+
+
+def format_report(results, comparison=None):
+    """Format results, and their comparison to a baseline, as a text table.
+
+    Args:
+        results:
+        comparison:
+
+    Returns:
+
+    """
+    lines = [
+        f"{'benchmark':<40} {'median (ms)':>12} {'p95 (ms)':>10} "
+        f"{'ops/s':>10} {'vs baseline':>12}"
+    ]
+    for name, stats in sorted(results["benchmarks"].items()):
+        line = (
+            f"{name:<40} {stats['median'] * 1000:>12.3f} "
+            f"{stats['p95'] * 1000:>10.3f} {stats['ops_per_sec'] or 0:>10.1f}"
+        )
+        if comparison and name in comparison:
+            flag = " !" if comparison[name]["regression"] else ""
+            line += f" {comparison[name]['ratio']:>11.2f}x{flag}"
+        lines.append(line)
+    return "\n".join(lines)
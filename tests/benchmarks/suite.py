@@ -0,0 +1,260 @@
+""" Benchmarks of the data ingestion, validation, query and rendering paths
+
+The functions of this module need a configured Django environment and a test
+database (see runbenchmarks.py).
+"""
+import json
+import os
+import shutil
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.template import Context, Template as DjangoTemplate
+
+from core_main_app.access_control import api as access_control_api
+from core_main_app.components.data import api as data_api
+from core_main_app.components.data import bulk_upload
+from core_main_app.components.data.models import Data
+from core_main_app.components.template import api as template_api
+from core_main_app.components.template.models import Template
+from core_main_app.components.workspace import api as workspace_api
+from core_main_app.rest.data import views as data_rest_views
+from core_main_app.settings import (
+    SEARCHABLE_DATA_OCCURRENCES_LIMIT,
+    XML_FORCE_LIST,
+    XML_POST_PROCESSOR,
+)
+from core_main_app.utils import xml as main_xml_utils
+from core_main_app.utils.query.mongo.prepare import convert_to_django
+from core_main_app.utils.tests_tools.RequestMock import (
+    RequestMock,
+    create_mock_request,
+)
+from tests.benchmarks import generators
+from tests.benchmarks.runner import Benchmark
+
+BULK_UPLOAD_FOLDER = "benchmarks_bulk_upload"
+
+
+class BenchmarkFixture:
+    """Synthetic users, workspace, template and data"""
+
+    def __init__(self, data_count=100, item_count=50, seed=0):
+        """Initialize fixture
+
+        Args:
+            data_count: number of data in the database
+            item_count: number of items in each data
+            seed:
+        """
+        self.data_count = data_count
+        self.item_count = item_count
+        self.seed = seed
+        self.admin = None
+        self.reader = None
+        self.workspace = None
+        self.template = None
+        self.data_list = []
+        self.large_xml = None
+
+    def insert_data(self):
+        """Insert the users, workspace, template and data.
+
+        Returns:
+
+        """
+        self.admin = User.objects.create_superuser(
+            "benchmark_admin", password="benchmark"
+        )
+        self.reader = User.objects.create_user(
+            "benchmark_reader", password="benchmark"
+        )
+        self.workspace = workspace_api.create_and_save(
+            "benchmark", owner_id=str(self.admin.id), is_public=True
+        )
+        self.template = template_api.upsert(
+            Template(
+                filename="benchmark.xsd", content=generators.generate_xsd()
+            ),
+            request=create_mock_request(user=self.admin),
+        )
+        for index in range(self.data_count):
+            data = self.build_data(index)
+            data.convert_and_save()
+            self.data_list.append(data)
+        self.large_xml = generators.generate_xml(
+            self.data_count, self.item_count * 20, seed=self.seed
+        )
+
+    def build_data(self, index):
+        """Build an unsaved data of the fixture.
+
+        Args:
+            index:
+
+        Returns:
+
+        """
+        data = Data(
+            template=self.template,
+            user_id=str(self.admin.id),
+            workspace=self.workspace,
+            title=f"record {index}",
+        )
+        data.xml_content = generators.generate_xml(
+            index, self.item_count, seed=self.seed
+        )
+        return data
+
+    def write_bulk_upload_folder(self, file_count):
+        """Write files to upload in a folder of MEDIA_ROOT.
+
+        Args:
+            file_count:
+
+        Returns:
+            path of the folder, relative to MEDIA_ROOT
+        """
+        folder_path = os.path.join(settings.MEDIA_ROOT, BULK_UPLOAD_FOLDER)
+        shutil.rmtree(folder_path, ignore_errors=True)
+        os.makedirs(folder_path)
+        for index in range(file_count):
+            with open(
+                os.path.join(folder_path, f"record_{index}.xml"),
+                "w",
+                encoding="utf-8",
+            ) as xml_file:
+                xml_file.write(
+                    generators.generate_xml(
+                        index, self.item_count, seed=self.seed
+                    )
+                )
+        return BULK_UPLOAD_FOLDER
+
+
+def get_benchmarks(fixture):
+    """Return the benchmarks of the hot paths on the fixture.
+
+    Args:
+        fixture: BenchmarkFixture (inserted)
+
+    Returns:
+
+    """
+    admin_request = create_mock_request(user=fixture.admin)
+    query = generators.generate_query()
+    bulk_upload_folder = fixture.write_bulk_upload_folder(
+        min(fixture.data_count, 50)
+    )
+    if settings.MONGODB_INDEXING:
+        from core_main_app.rest.mongo_data.serializers import (
+            MongoDataSerializer,
+        )
+
+        # the serializer of the view is selected when it is imported
+        query_view = type(
+            "ExecuteLocalQueryView",
+            (data_rest_views.ExecuteLocalQueryView,),
+            {"serializer": MongoDataSerializer},
+        ).as_view()
+    else:
+        query_view = data_rest_views.ExecuteLocalQueryView.as_view()
+    xsl_template = DjangoTemplate(
+        "{% load xsl_transform_tag %}"
+        "{% xsl_transform_list xml_content=xml_content template_id=template_id %}"
+    )
+    cached_xsl_template = DjangoTemplate(
+        "{% load xsl_transform_tag %}"
+        "{% xsl_transform_list data=data template_id=template_id %}"
+    )
+
+    def _upsert_data(data):
+        data_api.upsert(data, request=admin_request)
+
+    def _bulk_upload(_):
+        context = bulk_upload.BulkUploadContext(
+            fixture.template, bulk_upload_folder, True, True
+        )
+        writer = bulk_upload.BulkUploadWriter(
+            fixture.template.id,
+            fixture.workspace.id,
+            str(fixture.admin.id),
+            bulk_upload_folder,
+        )
+        bulk_upload.bulk_upload_folder(context, writer, 10, workers=1)
+
+    benchmarks = [
+        Benchmark(
+            "data_api.upsert",
+            _upsert_data,
+            setup=lambda: fixture.build_data(fixture.data_count),
+        ),
+        Benchmark(
+            "check_xml_file_is_valid",
+            lambda: data_api.check_xml_file_is_valid(
+                fixture.data_list[0], request=admin_request
+            ),
+            number=10,
+        ),
+        Benchmark(
+            "raw_xml_to_dict",
+            lambda: main_xml_utils.raw_xml_to_dict(
+                fixture.large_xml,
+                postprocessor=XML_POST_PROCESSOR,
+                force_list=XML_FORCE_LIST,
+                list_limit=SEARCHABLE_DATA_OCCURRENCES_LIMIT,
+            ),
+        ),
+        Benchmark(
+            "convert_to_django", lambda: convert_to_django(query), number=100
+        ),
+        Benchmark(
+            "ExecuteLocalQueryView",
+            lambda: RequestMock.do_request_post(
+                query_view,
+                fixture.reader,
+                data={
+                    "query": json.dumps({"root.title": "record 1"}),
+                    "all": "true",
+                },
+            ),
+        ),
+        Benchmark(
+            "xsl_transform_list_tag",
+            lambda: xsl_template.render(
+                Context(
+                    {
+                        "xml_content": fixture.data_list[0].xml_content,
+                        "template_id": fixture.template.id,
+                    }
+                )
+            ),
+            number=10,
+        ),
+        Benchmark(
+            "xsl_transform_list_tag_cached",
+            lambda: cached_xsl_template.render(
+                Context(
+                    {
+                        "data": fixture.data_list[0],
+                        "template_id": fixture.template.id,
+                    }
+                )
+            ),
+            number=10,
+        ),
+        Benchmark(
+            "check_can_read_list",
+            lambda: access_control_api.check_can_read_list(
+                fixture.data_list, fixture.reader
+            ),
+            number=10,
+        ),
+    ]
+    if not settings.MONGODB_INDEXING:
+        # the MongoDB stand-in does not support the bulk writes indexing the
+        # uploaded data
+        benchmarks.append(
+            Benchmark("BulkUploadFolder", _bulk_upload, setup=lambda: None)
+        )
+    return benchmarks
@@ -0,0 +1,111 @@
+""" Unit tests of the benchmark tools
+"""
+from unittest import TestCase
+
+from lxml import etree
+
+from tests.benchmarks import generators, runner
+
+
+class TestGenerators(TestCase):
+    """Test Generators"""
+
+    def test_generated_xml_is_valid(self):
+        """test generated xml is valid
+
+        Returns:
+
+        """
+        # Arrange
+        xml_schema = etree.XMLSchema(
+            etree.fromstring(generators.generate_xsd())
+        )
+
+        # Act
+        xml_tree = etree.fromstring(generators.generate_xml(1, 10))
+
+        # Assert
+        self.assertTrue(xml_schema.validate(xml_tree))
+
+    def test_generated_xml_is_reproducible(self):
+        """test generated xml is reproducible
+
+        Returns:
+
+        """
+        # Act / Assert
+        self.assertEqual(
+            generators.generate_xml(1, 10, seed=3),
+            generators.generate_xml(1, 10, seed=3),
+        )
+
+
+class TestRunner(TestCase):
+    """Test Runner"""
+
+    def test_get_statistics_returns_median_and_p95(self):
+        """test get statistics returns median and p95
+
+        Returns:
+
+        """
+        # Act
+        result = runner.get_statistics([0.4, 0.1, 0.2, 0.3, 0.5])
+
+        # Assert
+        self.assertEqual(result["median"], 0.3)
+        self.assertEqual(result["p95"], 0.5)
+        self.assertEqual(result["runs"], 5)
+
+    def test_run_benchmark_calls_setup_before_each_run(self):
+        """test run benchmark calls setup before each run
+
+        Returns:
+
+        """
+        # Arrange
+        calls = []
+        benchmark = runner.Benchmark(
+            "test", calls.append, setup=lambda: "setup", number=2
+        )
+
+        # Act
+        runner.run_benchmark(benchmark, repeat=3, warmup=1)
+
+        # Assert
+        self.assertEqual(calls, ["setup"] * 8)
+
+    def test_compare_results_flags_regressions(self):
+        """test compare results flags regressions
+
+        Returns:
+
+        """
+        # Arrange
+        baseline = {"benchmarks": {"fast": {"median": 1.0}}}
+        results = {
+            "benchmarks": {"fast": {"median": 1.5}, "new": {"median": 1.0}}
+        }
+
+        # Act
+        comparison = runner.compare_results(results, baseline, threshold=0.2)
+
+        # Assert
+        self.assertEqual(list(comparison), ["fast"])
+        self.assertTrue(comparison["fast"]["regression"])
+
+    def test_compare_results_ignores_small_slowdowns(self):
+        """test compare results ignores small slowdowns
+
+        Returns:
+
+        """
+        # Arrange
+        baseline = {"benchmarks": {"fast": {"median": 1.0}}}
+        results = {"benchmarks": {"fast": {"median": 1.1}}}
+
+        # Act
+        comparison = runner.compare_results(results, baseline, threshold=0.2)
+
+        # Assert
+        self.assertFalse(comparison["fast"]["regression"])
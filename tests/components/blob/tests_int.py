@@ -9,6 +9,7 @@ from tests.components.blob.fixtures.fixtures import (
 
 from core_main_app.commons import exceptions
 from core_main_app.components.blob.models import Blob
+from core_main_app.utils.checksum import compute_checksum
 from core_main_app.utils.integration_tests.integration_base_test_case import (
     IntegrationBaseTestCase,
 )
@@ -216,6 +217,21 @@ class TestBlobInsert(IntegrationBaseTestCase):
         # Assert
         self.assertIsInstance(result, Blob)
 
+    def test_insert_blob_sets_checksum_of_written_file(
+        self,
+    ):
+        """test_insert_blob_sets_checksum_of_written_file
+
+        Returns:
+
+        """
+        # Act
+        result = blob_api.insert(self.blob, self.user)
+        # Assert
+        blob = Blob.get_by_id(result.id)
+        self.assertEqual(blob.checksum, compute_checksum(b"blob", "MD5"))
+        self.assertEqual(blob.blob.read(), b"blob")
+
     def test_insert_blob_raises_api_error_if_already_exists(
         self,
     ):
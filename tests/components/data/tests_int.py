@@ -1,23 +1,33 @@
 """ Integration tests Data
 """
+import io
+import json
+import zipfile
 from types import SimpleNamespace
 from unittest.mock import patch
 
+from django.contrib.auth.models import User
 from django.db.models import Q
 from tests.components.data.fixtures.fixtures import (
     DataFixtures,
     AccessControlDataFixture,
+    AccessControlDataNoneFixture,
 )
 from tests.components.data.fixtures.fixtures import DataMigrationFixture
 from tests.components.user.fixtures.fixtures import UserFixtures
 
 from core_main_app.commons import exceptions
 from core_main_app.components.data import api as data_api
+from core_main_app.components.data import export as data_export
+from core_main_app.components.data.batch_resolvers import resolve_related
+from core_main_app.components.data.content_prefetch import prefetch_content
 from core_main_app.components.data import tasks as data_task
 from core_main_app.components.data.api import check_xml_file_is_valid
 from core_main_app.components.data.models import Data
+from core_main_app.rest.data.serializers import DataSerializer
 from core_main_app.settings import DATA_SORTING_FIELDS
 from core_main_app.system import api as system_api
+from core_main_app.utils.checksum import compute_checksum
 from core_main_app.utils.datetime import datetime_now
 from core_main_app.utils.integration_tests.integration_base_test_case import (
     IntegrationBaseTestCase,
@@ -1017,6 +1027,266 @@ class TestGetByIdList(IntegrationBaseTestCase):
         self.assertEqual(len(result), 0)
 
 
+class TestDataQuerySet(IntegrationBaseTestCase):
+    """TestDataQuerySet"""
+
+    fixture = AccessControlDataNoneFixture()
+
+    def test_get_all_does_not_defer_fields(self):
+        """test_get_all_does_not_defer_fields
+
+        Returns:
+
+        """
+        data = Data.get_all(DATA_SORTING_FIELDS).first()
+
+        self.assertEqual(data.get_deferred_fields(), set())
+
+    def test_deferred_dict_content_is_loaded_on_access(self):
+        """test_deferred_dict_content_is_loaded_on_access
+
+        Returns:
+
+        """
+        data = Data.objects.only_fields(["title"]).get(
+            pk=self.fixture.data_2.id
+        )
+
+        self.assertEqual(
+            data.get_dict_content(), self.fixture.data_2.dict_content
+        )
+
+    def test_only_fields_loads_file_for_content(self):
+        """test_only_fields_loads_file_for_content
+
+        Returns:
+
+        """
+        data = Data.objects.only_fields(["title", "content"]).first()
+
+        self.assertNotIn("file", data.get_deferred_fields())
+        self.assertNotIn("title", data.get_deferred_fields())
+        self.assertIn("template_id", data.get_deferred_fields())
+
+
+class TestPrefetchContent(IntegrationBaseTestCase):
+    """TestPrefetchContent"""
+
+    fixture = AccessControlDataNoneFixture()
+
+    def test_prefetch_content_caches_content_of_each_data(self):
+        """test_prefetch_content_caches_content_of_each_data
+
+        Returns:
+
+        """
+        data_list = prefetch_content(Data.objects.order_by("pk"), workers=4)
+
+        self.assertEqual(
+            [data._content for data in data_list],
+            [data.content for data in self.fixture.data_collection],
+        )
+
+    def test_prefetch_content_sequentially_caches_content(self):
+        """test_prefetch_content_sequentially_caches_content
+
+        Returns:
+
+        """
+        data_list = prefetch_content(Data.objects.order_by("pk"), workers=1)
+
+        self.assertEqual(
+            [data._content for data in data_list],
+            [data.content for data in self.fixture.data_collection],
+        )
+
+    def test_prefetch_content_keeps_content_already_set(self):
+        """test_prefetch_content_keeps_content_already_set
+
+        Returns:
+
+        """
+        data = Data.objects.get(pk=self.fixture.data_1.pk)
+        data._content = "<root>updated</root>"
+
+        prefetch_content([data])
+
+        self.assertEqual(data._content, "<root>updated</root>")
+
+
+class TestDataSaveObject(IntegrationBaseTestCase):
+    """TestDataSaveObject"""
+
+    fixture = AccessControlDataNoneFixture()
+
+    def test_save_object_sets_checksum_of_written_file(self):
+        """test_save_object_sets_checksum_of_written_file
+
+        Returns:
+
+        """
+        data = Data.objects.get(pk=self.fixture.data_1.pk)
+
+        self.assertEqual(
+            data.checksum,
+            compute_checksum(data.content.encode("utf-8"), "MD5"),
+        )
+
+    def test_save_object_streams_large_content_to_storage(self):
+        """test_save_object_streams_large_content_to_storage
+
+        Returns:
+
+        """
+        content = "<root>" + "<element>é€</element>" * 10000 + "</root>"
+        data = Data.objects.get(pk=self.fixture.data_1.pk)
+        data.content = content
+
+        data.convert_to_file()
+        data.save_object()
+
+        saved_data = Data.objects.get(pk=data.pk)
+        self.assertEqual(saved_data.content, content)
+        self.assertEqual(
+            saved_data.checksum,
+            compute_checksum(content.encode("utf-8"), "MD5"),
+        )
+
+    def test_save_object_without_new_file_keeps_checksum(self):
+        """test_save_object_without_new_file_keeps_checksum
+
+        Returns:
+
+        """
+        data = Data.objects.get(pk=self.fixture.data_1.pk)
+        checksum = data.checksum
+        data.title = "new title"
+
+        with patch(
+            "core_main_app.components.abstract_data.models.compute_checksum"
+        ) as mock_compute_checksum:
+            data.save_object()
+
+        mock_compute_checksum.assert_not_called()
+        self.assertIsNone(data._content)
+        self.assertEqual(Data.objects.get(pk=data.pk).checksum, checksum)
+
+
+class TestResolveRelated(IntegrationBaseTestCase):
+    """TestResolveRelated"""
+
+    fixture = AccessControlDataNoneFixture()
+
+    def test_resolve_related_loads_owner_names_in_one_query(self):
+        """test_resolve_related_loads_owner_names_in_one_query
+
+        Returns:
+
+        """
+        User.objects.create(id=1, username="user1")
+        User.objects.create(id=2, username="user2")
+        data_list = list(Data.objects.order_by("pk"))
+
+        with self.assertNumQueries(1):
+            resolve_related(data_list, owner_name=True)
+            owner_names = [data.owner_name for data in data_list]
+
+        self.assertEqual(owner_names, ["user1", "user2"])
+
+    def test_resolve_related_loads_templates_and_workspaces(self):
+        """test_resolve_related_loads_templates_and_workspaces
+
+        Returns:
+
+        """
+        data_list = list(Data.objects.order_by("pk"))
+
+        with self.assertNumQueries(2):
+            resolve_related(data_list, template=True, workspace=True)
+            workspaces = [data.workspace for data in data_list]
+            templates = [data.template for data in data_list]
+
+        self.assertEqual(workspaces, [None, self.fixture.workspace_1])
+        self.assertEqual(templates, [self.fixture.template] * 2)
+
+    def test_owner_name_is_reloaded_when_owner_changes(self):
+        """test_owner_name_is_reloaded_when_owner_changes
+
+        Returns:
+
+        """
+        User.objects.create(id=1, username="user1")
+        User.objects.create(id=2, username="user2")
+        data = Data.objects.get(pk=self.fixture.data_1.pk)
+        resolve_related([data], owner_name=True)
+
+        data.user_id = "2"
+
+        self.assertEqual(data.owner_name, "user2")
+
+
+class TestDataExport(IntegrationBaseTestCase):
+    """TestDataExport"""
+
+    fixture = AccessControlDataNoneFixture()
+
+    def test_iter_zip_reads_file_of_each_data(self):
+        """test_iter_zip_reads_file_of_each_data
+
+        Returns:
+
+        """
+        with zipfile.ZipFile(
+            io.BytesIO(
+                b"".join(data_export.iter_zip(Data.objects.order_by("pk")))
+            )
+        ) as zip_file:
+            contents = [
+                zip_file.read(name).decode() for name in zip_file.namelist()
+            ]
+
+        self.assertEqual(
+            contents, [data.content for data in self.fixture.data_collection]
+        )
+
+    def test_iter_ndjson_returns_one_line_per_data(self):
+        """test_iter_ndjson_returns_one_line_per_data
+
+        Returns:
+
+        """
+        lines = list(
+            data_export.iter_ndjson(
+                Data.objects.order_by("pk"), DataSerializer, chunk_size=1
+            )
+        )
+
+        self.assertEqual(
+            [json.loads(line)["title"] for line in lines],
+            [data.title for data in self.fixture.data_collection],
+        )
+
+    def test_iter_ndjson_serializes_data_by_chunk(self):
+        """test_iter_ndjson_serializes_data_by_chunk
+
+        Returns:
+
+        """
+        data_count = len(self.fixture.data_collection)
+        with patch(
+            "core_main_app.rest.data.serializers.resolve_related",
+            wraps=resolve_related,
+        ) as mock_resolve_related:
+            lines = list(
+                data_export.iter_ndjson(
+                    Data.objects.order_by("pk"), DataSerializer, chunk_size=1
+                )
+            )
+
+        self.assertEqual(len(lines), data_count)
+        self.assertEqual(mock_resolve_related.call_count, data_count)
+
+
 class TestDataMigration(IntegrationTransactionTestCase):
     """TestDataMigration"""
 
@@ -1080,16 +1350,16 @@ class TestDataMigration(IntegrationTransactionTestCase):
                 False,
             )
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_validation_success_for_one_data(
-        self, template_get, data_get_by_id
+        self, template_get, data_get_by_id_list
     ):
         """test_data_template_validation_success_for_one_data
 
         Args:
             template_get:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
@@ -1097,7 +1367,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         # Arrange
         request_user = UserFixtures().create_super_user("admin_test")
         template_get.return_value = self.fixture.template_2
-        data_get_by_id.return_value = self.fixture.data_1
+        data_get_by_id_list.return_value = [self.fixture.data_1]
 
         # Act
         response = data_task.async_migration_task(
@@ -1112,18 +1382,18 @@ class TestDataMigration(IntegrationTransactionTestCase):
         expected_result = {"valid": [str(self.fixture.data_1.id)], "wrong": []}
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_validation_success_for_one_transformed_data(
         self,
         template_get,
-        data_get_by_id,
+        data_get_by_id_list,
     ):
         """test_data_template_validation_success_for_one_transformed_data
 
         Args:
             template_get:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
@@ -1131,7 +1401,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         # Arrange
         request_user = UserFixtures().create_super_user("admin_test")
         template_get.return_value = self.fixture.template_4
-        data_get_by_id.return_value = self.fixture.data_1
+        data_get_by_id_list.return_value = [self.fixture.data_1]
 
         # Act
         response = data_task.async_migration_task(
@@ -1146,22 +1416,25 @@ class TestDataMigration(IntegrationTransactionTestCase):
         expected_result = {"valid": [str(self.fixture.data_1.id)], "wrong": []}
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_validation_success_for_multi_data(
-        self, template_get, data_get_by_id
+        self, template_get, data_get_by_id_list
     ):
         """test_data_template_validation_success_for_multi_data
 
         Args:
             template_get:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.side_effect = [self.fixture.data_1, self.fixture.data_2]
+        data_get_by_id_list.return_value = [
+            self.fixture.data_1,
+            self.fixture.data_2,
+        ]
         template_get.return_value = self.fixture.template_2
         request_user = UserFixtures().create_super_user("admin_test")
 
@@ -1184,24 +1457,27 @@ class TestDataMigration(IntegrationTransactionTestCase):
         }
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_validation_success_for_multi_transformed_data(
         self,
         template_get,
-        data_get_by_id,
+        data_get_by_id_list,
     ):
         """test_data_template_validation_success_for_multi_transformed_data
 
         Args:
             template_get:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.side_effect = [self.fixture.data_1, self.fixture.data_2]
+        data_get_by_id_list.return_value = [
+            self.fixture.data_1,
+            self.fixture.data_2,
+        ]
         template_get.return_value = self.fixture.template_4
         request_user = UserFixtures().create_super_user("admin_test")
 
@@ -1224,22 +1500,22 @@ class TestDataMigration(IntegrationTransactionTestCase):
         }
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_validation_error_for_one_data(
-        self, template_get, data_get_by_id
+        self, template_get, data_get_by_id_list
     ):
         """test_data_template_validation_error_for_one_data
 
         Args:
             template_get:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.return_value = self.fixture.data_5
+        data_get_by_id_list.return_value = [self.fixture.data_5]
         template_get.return_value = self.fixture.template_2
         request_user = UserFixtures().create_super_user("admin_test")
 
@@ -1256,22 +1532,22 @@ class TestDataMigration(IntegrationTransactionTestCase):
         expected_result = {"valid": [], "wrong": [str(self.fixture.data_5.id)]}
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_validation_error_for_one_transformed_data(
-        self, template_get, data_get_by_id
+        self, template_get, data_get_by_id_list
     ):
         """test_data_template_validation_error_for_one_transformed_data
 
         Args:
             template_get:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.return_value = self.fixture.data_5
+        data_get_by_id_list.return_value = [self.fixture.data_5]
         template_get.return_value = self.fixture.template_2
         request_user = UserFixtures().create_super_user("admin_test")
 
@@ -1288,22 +1564,25 @@ class TestDataMigration(IntegrationTransactionTestCase):
         expected_result = {"valid": [], "wrong": [str(self.fixture.data_5.id)]}
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_validation_for_multi_data(
-        self, template_get, data_get_by_id
+        self, template_get, data_get_by_id_list
     ):
         """test_data_template_validation_for_multi_data
 
         Args:
             template_get:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.side_effect = [self.fixture.data_1, self.fixture.data_5]
+        data_get_by_id_list.return_value = [
+            self.fixture.data_1,
+            self.fixture.data_5,
+        ]
         template_get.return_value = self.fixture.template_2
         request_user = UserFixtures().create_super_user("admin_test")
 
@@ -1323,22 +1602,25 @@ class TestDataMigration(IntegrationTransactionTestCase):
         }
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_validation_for_multi_transformed_data(
-        self, template_get, data_get_by_id
+        self, template_get, data_get_by_id_list
     ):
         """test_data_template_validation_for_multi_transformed_data
 
         Args:
             template_get:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.side_effect = [self.fixture.data_1, self.fixture.data_5]
+        data_get_by_id_list.return_value = [
+            self.fixture.data_1,
+            self.fixture.data_5,
+        ]
         template_get.return_value = self.fixture.template_4
         request_user = UserFixtures().create_super_user("admin_test")
 
@@ -1376,7 +1658,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         """
         # Arrange
         mock_query_set = {
-            "all": lambda: [
+            "iterator": lambda chunk_size: [
                 self.fixture.data_1,
                 self.fixture.data_2,
             ],
@@ -1430,7 +1712,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         """
         # Arrange
         mock_query_set = {
-            "all": lambda: [
+            "iterator": lambda chunk_size: [
                 self.fixture.data_1,
                 self.fixture.data_2,
             ],
@@ -1484,7 +1766,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         """
         # Arrange
         mock_query_set = {
-            "all": lambda: [
+            "iterator": lambda chunk_size: [
                 self.fixture.data_4,
                 self.fixture.data_5,
             ],
@@ -1538,7 +1820,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         """
         # Arrange
         mock_query_set = {
-            "all": lambda: [
+            "iterator": lambda chunk_size: [
                 self.fixture.data_4,
                 self.fixture.data_5,
             ],
@@ -1574,18 +1856,18 @@ class TestDataMigration(IntegrationTransactionTestCase):
         }
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "upsert")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_migration_success_for_one_transformed_data(
-        self, template_get, data_upsert, data_get_by_id
+        self, template_get, data_upsert, data_get_by_id_list
     ):
         """test_data_template_migration_success_for_one_transformed_data
 
         Args:
             template_get:
             data_upsert:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
@@ -1594,7 +1876,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         request_user = UserFixtures().create_super_user("admin_test")
         data_upsert.side_effect = mock_upsert
         template_get.return_value = self.fixture.template_4
-        data_get_by_id.return_value = self.fixture.data_1
+        data_get_by_id_list.return_value = [self.fixture.data_1]
 
         # Act
         data_task.async_migration_task(
@@ -1611,24 +1893,27 @@ class TestDataMigration(IntegrationTransactionTestCase):
         )
         self.assertEqual(migrated_data.template.id, self.fixture.template_4.id)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "upsert")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_migration_success_for_multi_data(
-        self, template_get, data_upsert, data_get_by_id
+        self, template_get, data_upsert, data_get_by_id_list
     ):
         """test_data_template_migration_success_for_multi_data
 
         Args:
             template_get:
             data_upsert:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.side_effect = [self.fixture.data_1, self.fixture.data_2]
+        data_get_by_id_list.return_value = [
+            self.fixture.data_1,
+            self.fixture.data_2,
+        ]
         template_get.return_value = self.fixture.template_2
         data_upsert.side_effect = mock_upsert
         request_user = UserFixtures().create_super_user("admin_test")
@@ -1652,24 +1937,27 @@ class TestDataMigration(IntegrationTransactionTestCase):
             [self.fixture.template_2.id, self.fixture.template_2.id],
         )
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "upsert")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_migration_success_for_multi_transformed_data(
-        self, template_get, data_upsert, data_get_by_id
+        self, template_get, data_upsert, data_get_by_id_list
     ):
         """test_data_template_migration_success_for_multi_transformed_data
 
         Args:
             template_get:
             data_upsert:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.side_effect = [self.fixture.data_1, self.fixture.data_2]
+        data_get_by_id_list.return_value = [
+            self.fixture.data_1,
+            self.fixture.data_2,
+        ]
         template_get.return_value = self.fixture.template_4
         data_upsert.side_effect = mock_upsert
         request_user = UserFixtures().create_super_user("admin_test")
@@ -1693,18 +1981,18 @@ class TestDataMigration(IntegrationTransactionTestCase):
             [self.fixture.template_4.id, self.fixture.template_4.id],
         )
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "upsert")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_migration_error_for_one_data(
-        self, template_get, data_upsert, data_get_by_id
+        self, template_get, data_upsert, data_get_by_id_list
     ):
         """test_data_template_migration_error_for_one_data
 
         Args:
             template_get:
             data_upsert:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
@@ -1713,7 +2001,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         request_user = UserFixtures().create_super_user("admin_test")
         data_upsert.side_effect = mock_upsert
         template_get.return_value = self.fixture.template_4
-        data_get_by_id.return_value = self.fixture.data_5
+        data_get_by_id_list.return_value = [self.fixture.data_5]
 
         # Act
         response = data_task.async_migration_task(
@@ -1728,18 +2016,18 @@ class TestDataMigration(IntegrationTransactionTestCase):
         expected_result = {"valid": [], "wrong": [str(self.fixture.data_5.id)]}
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "upsert")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_migration_error_for_one_transformed_data(
-        self, template_get, data_upsert, data_get_by_id
+        self, template_get, data_upsert, data_get_by_id_list
     ):
         """test_data_template_migration_error_for_one_transformed_data
 
         Args:
             template_get:
             data_upsert:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
@@ -1748,7 +2036,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         request_user = UserFixtures().create_super_user("admin_test")
         data_upsert.side_effect = mock_upsert
         template_get.return_value = self.fixture.template_4
-        data_get_by_id.return_value = self.fixture.data_5
+        data_get_by_id_list.return_value = [self.fixture.data_5]
 
         # Act
         response = data_task.async_migration_task(
@@ -1763,24 +2051,27 @@ class TestDataMigration(IntegrationTransactionTestCase):
         expected_result = {"valid": [], "wrong": [str(self.fixture.data_5.id)]}
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "upsert")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_migration_for_multi_data(
-        self, template_get, data_upsert, data_get_by_id
+        self, template_get, data_upsert, data_get_by_id_list
     ):
         """test_data_template_migration_for_multi_data
 
         Args:
             template_get:
             data_upsert:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.side_effect = [self.fixture.data_1, self.fixture.data_5]
+        data_get_by_id_list.return_value = [
+            self.fixture.data_1,
+            self.fixture.data_5,
+        ]
         template_get.return_value = self.fixture.template_2
         data_upsert.side_effect = mock_upsert
         request_user = UserFixtures().create_super_user("admin_test")
@@ -1804,24 +2095,27 @@ class TestDataMigration(IntegrationTransactionTestCase):
             [self.fixture.template_2.id, self.fixture.template_2.id],
         )
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "upsert")
     @patch.object(system_api, "get_template_by_id")
     def test_data_template_migration_for_multi_transformed_data(
-        self, template_get, data_upsert, data_get_by_id
+        self, template_get, data_upsert, data_get_by_id_list
     ):
         """test_data_template_migration_for_multi_transformed_data
 
         Args:
             template_get:
             data_upsert:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
         """
         # Arrange
-        data_get_by_id.side_effect = [self.fixture.data_1, self.fixture.data_5]
+        data_get_by_id_list.return_value = [
+            self.fixture.data_1,
+            self.fixture.data_5,
+        ]
         template_get.return_value = self.fixture.template_4
         data_upsert.side_effect = mock_upsert
         request_user = UserFixtures().create_super_user("admin_test")
@@ -1905,7 +2199,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         """
         # Arrange
         mock_query_set = {
-            "all": lambda: [
+            "iterator": lambda chunk_size: [
                 self.fixture.data_4,
                 self.fixture.data_5,
             ],
@@ -1959,7 +2253,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         """
         # Arrange
         mock_query_set = {
-            "all": lambda: [
+            "iterator": lambda chunk_size: [
                 self.fixture.data_4,
                 self.fixture.data_5,
             ],
@@ -2003,7 +2297,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         }
         self.assertEqual(response, expected_result)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "check_xml_file_is_valid")
     @patch.object(data_api, "check_json_file_is_valid")
     @patch.object(system_api, "get_template_by_id")
@@ -2012,7 +2306,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         template_get,
         mock_check_json_file_is_valid,
         mock_check_xml_file_is_valid,
-        data_get_by_id,
+        data_get_by_id_list,
     ):
         """test_data_xsd_template_validation_call_xml_validation
 
@@ -2020,7 +2314,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
             template_get:
             mock_check_json_file_is_valid
             mock_check_xml_file_is_valid:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
@@ -2028,7 +2322,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         # Arrange
         request_user = UserFixtures().create_super_user("admin_test")
         template_get.return_value = self.fixture.template_2
-        data_get_by_id.return_value = self.fixture.data_1
+        data_get_by_id_list.return_value = [self.fixture.data_1]
 
         # Act
         data_task.async_migration_task(
@@ -2043,7 +2337,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         self.assertTrue(mock_check_xml_file_is_valid.called)
         self.assertFalse(mock_check_json_file_is_valid.called)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "check_xml_file_is_valid")
     @patch.object(data_api, "check_json_file_is_valid")
     @patch.object(system_api, "get_template_by_id")
@@ -2052,7 +2346,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         template_get,
         mock_check_json_file_is_valid,
         mock_check_xml_file_is_valid,
-        data_get_by_id,
+        data_get_by_id_list,
     ):
         """test_data_json_template_validation_call_xml_validation
 
@@ -2060,7 +2354,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
             template_get:
             mock_check_json_file_is_valid:
             mock_check_xml_file_is_valid
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
@@ -2069,7 +2363,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         request_user = UserFixtures().create_super_user("admin_test")
         self.fixture.template_2.format = "JSON"
         template_get.return_value = self.fixture.template_2
-        data_get_by_id.return_value = self.fixture.data_1
+        data_get_by_id_list.return_value = [self.fixture.data_1]
 
         # Act
         data_task.async_migration_task(
@@ -2084,7 +2378,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         self.assertTrue(mock_check_json_file_is_valid.called)
         self.assertFalse(mock_check_xml_file_is_valid.called)
 
-    @patch.object(data_api, "get_by_id")
+    @patch.object(data_api, "get_by_id_list")
     @patch.object(data_api, "check_xml_file_is_valid")
     @patch.object(data_api, "check_json_file_is_valid")
     @patch.object(system_api, "get_template_by_id")
@@ -2093,7 +2387,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         template_get,
         mock_check_json_file_is_valid,
         mock_check_xml_file_is_valid,
-        data_get_by_id,
+        data_get_by_id_list,
     ):
         """test_data_unknown_template_format_validation_raises_error
 
@@ -2101,7 +2395,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
             template_get:
             mock_check_json_file_is_valid:
             mock_check_xml_file_is_valid:
-            data_get_by_id:
+            data_get_by_id_list:
 
         Returns:
 
@@ -2110,7 +2404,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         request_user = UserFixtures().create_super_user("admin_test")
         self.fixture.template_2.format = "UNKNOWN"
         template_get.return_value = self.fixture.template_2
-        data_get_by_id.return_value = self.fixture.data_1
+        data_get_by_id_list.return_value = [self.fixture.data_1]
 
         # Act
         data_task.async_migration_task(
@@ -2152,7 +2446,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         """
         # Arrange
         mock_query_set = {
-            "all": lambda: [
+            "iterator": lambda chunk_size: [
                 self.fixture.data_1,
                 self.fixture.data_2,
             ],
@@ -2208,7 +2502,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         """
         # Arrange
         mock_query_set = {
-            "all": lambda: [
+            "iterator": lambda chunk_size: [
                 self.fixture.data_1,
                 self.fixture.data_2,
             ],
@@ -2265,7 +2559,7 @@ class TestDataMigration(IntegrationTransactionTestCase):
         """
         # Arrange
         mock_query_set = {
-            "all": lambda: [
+            "iterator": lambda chunk_size: [
                 self.fixture.data_1,
                 self.fixture.data_2,
             ],
@@ -1,19 +1,29 @@
 """ Unit Test Data
 """
 import json
+import os
+import queue
+import shutil
+import tempfile
 from collections import OrderedDict
 from json import JSONDecodeError
 from time import sleep
 from unittest.case import TestCase
 from unittest.mock import patch, MagicMock
 
+from celery.canvas import _chord
+from celery.exceptions import Ignore
+
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
 
 from core_main_app.commons import exceptions
 from core_main_app.commons.exceptions import CoreError
 from core_main_app.components.abstract_data.models import AbstractData
 from core_main_app.components.blob.models import Blob
 from core_main_app.components.data import api as data_api
+from core_main_app.components.data import bulk_upload
+from core_main_app.components.data import tasks as data_tasks
 from core_main_app.components.data.models import Data
 from core_main_app.components.template.models import Template
 from core_main_app.utils.datetime import datetime_now, datetime_timedelta
@@ -423,7 +433,7 @@ class TestDataUpsert(TestCase):
         with self.assertRaises(CoreError):
             data_api.upsert(data, mock_request)
 
-    @patch("django.core.files.uploadedfile.SimpleUploadedFile.__init__")
+    @patch("core_main_app.components.data.models.HashingFile")
     @patch("core_main_app.utils.xml.raw_xml_to_dict")
     @patch.object(Data, "content")
     @patch.object(Data, "save")
@@ -434,7 +444,7 @@ class TestDataUpsert(TestCase):
         mock_data_save,
         mock_data_content,
         mock_raw_xml_to_dict,
-        mock_simple_upload_file,
+        mock_hashing_file,
     ):
         """test_data_encoding_error_returns_data_with_content_set
 
@@ -444,7 +454,6 @@ class TestDataUpsert(TestCase):
 
         """
         # Arrange
-        mock_simple_upload_file.return_value = None
         mock_content = MagicMock()
         mock_content.encode.side_effect = UnicodeEncodeError("", "", 0, 0, "")
         mock_data_content.return_value = mock_content
@@ -1267,6 +1276,379 @@ class TestAbstractData(TestCase):
             abs_data.convert_to_file()
 
 
+class TestMigrationTasks(TestCase):
+    """TestMigrationTasks"""
+
+    def test_split_in_chunks_returns_lists_of_chunk_size(self):
+        """test_split_in_chunks_returns_lists_of_chunk_size
+
+        Returns:
+
+        """
+        self.assertEqual(
+            list(data_tasks._split_in_chunks(range(5), 2)),
+            [[0, 1], [2, 3], [4]],
+        )
+
+    def test_split_in_chunks_yields_chunk_before_reading_next_items(self):
+        """test_split_in_chunks_yields_chunk_before_reading_next_items
+
+        Returns:
+
+        """
+        items = iter(range(5))
+        chunks = data_tasks._split_in_chunks(items, 2)
+        self.assertEqual(next(chunks), [0, 1])
+        self.assertEqual(next(items), 2)
+
+    def test_migration_progress_is_throttled(self):
+        """test_migration_progress_is_throttled
+
+        Returns:
+
+        """
+        mock_task = MagicMock()
+        progress = data_tasks.MigrationProgress(mock_task, 3)
+        with patch.object(data_tasks, "MIGRATION_PROGRESS_INTERVAL", 3600):
+            for _ in range(3):
+                progress.increment()
+        # first and last increments only
+        self.assertEqual(mock_task.update_state.call_count, 2)
+        mock_task.update_state.assert_called_with(
+            state="PROGRESS", meta={"current": 3, "total": 3}
+        )
+
+    @patch.object(data_tasks, "_migrate_data_batch")
+    @patch.object(data_api, "get_by_id_list")
+    def test_migrate_data_id_list_reports_missing_data_as_wrong(
+        self, mock_get_by_id_list, mock_migrate_data_batch
+    ):
+        """test_migrate_data_id_list_reports_missing_data_as_wrong
+
+        Returns:
+
+        """
+        mock_get_by_id_list.return_value = [Data(id=1)]
+        mock_migrate_data_batch.return_value = (["1"], [])
+
+        success, errors = data_tasks._migrate_data_id_list(
+            [1, 2], MagicMock(), MagicMock(), None, False, MagicMock()
+        )
+
+        self.assertEqual(success, ["1"])
+        self.assertEqual(errors, ["2"])
+
+    @patch.object(data_tasks, "_can_fan_out")
+    @patch.object(data_tasks, "_get_compiled_xslt")
+    @patch("core_main_app.system.api.get_template_by_id")
+    @patch.object(data_tasks, "_get_migration_user")
+    def test_large_migration_is_replaced_by_chord(
+        self,
+        mock_get_migration_user,
+        mock_get_template_by_id,
+        mock_get_compiled_xslt,
+        mock_can_fan_out,
+    ):
+        """test_large_migration_is_replaced_by_chord
+
+        Returns:
+
+        """
+        mock_can_fan_out.return_value = True
+        with patch.object(data_tasks, "MIGRATION_CHUNK_SIZE", 2), patch.object(
+            data_tasks.async_migration_task, "replace"
+        ) as mock_replace, patch.object(
+            data_tasks.async_migration_task, "update_state"
+        ) as mock_update_state:
+            data_tasks.async_migration_task(
+                ["1", "2", "3"], None, "1", "1", False
+            )
+
+        self.assertTrue(mock_replace.called)
+        meta = mock_update_state.call_args.kwargs["meta"]
+        self.assertEqual(len(meta["chunk_task_ids"]), 2)
+        self.assertEqual(meta["total"], 3)
+
+    @patch.object(_chord, "apply_async")
+    @patch.object(data_tasks, "_get_compiled_xslt")
+    @patch("core_main_app.system.api.get_template_by_id")
+    @patch.object(data_tasks, "_get_migration_user")
+    def test_large_migration_replaced_in_worker_is_not_aborted(
+        self,
+        mock_get_migration_user,
+        mock_get_template_by_id,
+        mock_get_compiled_xslt,
+        mock_chord_apply_async,
+    ):
+        """test_large_migration_replaced_in_worker_is_not_aborted
+
+        Returns:
+
+        """
+        task = data_tasks.async_migration_task
+        task.push_request(id="task_id", is_eager=False)
+        try:
+            with patch.object(
+                data_tasks, "MIGRATION_CHUNK_SIZE", 2
+            ), patch.object(task, "update_state") as mock_update_state:
+                with self.assertRaises(Ignore):
+                    task.run(["1", "2", "3"], None, "1", "1", False)
+        finally:
+            task.pop_request()
+
+        self.assertTrue(mock_chord_apply_async.called)
+        self.assertNotIn(
+            "ABORT",
+            [
+                call.kwargs["state"]
+                for call in mock_update_state.call_args_list
+            ],
+        )
+
+    def test_merge_migration_results(self):
+        """test_merge_migration_results
+
+        Returns:
+
+        """
+        self.assertEqual(
+            data_tasks.merge_migration_results_task(
+                [
+                    {"valid": ["1"], "wrong": ["2"]},
+                    {"valid": ["3"], "wrong": []},
+                ]
+            ),
+            {"valid": ["1", "3"], "wrong": ["2"]},
+        )
+
+    @patch.object(data_tasks, "AsyncResult")
+    def test_get_task_progress_aggregates_chunk_progress(
+        self, mock_async_result
+    ):
+        """test_get_task_progress_aggregates_chunk_progress
+
+        Returns:
+
+        """
+        results = {
+            "parent": MagicMock(
+                state="PROGRESS",
+                info={
+                    "current": 0,
+                    "total": 5,
+                    "chunk_task_ids": ["chunk_1", "chunk_2"],
+                },
+            ),
+            "chunk_1": MagicMock(
+                state="SUCCESS", info={"valid": ["1", "2"], "wrong": ["3"]}
+            ),
+            "chunk_2": MagicMock(
+                state="PROGRESS", info={"current": 1, "total": 2}
+            ),
+        }
+        mock_async_result.side_effect = lambda task_id: results[task_id]
+
+        progress = data_tasks.get_task_progress("parent")
+
+        self.assertEqual(
+            progress,
+            {"state": "PROGRESS", "details": {"current": 4, "total": 5}},
+        )
+
+
+class TestBulkUpload(TestCase):
+    """TestBulkUpload"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.media_root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.media_root, "folder"))
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root)
+
+    def _write_file(self, file_name, content):
+        """Write a file in the test folder
+
+        Args:
+            file_name:
+            content:
+
+        Returns:
+
+        """
+        with open(
+            os.path.join(self.media_root, "folder", file_name), "w"
+        ) as _file:
+            _file.write(content)
+
+    def test_process_valid_xml_file_returns_dict_content(self):
+        """test_process_valid_xml_file_returns_dict_content
+
+        Returns:
+
+        """
+        self._write_file("my_file.xml", "<tag>value</tag>")
+        context = bulk_upload.BulkUploadContext(
+            _get_template(), "folder", True, True
+        )
+        result = bulk_upload.process_file(context, "my_file.xml")
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["title"], "my file")
+        self.assertEqual(result["dict_content"], {"tag": "value"})
+
+    def test_process_invalid_xml_file_returns_error(self):
+        """test_process_invalid_xml_file_returns_error
+
+        Returns:
+
+        """
+        self._write_file("file.xml", "<other>value</other>")
+        context = bulk_upload.BulkUploadContext(
+            _get_template(), "folder", True, True
+        )
+        result = bulk_upload.process_file(context, "file.xml")
+        self.assertIsNotNone(result["error"])
+
+    def test_process_invalid_xml_file_without_validation(self):
+        """test_process_invalid_xml_file_without_validation
+
+        Returns:
+
+        """
+        self._write_file("file.xml", "<other>value</other>")
+        context = bulk_upload.BulkUploadContext(
+            _get_template(), "folder", False, False
+        )
+        result = bulk_upload.process_file(context, "file.xml")
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["title"], "file.xml")
+
+    def test_process_invalid_json_file_returns_error(self):
+        """test_process_invalid_json_file_returns_error
+
+        Returns:
+
+        """
+        self._write_file("file.json", "{")
+        context = bulk_upload.BulkUploadContext(
+            _get_json_template(), "folder", True, True
+        )
+        result = bulk_upload.process_file(context, "file.json")
+        self.assertIsNotNone(result["error"])
+
+    @patch.object(bulk_upload.BulkUploadWriter, "write_batch")
+    def test_bulk_upload_folder_sends_batches_and_reports_errors(
+        self, mock_write_batch
+    ):
+        """test_bulk_upload_folder_sends_batches_and_reports_errors
+
+        Returns:
+
+        """
+        for index in range(3):
+            self._write_file(f"file_{index}.xml", "<tag>value</tag>")
+        self._write_file("wrong.xml", "<other>value</other>")
+        context = bulk_upload.BulkUploadContext(
+            _get_template(), "folder", True, True
+        )
+        writer = bulk_upload.BulkUploadWriter(1, None, "1", "folder")
+        mock_task = MagicMock()
+        progress = data_tasks.MigrationProgress(mock_task, 4)
+
+        result = bulk_upload.bulk_upload_folder(
+            context, writer, 2, progress=progress, workers=1
+        )
+
+        self.assertEqual(mock_write_batch.call_count, 2)
+        self.assertEqual(result["wrong"], ["wrong.xml"])
+        self.assertIn("wrong.xml", result["errors"])
+        mock_task.update_state.assert_called_with(
+            state="PROGRESS", meta={"wrong": 1, "current": 4, "total": 4}
+        )
+
+    @patch.object(bulk_upload.BulkUploadWriter, "write_batch")
+    def test_bulk_upload_folder_with_process_pool(self, mock_write_batch):
+        """test_bulk_upload_folder_with_process_pool
+
+        Returns:
+
+        """
+        for index in range(5):
+            self._write_file(f"file_{index}.xml", "<tag>value</tag>")
+        context = bulk_upload.BulkUploadContext(
+            _get_template(), "folder", True, True
+        )
+        writer = bulk_upload.BulkUploadWriter(1, None, "1", "folder")
+
+        result = bulk_upload.bulk_upload_folder(context, writer, 10, workers=2)
+
+        self.assertEqual(result["wrong"], [])
+        batch = mock_write_batch.call_args[0][0]
+        self.assertEqual(len(batch), 5)
+        self.assertTrue(
+            all(item["dict_content"] == {"tag": "value"} for item in batch)
+        )
+
+    @patch.object(bulk_upload.BulkUploadWriter, "_get_data")
+    def test_bulk_upload_folder_raises_writer_error(self, mock_get_data):
+        """test_bulk_upload_folder_raises_writer_error
+
+        Returns:
+
+        """
+        for index in range(5):
+            self._write_file(f"file_{index}.xml", "<tag>value</tag>")
+        context = bulk_upload.BulkUploadContext(
+            _get_template(), "folder", True, True
+        )
+        writer = bulk_upload.BulkUploadWriter(1, None, "1", "folder")
+        writer.queue = queue.Queue(maxsize=1)
+        mock_get_data.side_effect = CoreError("error")
+
+        with self.assertRaises(CoreError):
+            bulk_upload.bulk_upload_folder(context, writer, 1, workers=1)
+
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(mock_get_data.call_count, 1)
+
+    @patch.object(Data, "save")
+    @patch.object(Data, "objects")
+    def test_write_batch_falls_back_to_single_saves(
+        self, mock_data_objects, mock_data_save
+    ):
+        """test_write_batch_falls_back_to_single_saves
+
+        Returns:
+
+        """
+        mock_data_objects.bulk_create.side_effect = Exception("error")
+        mock_data_save.side_effect = [None, Exception("error")]
+        writer = bulk_upload.BulkUploadWriter(1, None, "1", "folder")
+        batch = [
+            {"file_name": file_name, "title": file_name, "dict_content": {}}
+            for file_name in ("a.xml", "b.xml")
+        ]
+
+        writer.write_batch(batch)
+
+        self.assertEqual(mock_data_save.call_count, 2)
+        self.assertEqual(writer.wrong, ["b.xml"])
+        self.assertEqual(len(writer.valid), 1)
+
+
 def _get_template():
     """Get XSD template
 
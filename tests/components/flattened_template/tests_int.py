@@ -0,0 +1,210 @@
+""" Int Test Flattened Template
+"""
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from core_main_app.components.flattened_template import (
+    api as flattened_template_api,
+)
+from core_main_app.components.flattened_template.models import (
+    FlattenedTemplate,
+)
+from core_main_app.components.template.models import Template
+from core_main_app.utils.integration_tests.fixture_interface import (
+    FixtureInterface,
+)
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import create_mock_request
+
+
+class DependencyTemplateFixture(FixtureInterface):
+    """Templates with dependencies: template -> dependency -> sub dependency"""
+
+    template = None
+    dependency = None
+    sub_dependency = None
+
+    def insert_data(self):
+        """Insert a set of templates.
+
+        Returns:
+
+        """
+        self.sub_dependency = self._generate_template("sub_dependency")
+        self.dependency = self._generate_template("dependency")
+        self.dependency.dependencies.add(self.sub_dependency)
+        self.template = self._generate_template("template")
+        self.template.dependencies.add(self.dependency)
+
+    @staticmethod
+    def _generate_template(name):
+        """Generate a template.
+
+        Args:
+            name:
+
+        Returns:
+
+        """
+        xsd = (
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            f'<xs:element name="{name}"></xs:element></xs:schema>'
+        )
+        template = Template(
+            content=xsd,
+            checksum=f"{name}_checksum",
+            filename=f"{name}.xsd",
+            file=SimpleUploadedFile(f"{name}.xsd", xsd.encode("utf-8")),
+            user=None,
+            _cls="Template",
+        )
+        template.save()
+        return template
+
+
+fixture_template = DependencyTemplateFixture()
+
+
+class TestGetFlatContent(IntegrationBaseTestCase):
+    """Test Get Flat Content"""
+
+    fixture = fixture_template
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        self.request = create_mock_request(
+            user=create_mock_user("1", is_superuser=True)
+        )
+
+    @patch.object(flattened_template_api, "_flatten")
+    def test_get_flat_content_stores_flattened_content(self, mock_flatten):
+        """test get flat content stores flattened content
+
+        Args:
+            mock_flatten:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_flatten.return_value = "flat"
+
+        # Act
+        result = flattened_template_api.get_flat_content(
+            self.fixture.template, request=self.request
+        )
+
+        # Assert
+        self.assertEqual(result, "flat")
+        self.assertEqual(
+            FlattenedTemplate.get_by_template_id(
+                self.fixture.template.pk
+            ).content,
+            "flat",
+        )
+
+    @patch.object(flattened_template_api, "_flatten")
+    def test_get_flat_content_returns_stored_content_if_unchanged(
+        self, mock_flatten
+    ):
+        """test get flat content returns stored content if unchanged
+
+        Args:
+            mock_flatten:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_flatten.return_value = "flat"
+        flattened_template_api.get_flat_content(
+            self.fixture.template, request=self.request
+        )
+
+        # Act
+        result = flattened_template_api.get_flat_content(
+            self.fixture.template, request=self.request
+        )
+
+        # Assert
+        self.assertEqual(result, "flat")
+        self.assertEqual(mock_flatten.call_count, 1)
+
+    @patch.object(flattened_template_api, "_flatten")
+    def test_get_flat_content_flattens_again_if_transitive_dependency_changed(
+        self, mock_flatten
+    ):
+        """test get flat content flattens again if transitive dependency changed
+
+        Args:
+            mock_flatten:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_flatten.side_effect = ["flat", "new flat"]
+        flattened_template_api.get_flat_content(
+            self.fixture.template, request=self.request
+        )
+        self.fixture.sub_dependency.checksum = "new_checksum"
+        self.fixture.sub_dependency.save()
+
+        # Act
+        result = flattened_template_api.get_flat_content(
+            self.fixture.template, request=self.request
+        )
+
+        # Assert
+        self.assertEqual(result, "new flat")
+        self.assertEqual(
+            FlattenedTemplate.get_by_template_id(
+                self.fixture.template.pk
+            ).content,
+            "new flat",
+        )
+
+    def test_get_dependencies_checksum_changes_with_dependency_graph(self):
+        """test get dependencies checksum changes with dependency graph
+
+        Returns:
+
+        """
+        # Arrange
+        checksum = flattened_template_api.get_dependencies_checksum(
+            self.fixture.template
+        )
+
+        # Act
+        self.fixture.dependency.dependencies.clear()
+
+        # Assert
+        self.assertNotEqual(
+            flattened_template_api.get_dependencies_checksum(
+                self.fixture.template
+            ),
+            checksum,
+        )
+
+    def test_get_flat_content_flattens_template(self):
+        """test get flat content flattens template
+
+        Returns:
+
+        """
+        # Act
+        result = flattened_template_api.get_flat_content(
+            self.fixture.template, request=self.request
+        )
+
+        # Assert
+        self.assertTrue('<xs:element name="template"' in result)
@@ -0,0 +1,286 @@
+""" Int Test Keyword Index
+"""
+from unittest.mock import MagicMock, patch
+
+from django.db.models.signals import post_save
+from django.test import override_settings
+
+from core_main_app.components.data.models import Data
+from core_main_app.components.keyword_index import api as keyword_index_api
+from core_main_app.components.keyword_index.models import DataKeyword
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from tests.components.data.fixtures.fixtures import DataFixtures
+
+fixture_data = DataFixtures()
+
+
+class KeywordIndexTestCase(IntegrationBaseTestCase):
+    """Keyword Index Test Case"""
+
+    fixture = fixture_data
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        post_save.connect(keyword_index_api.post_save_data, sender=Data)
+        self.addCleanup(
+            post_save.disconnect, keyword_index_api.post_save_data, Data
+        )
+        self._set_content(
+            self.fixture.data_1, {"root": {"element": "value other"}}
+        )
+        self._set_content(
+            self.fixture.data_2,
+            {"root": {"element": ["value", "value", "value other"]}},
+        )
+        self._set_content(self.fixture.data_3, {"root": {"element": "none"}})
+
+    @staticmethod
+    def _set_content(data, dict_content):
+        """Set the content of a data
+
+        Args:
+            data:
+            dict_content:
+
+        Returns:
+
+        """
+        data.dict_content = dict_content
+        data.save()
+
+
+class TestIndexData(KeywordIndexTestCase):
+    """Test Index Data"""
+
+    def test_save_data_indexes_keywords(self):
+        """test save data indexes keywords
+
+        Returns:
+
+        """
+        # Act
+        keywords = dict(
+            DataKeyword.objects.filter(
+                data_id=self.fixture.data_2.pk
+            ).values_list("keyword", "count")
+        )
+
+        # Assert
+        self.assertEqual(keywords, {"value": 3, "other": 1})
+
+    def test_save_data_replaces_keywords(self):
+        """test save data replaces keywords
+
+        Returns:
+
+        """
+        # Act
+        self._set_content(self.fixture.data_1, {"root": "new"})
+
+        # Assert
+        self.assertEqual(
+            list(
+                DataKeyword.objects.filter(
+                    data_id=self.fixture.data_1.pk
+                ).values_list("keyword", flat=True)
+            ),
+            ["new"],
+        )
+
+    def test_delete_data_deletes_keywords(self):
+        """test delete data deletes keywords
+
+        Returns:
+
+        """
+        # Arrange
+        data_id = self.fixture.data_1.pk
+
+        # Act
+        self.fixture.data_1.delete()
+
+        # Assert
+        self.assertFalse(DataKeyword.objects.filter(data_id=data_id).exists())
+
+    def test_rebuild_keyword_index_indexes_all_data(self):
+        """test rebuild keyword index indexes all data
+
+        Returns:
+
+        """
+        # Arrange
+        DataKeyword.objects.all().delete()
+
+        # Act
+        result = keyword_index_api.rebuild_keyword_index(batch_size=2)
+
+        # Assert
+        self.assertEqual(result, 3)
+        self.assertEqual(
+            DataKeyword.objects.filter(keyword="other").count(), 2
+        )
+
+
+class TestGetKeywordFilter(KeywordIndexTestCase):
+    """Test Get Keyword Filter"""
+
+    def test_get_keyword_filter_returns_data_with_all_keywords(self):
+        """test get keyword filter returns data with all keywords
+
+        Returns:
+
+        """
+        # Act
+        result = Data.objects.filter(
+            keyword_index_api.get_keyword_filter("Other VALUE")
+        )
+
+        # Assert
+        self.assertEqual(
+            set(result),
+            {self.fixture.data_1, self.fixture.data_2},
+        )
+
+    def test_get_keyword_filter_excludes_data_missing_a_keyword(self):
+        """test get keyword filter excludes data missing a keyword
+
+        Returns:
+
+        """
+        # Act
+        result = Data.objects.filter(
+            keyword_index_api.get_keyword_filter("value none")
+        )
+
+        # Assert
+        self.assertEqual(list(result), [])
+
+
+class TestRankByKeywords(KeywordIndexTestCase):
+    """Test Rank By Keywords"""
+
+    @patch.object(keyword_index_api, "KEYWORD_INDEX_ENABLED", True)
+    def test_rank_by_keywords_sorts_by_number_of_occurrences(self):
+        """test rank by keywords sorts by number of occurrences
+
+        Returns:
+
+        """
+        # Arrange
+        data_list = Data.objects.filter(
+            keyword_index_api.get_keyword_filter("value")
+        ).order_by("pk")
+
+        # Act
+        result = keyword_index_api.rank_by_keywords(data_list, "value")
+
+        # Assert
+        self.assertEqual(
+            list(result), [self.fixture.data_2, self.fixture.data_1]
+        )
+
+    def test_rank_by_keywords_keeps_order_when_index_disabled(self):
+        """test rank by keywords keeps order when index disabled
+
+        Returns:
+
+        """
+        # Arrange
+        data_list = Data.objects.filter(
+            keyword_index_api.get_keyword_filter("value")
+        ).order_by("pk")
+
+        # Act
+        result = keyword_index_api.rank_by_keywords(data_list, "value")
+
+        # Assert
+        self.assertEqual(
+            list(result), [self.fixture.data_1, self.fixture.data_2]
+        )
+
+    @override_settings(MONGODB_INDEXING=True)
+    def test_rank_by_keywords_sorts_by_text_score_with_mongodb(self):
+        """test rank by keywords sorts by text score with mongodb
+
+        Returns:
+
+        """
+        # Arrange
+        data_list = MagicMock()
+
+        # Act
+        result = keyword_index_api.rank_by_keywords(data_list, "value")
+
+        # Assert
+        data_list.order_by.assert_called_with("$text_score")
+        self.assertEqual(result, data_list.order_by.return_value)
+
+    @override_settings(MONGODB_INDEXING=True)
+    def test_rank_by_keywords_without_keywords_keeps_order_with_mongodb(
+        self,
+    ):
+        """test rank by keywords without keywords keeps order with mongodb
+
+        Returns:
+
+        """
+        # Arrange
+        data_list = MagicMock()
+
+        # Act
+        result = keyword_index_api.rank_by_keywords(data_list, " !? ")
+
+        # Assert
+        self.assertFalse(data_list.order_by.called)
+        self.assertEqual(result, data_list)
+
+    @patch.object(keyword_index_api, "uses_postgresql_backend")
+    def test_rank_by_keywords_sorts_by_search_rank_with_postgresql(
+        self, mock_uses_postgresql_backend
+    ):
+        """test rank by keywords sorts by search rank with postgresql
+
+        Returns:
+
+        """
+        # Arrange
+        mock_uses_postgresql_backend.return_value = True
+        data_list = Data.objects.order_by("pk")
+
+        # Act
+        result = keyword_index_api.rank_by_keywords(data_list, "value")
+
+        # Assert
+        self.assertIn(
+            keyword_index_api.KEYWORD_SCORE_FIELD, result.query.annotations
+        )
+        self.assertEqual(
+            result.query.order_by,
+            (f"-{keyword_index_api.KEYWORD_SCORE_FIELD}", "pk"),
+        )
+
+    @patch.object(keyword_index_api, "uses_postgresql_backend")
+    def test_rank_by_keywords_without_keywords_keeps_order_with_postgresql(
+        self, mock_uses_postgresql_backend
+    ):
+        """test rank by keywords without keywords keeps order with postgresql
+
+        Returns:
+
+        """
+        # Arrange
+        mock_uses_postgresql_backend.return_value = True
+        data_list = Data.objects.order_by("pk")
+
+        # Act
+        result = keyword_index_api.rank_by_keywords(data_list, "")
+
+        # Assert
+        self.assertIs(result, data_list)
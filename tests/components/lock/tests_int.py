@@ -2,6 +2,9 @@
 """
 
 from core_main_app.commons.exceptions import LockError
+from core_main_app.components.lock.models import DatabaseLockObject
+from core_main_app.settings import LOCK_OBJECT_TTL
+from core_main_app.utils.datetime import datetime_now, datetime_timedelta
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 
 from tests.components.data.fixtures.fixtures import DataFixtures
@@ -159,3 +162,123 @@ class TestLockRemoveLockOnObject(IntegrationBaseTestCase):
         self.assertEqual(
             lock_api.is_object_locked(self.fixture.data_1, self.user2), True
         )
+
+
+class TestLockExpiry(IntegrationBaseTestCase):
+    """Test Lock Expiry"""
+
+    fixture = fixture_data
+    user1 = create_mock_user("1")
+    user2 = create_mock_user("2")
+
+    def _expire_lock(self, data):
+        """Move the lock date of the data before the lock TTL
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        DatabaseLockObject.objects.filter(object=data).update(
+            lock_date=datetime_now()
+            - datetime_timedelta(seconds=2 * LOCK_OBJECT_TTL)
+        )
+
+    def test_is_object_locked_returns_false_when_lock_expired(self):
+        """test_is_object_locked_returns_false_when_lock_expired
+
+        Returns:
+
+        """
+        # Arrange
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+        self._expire_lock(self.fixture.data_1)
+
+        # Act
+        result = lock_api.is_object_locked(self.fixture.data_1, self.user2)
+
+        # Assert
+        self.assertEqual(result, False)
+        self.assertEqual(DatabaseLockObject.objects.count(), 1)
+
+    def test_set_lock_takes_over_expired_lock(self):
+        """test_set_lock_takes_over_expired_lock
+
+        Returns:
+
+        """
+        # Arrange
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+        self._expire_lock(self.fixture.data_1)
+
+        # Act
+        lock_api.set_lock_object(self.fixture.data_1, self.user2)
+
+        # Assert
+        self.assertEqual(
+            lock_api.is_object_locked(self.fixture.data_1, self.user1), True
+        )
+        self.assertEqual(
+            DatabaseLockObject.get_lock_by_object(self.fixture.data_1).user_id,
+            str(self.user2.id),
+        )
+
+    def test_set_lock_twice_keeps_one_lock(self):
+        """test_set_lock_twice_keeps_one_lock
+
+        Returns:
+
+        """
+        # Act
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+
+        # Assert
+        self.assertEqual(
+            DatabaseLockObject.objects.filter(
+                object=self.fixture.data_1
+            ).count(),
+            1,
+        )
+
+    def test_locks_on_different_objects_are_independent(self):
+        """test_locks_on_different_objects_are_independent
+
+        Returns:
+
+        """
+        # Act
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+        lock_api.set_lock_object(self.fixture.data_2, self.user2)
+
+        # Assert
+        self.assertEqual(
+            lock_api.is_object_locked(self.fixture.data_1, self.user2), True
+        )
+        self.assertEqual(
+            lock_api.is_object_locked(self.fixture.data_2, self.user1), True
+        )
+
+    def test_delete_expired_locks_deletes_only_expired_locks(self):
+        """test_delete_expired_locks_deletes_only_expired_locks
+
+        Returns:
+
+        """
+        # Arrange
+        lock_api.set_lock_object(self.fixture.data_1, self.user1)
+        lock_api.set_lock_object(self.fixture.data_2, self.user1)
+        self._expire_lock(self.fixture.data_1)
+
+        # Act
+        deleted_count = lock_api.delete_expired_locks()
+
+        # Assert
+        self.assertEqual(deleted_count, 1)
+        self.assertEqual(
+            list(
+                DatabaseLockObject.objects.values_list("object_id", flat=True)
+            ),
+            [self.fixture.data_2.id],
+        )
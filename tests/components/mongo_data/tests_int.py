@@ -0,0 +1,197 @@
+""" Integration tests for the MongoDB index synchronization
+"""
+from unittest.mock import patch
+
+from django.test import override_settings, tag
+
+from core_main_app.components.data.batch_resolvers import resolve_related
+from core_main_app.components.mongo import bulk_index
+from core_main_app.permissions.discover import init_mongo_indexing
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    MongoDBIntegrationBaseTestCase,
+)
+
+
+class TestBulkIndex(MongoDBIntegrationBaseTestCase):
+    """TestBulkIndex"""
+
+    @override_settings(MONGODB_INDEXING=True)
+    @override_settings(MONGODB_ASYNC_SAVE=False)
+    def setUp(self):
+        """Insert needed data.
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import (  # noqa: keep import to init signals
+            MongoData,
+        )
+        from tests.components.data.fixtures.fixtures import (
+            AccessControlDataFixture,
+        )
+
+        # Mongo indexing is not initialized by default
+        init_mongo_indexing()
+
+        self.fixture = AccessControlDataFixture()
+        self.fixture.insert_data()
+
+    @override_settings(MONGODB_INDEXING=True)
+    @override_settings(MONGODB_ASYNC_SAVE=False)
+    @tag("mongodb")
+    def test_update_data_fields_updates_all_documents(self):
+        """test_update_data_fields_updates_all_documents
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import MongoData
+
+        data_ids = [data.id for data in self.fixture.data_collection]
+        bulk_index.update_data_fields(
+            data_ids, _workspace_id=self.fixture.workspace_2.id
+        )
+        self.assertEqual(
+            MongoData.objects(
+                _workspace_id=self.fixture.workspace_2.id
+            ).count(),
+            len(data_ids),
+        )
+
+    @patch.object(bulk_index, "_get_collection")
+    @override_settings(MONGODB_INDEXING=True)
+    @override_settings(MONGODB_ASYNC_SAVE=False)
+    @tag("mongodb")
+    def test_index_data_list_upserts_documents(self, mock_get_collection):
+        """test_index_data_list_upserts_documents
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import MongoData
+
+        mock_get_collection.return_value = _BulkWriteCollection(
+            MongoData._get_collection()
+        )
+        mongo_id = MongoData.objects.get(pk=self.fixture.data_1.id).mongo_id
+        MongoData.objects(pk=self.fixture.data_2.id).delete()
+        self.fixture.data_1.title = "new title"
+
+        bulk_index.index_data_list([self.fixture.data_1, self.fixture.data_2])
+
+        mongo_data = MongoData.objects.get(pk=self.fixture.data_1.id)
+        self.assertEqual(mongo_data.title, "new title")
+        self.assertEqual(mongo_data.mongo_id, mongo_id)
+        self.assertEqual(
+            MongoData.objects(pk=self.fixture.data_2.id).count(), 1
+        )
+
+    @patch.object(bulk_index, "_get_collection")
+    @override_settings(MONGODB_INDEXING=True)
+    @override_settings(MONGODB_ASYNC_SAVE=False)
+    @tag("mongodb")
+    def test_data_saved_in_coalesce_block_are_indexed(
+        self, mock_get_collection
+    ):
+        """test_data_saved_in_coalesce_block_are_indexed
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import MongoData
+
+        mock_get_collection.return_value = _BulkWriteCollection(
+            MongoData._get_collection()
+        )
+        with bulk_index.coalesce_index_updates():
+            for data in self.fixture.data_collection:
+                data.title = f"{data.title} updated"
+                data.convert_and_save()
+            self.assertEqual(
+                MongoData.objects(title__endswith="updated").count(), 0
+            )
+
+        self.assertEqual(
+            MongoData.objects(title__endswith="updated").count(),
+            len(self.fixture.data_collection),
+        )
+
+
+class TestResolveRelated(MongoDBIntegrationBaseTestCase):
+    """TestResolveRelated"""
+
+    @override_settings(MONGODB_INDEXING=True)
+    @override_settings(MONGODB_ASYNC_SAVE=False)
+    def setUp(self):
+        """Insert needed data.
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import (  # noqa: keep import to init signals
+            MongoData,
+        )
+        from tests.components.data.fixtures.fixtures import (
+            AccessControlDataFixture,
+        )
+
+        # Mongo indexing is not initialized by default
+        init_mongo_indexing()
+
+        self.fixture = AccessControlDataFixture()
+        self.fixture.insert_data()
+
+    @override_settings(MONGODB_INDEXING=True)
+    @tag("mongodb")
+    def test_resolve_related_loads_templates_and_workspaces(self):
+        """test_resolve_related_loads_templates_and_workspaces
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import MongoData
+
+        mongo_data_list = list(MongoData.objects.order_by("data_id"))
+
+        with self.assertNumQueries(2):
+            resolve_related(mongo_data_list, template=True, workspace=True)
+            templates = [mongo_data.template for mongo_data in mongo_data_list]
+            workspaces = [
+                mongo_data.workspace for mongo_data in mongo_data_list
+            ]
+
+        self.assertEqual(
+            templates, [self.fixture.template] * len(mongo_data_list)
+        )
+        self.assertEqual(
+            workspaces,
+            [data.workspace for data in self.fixture.data_collection],
+        )
+
+
+class _BulkWriteCollection:
+    """Apply bulk writes with single operations (mongomock does not support
+    the bulk operations of recent pymongo versions)"""
+
+    def __init__(self, collection):
+        """Initialize collection
+
+        Args:
+            collection:
+        """
+        self.collection = collection
+
+    def bulk_write(self, operations, ordered=True):
+        """Apply ReplaceOne operations one by one
+
+        Args:
+            operations:
+            ordered:
+
+        Returns:
+
+        """
+        for operation in operations:
+            self.collection.replace_one(
+                operation._filter, operation._doc, upsert=operation._upsert
+            )
@@ -4,7 +4,7 @@ import json
 from unittest import TestCase
 from unittest.mock import patch
 
-from django.test import tag
+from django.test import override_settings, tag
 from tests.components.data.tests_unit import (
     _create_data,
     _create_blob,
@@ -14,6 +14,7 @@ from tests.components.data.tests_unit import (
 
 from core_main_app.commons.exceptions import ModelError
 from core_main_app.components.data.models import Data
+from core_main_app.components.mongo import bulk_index
 
 
 class TestMongoDataBlob(TestCase):
@@ -216,3 +217,61 @@ class TestInitMongoData(TestCase):
 
         # Assert
         self.assertFalse(mock_raw_xml_to_dict.called)
+
+
+class TestCoalesceIndexUpdates(TestCase):
+    """TestCoalesceIndexUpdates"""
+
+    def test_defer_index_outside_block_returns_false(self):
+        """test_defer_index_outside_block_returns_false
+
+        Returns:
+
+        """
+        self.assertFalse(bulk_index.defer_index(1))
+
+    @override_settings(MONGODB_ASYNC_SAVE=False)
+    @patch.object(bulk_index, "index_data_ids")
+    def test_ids_are_indexed_once_when_leaving_block(
+        self, mock_index_data_ids
+    ):
+        """test_ids_are_indexed_once_when_leaving_block
+
+        Returns:
+
+        """
+        with bulk_index.coalesce_index_updates():
+            with bulk_index.coalesce_index_updates():
+                for data_id in (1, 2, 1):
+                    self.assertTrue(bulk_index.defer_index(data_id))
+            mock_index_data_ids.assert_not_called()
+        mock_index_data_ids.assert_called_once_with(["1", "2"])
+
+    @override_settings(MONGODB_ASYNC_SAVE=False)
+    @patch.object(bulk_index, "MONGODB_INDEX_BATCH_SIZE", 2)
+    @patch.object(bulk_index, "index_data_ids")
+    def test_ids_are_indexed_by_batch(self, mock_index_data_ids):
+        """test_ids_are_indexed_by_batch
+
+        Returns:
+
+        """
+        with bulk_index.coalesce_index_updates():
+            for data_id in range(3):
+                bulk_index.defer_index(data_id)
+        self.assertEqual(mock_index_data_ids.call_count, 2)
+
+    @override_settings(MONGODB_ASYNC_SAVE=True)
+    @patch("core_main_app.components.data.tasks.index_mongo_data_list")
+    def test_async_save_sends_one_task(self, mock_index_mongo_data_list):
+        """test_async_save_sends_one_task
+
+        Returns:
+
+        """
+        with bulk_index.coalesce_index_updates():
+            for data_id in range(3):
+                bulk_index.defer_index(data_id)
+        mock_index_mongo_data_list.apply_async.assert_called_once_with(
+            (["0", "1", "2"],)
+        )
@@ -382,7 +382,7 @@ class TestXslTransform(TestCase):
             xsl_transformation_api.xsl_transform(mock_xml_data, mock_xslt.name)
 
     @patch.object(XslTransformation, "get_by_name")
-    @patch("core_main_app.utils.xml.xsl_transform")
+    @patch("core_main_app.utils.cache.xslt.xsl_transform")
     def test_xsl_transform_raise_api_error_on_other_exception(
         self, mock_xsl_transform, mock_get_by_name
     ):
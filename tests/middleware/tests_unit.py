@@ -3,13 +3,22 @@ from unittest.mock import MagicMock, patch
 from core_main_app.commons.exceptions import DoesNotExist
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from django.contrib.sessions.middleware import SessionMiddleware
-from django.test import SimpleTestCase, RequestFactory
+from django.http import HttpResponse
+from django.test import SimpleTestCase, RequestFactory, override_settings
 
 from core_main_app.components.user_preferences.models import UserPreferences
+from core_main_app.middleware.access_control import (
+    WorkspaceAccessCacheMiddleware,
+)
+from core_main_app.middleware.performance import PerformanceMiddleware
 from core_main_app.middleware.timezone import (
     TimezoneMiddleware,
     USER_TIMEZONE_NOT_SET,
 )
+from core_main_app.utils import performance
+from core_main_app.utils.cache import (
+    workspace_access as workspace_access_cache,
+)
 
 
 class TestTimezoneMiddleware(SimpleTestCase):
@@ -111,3 +120,140 @@ class TestTimezoneMiddleware(SimpleTestCase):
         self.assertEqual(
             request.session["django_timezone"], USER_TIMEZONE_NOT_SET
         )
+
+
+class TestWorkspaceAccessCacheMiddleware(SimpleTestCase):
+    """TestWorkspaceAccessCacheMiddleware"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+
+    @override_settings(DEBUG=True)
+    def test_acl_queries_are_counted_once_per_request(self):
+        """test_acl_queries_are_counted_once_per_request
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user("1")
+        mock_get_workspace_ids = MagicMock(return_value=[1])
+
+        def get_response(request):
+            for _ in range(3):
+                workspace_access_cache.get_accessible_workspaces(
+                    mock_user,
+                    workspace_access_cache.READ_ACCESS,
+                    mock_get_workspace_ids,
+                )
+            return HttpResponse()
+
+        request = self.factory.get("/")
+
+        # Act
+        with patch.object(
+            workspace_access_cache, "WORKSPACE_ACCESS_CACHE_TTL", 0
+        ):
+            response = WorkspaceAccessCacheMiddleware(get_response)(request)
+
+        # Assert
+        self.assertEqual(mock_get_workspace_ids.call_count, 1)
+        self.assertEqual(
+            request.acl_stats, {"acl_queries": 1, "acl_cache_hits": 2}
+        )
+        self.assertEqual(response["X-ACL-Queries"], "1")
+
+
+class TestPerformanceMiddleware(SimpleTestCase):
+    """TestPerformanceMiddleware"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+        performance.PERFORMANCE_STATS.clear()
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        performance.PERFORMANCE_STATS.clear()
+
+    @patch.object(performance, "PERFORMANCE_SAMPLE_RATE", 1)
+    def test_sampled_request_sets_server_timing_header(self):
+        """test_sampled_request_sets_server_timing_header
+
+        Returns:
+
+        """
+        # Arrange
+        def get_response(request):
+            with performance.timed(performance.XSD_VALIDATE):
+                performance.record_bytes_read(10)
+            request.acl_stats = {"acl_queries": 1, "acl_cache_hits": 2}
+            return HttpResponse()
+
+        request = self.factory.get("/")
+
+        # Act
+        response = PerformanceMiddleware(get_response)(request)
+
+        # Assert
+        self.assertIn("total;dur=", response["Server-Timing"])
+        self.assertIn("xsd_validate;dur=", response["Server-Timing"])
+        self.assertIn('storage;desc="read 10 B', response["Server-Timing"])
+
+    @patch.object(performance, "PERFORMANCE_SAMPLE_RATE", 1)
+    def test_sampled_request_is_added_to_stats(self):
+        """test_sampled_request_is_added_to_stats
+
+        Returns:
+
+        """
+        # Arrange
+        def get_response(request):
+            request.acl_stats = {"acl_queries": 1, "acl_cache_hits": 2}
+            return HttpResponse()
+
+        # Act
+        PerformanceMiddleware(get_response)(self.factory.get("/"))
+
+        # Assert
+        stats = performance.PERFORMANCE_STATS.get_percentiles()
+        self.assertEqual(stats["sampled_requests"], 1)
+        self.assertEqual(stats["metrics"]["acl_queries"]["max"], 1)
+        self.assertEqual(stats["metrics"]["acl_cache_hits"]["p50"], 2)
+
+    @patch.object(performance, "PERFORMANCE_SAMPLE_RATE", 0)
+    def test_request_not_sampled_is_not_instrumented(self):
+        """test_request_not_sampled_is_not_instrumented
+
+        Returns:
+
+        """
+        # Arrange
+        def get_response(request):
+            self.assertIsNone(performance.get_request_metrics())
+            return HttpResponse()
+
+        # Act
+        response = PerformanceMiddleware(get_response)(self.factory.get("/"))
+
+        # Assert
+        self.assertFalse(response.has_header("Server-Timing"))
+        self.assertEqual(
+            performance.PERFORMANCE_STATS.get_percentiles()[
+                "sampled_requests"
+            ],
+            0,
+        )
@@ -6,6 +6,7 @@ from unittest.mock import patch
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import override_settings
 from rest_framework import status
+from rest_framework.test import APIRequestFactory
 from tests.components.blob.fixtures.fixtures import (
     BlobFixtures,
     AccessControlBlobFixture,
@@ -517,6 +518,110 @@ class TestBlobDownload(IntegrationBaseTestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    @override_settings(ROOT_URLCONF="core_main_app.urls")
+    def test_get_streams_blob_file(self):
+        """test_get_streams_blob_file
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.BlobDownload.as_view(),
+            user,
+            param={"pk": str(self.fixture.blob_1.id)},
+        )
+
+        # Assert
+        self.assertEqual(b"".join(response.streaming_content), b"blob")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+    @override_settings(ROOT_URLCONF="core_main_app.urls")
+    def test_get_range_returns_http_206(self):
+        """test_get_range_returns_http_206
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user("1")
+        request = APIRequestFactory().get("/", HTTP_RANGE="bytes=1-2")
+        request.user = user
+
+        # Act
+        response = views.BlobDownload.as_view()(
+            request, pk=str(self.fixture.blob_1.id)
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), b"lo")
+        self.assertEqual(response["Content-Range"], "bytes 1-2/4")
+
+    @override_settings(ROOT_URLCONF="core_main_app.urls")
+    def test_get_with_current_etag_returns_http_304_without_reading_file(
+        self,
+    ):
+        """test_get_with_current_etag_returns_http_304_without_reading_file
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user("1")
+        response = RequestMock.do_request_get(
+            views.BlobDownload.as_view(),
+            user,
+            param={"pk": str(self.fixture.blob_1.id)},
+        )
+        request = APIRequestFactory().get(
+            "/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        request.user = user
+
+        # Act
+        with patch(
+            "core_main_app.rest.blob.views.get_file_streaming_response"
+        ) as mock_get_file_streaming_response:
+            response = views.BlobDownload.as_view()(
+                request, pk=str(self.fixture.blob_1.id)
+            )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_get_file_streaming_response.assert_not_called()
+
+    @override_settings(ROOT_URLCONF="core_main_app.urls")
+    def test_get_with_offload_returns_file_path_header(self):
+        """test_get_with_offload_returns_file_path_header
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        with patch(
+            "core_main_app.utils.file.FILE_DOWNLOAD_OFFLOAD_HEADER",
+            "X-Accel-Redirect",
+        ):
+            response = RequestMock.do_request_get(
+                views.BlobDownload.as_view(),
+                user,
+                param={"pk": str(self.fixture.blob_1.id)},
+            )
+
+        # Assert
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            "/protected-media/" + self.fixture.blob_1.blob.name,
+        )
+        self.assertEqual(response.content, b"")
+
     @override_settings(ROOT_URLCONF="core_main_app.urls")
     def test_get_wrong_id_returns_http_404(self):
         """test_get_wrong_id_returns_http_404
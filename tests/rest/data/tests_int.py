@@ -1,9 +1,15 @@
 """ Integration Test for Data Rest API
 """
+import io
+import json
+import zipfile
 from copy import copy
 from unittest.mock import patch
 
+from django.core.cache import cache
 from rest_framework import status
+from rest_framework.serializers import ModelSerializer
+from rest_framework.test import APIRequestFactory
 from tests.components.data.fixtures.fixtures import (
     DataFixtures,
     QueryDataFixtures,
@@ -12,6 +18,7 @@ from tests.components.data.fixtures.fixtures import (
 from tests.components.user.fixtures.fixtures import UserFixtures
 
 from core_main_app.components.data import api as data_api
+from core_main_app.components.data.batch import CONTENT_FIELD
 from core_main_app.components.data.models import Data
 from core_main_app.components.template.models import Template
 from core_main_app.components.workspace import api as workspace_api
@@ -273,6 +280,126 @@ class TestDataList(IntegrationBaseTestCase):
         # Assert
         self.assertEqual(len(response.data["results"]), 0)
 
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_cursor_returns_all_user_data(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_cursor_returns_all_user_data
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+        # counts are cached by query
+        cache.clear()
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"cursor": "", "count": "true"},
+        )
+
+        # Assert
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(response.data["count"], 2)
+        self.assertIsNone(response.data["next"])
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_invalid_cursor_returns_http_400(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_invalid_cursor_returns_http_400
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"cursor": "bad cursor"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_fields_returns_requested_fields(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_fields_returns_requested_fields
+
+        Returns:
+
+        """
+        # Arrange
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataList.as_view(),
+            user,
+            data={"fields": "id,title"},
+        )
+
+        # Assert
+        self.assertEqual(
+            [set(data) for data in response.data["results"]],
+            [{"id", "title"}, {"id", "title"}],
+        )
+
+    @patch(
+        "core_main_app.components.workspace.api.get_all_workspaces_with_read_access_by_user"
+    )
+    def test_get_with_fields_and_plain_serializer_returns_all_fields(
+        self, get_all_workspaces_with_read_access_by_user
+    ):
+        """test_get_with_fields_and_plain_serializer_returns_all_fields
+
+        Returns:
+
+        """
+
+        # Arrange
+        class PlainDataSerializer(ModelSerializer):
+            class Meta:
+                model = Data
+                fields = ["id", "title", "user_id"]
+
+        class PlainDataList(data_rest_views.DataList):
+            serializer = PlainDataSerializer
+
+        get_all_workspaces_with_read_access_by_user.return_value = []
+        user = create_mock_user(1)
+
+        # Act
+        response = RequestMock.do_request_get(
+            PlainDataList.as_view(),
+            user,
+            data={"fields": "id,title"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [set(data) for data in response.data["results"]],
+            [{"id", "title", "user_id"}, {"id", "title", "user_id"}],
+        )
+
     def test_post_data_missing_field_returns_http_400(self):
         """test_post_data_missing_field_returns_http_400
 
@@ -332,6 +459,82 @@ class TestDataDetail(IntegrationBaseTestCase):
         """
         super().setUp()
 
+    def _get_data_detail(self, user, **headers):
+        """Get the detail of data_1
+
+        Args:
+            user:
+            **headers:
+
+        Returns:
+
+        """
+        request = APIRequestFactory().get("/", **headers)
+        request.user = user
+        return data_rest_views.DataDetail.as_view()(
+            request, pk=self.fixture.data_1.id
+        )
+
+    def test_get_with_current_etag_returns_http_304(self):
+        """test_get_with_current_etag_returns_http_304
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user("1")
+        self.fixture.data_1.save_object()
+        etag = self._get_data_detail(user)["ETag"]
+
+        # Act
+        with patch.object(
+            data_rest_views.DataDetail, "serializer"
+        ) as mock_serializer:
+            response = self._get_data_detail(user, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_serializer.assert_not_called()
+
+    def test_get_after_change_returns_http_200(self):
+        """test_get_after_change_returns_http_200
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user("1")
+        self.fixture.data_1.save_object()
+        etag = self._get_data_detail(user)["ETag"]
+        self.fixture.data_1.title = "new title"
+        self.fixture.data_1.save_object()
+
+        # Act
+        response = self._get_data_detail(user, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_get_if_modified_since_last_change_returns_http_304(self):
+        """test_get_if_modified_since_last_change_returns_http_304
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user("1")
+        self.fixture.data_1.save_object()
+        last_modified = self._get_data_detail(user)["Last-Modified"]
+
+        # Act
+        response = self._get_data_detail(
+            user, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
     @patch.object(Data, "content")
     def test_get_returns_http_200(self, mock_content):
         """test_get_returns_http_200
@@ -633,6 +836,31 @@ class TestDataDownload(IntegrationBaseTestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_get_streams_data_file(self):
+        """test_get_streams_data_file
+
+        Returns:
+
+        """
+        # Arrange
+        user = create_mock_user("1")
+        self.fixture.data_1.convert_to_file()
+        self.fixture.data_1.save_object()
+
+        # Act
+        response = RequestMock.do_request_get(
+            data_rest_views.DataDownload.as_view(),
+            user,
+            param={"pk": self.fixture.data_1.id},
+        )
+
+        # Assert
+        self.assertEqual(
+            b"".join(response.streaming_content),
+            self.fixture.data_1.content.encode("utf-8"),
+        )
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
     def test_get_with_param_returns_http_400_when_content_not_well_formatted(
         self,
     ):
@@ -734,6 +962,85 @@ class TestExecuteLocalQueryView(IntegrationBaseTestCase):
         # Assert
         self.assertEqual(len(response.data), 2)
 
+    def test_post_export_ndjson_streams_one_line_per_data(self):
+        """test_post_export_ndjson_streams_one_line_per_data
+
+        Returns:
+
+        """
+        # Arrange
+        self.data = {
+            "query": '{"$or": [{"root.element": "value"}, {"root.element":"value2"}]}',
+            "export": "ndjson",
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.ExecuteLocalQueryView.as_view(),
+            self.user,
+            data=self.data,
+        )
+
+        # Assert
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(
+            sorted(json.loads(line)["title"] for line in lines),
+            ["title", "title2"],
+        )
+
+    def test_post_export_zip_streams_one_file_per_data(self):
+        """test_post_export_zip_streams_one_file_per_data
+
+        Returns:
+
+        """
+        # Arrange
+        self.data = {
+            "query": '{"$or": [{"root.element": "value"}, {"root.element":"value2"}]}',
+            "export": "zip",
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.ExecuteLocalQueryView.as_view(),
+            self.user,
+            data=self.data,
+        )
+
+        # Assert
+        with zipfile.ZipFile(
+            io.BytesIO(b"".join(response.streaming_content))
+        ) as zip_file:
+            file_names = sorted(zip_file.namelist())
+        self.assertEqual(
+            file_names,
+            sorted(
+                [
+                    f"{self.fixture.data_1.id}_title.xml",
+                    f"{self.fixture.data_2.id}_title2.xml",
+                ]
+            ),
+        )
+
+    def test_post_export_unknown_format_returns_http_400(self):
+        """test_post_export_unknown_format_returns_http_400
+
+        Returns:
+
+        """
+        # Arrange
+        self.data = {"query": "{}", "export": "csv"}
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.ExecuteLocalQueryView.as_view(),
+            self.user,
+            data=self.data,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_post_empty_query_string_filter_by_templates_returns_all_data_of_the_template(
         self,
     ):
@@ -1825,3 +2132,352 @@ class TestDataPermissions(IntegrationTransactionTestCase):
         excepted_result = {}
         excepted_result[str(data.id)] = True
         self.assertEqual(response.data, excepted_result)
+
+
+class TestDataBatch(IntegrationBaseTestCase):
+    """TestDataBatch"""
+
+    fixture = fixture_data
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        # store the schema of the template, read to validate the records
+        self.fixture.template.save_template()
+        self.user = create_mock_user(1)
+
+    def _get_record(self, title, content="<tag>value</tag>"):
+        """Get a record to create
+
+        Args:
+            title:
+            content:
+
+        Returns:
+
+        """
+        return {
+            "title": title,
+            "template": str(self.fixture.template.id),
+            CONTENT_FIELD: content,
+        }
+
+    def test_post_creates_each_record(self):
+        """test_post_creates_each_record
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=[self._get_record("new 1"), self._get_record("new 2")],
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(response.data["succeeded"], 2)
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            [status.HTTP_201_CREATED, status.HTTP_201_CREATED],
+        )
+        data = Data.objects.get(pk=response.data["results"][1]["id"])
+        self.assertEqual(data.title, "new 2")
+        self.assertEqual(data.user_id, "1")
+        self.assertEqual(data.content, "<tag>value</tag>")
+
+    def test_post_invalid_record_does_not_cancel_other_records(self):
+        """test_post_invalid_record_does_not_cancel_other_records
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=[
+                self._get_record("new 1"),
+                self._get_record("invalid", content="<other></other>"),
+                self._get_record("new 2"),
+            ],
+        )
+
+        # Assert
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            [
+                status.HTTP_201_CREATED,
+                status.HTTP_400_BAD_REQUEST,
+                status.HTTP_201_CREATED,
+            ],
+        )
+        self.assertEqual(response.data["failed"], 1)
+        self.assertFalse(Data.objects.filter(title="invalid").exists())
+        self.assertTrue(Data.objects.filter(title="new 2").exists())
+
+    def test_post_record_with_missing_field_returns_item_http_400(self):
+        """test_post_record_with_missing_field_returns_item_http_400
+
+        Returns:
+
+        """
+        # Arrange
+        record = self._get_record("new")
+        del record[CONTENT_FIELD]
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.DataBatch.as_view(), self.user, data=[record]
+        )
+
+        # Assert
+        result = response.data["results"][0]
+        self.assertEqual(result["status"], status.HTTP_400_BAD_REQUEST)
+        self.assertIn(CONTENT_FIELD, result["message"])
+
+    def test_post_record_with_unknown_template_returns_item_http_404(self):
+        """test_post_record_with_unknown_template_returns_item_http_404
+
+        Returns:
+
+        """
+        # Arrange
+        record = self._get_record("new")
+        record["template"] = "-1"
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.DataBatch.as_view(), self.user, data=[record]
+        )
+
+        # Assert
+        self.assertEqual(
+            response.data["results"][0]["status"], status.HTTP_404_NOT_FOUND
+        )
+
+    def test_post_ndjson_creates_each_line(self):
+        """test_post_ndjson_creates_each_line
+
+        Returns:
+
+        """
+        # Arrange
+        lines = [
+            json.dumps(self._get_record("new 1")),
+            "",
+            json.dumps(self._get_record("new 2")),
+        ]
+
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data="\n".join(lines),
+            content_type="application/x-ndjson",
+        )
+
+        # Assert
+        self.assertEqual(response.data["succeeded"], 2)
+
+    def test_post_invalid_ndjson_returns_http_400(self):
+        """test_post_invalid_ndjson_returns_http_400
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=json.dumps(self._get_record("new 1")) + "\n{",
+            content_type="application/x-ndjson",
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Data.objects.filter(title="new 1").count(), 0)
+
+    def test_post_object_returns_http_400(self):
+        """test_post_object_returns_http_400
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=self._get_record("new"),
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("core_main_app.rest.data.views.DATA_BATCH_MAX_SIZE", 1)
+    def test_post_too_many_records_returns_http_400(self):
+        """test_post_too_many_records_returns_http_400
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_post(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=[self._get_record("new 1"), self._get_record("new 2")],
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_post_records_in_several_chunks_creates_each_record(self):
+        """test_post_records_in_several_chunks_creates_each_record
+
+        Returns:
+
+        """
+        # Act
+        with patch(
+            "core_main_app.components.data.batch.DATA_BATCH_CHUNK_SIZE", 2
+        ):
+            response = RequestMock.do_request_post(
+                data_rest_views.DataBatch.as_view(),
+                self.user,
+                data=[self._get_record(f"new {index}") for index in range(5)],
+            )
+
+        # Assert
+        self.assertEqual(response.data["succeeded"], 5)
+        self.assertEqual(
+            [result["index"] for result in response.data["results"]],
+            list(range(5)),
+        )
+
+    def test_patch_updates_each_record(self):
+        """test_patch_updates_each_record
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_patch(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=[
+                {
+                    "id": str(self.fixture.data_1.id),
+                    "title": "new title",
+                    CONTENT_FIELD: "<tag>value</tag>",
+                },
+                {
+                    "id": str(self.fixture.data_3.id),
+                    CONTENT_FIELD: "<tag>new</tag>",
+                },
+            ],
+        )
+
+        # Assert
+        self.assertEqual(response.data["succeeded"], 2)
+        self.assertEqual(
+            Data.objects.get(pk=self.fixture.data_1.id).title, "new title"
+        )
+        self.assertEqual(
+            Data.objects.get(pk=self.fixture.data_3.id).content,
+            "<tag>new</tag>",
+        )
+
+    def test_patch_data_of_other_user_returns_item_http_403(self):
+        """test_patch_data_of_other_user_returns_item_http_403
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_patch(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=[{"id": str(self.fixture.data_2.id), "title": "new title"}],
+        )
+
+        # Assert
+        self.assertEqual(
+            response.data["results"][0]["status"], status.HTTP_403_FORBIDDEN
+        )
+        self.assertEqual(
+            Data.objects.get(pk=self.fixture.data_2.id).title, "title2"
+        )
+
+    def test_patch_unknown_data_returns_item_http_404(self):
+        """test_patch_unknown_data_returns_item_http_404
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_patch(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=[{"id": "-1", "title": "new title"}],
+        )
+
+        # Assert
+        self.assertEqual(
+            response.data["results"][0]["status"], status.HTTP_404_NOT_FOUND
+        )
+
+    def test_delete_deletes_each_data(self):
+        """test_delete_deletes_each_data
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_delete(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=[
+                str(self.fixture.data_1.id),
+                {"id": str(self.fixture.data_3.id)},
+            ],
+        )
+
+        # Assert
+        self.assertEqual(
+            [result["status"] for result in response.data["results"]],
+            [status.HTTP_204_NO_CONTENT, status.HTTP_204_NO_CONTENT],
+        )
+        self.assertEqual(
+            response.data["results"][0]["id"], str(self.fixture.data_1.id)
+        )
+        self.assertFalse(
+            Data.objects.filter(
+                pk__in=[self.fixture.data_1.id, self.fixture.data_3.id]
+            ).exists()
+        )
+
+    def test_delete_data_of_other_user_returns_item_http_403(self):
+        """test_delete_data_of_other_user_returns_item_http_403
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_delete(
+            data_rest_views.DataBatch.as_view(),
+            self.user,
+            data=[str(self.fixture.data_2.id)],
+        )
+
+        # Assert
+        self.assertEqual(
+            response.data["results"][0]["status"], status.HTTP_403_FORBIDDEN
+        )
+        self.assertTrue(
+            Data.objects.filter(pk=self.fixture.data_2.id).exists()
+        )
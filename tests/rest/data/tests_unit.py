@@ -1,10 +1,11 @@
 """Unit tests for data rest api
 """
-from unittest.mock import patch, MagicMock, mock_open
+import io
+from unittest.mock import patch, MagicMock
 
 from django.test import SimpleTestCase
 from rest_framework import status
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import ParseError, ValidationError
 from tests.components.data.fixtures.fixtures import QueryDataFixtures
 from tests.components.data.tests_unit import _get_template, _get_json_template
 from tests.mocks import MockQuerySet
@@ -20,6 +21,7 @@ from core_main_app.rest.data.abstract_views import (
     AbstractExecuteLocalQueryView,
 )
 from core_main_app.rest.data.admin_serializers import AdminDataSerializer
+from core_main_app.rest.data.parsers import NDJSONParser
 from core_main_app.rest.data.serializers import DataSerializer
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_main_app.utils.tests_tools.RequestMock import (
@@ -674,24 +676,12 @@ class TestBulkUploadFolder(SimpleTestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-    @patch.object(data_rest_views.BulkUploadFolder, "_bulk_create")
-    @patch("builtins.open", new_callable=mock_open, read_data=b"<tag></tag>")
-    @patch("core_main_app.components.data.api.check_json_file_is_valid")
-    @patch("core_main_app.components.data.api.check_xml_file_is_valid")
-    @patch("os.listdir")
-    @patch("os.path.exists")
+    @patch("os.path.isdir")
     @patch.object(template_api, "get_by_id")
-    def test_put_xml_folder_calls_xml_validation(
-        self,
-        mock_template_api_get_by_id,
-        mock_exists,
-        mock_list_dir,
-        mock_check_xml_file_is_valid,
-        mock_check_json_file_is_valid,
-        mock_open_func,
-        mock_bulk_create,
+    def test_put_folder_not_found_return_http_400(
+        self, mock_template_api_get_by_id, mock_isdir
     ):
-        """test_put_xml_folder_calls_xml_validation
+        """test_put_folder_not_found_return_http_400
 
         Returns:
 
@@ -701,11 +691,7 @@ class TestBulkUploadFolder(SimpleTestCase):
         mock_template_api_get_by_id.return_value = MagicMock(
             format=Template.XSD
         )
-        mock_exists.return_value = True
-        mock_list_dir.return_value = [MagicMock()]
-        mock_check_xml_file_is_valid.return_value = True
-        mock_check_json_file_is_valid.return_value = True
-        mock_bulk_create.return_value = None
+        mock_isdir.return_value = False
 
         # Mock
         response = RequestMock.do_request_put(
@@ -715,58 +701,47 @@ class TestBulkUploadFolder(SimpleTestCase):
         )
 
         # Assert
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(mock_check_xml_file_is_valid.called)
-        self.assertFalse(mock_check_json_file_is_valid.called)
-
-    @patch.object(data_rest_views.BulkUploadFolder, "_bulk_create")
-    @patch(
-        "builtins.open",
-        new_callable=mock_open,
-        read_data=b'{"element": "value"}',
-    )
-    @patch("core_main_app.components.data.api.check_json_file_is_valid")
-    @patch("core_main_app.components.data.api.check_xml_file_is_valid")
-    @patch("os.listdir")
-    @patch("os.path.exists")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("core_main_app.components.data.api.bulk_upload_folder")
+    @patch("os.path.isdir")
     @patch.object(template_api, "get_by_id")
-    def test_put_json_folder_calls_json_validation(
+    def test_put_folder_returns_task_id(
         self,
         mock_template_api_get_by_id,
-        mock_exists,
-        mock_list_dir,
-        mock_check_xml_file_is_valid,
-        mock_check_json_file_is_valid,
-        mock_open_func,
-        mock_bulk_create,
+        mock_isdir,
+        mock_bulk_upload_folder,
     ):
-        """test_put_json_folder_calls_json_validation
+        """test_put_folder_returns_task_id
 
         Returns:
 
         """
         # Arrange
         mock_user = create_mock_user("1", is_staff=True)
-        mock_template_api_get_by_id.return_value = MagicMock(
-            format=Template.JSON
-        )
-        mock_exists.return_value = True
-        mock_list_dir.return_value = [MagicMock()]
-        mock_check_xml_file_is_valid.return_value = True
-        mock_check_json_file_is_valid.return_value = True
-        mock_bulk_create.return_value = None
+        mock_template = MagicMock(format=Template.XSD)
+        mock_template_api_get_by_id.return_value = mock_template
+        mock_isdir.return_value = True
+        mock_bulk_upload_folder.return_value = "task_id"
 
         # Mock
         response = RequestMock.do_request_put(
             data_rest_views.BulkUploadFolder.as_view(),
             mock_user,
-            data={"folder": "folder", "template": "1", "workspace": "1"},
+            data={
+                "folder": "folder",
+                "template": "1",
+                "workspace": "1",
+                "validate_xml": False,
+            },
         )
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertFalse(mock_check_xml_file_is_valid.called)
-        self.assertTrue(mock_check_json_file_is_valid.called)
+        self.assertEqual(response.data, "task_id")
+        mock_bulk_upload_folder.assert_called_with(
+            "folder", mock_template, "1", 10, False, True, mock_user
+        )
 
 
 class TestDataSerializer(SimpleTestCase):
@@ -1094,6 +1069,47 @@ class TestAbstractExecuteLocalQueryView(SimpleTestCase):
             AbstractExecuteLocalQueryView.parse_id(mock_template_dict)
 
 
+class TestNDJSONParser(SimpleTestCase):
+    """TestNDJSONParser"""
+
+    def test_parse_returns_one_document_per_line(self):
+        """test_parse_returns_one_document_per_line
+
+        Returns:
+
+        """
+        # Arrange
+        stream = io.BytesIO(b'{"title": "a"}\n\n{"title": "b"}\n')
+
+        # Act
+        documents = NDJSONParser().parse(stream)
+
+        # Assert
+        self.assertEqual(documents, [{"title": "a"}, {"title": "b"}])
+
+    def test_parse_invalid_line_raises_parse_error(self):
+        """test_parse_invalid_line_raises_parse_error
+
+        Returns:
+
+        """
+        # Arrange
+        stream = io.BytesIO(b'{"title": "a"}\n{"title"\n')
+
+        # Act # Assert
+        with self.assertRaises(ParseError) as context:
+            NDJSONParser().parse(stream)
+        self.assertIn("line 2", str(context.exception.detail))
+
+    def test_parse_empty_body_returns_empty_list(self):
+        """test_parse_empty_body_returns_empty_list
+
+        Returns:
+
+        """
+        self.assertEqual(NDJSONParser().parse(None), [])
+
+
 def _create_data(title="test"):
     """Create an XML data
 
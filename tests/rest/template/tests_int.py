@@ -2,6 +2,7 @@
 """
 
 from rest_framework import status
+from rest_framework.test import APIRequestFactory
 from tests.components.template.fixtures.fixtures import (
     AccessControlTemplateFixture,
 )
@@ -78,3 +79,44 @@ class TestTemplateDownload(IntegrationBaseTestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.content, expected_value)
+
+    def test_get_with_current_etag_returns_http_304(self):
+        # Arrange
+        user = create_mock_user("1")
+        response = RequestMock.do_request_get(
+            template_rest_views.TemplateDownload.as_view(),
+            user,
+            param={"pk": self.fixture.user1_template.id},
+        )
+        request = APIRequestFactory().get(
+            "/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        request.user = user
+
+        # Act
+        response = template_rest_views.TemplateDownload.as_view()(
+            request, pk=self.fixture.user1_template.id
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_get_pretty_print_has_other_etag(self):
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            template_rest_views.TemplateDownload.as_view(),
+            user,
+            param={"pk": self.fixture.user1_template.id},
+        )
+        pretty_response = RequestMock.do_request_get(
+            template_rest_views.TemplateDownload.as_view(),
+            user,
+            param={"pk": self.fixture.user1_template.id},
+            data={"pretty_print": "true"},
+        )
+
+        # Assert
+        self.assertNotEqual(response["ETag"], pretty_response["ETag"])
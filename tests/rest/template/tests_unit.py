@@ -8,6 +8,9 @@ from tests.components.data.tests_unit import _get_template, _get_json_template
 
 import core_main_app.components.template.api as template_api
 from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.components.flattened_template import (
+    api as flattened_template_api,
+)
 from core_main_app.components.template.models import Template
 from core_main_app.rest.template import views as template_rest_views
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
@@ -191,3 +194,35 @@ class TestTemplateDownload(SimpleTestCase):
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch.object(flattened_template_api, "get_flat_content")
+    @patch.object(template_api, "get_by_id")
+    def test_get_with_flatten_returns_flattened_template(
+        self, mock_template_api_get_by_id, mock_get_flat_content
+    ):
+        """test_get_with_flatten_returns_flattened_template
+
+        Args:
+            mock_template_api_get_by_id:
+            mock_get_flat_content:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user("1")
+        mock_template = _get_template()
+        mock_template_api_get_by_id.return_value = mock_template
+        mock_get_flat_content.return_value = "<schema/>"
+
+        # Mock
+        response = RequestMock.do_request_get(
+            template_rest_views.TemplateDownload.as_view(),
+            mock_user,
+            param={"pk": "1"},
+            data={"flatten": "true"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, b"<schema/>")
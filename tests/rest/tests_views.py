@@ -6,7 +6,7 @@ from unittest.mock import patch, MagicMock
 from django.test import override_settings, tag
 from importlib.metadata import PackageNotFoundError
 
-from core_main_app.rest.views import CoreSettings
+from core_main_app.rest.views import CoreSettings, PerformanceStats
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_main_app.utils.tests_tools.RequestMock import RequestMock
 
@@ -147,3 +147,60 @@ class TestCoreSetting(TestCase):
 
         # Assert
         self.assertEqual(response.data["core_version"], None)
+
+
+class TestPerformanceStats(TestCase):
+    """TestPerformanceStats"""
+
+    def test_anonymous_user_access_denied(self):
+        """test_anonymous_user_access_denied
+
+        Returns:
+
+        """
+        # Act
+        response = RequestMock.do_request_get(
+            PerformanceStats.as_view(),
+            None,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 403)
+
+    def test_user_access_denied(self):
+        """test_user_access_denied
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            PerformanceStats.as_view(),
+            mock_user,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 403)
+
+    def test_admin_get_stats(self):
+        """test_admin_get_stats
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user("1", is_staff=True)
+
+        # Act
+        response = RequestMock.do_request_get(
+            PerformanceStats.as_view(),
+            mock_user,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("requests", response.data)
+        self.assertIn("xml_schema", response.data["caches"])
@@ -0,0 +1,96 @@
+""" Unit tests of xsl transform templatetag
+"""
+from types import SimpleNamespace
+from unittest.case import TestCase
+
+from django.core.cache import cache
+
+from core_main_app.templatetags.xsl_transform_tag import (
+    render_xml_as_html_detail,
+)
+
+
+class TestRenderXmlAsHtmlDetail(TestCase):
+    """Test render xml as html detail"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        cache.clear()
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        cache.clear()
+
+    def test_xml_content_is_rendered(self):
+        """test_xml_content_is_rendered
+
+        Returns:
+
+        """
+        result = render_xml_as_html_detail(xml_content="<tag>value</tag>")
+        self.assertIn("value", result)
+
+    def test_content_of_data_is_rendered(self):
+        """test_content_of_data_is_rendered
+
+        Returns:
+
+        """
+        data = SimpleNamespace(
+            id=1, checksum="checksum", content="<tag>value</tag>"
+        )
+        result = render_xml_as_html_detail(data=data)
+        self.assertIn("value", result)
+
+    def test_same_version_of_data_is_rendered_from_cache(self):
+        """test_same_version_of_data_is_rendered_from_cache
+
+        Returns:
+
+        """
+        render_xml_as_html_detail(
+            data=SimpleNamespace(
+                id=1, checksum="checksum", content="<tag>value</tag>"
+            )
+        )
+        result = render_xml_as_html_detail(
+            data=SimpleNamespace(
+                id=1, checksum="checksum", content="<tag>other</tag>"
+            )
+        )
+        self.assertIn("value", result)
+
+    def test_new_version_of_data_is_rendered_again(self):
+        """test_new_version_of_data_is_rendered_again
+
+        Returns:
+
+        """
+        render_xml_as_html_detail(
+            data=SimpleNamespace(
+                id=1, checksum="checksum", content="<tag>value</tag>"
+            )
+        )
+        result = render_xml_as_html_detail(
+            data=SimpleNamespace(
+                id=1, checksum="new checksum", content="<tag>other</tag>"
+            )
+        )
+        self.assertIn("other", result)
+
+    def test_invalid_content_of_data_is_returned(self):
+        """test_invalid_content_of_data_is_returned
+
+        Returns:
+
+        """
+        data = SimpleNamespace(id=1, checksum="checksum", content="<tag>")
+        self.assertEqual(render_xml_as_html_detail(data=data), "<tag>")
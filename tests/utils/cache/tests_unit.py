@@ -0,0 +1,681 @@
+""" Unit tests for cache utils
+"""
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from django.core.cache import cache
+from lxml import etree
+
+from core_main_app.commons import exceptions
+from core_main_app.components.template.models import Template
+from core_main_app.components.xsl_transformation.models import (
+    XslTransformation,
+)
+from core_main_app.utils.cache import (
+    rendered_fragment as rendered_fragment_cache,
+)
+from core_main_app.utils.cache import (
+    workspace_access as workspace_access_cache,
+)
+from core_main_app.utils.cache import xml_schema as xml_schema_cache
+from core_main_app.utils.cache import xslt as xslt_cache
+from core_main_app.utils.cache.lru_cache import LRUCache
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+XSD = (
+    '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+    '<xs:element name="tag"></xs:element></xs:schema>'
+)
+XSLT = (
+    '<xsl:stylesheet version="1.0" '
+    'xmlns:xsl="http://www.w3.org/1999/XSL/Transform">'
+    '<xsl:template match="/tag"><p><xsl:value-of select="."/></p>'
+    "</xsl:template></xsl:stylesheet>"
+)
+
+INCLUDE_URL = "http://example.com/core/download-template/2/"
+XSD_WITH_INCLUDE = (
+    '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+    f'<xs:include schemaLocation="{INCLUDE_URL}"/></xs:schema>'
+)
+
+
+class TestLRUCache(TestCase):
+    """TestLRUCache"""
+
+    def test_get_returns_cached_value_and_counts_hit(self):
+        """test_get_returns_cached_value_and_counts_hit
+
+        Returns:
+
+        """
+        cache = LRUCache(2)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_get_missing_key_returns_default_and_counts_miss(self):
+        """test_get_missing_key_returns_default_and_counts_miss
+
+        Returns:
+
+        """
+        cache = LRUCache(2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_set_evicts_least_recently_used(self):
+        """test_set_evicts_least_recently_used
+
+        Returns:
+
+        """
+        cache = LRUCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_zero_size_disables_cache(self):
+        """test_zero_size_disables_cache
+
+        Returns:
+
+        """
+        cache = LRUCache(0)
+        cache.set("a", 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_if_removes_matching_entries(self):
+        """test_invalidate_if_removes_matching_entries
+
+        Returns:
+
+        """
+        cache = LRUCache(5)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate_if(lambda key, value: value == 2)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+
+
+class TestXmlSchemaCache(TestCase):
+    """TestXmlSchemaCache"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        xml_schema_cache.clear_cache()
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        xml_schema_cache.clear_cache()
+
+    @patch.object(xml_schema_cache, "_get_dependency_ids")
+    def test_same_template_is_compiled_once(self, mock_get_dependency_ids):
+        """test_same_template_is_compiled_once
+
+        Returns:
+
+        """
+        mock_get_dependency_ids.return_value = set()
+        template = _get_template(template_id=1)
+        xml_tree = XSDTree.build_tree("<tag></tag>")
+
+        with patch.object(
+            xml_schema_cache,
+            "compile_xml_schema",
+            wraps=xml_schema_cache.compile_xml_schema,
+        ) as mock_compile:
+            for _ in range(3):
+                self.assertIsNone(
+                    xml_schema_cache.validate_xml_tree(template, xml_tree)
+                )
+            self.assertEqual(mock_compile.call_count, 1)
+
+        stats = xml_schema_cache.get_cache_stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+
+    @patch.object(xml_schema_cache, "_get_dependency_ids")
+    def test_new_checksum_recompiles_schema(self, mock_get_dependency_ids):
+        """test_new_checksum_recompiles_schema
+
+        Returns:
+
+        """
+        mock_get_dependency_ids.return_value = set()
+        template = _get_template(template_id=1)
+        xml_schema_cache.get_xml_schema(template)
+        template.checksum = "other"
+        xml_schema_cache.get_xml_schema(template)
+        self.assertEqual(xml_schema_cache.get_cache_stats()["misses"], 2)
+
+    @patch.object(xml_schema_cache, "lmxl_uri_resolver")
+    @patch.object(xml_schema_cache, "_get_dependency_ids")
+    def test_schema_resolved_with_request_is_cached_per_user(
+        self, mock_get_dependency_ids, mock_lmxl_uri_resolver
+    ):
+        """test_schema_resolved_with_request_is_cached_per_user
+
+        Returns:
+
+        """
+        mock_get_dependency_ids.return_value = set()
+        mock_lmxl_uri_resolver.side_effect = lambda request: _IncludeResolver()
+        template = _get_template(template_id=1)
+        template.content = XSD_WITH_INCLUDE
+        first_user_request = MagicMock(user=create_mock_user("1"))
+        other_user_request = MagicMock(user=create_mock_user("2"))
+
+        first_schema = xml_schema_cache.get_xml_schema(
+            template, request=first_user_request
+        )
+        self.assertIs(
+            xml_schema_cache.get_xml_schema(
+                template, request=first_user_request
+            ),
+            first_schema,
+        )
+        self.assertIsNot(
+            xml_schema_cache.get_xml_schema(
+                template, request=other_user_request
+            ),
+            first_schema,
+        )
+        self.assertIsNot(
+            xml_schema_cache.get_xml_schema(template), first_schema
+        )
+
+    @patch.object(xml_schema_cache, "lmxl_uri_resolver")
+    @patch.object(xml_schema_cache, "_get_dependency_ids")
+    def test_schema_not_resolved_with_request_is_shared(
+        self, mock_get_dependency_ids, mock_lmxl_uri_resolver
+    ):
+        """test_schema_not_resolved_with_request_is_shared
+
+        Returns:
+
+        """
+        mock_get_dependency_ids.return_value = set()
+        mock_lmxl_uri_resolver.side_effect = lambda request: _IncludeResolver()
+        template = _get_template(template_id=1)
+
+        first_schema = xml_schema_cache.get_xml_schema(
+            template, request=MagicMock(user=create_mock_user("1"))
+        )
+        self.assertIs(
+            xml_schema_cache.get_xml_schema(
+                template, request=MagicMock(user=create_mock_user("2"))
+            ),
+            first_schema,
+        )
+
+    def test_unsaved_template_is_not_cached(self):
+        """test_unsaved_template_is_not_cached
+
+        Returns:
+
+        """
+        template = _get_template()
+        xml_schema_cache.get_xml_schema(template)
+        self.assertEqual(xml_schema_cache.get_cache_stats()["size"], 0)
+
+    @patch.object(xml_schema_cache, "_get_dependency_ids")
+    def test_invalidate_dependency_removes_dependent_templates(
+        self, mock_get_dependency_ids
+    ):
+        """test_invalidate_dependency_removes_dependent_templates
+
+        Returns:
+
+        """
+        mock_get_dependency_ids.return_value = {"2"}
+        xml_schema_cache.get_xml_schema(_get_template(template_id=1))
+        mock_get_dependency_ids.return_value = set()
+        xml_schema_cache.get_xml_schema(_get_template(template_id=3))
+
+        xml_schema_cache.invalidate_template(2)
+
+        self.assertEqual(xml_schema_cache.get_cache_stats()["size"], 1)
+
+    def test_post_save_template_invalidates_template(self):
+        """test_post_save_template_invalidates_template
+
+        Returns:
+
+        """
+        with patch.object(
+            xml_schema_cache, "invalidate_template"
+        ) as mock_invalidate:
+            xml_schema_cache.post_save_template(
+                Template, MagicMock(pk=1), created=False
+            )
+        mock_invalidate.assert_called_with(1)
+
+    def test_invalid_template_raises_xsd_error(self):
+        """test_invalid_template_raises_xsd_error
+
+        Returns:
+
+        """
+        template = _get_template()
+        template.content += "<"
+        with self.assertRaises(exceptions.XSDError):
+            xml_schema_cache.validate_xml_tree(
+                template, XSDTree.build_tree("<tag></tag>")
+            )
+
+    def test_validate_invalid_xml_returns_error(self):
+        """test_validate_invalid_xml_returns_error
+
+        Returns:
+
+        """
+        template = _get_template()
+        self.assertIsNotNone(
+            xml_schema_cache.validate_xml_tree(
+                template, XSDTree.build_tree("<other></other>")
+            )
+        )
+
+
+class TestXsltCache(TestCase):
+    """TestXsltCache"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        xslt_cache.clear_cache()
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        xslt_cache.clear_cache()
+
+    def test_same_xslt_is_compiled_once(self):
+        """test_same_xslt_is_compiled_once
+
+        Returns:
+
+        """
+        xsl_transformation = _get_xsl_transformation(xslt_id=1)
+        with patch.object(
+            xslt_cache, "compile_xslt", wraps=xslt_cache.compile_xslt
+        ) as mock_compile:
+            for _ in range(10):
+                result = xslt_cache.xsl_transform(
+                    "<tag>value</tag>", xsl_transformation
+                )
+            self.assertEqual(mock_compile.call_count, 1)
+        self.assertIn("<p>value</p>", result)
+        self.assertEqual(xslt_cache.get_cache_stats()["hits"], 9)
+
+    def test_invalidate_xsl_transformation_removes_entry(self):
+        """test_invalidate_xsl_transformation_removes_entry
+
+        Returns:
+
+        """
+        xslt_cache.get_xslt(_get_xsl_transformation(xslt_id=1))
+        xslt_cache.post_delete_xsl_transformation(
+            XslTransformation, MagicMock(pk=1)
+        )
+        self.assertEqual(xslt_cache.get_cache_stats()["size"], 0)
+
+    def test_transform_bad_xml_raises_core_error(self):
+        """test_transform_bad_xml_raises_core_error
+
+        Returns:
+
+        """
+        with self.assertRaises(exceptions.CoreError):
+            xslt_cache.xsl_transform("<tag>", _get_xsl_transformation())
+
+    def test_compile_bad_xslt_raises_core_error(self):
+        """test_compile_bad_xslt_raises_core_error
+
+        Returns:
+
+        """
+        with self.assertRaises(exceptions.CoreError):
+            xslt_cache.compile_xslt("<xsl:stylesheet")
+
+
+def _get_xsl_transformation(xslt_id=None):
+    """Get XslTransformation
+
+    Args:
+        xslt_id:
+
+    Returns:
+
+    """
+    xsl_transformation = XslTransformation(
+        id=xslt_id, name="xslt", filename="xslt.xsl", checksum="checksum"
+    )
+    xsl_transformation.content = XSLT
+    return xsl_transformation
+
+
+class _IncludeResolver(etree.Resolver):
+    """Resolver serving the included schema"""
+
+    def resolve(self, url, id, context):
+        """Resolve the included schema
+
+        Args:
+            url:
+            id:
+            context:
+
+        Returns:
+
+        """
+        if url == INCLUDE_URL:
+            return self.resolve_string(XSD, context)
+        return None
+
+
+def _get_template(template_id=None):
+    """Get XSD template
+
+    Args:
+        template_id:
+
+    Returns:
+
+    """
+    template = Template(id=template_id, format=Template.XSD)
+    template.content = XSD
+    template.checksum = "checksum"
+    return template
+
+
+class TestWorkspaceAccessCache(TestCase):
+    """TestWorkspaceAccessCache"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.user = create_mock_user("1")
+        self.get_workspace_ids = MagicMock(return_value=[1, 2])
+
+    def _get_accessible_workspaces(self):
+        """Get the read accessible workspaces of the test user
+
+        Returns:
+
+        """
+        return workspace_access_cache.get_accessible_workspaces(
+            self.user,
+            workspace_access_cache.READ_ACCESS,
+            self.get_workspace_ids,
+        )
+
+    @patch.object(workspace_access_cache, "WORKSPACE_ACCESS_CACHE_TTL", 0)
+    def test_request_scope_computes_workspaces_once(self):
+        """test_request_scope_computes_workspaces_once
+
+        Returns:
+
+        """
+        with workspace_access_cache.request_scope():
+            first = self._get_accessible_workspaces()
+            second = self._get_accessible_workspaces()
+            stats = workspace_access_cache.get_request_stats()
+        self.assertIs(first, second)
+        self.assertEqual(self.get_workspace_ids.call_count, 1)
+        self.assertEqual(stats, {"acl_queries": 1, "acl_cache_hits": 1})
+        self.assertIsNone(workspace_access_cache.get_request_stats())
+
+    @patch.object(workspace_access_cache, "WORKSPACE_ACCESS_CACHE_TTL", 0)
+    def test_no_cache_outside_request_scope_if_ttl_is_zero(self):
+        """test_no_cache_outside_request_scope_if_ttl_is_zero
+
+        Returns:
+
+        """
+        self._get_accessible_workspaces()
+        self._get_accessible_workspaces()
+        self.assertEqual(self.get_workspace_ids.call_count, 2)
+
+    @patch.object(workspace_access_cache, "WORKSPACE_ACCESS_CACHE_TTL", 60)
+    def test_ttl_cache_is_invalidated(self):
+        """test_ttl_cache_is_invalidated
+
+        Returns:
+
+        """
+        workspace_access_cache.invalidate()
+        self._get_accessible_workspaces()
+        self._get_accessible_workspaces()
+        self.assertEqual(self.get_workspace_ids.call_count, 1)
+
+        workspace_access_cache.invalidate()
+        self._get_accessible_workspaces()
+        self.assertEqual(self.get_workspace_ids.call_count, 2)
+
+    def test_permissions_changed_invalidates_after_change(self):
+        """test_permissions_changed_invalidates_after_change
+
+        Returns:
+
+        """
+        with patch.object(
+            workspace_access_cache, "invalidate"
+        ) as mock_invalidate:
+            workspace_access_cache.permissions_changed(
+                None, self.user, "pre_add"
+            )
+            mock_invalidate.assert_not_called()
+            workspace_access_cache.permissions_changed(
+                None, self.user, "post_remove"
+            )
+            mock_invalidate.assert_called_once()
+
+
+class TestRenderedFragmentCache(TestCase):
+    """TestRenderedFragmentCache"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        cache.clear()
+        self.render = MagicMock(return_value="<p>value</p>")
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        cache.clear()
+
+    def test_fragment_is_rendered_once(self):
+        """test_fragment_is_rendered_once
+
+        Returns:
+
+        """
+        data = SimpleNamespace(id=1, checksum="checksum")
+        for _ in range(3):
+            result = rendered_fragment_cache.get_or_render(
+                "Detail", data, _get_xsl_transformation(xslt_id=1), self.render
+            )
+        self.assertEqual(result, "<p>value</p>")
+        self.assertEqual(self.render.call_count, 1)
+
+    def test_fragment_is_rendered_again_when_data_changes(self):
+        """test_fragment_is_rendered_again_when_data_changes
+
+        Returns:
+
+        """
+        xsl_transformation = _get_xsl_transformation(xslt_id=1)
+        for checksum in ("checksum", "new checksum"):
+            rendered_fragment_cache.get_or_render(
+                "Detail",
+                SimpleNamespace(id=1, checksum=checksum),
+                xsl_transformation,
+                self.render,
+            )
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_fragment_is_rendered_again_when_xslt_changes(self):
+        """test_fragment_is_rendered_again_when_xslt_changes
+
+        Returns:
+
+        """
+        data = SimpleNamespace(id=1, checksum="checksum")
+        xsl_transformation = _get_xsl_transformation(xslt_id=1)
+        for checksum in ("checksum", "new checksum"):
+            xsl_transformation.checksum = checksum
+            rendered_fragment_cache.get_or_render(
+                "Detail", data, xsl_transformation, self.render
+            )
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_list_and_detail_fragments_are_cached_separately(self):
+        """test_list_and_detail_fragments_are_cached_separately
+
+        Returns:
+
+        """
+        data = SimpleNamespace(id=1, checksum="checksum")
+        for xslt_type in ("List", "Detail"):
+            rendered_fragment_cache.get_or_render(
+                xslt_type, data, None, self.render
+            )
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_data_without_version_is_not_cached(self):
+        """test_data_without_version_is_not_cached
+
+        Returns:
+
+        """
+        data = {"id": 1, "checksum": None, "last_modification_date": None}
+        for _ in range(2):
+            rendered_fragment_cache.get_or_render(
+                "Detail", data, None, self.render
+            )
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_fragment_without_data_is_not_cached(self):
+        """test_fragment_without_data_is_not_cached
+
+        Returns:
+
+        """
+        for _ in range(2):
+            rendered_fragment_cache.get_or_render(
+                "Detail", None, None, self.render
+            )
+        self.assertEqual(self.render.call_count, 2)
+
+    @patch.object(
+        rendered_fragment_cache, "RENDERED_FRAGMENT_CACHE_TIMEOUT", 0
+    )
+    def test_timeout_zero_disables_cache(self):
+        """test_timeout_zero_disables_cache
+
+        Returns:
+
+        """
+        data = SimpleNamespace(id=1, checksum="checksum")
+        for _ in range(2):
+            rendered_fragment_cache.get_or_render(
+                "Detail", data, None, self.render
+            )
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_render_error_is_not_cached(self):
+        """test_render_error_is_not_cached
+
+        Returns:
+
+        """
+        data = SimpleNamespace(id=1, checksum="checksum")
+        self.render.side_effect = exceptions.CoreError("error")
+        for _ in range(2):
+            with self.assertRaises(exceptions.CoreError):
+                rendered_fragment_cache.get_or_render(
+                    "Detail", data, None, self.render
+                )
+        self.assertEqual(self.render.call_count, 2)
+
+    def test_unavailable_cache_renders_fragment(self):
+        """test_unavailable_cache_renders_fragment
+
+        Returns:
+
+        """
+        data = SimpleNamespace(id=1, checksum="checksum")
+        with patch.object(
+            rendered_fragment_cache.cache, "get", side_effect=Exception()
+        ):
+            result = rendered_fragment_cache.get_or_render(
+                "Detail", data, None, self.render
+            )
+        self.assertEqual(result, "<p>value</p>")
+
+    @patch(
+        "core_main_app.components.template_xsl_rendering.api.get_by_template_id"
+    )
+    def test_prewarm_caches_list_and_detail_fragments(
+        self, mock_get_by_template_id
+    ):
+        """test_prewarm_caches_list_and_detail_fragments
+
+        Args:
+            mock_get_by_template_id:
+
+        Returns:
+
+        """
+        mock_get_by_template_id.side_effect = exceptions.DoesNotExist("")
+        data = SimpleNamespace(
+            id=1,
+            checksum="checksum",
+            content="<tag>value</tag>",
+            template=SimpleNamespace(format=Template.XSD),
+            template_id=1,
+        )
+
+        rendered_fragment_cache.prewarm(data)
+
+        for xslt_type in ("List", "Detail"):
+            self.assertIsNotNone(
+                cache.get(
+                    rendered_fragment_cache.get_cache_key(
+                        xslt_type, data, None
+                    )
+                )
+            )
@@ -0,0 +1,232 @@
+""" Unit tests for conditional GET utils
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import TestCase
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.http import http_date
+
+from core_main_app.utils.conditional import (
+    get_etag,
+    get_not_modified_response,
+    get_validators,
+    is_if_range_valid,
+    set_conditional_headers,
+)
+
+LAST_MODIFIED = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+class TestGetEtag(TestCase):
+    """TestGetEtag"""
+
+    def test_etag_is_quoted(self):
+        """test_etag_is_quoted
+
+        Returns:
+
+        """
+        etag = get_etag("checksum")
+
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+
+    def test_etag_depends_on_variant(self):
+        """test_etag_depends_on_variant
+
+        Returns:
+
+        """
+        self.assertNotEqual(
+            get_etag("checksum", True), get_etag("checksum", False)
+        )
+
+    def test_etag_without_version_is_none(self):
+        """test_etag_without_version_is_none
+
+        Returns:
+
+        """
+        self.assertIsNone(get_etag(None, True))
+
+
+class TestGetValidators(TestCase):
+    """TestGetValidators"""
+
+    def test_validators_of_object(self):
+        """test_validators_of_object
+
+        Returns:
+
+        """
+        obj = SimpleNamespace(checksum="abc", last_change_date=LAST_MODIFIED)
+
+        etag, last_modified = get_validators(
+            obj, ("checksum", "last_change_date"), "last_change_date"
+        )
+
+        self.assertEqual(etag, get_etag(f"abc:{LAST_MODIFIED}"))
+        self.assertEqual(last_modified, LAST_MODIFIED)
+
+    def test_validators_of_object_without_stored_fields(self):
+        """test_validators_of_object_without_stored_fields
+
+        Returns:
+
+        """
+        etag, last_modified = get_validators(
+            SimpleNamespace(checksum=None), ("checksum",), "creation_date"
+        )
+
+        self.assertIsNone(etag)
+        self.assertIsNone(last_modified)
+
+
+class TestGetNotModifiedResponse(TestCase):
+    """TestGetNotModifiedResponse"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+        self.etag = get_etag("checksum")
+
+    def test_matching_if_none_match_returns_http_304(self):
+        """test_matching_if_none_match_returns_http_304
+
+        Returns:
+
+        """
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH=self.etag)
+
+        response = get_not_modified_response(request, self.etag, LAST_MODIFIED)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], self.etag)
+
+    def test_other_if_none_match_returns_none(self):
+        """test_other_if_none_match_returns_none
+
+        Returns:
+
+        """
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH=get_etag("other"))
+
+        self.assertIsNone(
+            get_not_modified_response(request, self.etag, LAST_MODIFIED)
+        )
+
+    def test_if_modified_since_last_modified_returns_http_304(self):
+        """test_if_modified_since_last_modified_returns_http_304
+
+        Returns:
+
+        """
+        request = self.factory.get(
+            "/", HTTP_IF_MODIFIED_SINCE=http_date(LAST_MODIFIED.timestamp())
+        )
+
+        response = get_not_modified_response(request, None, LAST_MODIFIED)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_if_modified_since_before_last_modified_returns_none(self):
+        """test_if_modified_since_before_last_modified_returns_none
+
+        Returns:
+
+        """
+        request = self.factory.get(
+            "/",
+            HTTP_IF_MODIFIED_SINCE=http_date(LAST_MODIFIED.timestamp() - 60),
+        )
+
+        self.assertIsNone(
+            get_not_modified_response(request, None, LAST_MODIFIED)
+        )
+
+    def test_request_without_validators_returns_none(self):
+        """test_request_without_validators_returns_none
+
+        Returns:
+
+        """
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH="*")
+
+        self.assertIsNone(get_not_modified_response(request, None, None))
+
+
+class TestSetConditionalHeaders(TestCase):
+    """TestSetConditionalHeaders"""
+
+    def test_headers_are_set(self):
+        """test_headers_are_set
+
+        Returns:
+
+        """
+        etag = get_etag("checksum")
+
+        response = set_conditional_headers(HttpResponse(), etag, LAST_MODIFIED)
+
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(
+            response["Last-Modified"], http_date(LAST_MODIFIED.timestamp())
+        )
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_no_headers_without_validators(self):
+        """test_no_headers_without_validators
+
+        Returns:
+
+        """
+        response = set_conditional_headers(HttpResponse())
+
+        self.assertFalse(response.has_header("ETag"))
+        self.assertFalse(response.has_header("Cache-Control"))
+
+
+class TestIsIfRangeValid(TestCase):
+    """TestIsIfRangeValid"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+        self.etag = get_etag("checksum")
+
+    def test_request_without_if_range_is_valid(self):
+        """test_request_without_if_range_is_valid
+
+        Returns:
+
+        """
+        self.assertTrue(is_if_range_valid(self.factory.get("/"), self.etag))
+
+    def test_matching_if_range_is_valid(self):
+        """test_matching_if_range_is_valid
+
+        Returns:
+
+        """
+        request = self.factory.get("/", HTTP_IF_RANGE=self.etag)
+
+        self.assertTrue(is_if_range_valid(request, self.etag))
+
+    def test_other_if_range_is_not_valid(self):
+        """test_other_if_range_is_not_valid
+
+        Returns:
+
+        """
+        request = self.factory.get("/", HTTP_IF_RANGE=get_etag("other"))
+
+        self.assertFalse(is_if_range_valid(request, self.etag))
@@ -0,0 +1,148 @@
+""" Integration tests for the keyset paginator
+"""
+from django.core.cache import cache
+from django.test import override_settings, tag
+
+from core_main_app.components.data.models import Data
+from core_main_app.permissions.discover import init_mongo_indexing
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+    MongoDBIntegrationBaseTestCase,
+)
+from core_main_app.utils.pagination.keyset_paginator.paginator import (
+    KeysetPaginator,
+)
+from tests.components.data.fixtures.fixtures import AccessControlDataFixture
+
+
+class TestKeysetPaginator(IntegrationBaseTestCase):
+    """TestKeysetPaginator"""
+
+    fixture = AccessControlDataFixture()
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        # counts are cached by query
+        cache.clear()
+
+    def test_pages_return_all_data_in_order(self):
+        """test_pages_return_all_data_in_order
+
+        Returns:
+
+        """
+        for order_by_field in (
+            [],
+            ["-title"],
+            ["+title", "-last_modification_date"],
+            ["+workspace"],
+            ["-workspace", "+title"],
+        ):
+            with self.subTest(order_by_field=order_by_field):
+                self.assertEqual(
+                    _get_all_pages(Data.objects.all(), order_by_field),
+                    _get_expected_order(Data.objects.all(), order_by_field),
+                )
+
+    def test_last_page_has_no_cursor(self):
+        """test_last_page_has_no_cursor
+
+        Returns:
+
+        """
+        paginator = KeysetPaginator(
+            Data.objects.all(), len(self.fixture.data_collection), []
+        )
+
+        _, cursor = paginator.page()
+
+        self.assertIsNone(cursor)
+
+    def test_count_returns_number_of_data(self):
+        """test_count_returns_number_of_data
+
+        Returns:
+
+        """
+        paginator = KeysetPaginator(Data.objects.filter(user_id="1"), 2, [])
+
+        self.assertEqual(paginator.count, 3)
+
+
+class TestMongoKeysetPaginator(MongoDBIntegrationBaseTestCase):
+    """TestMongoKeysetPaginator"""
+
+    @override_settings(MONGODB_INDEXING=True)
+    @override_settings(MONGODB_ASYNC_SAVE=False)
+    def setUp(self):
+        """Insert needed data.
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import (  # noqa: keep import to init signals
+            MongoData,
+        )
+
+        # Mongo indexing is not initialized by default
+        init_mongo_indexing()
+
+        self.fixture = AccessControlDataFixture()
+        self.fixture.insert_data()
+
+    @override_settings(MONGODB_INDEXING=True)
+    @tag("mongodb")
+    def test_pages_return_all_data_in_order(self):
+        """test_pages_return_all_data_in_order
+
+        Returns:
+
+        """
+        from core_main_app.components.mongo.models import MongoData
+
+        for order_by_field in ([], ["-title"], ["+title", "-data_id"]):
+            with self.subTest(order_by_field=order_by_field):
+                self.assertEqual(
+                    _get_all_pages(MongoData.objects.all(), order_by_field),
+                    _get_expected_order(
+                        MongoData.objects.all(), order_by_field
+                    ),
+                )
+
+
+def _get_all_pages(queryset, order_by_field):
+    """Return the ids of the documents of all pages of 2 documents
+
+    Args:
+        queryset:
+        order_by_field:
+
+    Returns:
+
+    """
+    paginator = KeysetPaginator(queryset, 2, order_by_field)
+    page, cursor = paginator.page()
+    document_ids = [document.pk for document in page]
+    while cursor is not None:
+        page, cursor = paginator.page(cursor)
+        document_ids.extend(document.pk for document in page)
+    return document_ids
+
+
+def _get_expected_order(queryset, order_by_field):
+    """Return the ids of the documents, sorted in a single page
+
+    Args:
+        queryset:
+        order_by_field:
+
+    Returns:
+
+    """
+    page, _ = KeysetPaginator(queryset, 100, order_by_field).page()
+    return [document.pk for document in page]
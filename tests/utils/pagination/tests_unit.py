@@ -0,0 +1,83 @@
+""" Unit tests for the keyset paginator
+"""
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from core_main_app.commons.exceptions import PaginationError
+from core_main_app.utils.pagination.keyset_paginator.paginator import (
+    decode_cursor,
+    encode_cursor,
+    get_ordering,
+)
+
+
+class TestGetOrdering(TestCase):
+    """TestGetOrdering"""
+
+    def test_primary_key_is_appended(self):
+        """test_primary_key_is_appended
+
+        Returns:
+
+        """
+        self.assertEqual(
+            get_ordering(["-title", "+last_modification_date"]),
+            [
+                ("title", True),
+                ("last_modification_date", False),
+                ("pk", False),
+            ],
+        )
+
+    def test_primary_key_is_not_duplicated(self):
+        """test_primary_key_is_not_duplicated
+
+        Returns:
+
+        """
+        self.assertEqual(get_ordering(["-id"]), [("pk", True)])
+
+    def test_empty_ordering_sorts_by_primary_key(self):
+        """test_empty_ordering_sorts_by_primary_key
+
+        Returns:
+
+        """
+        self.assertEqual(get_ordering([]), [("pk", False)])
+
+
+class TestCursor(TestCase):
+    """TestCursor"""
+
+    def test_decode_returns_encoded_values(self):
+        """test_decode_returns_encoded_values
+
+        Returns:
+
+        """
+        ordering = get_ordering(["-title", "+last_modification_date"])
+        values = ["title", datetime(2024, 1, 2, tzinfo=timezone.utc), 3]
+
+        cursor = encode_cursor(ordering, values)
+
+        self.assertEqual(decode_cursor(ordering, cursor), values)
+
+    def test_decode_invalid_cursor_raises_pagination_error(self):
+        """test_decode_invalid_cursor_raises_pagination_error
+
+        Returns:
+
+        """
+        with self.assertRaises(PaginationError):
+            decode_cursor(get_ordering([]), "not a cursor")
+
+    def test_decode_cursor_of_other_ordering_raises_pagination_error(self):
+        """test_decode_cursor_of_other_ordering_raises_pagination_error
+
+        Returns:
+
+        """
+        cursor = encode_cursor(get_ordering(["title"]), ["title", 1])
+
+        with self.assertRaises(PaginationError):
+            decode_cursor(get_ordering(["-title"]), cursor)
@@ -0,0 +1,289 @@
+""" Unit tests for performance instrumentation
+"""
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase as DjangoTestCase
+
+from core_main_app.access_control.decorators import access_control
+from core_main_app.utils import performance
+
+
+class TestRequestScope(TestCase):
+    """TestRequestScope"""
+
+    def test_operations_outside_request_scope_are_not_recorded(self):
+        """test_operations_outside_request_scope_are_not_recorded
+
+        Returns:
+
+        """
+        # Act
+        with performance.timed(performance.XSLT_TRANSFORM):
+            performance.record_bytes_read(10)
+
+        # Assert
+        self.assertIsNone(performance.get_request_metrics())
+
+    def test_timed_operations_are_counted(self):
+        """test_timed_operations_are_counted
+
+        Returns:
+
+        """
+        # Act
+        with performance.request_scope() as metrics:
+            for _ in range(2):
+                with performance.timed(performance.XSLT_TRANSFORM):
+                    pass
+            summary = metrics.get_summary()
+
+        # Assert
+        self.assertEqual(summary["xslt_transform_count"], 2)
+        self.assertEqual(summary["xsd_compile_count"], 0)
+        self.assertIsNone(performance.get_request_metrics())
+
+    def test_nested_operations_of_same_type_are_counted_once(self):
+        """test_nested_operations_of_same_type_are_counted_once
+
+        Returns:
+
+        """
+        # Act
+        with performance.request_scope() as metrics:
+            with performance.timed(performance.ACL_CHECK):
+                with performance.timed(performance.ACL_CHECK):
+                    pass
+            summary = metrics.get_summary()
+
+        # Assert
+        self.assertEqual(summary["acl_check_count"], 1)
+
+    def test_storage_bytes_are_summed(self):
+        """test_storage_bytes_are_summed
+
+        Returns:
+
+        """
+        # Act
+        with performance.request_scope() as metrics:
+            performance.record_bytes_read(10)
+            performance.record_bytes_read(5)
+            performance.record_bytes_written(3)
+            summary = metrics.get_summary()
+
+        # Assert
+        self.assertEqual(summary["bytes_read"], 15)
+        self.assertEqual(summary["bytes_written"], 3)
+
+    def test_summary_includes_acl_stats(self):
+        """test_summary_includes_acl_stats
+
+        Returns:
+
+        """
+        # Act
+        with performance.request_scope() as metrics:
+            summary = metrics.get_summary(
+                {"acl_queries": 2, "acl_cache_hits": 4}
+            )
+
+        # Assert
+        self.assertEqual(summary["acl_queries"], 2)
+        self.assertEqual(summary["acl_cache_hits"], 4)
+
+    def test_access_control_checks_are_timed(self):
+        """test_access_control_checks_are_timed
+
+        Returns:
+
+        """
+
+        # Arrange
+        def check(func, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        @access_control(check)
+        def get_value():
+            return 1
+
+        # Act
+        with performance.request_scope() as metrics:
+            get_value()
+            summary = metrics.get_summary()
+
+        # Assert
+        self.assertEqual(summary["acl_check_count"], 1)
+
+    def test_access_control_checks_exclude_decorated_function(self):
+        """test_access_control_checks_exclude_decorated_function
+
+        Returns:
+
+        """
+
+        # Arrange
+        def check(func, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        @access_control(check)
+        def get_value():
+            time.sleep(0.05)
+            return 1
+
+        # Act
+        with performance.request_scope() as metrics:
+            get_value()
+            summary = metrics.get_summary()
+
+        # Assert
+        self.assertLess(summary["acl_check_ms"], 50)
+
+    def test_access_control_checks_in_decorated_function_are_timed(self):
+        """test_access_control_checks_in_decorated_function_are_timed
+
+        Returns:
+
+        """
+
+        # Arrange
+        def check(func, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        @access_control(check)
+        def get_value():
+            return 1
+
+        @access_control(check)
+        def get_values():
+            return [get_value(), get_value()]
+
+        # Act
+        with performance.request_scope() as metrics:
+            get_values()
+            summary = metrics.get_summary()
+
+        # Assert
+        self.assertEqual(summary["acl_check_count"], 3)
+
+
+class TestSqlQueries(DjangoTestCase):
+    """TestSqlQueries"""
+
+    def test_sql_queries_are_counted(self):
+        """test_sql_queries_are_counted
+
+        Returns:
+
+        """
+        # Act
+        with performance.request_scope() as metrics:
+            list(User.objects.all())
+            User.objects.count()
+            summary = metrics.get_summary()
+
+        # Assert
+        self.assertEqual(summary["sql_count"], 2)
+
+
+class TestPerformanceStats(TestCase):
+    """TestPerformanceStats"""
+
+    def test_percentiles_of_summaries(self):
+        """test_percentiles_of_summaries
+
+        Returns:
+
+        """
+        # Arrange
+        stats = performance.PerformanceStats(100)
+        for value in range(1, 101):
+            stats.add({"sql_count": value})
+
+        # Act
+        result = stats.get_percentiles()
+
+        # Assert
+        self.assertEqual(result["sampled_requests"], 100)
+        self.assertEqual(
+            result["metrics"]["sql_count"],
+            {"p50": 50, "p90": 90, "p99": 99, "max": 100, "mean": 50.5},
+        )
+
+    def test_only_last_summaries_are_kept(self):
+        """test_only_last_summaries_are_kept
+
+        Returns:
+
+        """
+        # Arrange
+        stats = performance.PerformanceStats(2)
+        for value in (100, 1, 2):
+            stats.add({"sql_count": value})
+
+        # Act
+        result = stats.get_percentiles()
+
+        # Assert
+        self.assertEqual(result["sampled_requests"], 3)
+        self.assertEqual(result["window"], 2)
+        self.assertEqual(result["metrics"]["sql_count"]["max"], 2)
+
+    def test_empty_stats(self):
+        """test_empty_stats
+
+        Returns:
+
+        """
+        # Act
+        result = performance.PerformanceStats(10).get_percentiles()
+
+        # Assert
+        self.assertEqual(result["metrics"], {})
+
+
+class TestIsSampled(TestCase):
+    """TestIsSampled"""
+
+    @patch.object(performance, "PERFORMANCE_SAMPLE_RATE", 0)
+    def test_sample_rate_zero_never_samples(self):
+        """test_sample_rate_zero_never_samples
+
+        Returns:
+
+        """
+        self.assertFalse(performance.is_sampled())
+
+    @patch.object(performance, "PERFORMANCE_SAMPLE_RATE", 1)
+    def test_sample_rate_one_always_samples(self):
+        """test_sample_rate_one_always_samples
+
+        Returns:
+
+        """
+        self.assertTrue(performance.is_sampled())
+
+
+class TestGetServerTiming(TestCase):
+    """TestGetServerTiming"""
+
+    def test_only_executed_operations_are_listed(self):
+        """test_only_executed_operations_are_listed
+
+        Returns:
+
+        """
+        # Arrange
+        with performance.request_scope() as metrics:
+            metrics.record(performance.SQL, 0.002)
+            summary = metrics.get_summary()
+
+        # Act
+        server_timing = performance.get_server_timing(summary)
+
+        # Assert
+        self.assertIn('sql;dur=2.0;desc="1"', server_timing)
+        self.assertNotIn("mongo", server_timing)
+        self.assertNotIn("storage", server_timing)
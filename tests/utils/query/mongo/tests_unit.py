@@ -13,6 +13,13 @@ from core_main_app.utils.query.mongo.prepare import (
     sanitize_number,
     sanitize_value,
     convert_to_django,
+    prepare_query,
+)
+from core_main_app.utils.query.mongo.query_plan import (
+    clear_query_plan_cache,
+    convert_query,
+    get_query_plan,
+    get_query_plan_stats,
 )
 
 
@@ -373,3 +380,176 @@ class TestPrepareQuery(TestCase):
         self.assertEqual(
             convert_to_django({"$text": {"$search": "test"}}), expected_query
         )
+
+
+class TestPrepareQueryCopy(TestCase):
+    """TestPrepareQueryCopy"""
+
+    def test_prepare_query_does_not_modify_query(self):
+        """test_prepare_query_does_not_modify_query
+
+        Returns:
+
+        """
+        query = {"$and": [{"a": "/x/"}, {"b": {"$in": [1, 2]}}], "c": "/y/"}
+        expected_query = copy.deepcopy(query)
+
+        prepare_query(query, regex=True, sub_document_root="root")
+
+        self.assertEqual(query, expected_query)
+
+    def test_prepare_query_compiles_regex_and_adds_sub_document_root(
+        self,
+    ):
+        """test_prepare_query_compiles_regex_and_adds_sub_document_root
+
+        Returns:
+
+        """
+        query = {"a": "/x/", "$or": [{"b": {"$regex": "/y/"}}], "c": 1}
+
+        prepared_query = prepare_query(
+            query, regex=True, sub_document_root="root"
+        )
+
+        self.assertEqual(
+            prepared_query,
+            {
+                "$or": [{"root.b": {"$regex": re.compile("y")}}],
+                "root.a": re.compile("x"),
+                "root.c": 1,
+            },
+        )
+        self.assertEqual(list(prepared_query), ["$or", "root.a", "root.c"])
+
+
+class TestQueryPlan(TestCase):
+    """TestQueryPlan"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        clear_query_plan_cache()
+
+    def test_queries_with_same_shape_share_plan(self):
+        """test_queries_with_same_shape_share_plan
+
+        Returns:
+
+        """
+        first_plan = get_query_plan({"a.b": {"$gt": 1}, "c": "x"})
+        second_plan = get_query_plan({"a.b": {"$gt": 5}, "c": "y"})
+
+        self.assertIs(first_plan, second_plan)
+        self.assertEqual(get_query_plan_stats()["hits"], 1)
+        self.assertEqual(get_query_plan_stats()["translations"], 1)
+
+    def test_queries_with_different_shapes_have_different_plans(self):
+        """test_queries_with_different_shapes_have_different_plans
+
+        Returns:
+
+        """
+        first_plan = get_query_plan({"a": 1})
+        second_plan = get_query_plan({"a": "1"})
+        third_plan = get_query_plan({"a": {"$lt": 1}})
+
+        self.assertIsNot(first_plan, second_plan)
+        self.assertIsNot(first_plan, third_plan)
+        self.assertEqual(get_query_plan_stats()["hits"], 0)
+
+    def test_cached_plan_uses_values_of_query(self):
+        """test_cached_plan_uses_values_of_query
+
+        Returns:
+
+        """
+        from django.db.models import Q
+
+        convert_to_django({"a.b": {"$gt": 1}, "c": {"$ne": "x"}})
+
+        query = convert_to_django({"a.b": {"$gt": 5}, "c": {"$ne": "y"}})
+
+        self.assertEqual(query, Q(a__b__gt=5) & ~Q(c__exact="y"))
+        self.assertEqual(get_query_plan_stats()["hits"], 1)
+
+    def test_cached_plan_sanitizes_values_of_query(self):
+        """test_cached_plan_sanitizes_values_of_query
+
+        Returns:
+
+        """
+        convert_to_django({"a": {"$in": ["x"]}})
+
+        with self.assertRaises(QueryError):
+            convert_to_django({"a": {"$in": ["$x"]}})
+
+    def test_cached_plan_checks_where_operator(self):
+        """test_cached_plan_checks_where_operator
+
+        Returns:
+
+        """
+        convert_to_django({"workspace": "1"})
+
+        with self.assertRaises(QueryError):
+            convert_to_django({"workspace": "$where"})
+
+    def test_cached_plan_checks_numbers(self):
+        """test_cached_plan_checks_numbers
+
+        Returns:
+
+        """
+        convert_to_django({"a": {"$lt": 1}})
+
+        with self.assertRaises(QueryError):
+            convert_to_django({"a": {"$lt": "1"}})
+
+    @override_settings(MONGODB_INDEXING=True)
+    def test_plan_depends_on_mongodb_indexing(self):
+        """test_plan_depends_on_mongodb_indexing
+
+        Returns:
+
+        """
+        from mongoengine.queryset.visitor import Q
+
+        with override_settings(MONGODB_INDEXING=False):
+            convert_to_django({"template": 1})
+
+        self.assertEqual(convert_to_django({"template": 1}), Q(_template_id=1))
+
+    def test_convert_query_returns_access_filters(self):
+        """test_convert_query_returns_access_filters
+
+        Returns:
+
+        """
+        query_dict = {
+            "workspace": {"$in": [1, 2]},
+            "$or": [{"user_id": 3}, {"workspace": None}],
+            "a": 1,
+        }
+
+        query, workspace_filter, user_filter = convert_query(query_dict)
+
+        self.assertEqual(workspace_filter, [1, 2, None])
+        self.assertEqual(user_filter, ["3"])
+
+    def test_stats_return_hit_rate(self):
+        """test_stats_return_hit_rate
+
+        Returns:
+
+        """
+        for value in range(4):
+            convert_to_django({"a": value})
+
+        stats = get_query_plan_stats()
+
+        self.assertEqual(stats["hit_rate"], 0.75)
+        self.assertEqual(stats["builds"], 4)
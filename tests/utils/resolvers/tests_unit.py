@@ -0,0 +1,245 @@
+""" Unit tests for the lxml URI resolvers
+"""
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+from lxml import etree
+
+from core_main_app.components.template import api as template_api
+from core_main_app.components.template.models import Template
+from core_main_app.utils.resolvers import local_resolver, resolver_utils
+from core_main_app.utils.resolvers.local_resolver import LocalResolver
+from core_main_app.utils.resolvers.requests_resolver import RequestsResolver
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import create_mock_request
+
+DEPENDENCY = (
+    '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+    '<xs:element name="dependency"/></xs:schema>'
+)
+
+
+def _get_schema(schema_location):
+    """Return an XSD including a dependency
+
+    Args:
+        schema_location:
+
+    Returns:
+
+    """
+    return (
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+        f'<xs:include schemaLocation="{schema_location}"/>'
+        '<xs:element name="root"/></xs:schema>'
+    )
+
+
+def _compile_schema(xsd_string, uri_resolver):
+    """Compile an XSD using the resolver
+
+    Args:
+        xsd_string:
+        uri_resolver:
+
+    Returns:
+
+    """
+    parser = etree.XMLParser()
+    parser.resolvers.add(uri_resolver)
+    return etree.XMLSchema(etree.fromstring(xsd_string, parser))
+
+
+@override_settings(ROOT_URLCONF="core_main_app.urls")
+class TestLocalResolver(SimpleTestCase):
+    """Test Local Resolver"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        local_resolver.clear_remote_content_cache()
+        self.request = create_mock_request(
+            user=create_mock_user("1", is_superuser=True)
+        )
+
+    @patch.object(local_resolver, "get_http_session")
+    @patch.object(template_api, "get_by_id")
+    def test_local_template_url_is_read_from_database(
+        self, mock_get_by_id, mock_get_http_session
+    ):
+        """test local template url is read from database
+
+        Args:
+            mock_get_by_id:
+            mock_get_http_session:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_get_by_id.return_value = Template(content=DEPENDENCY)
+
+        # Act
+        xml_schema = _compile_schema(
+            _get_schema("http://127.0.0.1:8000/rest/template/1/download/"),
+            LocalResolver(request=self.request),
+        )
+
+        # Assert
+        self.assertTrue(xml_schema.validate(etree.fromstring("<dependency/>")))
+        mock_get_by_id.assert_called_with("1", request=self.request)
+        mock_get_http_session.assert_not_called()
+
+    @patch.object(RequestsResolver, "resolve")
+    @patch.object(template_api, "get_by_id")
+    def test_local_template_url_without_request_uses_requests_resolver(
+        self, mock_get_by_id, mock_requests_resolve
+    ):
+        """test local template url without request uses requests resolver
+
+        Args:
+            mock_get_by_id:
+            mock_requests_resolve:
+
+        Returns:
+
+        """
+        # Arrange
+        url = "http://127.0.0.1:8000/rest/template/1/download/"
+        mock_requests_resolve.return_value = None
+
+        # Act
+        LocalResolver().resolve(url, None, None)
+
+        # Assert
+        mock_get_by_id.assert_not_called()
+        mock_requests_resolve.assert_called_with(url, None, None)
+
+    @patch.object(local_resolver, "get_http_session")
+    @patch.object(template_api, "get_by_id")
+    def test_template_url_of_other_server_is_downloaded(
+        self, mock_get_by_id, mock_get_http_session
+    ):
+        """test template url of other server is downloaded
+
+        Args:
+            mock_get_by_id:
+            mock_get_http_session:
+
+        Returns:
+
+        """
+        # Arrange
+        url = "https://remote.org/rest/template/1/download/"
+        mock_get_http_session.return_value.get.return_value = MagicMock(
+            content=DEPENDENCY.encode("utf-8")
+        )
+
+        # Act
+        _compile_schema(_get_schema(url), LocalResolver(request=self.request))
+
+        # Assert
+        mock_get_by_id.assert_not_called()
+        mock_get_http_session.return_value.get.assert_called_with(url)
+
+    @patch.object(local_resolver, "get_http_session")
+    def test_remote_content_is_cached(self, mock_get_http_session):
+        """test remote content is cached
+
+        Args:
+            mock_get_http_session:
+
+        Returns:
+
+        """
+        # Arrange
+        url = "https://remote.org/dependency.xsd"
+        mock_get_http_session.return_value.get.return_value = MagicMock(
+            content=DEPENDENCY.encode("utf-8")
+        )
+
+        # Act
+        for _ in range(2):
+            _compile_schema(
+                _get_schema(url), LocalResolver(request=self.request)
+            )
+
+        # Assert
+        self.assertEqual(mock_get_http_session.return_value.get.call_count, 1)
+
+    @patch.object(local_resolver, "XSD_URI_RESOLVER_CACHE_TIMEOUT", 0)
+    @patch.object(local_resolver, "get_http_session")
+    def test_remote_content_is_not_cached_if_timeout_is_zero(
+        self, mock_get_http_session
+    ):
+        """test remote content is not cached if timeout is zero
+
+        Args:
+            mock_get_http_session:
+
+        Returns:
+
+        """
+        # Arrange
+        url = "https://remote.org/dependency.xsd"
+        mock_get_http_session.return_value.get.return_value = MagicMock(
+            content=DEPENDENCY.encode("utf-8")
+        )
+
+        # Act
+        for _ in range(2):
+            local_resolver.get_remote_content(url)
+
+        # Assert
+        self.assertEqual(mock_get_http_session.return_value.get.call_count, 2)
+
+    def test_get_http_session_returns_shared_session(self):
+        """test get http session returns shared session
+
+        Returns:
+
+        """
+        # Act / Assert
+        self.assertIs(
+            local_resolver.get_http_session(),
+            local_resolver.get_http_session(),
+        )
+
+
+class TestLmxlUriResolver(TestCase):
+    """Test lmxl_uri_resolver"""
+
+    @patch.object(resolver_utils, "XSD_URI_RESOLVER", "LOCAL_RESOLVER")
+    def test_lmxl_uri_resolver_returns_local_resolver_with_request(self):
+        """test lmxl uri resolver returns local resolver with request
+
+        Returns:
+
+        """
+        # Arrange
+        mock_request = create_mock_request(user=create_mock_user("1"))
+
+        # Act
+        uri_resolver = resolver_utils.lmxl_uri_resolver(request=mock_request)
+
+        # Assert
+        self.assertIsInstance(uri_resolver, LocalResolver)
+        self.assertEqual(uri_resolver.request, mock_request)
+
+    @patch.object(resolver_utils, "XSD_URI_RESOLVER", "LOCAL_RESOLVER")
+    def test_lmxl_uri_resolver_without_request_returns_resolver(self):
+        """test lmxl uri resolver without request returns resolver
+
+        Returns:
+
+        """
+        # Act
+        uri_resolver = resolver_utils.lmxl_uri_resolver()
+
+        # Assert
+        self.assertIsNone(uri_resolver.request)
@@ -0,0 +1,172 @@
+""" Unit tests for the storage utils
+"""
+import io
+from unittest import TestCase
+
+from core_main_app.commons.exceptions import CoreError
+from core_main_app.utils.checksum import compute_checksum
+from core_main_app.utils.storage.hashing_file import HashingFile
+
+CONTENT = "<root>" + "<element>é€</element>" * 100 + "</root>"
+
+
+class TestHashingFile(TestCase):
+    """TestHashingFile"""
+
+    def test_chunks_of_string_are_encoded_content(self):
+        """test_chunks_of_string_are_encoded_content
+
+        Returns:
+
+        """
+        # Arrange
+        hashing_file = HashingFile(CONTENT, name="data.xml", chunk_size=64)
+
+        # Act
+        chunks = list(hashing_file.chunks(chunk_size=64))
+
+        # Assert
+        self.assertEqual(b"".join(chunks), CONTENT.encode("utf-8"))
+        self.assertTrue(all(len(chunk) == 64 for chunk in chunks[:-1]))
+
+    def test_checksum_of_string_is_checksum_of_encoded_content(self):
+        """test_checksum_of_string_is_checksum_of_encoded_content
+
+        Returns:
+
+        """
+        # Arrange
+        hashing_file = HashingFile(
+            CONTENT, checksum_algorithm="SHA256", chunk_size=64
+        )
+
+        # Act
+        for _ in hashing_file.chunks(chunk_size=100):
+            pass
+
+        # Assert
+        self.assertEqual(
+            hashing_file.checksum,
+            compute_checksum(CONTENT.encode("utf-8"), "SHA256"),
+        )
+
+    def test_checksum_of_bytes(self):
+        """test_checksum_of_bytes
+
+        Returns:
+
+        """
+        # Arrange
+        content = CONTENT.encode("utf-8")
+        hashing_file = HashingFile(
+            content, checksum_algorithm="MD5", chunk_size=64
+        )
+
+        # Act
+        data = hashing_file.read()
+
+        # Assert
+        self.assertEqual(data, content)
+        self.assertEqual(
+            hashing_file.checksum, compute_checksum(content, "MD5")
+        )
+
+    def test_checksum_of_file_object(self):
+        """test_checksum_of_file_object
+
+        Returns:
+
+        """
+        # Arrange
+        content = CONTENT.encode("utf-8")
+        hashing_file = HashingFile(
+            io.BytesIO(content), checksum_algorithm="MD5", chunk_size=64
+        )
+
+        # Act
+        data = b"".join(hashing_file.chunks(chunk_size=50))
+
+        # Assert
+        self.assertEqual(data, content)
+        self.assertEqual(
+            hashing_file.checksum, compute_checksum(content, "MD5")
+        )
+
+    def test_checksum_is_reset_when_content_is_read_again(self):
+        """test_checksum_is_reset_when_content_is_read_again
+
+        Returns:
+
+        """
+        # Arrange
+        hashing_file = HashingFile(
+            CONTENT, checksum_algorithm="MD5", chunk_size=64
+        )
+        hashing_file.read()
+
+        # Act
+        hashing_file.seek(0)
+        hashing_file.read()
+
+        # Assert
+        self.assertEqual(
+            hashing_file.checksum,
+            compute_checksum(CONTENT.encode("utf-8"), "MD5"),
+        )
+
+    def test_checksum_reads_end_of_content(self):
+        """test_checksum_reads_end_of_content
+
+        Returns:
+
+        """
+        # Arrange
+        hashing_file = HashingFile(
+            CONTENT, checksum_algorithm="MD5", chunk_size=64
+        )
+        hashing_file.read(10)
+
+        # Act
+        checksum = hashing_file.checksum
+
+        # Assert
+        self.assertEqual(
+            checksum, compute_checksum(CONTENT.encode("utf-8"), "MD5")
+        )
+
+    def test_checksum_is_none_without_algorithm(self):
+        """test_checksum_is_none_without_algorithm
+
+        Returns:
+
+        """
+        self.assertIsNone(HashingFile(CONTENT).checksum)
+
+    def test_size_is_size_of_encoded_content(self):
+        """test_size_is_size_of_encoded_content
+
+        Returns:
+
+        """
+        self.assertEqual(
+            HashingFile(CONTENT, chunk_size=64).size,
+            len(CONTENT.encode("utf-8")),
+        )
+
+    def test_seek_to_other_position_raises_error(self):
+        """test_seek_to_other_position_raises_error
+
+        Returns:
+
+        """
+        with self.assertRaises(io.UnsupportedOperation):
+            HashingFile(CONTENT).seek(10)
+
+    def test_unknown_algorithm_raises_error(self):
+        """test_unknown_algorithm_raises_error
+
+        Returns:
+
+        """
+        with self.assertRaises(CoreError):
+            HashingFile(CONTENT, checksum_algorithm="TEST")
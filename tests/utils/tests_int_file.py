@@ -1,8 +1,11 @@
 """ Blob utils test class
 """
+from io import BytesIO
 from unittest import TestCase
 from unittest.mock import patch
 
+from django.test import RequestFactory
+
 from core_main_app.commons.exceptions import CoreError
 from core_main_app.components.template.models import Template
 from core_main_app.utils.file import (
@@ -14,6 +17,7 @@ from core_main_app.utils.file import (
     get_data_file_extension_for_template_format,
     get_template_file_extension_for_template_format,
     get_file_http_response,
+    get_file_streaming_response,
 )
 
 
@@ -276,3 +280,129 @@ class TestGetFileHttpResponse(TestCase):
         )
         self.assertEqual(response.content, b'{"element": "value"}')
         self.assertEqual(response.headers["Content-Type"], "application/json")
+
+
+class TestGetFileStreamingResponse(TestCase):
+    """TestGetFileStreamingResponse"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.factory = RequestFactory()
+        self.file = BytesIO(b"0123456789")
+
+    def _get_response(self, range_header=None):
+        """Return the response of a file download
+
+        Args:
+            range_header:
+
+        Returns:
+
+        """
+        headers = {"HTTP_RANGE": range_header} if range_header else {}
+        return get_file_streaming_response(
+            self.factory.get("/", **headers), self.file, "test.txt"
+        )
+
+    def test_whole_file_is_streamed(self):
+        """test_whole_file_is_streamed
+
+        Returns:
+
+        """
+        response = self._get_response()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"0123456789")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(response["Content-Type"], "text/plain")
+        self.assertEqual(
+            response["Content-Disposition"], "attachment; filename=test.txt"
+        )
+
+    def test_range_returns_partial_content(self):
+        """test_range_returns_partial_content
+
+        Returns:
+
+        """
+        response = self._get_response("bytes=2-5")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"2345")
+        self.assertEqual(response["Content-Length"], "4")
+        self.assertEqual(response["Content-Range"], "bytes 2-5/10")
+
+    def test_open_range_returns_end_of_file(self):
+        """test_open_range_returns_end_of_file
+
+        Returns:
+
+        """
+        response = self._get_response("bytes=7-")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"789")
+        self.assertEqual(response["Content-Range"], "bytes 7-9/10")
+
+    def test_suffix_range_returns_last_bytes(self):
+        """test_suffix_range_returns_last_bytes
+
+        Returns:
+
+        """
+        response = self._get_response("bytes=-3")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"789")
+
+    def test_range_after_end_of_file_returns_http_416(self):
+        """test_range_after_end_of_file_returns_http_416
+
+        Returns:
+
+        """
+        response = self._get_response("bytes=20-30")
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */10")
+
+    def test_multiple_ranges_return_whole_file(self):
+        """test_multiple_ranges_return_whole_file
+
+        Returns:
+
+        """
+        response = self._get_response("bytes=0-1,4-5")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"0123456789")
+
+    def test_invalid_range_returns_whole_file(self):
+        """test_invalid_range_returns_whole_file
+
+        Returns:
+
+        """
+        response = self._get_response("bytes=5-2")
+
+        self.assertEqual(response.status_code, 200)
+
+    @patch(
+        "core_main_app.utils.file.FILE_DOWNLOAD_OFFLOAD_HEADER", "X-Sendfile"
+    )
+    def test_offload_is_ignored_for_file_without_path(self):
+        """test_offload_is_ignored_for_file_without_path
+
+        Returns:
+
+        """
+        response = self._get_response()
+
+        self.assertFalse(response.has_header("X-Sendfile"))
+        self.assertEqual(b"".join(response.streaming_content), b"0123456789")
@@ -3,8 +3,11 @@
 from collections import OrderedDict
 from unittest import TestCase
 
+import xmltodict
+
 from core_main_app.commons import exceptions
 from core_main_app.utils.xml import (
+    XML_POST_PROCESSORS,
     raw_xml_to_dict,
     remove_lists_from_xml_dict,
     get_content_by_xpath,
@@ -146,6 +149,138 @@ class TestRawToDict(TestCase):
         with self.assertRaises(exceptions.CoreError):
             raw_xml_to_dict(raw_xml, postprocessor=1)
 
+    def test_raw_to_dict_with_list_limit_removes_lists_exceeding_limit(
+        self,
+    ):
+        """test_raw_to_dict_with_list_limit_removes_lists_exceeding_limit
+
+        Returns:
+
+        """
+        # Arrange
+        raw_xml = (
+            "<root><a>1</a><a>2</a><a>3</a><b>1</b><b>2</b><c>1</c></root>"
+        )
+
+        # Act
+        xml_dict = raw_xml_to_dict(
+            raw_xml, postprocessor="NUMERIC", list_limit=2
+        )
+
+        # Assert
+        self.assertEqual(xml_dict, {"root": {"b": [1, 2], "c": 1}})
+
+    def test_raw_to_dict_with_list_limit_removes_lists_of_nested_elements(
+        self,
+    ):
+        """test_raw_to_dict_with_list_limit_removes_lists_of_nested_elements
+
+        Returns:
+
+        """
+        # Arrange
+        raw_xml = "<root><a><b>1</b><b>2</b><b>3</b><c>4</c></a></root>"
+
+        # Act
+        xml_dict = raw_xml_to_dict(raw_xml, list_limit=2)
+
+        # Assert
+        self.assertEqual(xml_dict, {"root": {"a": {"c": "4"}}})
+
+    def test_raw_to_dict_with_list_limit_keeps_lists_nested_in_lists(
+        self,
+    ):
+        """test_raw_to_dict_with_list_limit_keeps_lists_nested_in_lists
+
+        Returns:
+
+        """
+        # Arrange
+        raw_xml = "<root><a><b>1</b><b>2</b><b>3</b></a><a>4</a></root>"
+
+        # Act
+        xml_dict = raw_xml_to_dict(raw_xml, list_limit=2)
+
+        # Assert
+        self.assertEqual(
+            xml_dict, {"root": {"a": [{"b": ["1", "2", "3"]}, "4"]}}
+        )
+
+    def test_raw_to_dict_with_list_limit_and_force_list(self):
+        """test_raw_to_dict_with_list_limit_and_force_list
+
+        Returns:
+
+        """
+        # Arrange
+        raw_xml = "<root><a><b>1</b><b>2</b><c>3</c></a></root>"
+
+        # Act
+        xml_dict = raw_xml_to_dict(raw_xml, force_list=True, list_limit=1)
+
+        # Assert
+        self.assertEqual(
+            xml_dict, {"root": [{"a": [{"b": ["1", "2"], "c": ["3"]}]}]}
+        )
+
+    def test_raw_to_dict_with_list_limit_returns_same_dict_as_xmltodict(
+        self,
+    ):
+        """test_raw_to_dict_with_list_limit_returns_same_dict_as_xmltodict
+
+        Returns:
+
+        """
+        # Arrange
+        raw_xml = (
+            '<root xmlns:ns="http://ns"><ns:a id="1"> text <b>1.5</b></ns:a>'
+            "<ns:a><b>x</b><b>2</b><b>3</b></ns:a><d/><e>  </e>"
+            "<f><g>1</g><g>2</g></f></root>"
+        )
+        for postprocessor in (None, "NUMERIC", "NUMERIC_AND_STRING"):
+            for force_list in (None, True, ("b",)):
+                expected_dict = xmltodict.parse(
+                    raw_xml,
+                    postprocessor=XML_POST_PROCESSORS.get(postprocessor),
+                    force_list=force_list,
+                )
+                remove_lists_from_xml_dict(expected_dict, 2)
+
+                # Act
+                xml_dict = raw_xml_to_dict(
+                    raw_xml,
+                    postprocessor=postprocessor,
+                    force_list=force_list,
+                    list_limit=2,
+                )
+
+                # Assert
+                self.assertEqual(xml_dict, expected_dict)
+
+    def test_raw_to_dict_with_list_limit_and_renaming_post_processor(self):
+        """test_raw_to_dict_with_list_limit_and_renaming_post_processor
+
+        Returns:
+
+        """
+
+        # Arrange
+        def test_processor(path, key, value):
+            try:
+                return key + ":int", int(value)
+            except (ValueError, TypeError):
+                return key, value
+
+        raw_xml = "<root><b>1</b><b>2</b><b>x</b></root>"
+
+        # Act
+        xml_dict = raw_xml_to_dict(
+            raw_xml, postprocessor=test_processor, list_limit=1
+        )
+
+        # Assert
+        self.assertEqual(xml_dict, {"root": {"b": "x"}})
+
 
 class TestRemoveListsFromXmlDict(TestCase):
     """Test remove_lists_from_xml_dict"""
@@ -246,6 +381,44 @@ class TestRemoveListsFromXmlDict(TestCase):
             == {"root": {"int": 3, "str": "test", "dict": {"value": "test"}}}
         )
 
+    def test_remove_lists_from_xml_dict_list_in_list_item_is_kept(
+        self,
+    ):
+        """test_remove_lists_from_xml_dict_list_in_list_item_is_kept
+
+        Returns:
+
+        """
+        # Arrange
+        xml_dict = {"root": {"list": [{"sub": [1, 2]}, {"value": 1}]}}
+        # Act
+        remove_lists_from_xml_dict(xml_dict, 2)
+        # Assert
+        self.assertEqual(
+            xml_dict, {"root": {"list": [{"sub": [1, 2]}, {"value": 1}]}}
+        )
+        # Act
+        remove_lists_from_xml_dict(xml_dict, 1)
+        # Assert
+        self.assertEqual(xml_dict, {"root": {}})
+
+    def test_remove_lists_from_xml_dict_list_in_small_list_item_is_kept(
+        self,
+    ):
+        """test_remove_lists_from_xml_dict_list_in_small_list_item_is_kept
+
+        Returns:
+
+        """
+        # Arrange
+        xml_dict = {"root": {"list": [{"sub": [1, 2, 3]}, {"value": 1}]}}
+        # Act
+        remove_lists_from_xml_dict(xml_dict, 2)
+        # Assert
+        self.assertEqual(
+            xml_dict, {"root": {"list": [{"sub": [1, 2, 3]}, {"value": 1}]}}
+        )
+
 
 class TestGetContentByXpath(TestCase):
     """Test get_content_by_xpath"""
@@ -7,6 +7,9 @@ from django.test.utils import override_settings
 from django.urls import reverse
 
 from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.components.flattened_template import (
+    api as flattened_template_api,
+)
 from core_main_app.components.template import api as template_api
 from core_main_app.components.template.models import Template
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
@@ -125,3 +128,33 @@ class TestXSDFlattenerDatabaseUrl(TestCase):
 
         # Assert
         self.assertTrue('<xs:element name="test"/>' in flat_string)
+
+    @patch.object(flattened_template_api, "get_flat_content")
+    def test_get_flat_with_template_returns_stored_content(
+        self, mock_get_flat_content
+    ):
+        """test get flat with template returns stored content
+
+        Args:
+            mock_get_flat_content:
+
+        Returns:
+
+        """
+        # Arrange
+        mock_user = create_mock_user("1", is_superuser=True)
+        mock_request = create_mock_request(user=mock_user)
+        mock_template = Template(content="<schema/>")
+        mock_get_flat_content.return_value = "<flat/>"
+
+        # Act
+        flattener = XSDFlattenerDatabaseOrURL(
+            mock_template.content, request=mock_request, template=mock_template
+        )
+        flat_string = flattener.get_flat()
+
+        # Assert
+        self.assertEqual(flat_string, "<flat/>")
+        mock_get_flat_content.assert_called_with(
+            mock_template, request=mock_request
+        )